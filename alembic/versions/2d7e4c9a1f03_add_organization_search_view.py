@@ -0,0 +1,96 @@
+"""Add organization search materialized view
+
+Revision ID: 2d7e4c9a1f03
+Revises: 8f3b6a1d2c95
+Create Date: 2026-10-19 14:05:52.114870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d7e4c9a1f03'
+down_revision: Union[str, None] = '8f3b6a1d2c95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# One row per organization: pre-joined search columns and the OrganizationFull payload
+ORGANIZATION_SEARCH_VIEW = """
+CREATE MATERIALIZED VIEW organization.organization_search AS
+SELECT
+    o.sid,
+    o.name,
+    o.created_at,
+    b.sid AS building_sid,
+    b.latitude,
+    b.longitude,
+    b.city,
+    coalesce(act.activity_sids, '{}') AS activity_sids,
+    coalesce(ph.phones, '{}') AS phones,
+    jsonb_build_object(
+        'name', o.name,
+        'sid', o.sid,
+        'address', CASE WHEN a.organization_sid IS NOT NULL THEN jsonb_build_object(
+            'organizationSid', a.organization_sid,
+            'buildingSid', a.building_sid,
+            'office', a.office,
+            'building', jsonb_build_object(
+                'address', b.address,
+                'latitude', b.latitude,
+                'longitude', b.longitude,
+                'sid', b.sid
+            )
+        ) END,
+        'activities', coalesce(act.activities, '[]'::jsonb),
+        'phoneNumbers', coalesce(ph.phone_numbers, '[]'::jsonb)
+    ) AS payload
+FROM organization.organization AS o
+LEFT JOIN LATERAL (
+    SELECT organization_sid, building_sid, office
+    FROM organization.organization_address
+    WHERE organization_sid = o.sid
+    ORDER BY created_at
+    LIMIT 1
+) AS a ON true
+LEFT JOIN building.building AS b ON b.sid = a.building_sid
+LEFT JOIN LATERAL (
+    SELECT
+        array_agg(ac.sid) AS activity_sids,
+        jsonb_agg(
+            jsonb_build_object('name', ac.name, 'parentSid', ac.parent_sid, 'sid', ac.sid)
+        ) AS activities
+    FROM organization.organization_activity AS oa
+    JOIN activity.activity AS ac ON ac.sid = oa.activity_sid
+    WHERE oa.organization_sid = o.sid
+) AS act ON true
+LEFT JOIN LATERAL (
+    SELECT
+        array_agg(p.phone) AS phones,
+        jsonb_agg(
+            jsonb_build_object('organizationSid', p.organization_sid, 'phone', p.phone)
+        ) AS phone_numbers
+    FROM organization.phone_number AS p
+    WHERE p.organization_sid = o.sid
+) AS ph ON true
+WITH DATA
+"""
+
+
+def upgrade() -> None:
+    op.execute(sa.text(ORGANIZATION_SEARCH_VIEW))
+
+    # A unique index is required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index('ux_organization_organization_search_sid', 'organization_search', ['sid'], unique=True, schema='organization')
+    op.create_index('ix_organization_organization_search_name', 'organization_search', ['name'], unique=False, schema='organization')
+    op.create_index('ix_organization_organization_search_name_trgm', 'organization_search', ['name'], unique=False, schema='organization', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_organization_organization_search_activity_sids', 'organization_search', ['activity_sids'], unique=False, schema='organization', postgresql_using='gin')
+    op.create_index('ix_organization_organization_search_latitude_longitude', 'organization_search', ['latitude', 'longitude'], unique=False, schema='organization')
+    op.create_index('ix_organization_organization_search_city', 'organization_search', ['city'], unique=False, schema='organization')
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DROP MATERIALIZED VIEW IF EXISTS organization.organization_search"))
@@ -0,0 +1,38 @@
+"""Add organization search indexes
+
+Revision ID: 5c1e9d3a7b42
+Revises: a202680d1617
+Create Date: 2026-10-19 10:12:40.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e9d3a7b42'
+down_revision: Union[str, None] = 'a202680d1617'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+    op.create_index(op.f('ix_activity_activity_parent_sid'), 'activity', ['parent_sid'], unique=False, schema='activity')
+    op.create_index('ix_building_building_latitude_longitude', 'building', ['latitude', 'longitude'], unique=False, schema='building')
+    op.create_index('ix_organization_organization_name_trgm', 'organization', ['name'], unique=False, schema='organization', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index(op.f('ix_organization_organization_address_building_sid'), 'organization_address', ['building_sid'], unique=False, schema='organization')
+    op.create_index(op.f('ix_organization_phone_number_organization_sid'), 'phone_number', ['organization_sid'], unique=False, schema='organization')
+    op.create_index('ix_organization_phone_number_phone', 'phone_number', ['phone'], unique=False, schema='organization', postgresql_ops={'phone': 'varchar_pattern_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_organization_phone_number_phone', table_name='phone_number', schema='organization')
+    op.drop_index(op.f('ix_organization_phone_number_organization_sid'), table_name='phone_number', schema='organization')
+    op.drop_index(op.f('ix_organization_organization_address_building_sid'), table_name='organization_address', schema='organization')
+    op.drop_index('ix_organization_organization_name_trgm', table_name='organization', schema='organization')
+    op.drop_index('ix_building_building_latitude_longitude', table_name='building', schema='building')
+    op.drop_index(op.f('ix_activity_activity_parent_sid'), table_name='activity', schema='activity')
@@ -0,0 +1,28 @@
+"""Add building city
+
+Revision ID: 8f3b6a1d2c95
+Revises: 5c1e9d3a7b42
+Create Date: 2026-10-19 12:41:07.529318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3b6a1d2c95'
+down_revision: Union[str, None] = '5c1e9d3a7b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('building', sa.Column('city', sa.String(length=150), sa.Computed("btrim(regexp_replace(split_part(address, ',', 1), '^\\s*г\\.\\s*', ''))", persisted=True), nullable=False), schema='building')
+    op.create_index(op.f('ix_building_building_city'), 'building', ['city'], unique=False, schema='building')
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_building_building_city'), table_name='building', schema='building')
+    op.drop_column('building', 'city', schema='building')
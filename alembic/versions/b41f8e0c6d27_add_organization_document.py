@@ -0,0 +1,241 @@
+"""Add trigger-maintained organization document
+
+Revision ID: b41f8e0c6d27
+Revises: 2d7e4c9a1f03
+Create Date: 2026-10-19 16:27:31.402518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41f8e0c6d27'
+down_revision: Union[str, None] = '2d7e4c9a1f03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Builds the OrganizationFull payload (camelCase) of one organization, NULL if absent
+BUILD_DOCUMENT_FUNCTION = """
+CREATE FUNCTION organization.build_organization_document(p_sid uuid)
+RETURNS jsonb
+LANGUAGE sql STABLE AS $$
+SELECT jsonb_build_object(
+    'name', o.name,
+    'sid', o.sid,
+    'address', CASE WHEN a.organization_sid IS NOT NULL THEN jsonb_build_object(
+        'organizationSid', a.organization_sid,
+        'buildingSid', a.building_sid,
+        'office', a.office,
+        'building', jsonb_build_object(
+            'address', b.address,
+            'latitude', b.latitude,
+            'longitude', b.longitude,
+            'sid', b.sid
+        )
+    ) END,
+    'activities', coalesce(act.activities, '[]'::jsonb),
+    'phoneNumbers', coalesce(ph.phone_numbers, '[]'::jsonb)
+)
+FROM organization.organization AS o
+LEFT JOIN LATERAL (
+    SELECT organization_sid, building_sid, office
+    FROM organization.organization_address
+    WHERE organization_sid = o.sid
+    ORDER BY created_at
+    LIMIT 1
+) AS a ON true
+LEFT JOIN building.building AS b ON b.sid = a.building_sid
+LEFT JOIN LATERAL (
+    SELECT jsonb_agg(
+        jsonb_build_object('name', ac.name, 'parentSid', ac.parent_sid, 'sid', ac.sid)
+    ) AS activities
+    FROM organization.organization_activity AS oa
+    JOIN activity.activity AS ac ON ac.sid = oa.activity_sid
+    WHERE oa.organization_sid = o.sid
+) AS act ON true
+LEFT JOIN LATERAL (
+    SELECT jsonb_agg(
+        jsonb_build_object('organizationSid', p.organization_sid, 'phone', p.phone)
+    ) AS phone_numbers
+    FROM organization.phone_number AS p
+    WHERE p.organization_sid = o.sid
+) AS ph ON true
+WHERE o.sid = p_sid
+$$
+"""
+
+REFRESH_DOCUMENT_FUNCTION = """
+CREATE FUNCTION organization.refresh_organization_document(p_sid uuid)
+RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+    document jsonb;
+BEGIN
+    IF p_sid IS NULL THEN
+        RETURN;
+    END IF;
+
+    document := organization.build_organization_document(p_sid);
+
+    IF document IS NULL THEN
+        DELETE FROM organization.organization_document WHERE sid = p_sid;
+    ELSE
+        INSERT INTO organization.organization_document (sid, payload, created_at, updated_at)
+        VALUES (p_sid, document, timezone('utc', now()), timezone('utc', now()))
+        ON CONFLICT (sid) DO UPDATE
+        SET payload = EXCLUDED.payload, updated_at = EXCLUDED.updated_at
+        WHERE organization_document.payload IS DISTINCT FROM EXCLUDED.payload;
+    END IF;
+END
+$$
+"""
+
+ON_ORGANIZATION_FUNCTION = """
+CREATE FUNCTION organization.organization_document_on_organization()
+RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM organization.refresh_organization_document(NEW.sid);
+    RETURN NULL;
+END
+$$
+"""
+
+# Shared by phone_number, organization_address and organization_activity
+ON_CHILD_FUNCTION = """
+CREATE FUNCTION organization.organization_document_on_child()
+RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM organization.refresh_organization_document(NEW.organization_sid);
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM organization.refresh_organization_document(OLD.organization_sid);
+    ELSE
+        PERFORM organization.refresh_organization_document(NEW.organization_sid);
+        IF NEW.organization_sid IS DISTINCT FROM OLD.organization_sid THEN
+            PERFORM organization.refresh_organization_document(OLD.organization_sid);
+        END IF;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+ON_BUILDING_FUNCTION = """
+CREATE FUNCTION organization.organization_document_on_building()
+RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM organization.refresh_organization_document(oa.organization_sid)
+    FROM organization.organization_address AS oa
+    WHERE oa.building_sid = NEW.sid;
+    RETURN NULL;
+END
+$$
+"""
+
+ON_ACTIVITY_FUNCTION = """
+CREATE FUNCTION organization.organization_document_on_activity()
+RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM organization.refresh_organization_document(oa.organization_sid)
+    FROM organization.organization_activity AS oa
+    WHERE oa.activity_sid = NEW.sid;
+    RETURN NULL;
+END
+$$
+"""
+
+TRIGGERS = (
+    (
+        "organization.organization",
+        "AFTER INSERT OR UPDATE OF name",
+        "organization.organization_document_on_organization",
+    ),
+    (
+        "organization.phone_number",
+        "AFTER INSERT OR UPDATE OR DELETE",
+        "organization.organization_document_on_child",
+    ),
+    (
+        "organization.organization_address",
+        "AFTER INSERT OR UPDATE OR DELETE",
+        "organization.organization_document_on_child",
+    ),
+    (
+        "organization.organization_activity",
+        "AFTER INSERT OR UPDATE OR DELETE",
+        "organization.organization_document_on_child",
+    ),
+    (
+        "building.building",
+        "AFTER UPDATE OF address, latitude, longitude",
+        "organization.organization_document_on_building",
+    ),
+    (
+        "activity.activity",
+        "AFTER UPDATE OF name, parent_sid",
+        "organization.organization_document_on_activity",
+    ),
+)
+
+FUNCTIONS = (
+    "organization.organization_document_on_activity()",
+    "organization.organization_document_on_building()",
+    "organization.organization_document_on_child()",
+    "organization.organization_document_on_organization()",
+    "organization.refresh_organization_document(uuid)",
+    "organization.build_organization_document(uuid)",
+)
+
+
+def upgrade() -> None:
+    op.create_table('organization_document',
+    sa.Column('sid', sa.Uuid(), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['sid'], ['organization.organization.sid'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('sid'),
+    schema='organization',
+    comment='organization module schema'
+    )
+
+    for function in (
+        BUILD_DOCUMENT_FUNCTION,
+        REFRESH_DOCUMENT_FUNCTION,
+        ON_ORGANIZATION_FUNCTION,
+        ON_CHILD_FUNCTION,
+        ON_BUILDING_FUNCTION,
+        ON_ACTIVITY_FUNCTION,
+    ):
+        op.execute(sa.text(function))
+
+    for table, event, function in TRIGGERS:
+        op.execute(sa.text(
+            f"CREATE TRIGGER organization_document_sync {event} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION {function}()"
+        ))
+
+    # Backfill
+    op.execute(sa.text(
+        "SELECT organization.refresh_organization_document(sid) "
+        "FROM organization.organization"
+    ))
+
+
+def downgrade() -> None:
+    for table, _, _ in TRIGGERS:
+        op.execute(sa.text(f"DROP TRIGGER IF EXISTS organization_document_sync ON {table}"))
+
+    for function in FUNCTIONS:
+        op.execute(sa.text(f"DROP FUNCTION IF EXISTS {function}"))
+
+    op.drop_table('organization_document', schema='organization')
@@ -0,0 +1,34 @@
+"""Add organization search refresh state
+
+Revision ID: de365e02adb8
+Revises: b41f8e0c6d27
+Create Date: 2026-10-19 04:26:50.006560
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'de365e02adb8'
+down_revision: Union[str, None] = 'b41f8e0c6d27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('organization_search_refresh',
+    sa.Column('sid', sa.String(length=63), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('sid'),
+    schema='organization',
+    comment='organization module schema'
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('organization_search_refresh', schema='organization')
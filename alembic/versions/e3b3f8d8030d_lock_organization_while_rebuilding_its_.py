@@ -0,0 +1,154 @@
+"""Lock organization while rebuilding its document
+
+Revision ID: e3b3f8d8030d
+Revises: de365e02adb8
+Create Date: 2026-10-19 04:28:38.624813
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b3f8d8030d'
+down_revision: Union[str, None] = 'de365e02adb8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Concurrent writes to the rows of one organization rebuild its document one after
+# the other: the lock is held until commit, and the document is built in a statement
+# started after it is taken, so under READ COMMITTED it sees the committed writes of
+# the previous holder. FOR NO KEY UPDATE does not conflict with the FOR KEY SHARE
+# locks the foreign key checks of the child inserts hold on the organization row.
+REFRESH_DOCUMENT_FUNCTION = """
+CREATE OR REPLACE FUNCTION organization.refresh_organization_document(p_sid uuid)
+RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+    document jsonb;
+BEGIN
+    IF p_sid IS NULL THEN
+        RETURN;
+    END IF;
+
+    PERFORM 1 FROM organization.organization WHERE sid = p_sid FOR NO KEY UPDATE;
+
+    document := organization.build_organization_document(p_sid);
+
+    IF document IS NULL THEN
+        DELETE FROM organization.organization_document WHERE sid = p_sid;
+    ELSE
+        INSERT INTO organization.organization_document (sid, payload, created_at, updated_at)
+        VALUES (p_sid, document, timezone('utc', now()), timezone('utc', now()))
+        ON CONFLICT (sid) DO UPDATE
+        SET payload = EXCLUDED.payload, updated_at = EXCLUDED.updated_at
+        WHERE organization_document.payload IS DISTINCT FROM EXCLUDED.payload;
+    END IF;
+END
+$$
+"""
+
+# Organizations of a building or an activity are locked in one order, so two such
+# updates do not deadlock
+ON_BUILDING_FUNCTION = """
+CREATE OR REPLACE FUNCTION organization.organization_document_on_building()
+RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM organization.refresh_organization_document(oa.organization_sid)
+    FROM organization.organization_address AS oa
+    WHERE oa.building_sid = NEW.sid
+    ORDER BY oa.organization_sid;
+    RETURN NULL;
+END
+$$
+"""
+
+ON_ACTIVITY_FUNCTION = """
+CREATE OR REPLACE FUNCTION organization.organization_document_on_activity()
+RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM organization.refresh_organization_document(oa.organization_sid)
+    FROM organization.organization_activity AS oa
+    WHERE oa.activity_sid = NEW.sid
+    ORDER BY oa.organization_sid;
+    RETURN NULL;
+END
+$$
+"""
+
+
+# Definitions of b41f8e0c6d27, restored on downgrade
+PREVIOUS_REFRESH_DOCUMENT_FUNCTION = """
+CREATE OR REPLACE FUNCTION organization.refresh_organization_document(p_sid uuid)
+RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+    document jsonb;
+BEGIN
+    IF p_sid IS NULL THEN
+        RETURN;
+    END IF;
+
+    document := organization.build_organization_document(p_sid);
+
+    IF document IS NULL THEN
+        DELETE FROM organization.organization_document WHERE sid = p_sid;
+    ELSE
+        INSERT INTO organization.organization_document (sid, payload, created_at, updated_at)
+        VALUES (p_sid, document, timezone('utc', now()), timezone('utc', now()))
+        ON CONFLICT (sid) DO UPDATE
+        SET payload = EXCLUDED.payload, updated_at = EXCLUDED.updated_at
+        WHERE organization_document.payload IS DISTINCT FROM EXCLUDED.payload;
+    END IF;
+END
+$$
+"""
+
+PREVIOUS_ON_BUILDING_FUNCTION = """
+CREATE OR REPLACE FUNCTION organization.organization_document_on_building()
+RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM organization.refresh_organization_document(oa.organization_sid)
+    FROM organization.organization_address AS oa
+    WHERE oa.building_sid = NEW.sid;
+    RETURN NULL;
+END
+$$
+"""
+
+PREVIOUS_ON_ACTIVITY_FUNCTION = """
+CREATE OR REPLACE FUNCTION organization.organization_document_on_activity()
+RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM organization.refresh_organization_document(oa.organization_sid)
+    FROM organization.organization_activity AS oa
+    WHERE oa.activity_sid = NEW.sid;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    for function in (
+        REFRESH_DOCUMENT_FUNCTION,
+        ON_BUILDING_FUNCTION,
+        ON_ACTIVITY_FUNCTION,
+    ):
+        op.execute(sa.text(function))
+
+
+def downgrade() -> None:
+    for function in (
+        PREVIOUS_REFRESH_DOCUMENT_FUNCTION,
+        PREVIOUS_ON_BUILDING_FUNCTION,
+        PREVIOUS_ON_ACTIVITY_FUNCTION,
+    ):
+        op.execute(sa.text(function))
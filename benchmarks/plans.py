@@ -0,0 +1,444 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import argparse
+import asyncio
+import difflib
+import json
+import subprocess
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Any, NamedTuple
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.client.storages.postgres.core.deps import get_postgres_engine
+from src.client.storages.postgres.core.engine import SKIP_SLOW_QUERY_LOG
+from src.common.constants.deps import get_error_codes
+from src.common.logger.constants.deps import get_logger_config
+from src.common.logger.deps import get_base_logger, get_logger_manager
+from src.common.schemas import Pagination
+from src.modules.activity.adapters.repositories.postgres import ActivityPsqlRepo
+from src.modules.activity.models import ActivityModel
+from src.modules.building.adapters.caches.memory.deps import get_building_tile_cache
+from src.modules.building.adapters.repositories.postgres import BuildingPsqlRepo
+from src.modules.building.filters import BuildingCoordinatesFilter
+from src.modules.building.models import BuildingModel
+from src.modules.organization.adapters.repositories.postgres import (
+    OrganizationPsqlRepo,
+    OrganizationSearchPsqlRepo,
+)
+from src.modules.organization.filters import OrganizationQueryFilter
+from src.modules.organization.models import (
+    OrganizationActivityModel,
+    OrganizationAddressModel,
+    OrganizationModel,
+)
+from src.modules.organization.models.organization import PhoneNumberModel
+from src.modules.organization.usecases.constants.consts import CustomOptions
+
+# Tables growing with the number of organizations, never to be read with a Seq Scan
+LARGE_TABLES = (
+    OrganizationModel.__table__.name,
+    OrganizationAddressModel.__table__.name,
+    OrganizationActivityModel.__table__.name,
+    PhoneNumberModel.__table__.name,
+    BuildingModel.__table__.name,
+    "organization_search",
+)
+# Side in degrees of the bounding boxes
+BOX_SIDE = 0.01
+
+
+class PlanCase(NamedTuple):
+    """Repository call whose statements are explained, with its plan expectations."""
+
+    call: Callable[[AsyncSession], Awaitable[Any]]
+    indexes: tuple[str, ...] = ()
+    seq_scan_tables: tuple[str, ...] = LARGE_TABLES
+
+
+class QueryPlanCheck:
+    """
+    Checks the plans of the repository queries against a filled PostgreSQL.
+
+    Every case runs a repository method, captures the statements it executes,
+    including the eager loads, and explains them with EXPLAIN (FORMAT JSON). A case
+    fails when a statement reads a large table with a Seq Scan or when an expected
+    index is not used by any of them.
+
+    Plans are reduced to their node types, relations and indexes. With
+    ``--snapshot`` they are compared to a previous run and any difference fails the
+    check, rerun with ``--update`` to accept the plans of a changed schema.
+
+    The arguments are the most selective ones of the database, such as the rarest
+    name, as the planner rightly prefers a Seq Scan for values matching a large share
+    of a table. Fill the database with ``make generate-data`` first, the organization
+    search view included. ``tests/test_plans.py`` runs the check with pytest and is
+    skipped when the database is not reachable or empty.
+    """
+
+    def __init__(self):
+        """Initialize the check."""
+
+        # Statements are not timed, slow query log lines would mix with the report
+        self._engine = (
+            get_postgres_engine().get().execution_options(**{SKIP_SLOW_QUERY_LOG: True})
+        )
+        self._session_factory = async_sessionmaker(
+            bind=self._engine, expire_on_commit=False
+        )
+        self._logger = get_base_logger(get_logger_manager(get_logger_config()))
+
+    async def _get_arguments(self) -> dict[str, Any]:
+        """
+        Select deterministic and selective arguments of the cases.
+
+        :return: Arguments keyed by name.
+        """
+
+        linked = (
+            select(OrganizationActivityModel.activity_sid, ActivityModel.name)
+            .join(
+                ActivityModel,
+                ActivityModel.sid == OrganizationActivityModel.activity_sid,
+            )
+            .group_by(OrganizationActivityModel.activity_sid, ActivityModel.name)
+            .order_by(func.count(), OrganizationActivityModel.activity_sid)
+            .limit(1)
+        )
+        queries = {
+            "sid": select(OrganizationModel.sid)
+            .order_by(OrganizationModel.sid)
+            .limit(1),
+            "name": select(OrganizationModel.name)
+            .group_by(OrganizationModel.name)
+            .order_by(func.count(), OrganizationModel.name)
+            .limit(1),
+            "activity": linked,
+            "root": select(ActivityModel.name)
+            .where(ActivityModel.parent_sid.is_(None))
+            .order_by(ActivityModel.name)
+            .limit(1),
+            "location": select(BuildingModel.latitude, BuildingModel.longitude)
+            .order_by(BuildingModel.sid)
+            .limit(1),
+        }
+
+        async with self._engine.connect() as connection:
+            rows = {
+                name: (await connection.execute(query)).first()
+                for name, query in queries.items()
+            }
+
+        if None in rows.values():
+            msg = "The directory is empty, fill it with make generate-data first"
+            raise RuntimeError(msg)
+        return rows
+
+    def _get_cases(self, arguments: dict[str, Any]) -> dict[str, PlanCase]:
+        """
+        Build the checked repository calls.
+
+        :param arguments: Arguments selected from the database.
+        :return: Cases keyed by name.
+        """
+
+        errors = get_error_codes()
+        options = tuple(CustomOptions.full())
+        activity_sid, activity_name = arguments["activity"]
+        latitude, longitude = arguments["location"]
+        bbox = {
+            "latitude_gte": latitude - BOX_SIDE / 2,
+            "latitude_lte": latitude + BOX_SIDE / 2,
+            "longitude_gte": longitude - BOX_SIDE / 2,
+            "longitude_lte": longitude + BOX_SIDE / 2,
+        }
+
+        def organization_repo(db: AsyncSession) -> OrganizationPsqlRepo:
+            return OrganizationPsqlRepo(db=db, errors=errors, logger=self._logger)
+
+        return {
+            "organization.get": PlanCase(
+                call=lambda db: organization_repo(db).get(
+                    sid=arguments["sid"][0], custom_options=options
+                ),
+                indexes=(
+                    "organization_pkey",
+                    "ix_organization_phone_number_organization_sid",
+                ),
+            ),
+            "organization.search_by_name": PlanCase(
+                call=lambda db: organization_repo(db).search_by_name(
+                    name=arguments["name"][0], custom_options=options
+                ),
+                indexes=("ix_organization_organization_name_trgm",),
+            ),
+            "organization.get_by_activity_sids": PlanCase(
+                call=lambda db: organization_repo(db).get_by_activity_sids(
+                    activity_sids=[activity_sid], custom_options=options
+                ),
+                indexes=("ix_organization_organization_activity_activity_sid",),
+            ),
+            "organization.get_filtered_page[bbox]": PlanCase(
+                call=lambda db: organization_repo(db).get_filtered_page(
+                    filters=OrganizationQueryFilter(**bbox),
+                    pagination=Pagination(),
+                    custom_options=options,
+                ),
+                indexes=("ix_building_building_latitude_longitude",),
+            ),
+            "organization.get_filtered_page[activity]": PlanCase(
+                call=lambda db: organization_repo(db).get_filtered_page(
+                    filters=OrganizationQueryFilter(activity_name=activity_name),
+                    pagination=Pagination(),
+                    custom_options=options,
+                ),
+                indexes=("ix_organization_organization_activity_activity_sid",),
+            ),
+            "building.get_filtered_all": PlanCase(
+                call=lambda db: BuildingPsqlRepo(
+                    db=db,
+                    errors=errors,
+                    logger=self._logger,
+                    tile_cache=get_building_tile_cache(),
+                ).get_filtered_all(
+                    filters=BuildingCoordinatesFilter(
+                        latitudeGte=bbox["latitude_gte"],
+                        latitudeLte=bbox["latitude_lte"],
+                        longitudeGte=bbox["longitude_gte"],
+                        longitudeLte=bbox["longitude_lte"],
+                    )
+                ),
+                indexes=("ix_building_building_latitude_longitude",),
+            ),
+            "activity.get_all_descendant_activity_sids": PlanCase(
+                call=lambda db: ActivityPsqlRepo(
+                    db=db, errors=errors, logger=self._logger
+                ).get_all_descendant_activity_sids(activity_name=arguments["root"][0]),
+            ),
+            "organization_search.search_payloads_by_name": PlanCase(
+                call=lambda db: OrganizationSearchPsqlRepo(
+                    db=db, errors=errors, logger=self._logger
+                ).search_payloads_by_name(name=arguments["name"][0]),
+                indexes=("ix_organization_organization_search_name_trgm",),
+            ),
+        }
+
+    async def _capture(self, case: PlanCase) -> list[tuple[str, Any]]:
+        """
+        Run a case and capture the statements it executes.
+
+        :param case: Checked case.
+        :return: Statements with their bound parameters.
+        """
+
+        statements = []
+
+        def on_executed(
+            _connection: object,
+            _cursor: object,
+            statement: str,
+            parameters: Any,  # noqa: ANN401
+            *_: object,
+        ) -> None:
+            # Skips the setup statements of connections opened meanwhile
+            if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+                statements.append((statement, parameters))
+
+        sync_engine = self._engine.sync_engine
+        async with self._session_factory() as db:
+            event.listen(sync_engine, "after_cursor_execute", on_executed)
+            try:
+                await case.call(db)
+            finally:
+                event.remove(sync_engine, "after_cursor_execute", on_executed)
+                await db.rollback()
+
+        return statements
+
+    async def _explain(self, statements: list[tuple[str, Any]]) -> list[dict]:
+        """
+        Explain captured statements with the values they were executed with.
+
+        :param statements: Statements with their bound parameters.
+        :return: Root plan node of every statement.
+        """
+
+        plans = []
+        async with self._engine.connect() as connection:
+            for statement, parameters in statements:
+                result = await connection.exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) {statement}", parameters
+                )
+                plan = result.scalar()
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                plans.append(plan[0]["Plan"])
+            await connection.rollback()
+
+        return plans
+
+    @classmethod
+    def _walk(cls, node: dict, depth: int = 0) -> Iterator[tuple[int, dict]]:
+        """
+        Iterate over a plan node and its descendants, depth first.
+
+        :param node: Plan node.
+        :param depth: Depth of the node.
+        :return: Depth and node pairs.
+        """
+
+        yield depth, node
+        for child in node.get("Plans", ()):
+            yield from cls._walk(child, depth + 1)
+
+    @classmethod
+    def _describe(cls, plan: dict) -> list[str]:
+        """
+        Reduce a plan to its shape, without the estimates varying between runs.
+
+        :param plan: Root plan node.
+        :return: One indented line per node.
+        """
+
+        lines = []
+        for depth, node in cls._walk(plan):
+            line = node["Node Type"]
+            if "Join Type" in node and node["Join Type"] != "Inner":
+                line += f" ({node['Join Type']})"
+            if "Relation Name" in node:
+                line += f" on {node['Relation Name']}"
+            if "Index Name" in node:
+                line += f" using {node['Index Name']}"
+            lines.append("  " * depth + line)
+        return lines
+
+    @classmethod
+    def _get_violations(cls, case: PlanCase, plans: list[dict]) -> list[str]:
+        """
+        Check the plans of a case against its expectations.
+
+        :param case: Checked case.
+        :param plans: Root plan node of every statement of the case.
+        :return: Description of every violated expectation.
+        """
+
+        nodes = [node for plan in plans for _, node in cls._walk(plan)]
+        violations = sorted(
+            {
+                f"Seq Scan on {node['Relation Name']}"
+                for node in nodes
+                if node["Node Type"] == "Seq Scan"
+                and node.get("Relation Name") in case.seq_scan_tables
+            }
+        )
+
+        used = {node["Index Name"] for node in nodes if "Index Name" in node}
+        violations.extend(
+            f"Index {index} not used" for index in case.indexes if index not in used
+        )
+        return violations
+
+    @staticmethod
+    def _get_commit() -> str | None:
+        """Get the commit of the working tree, None outside of a git checkout."""
+
+        try:
+            result = subprocess.run(  # noqa: S603
+                ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return result.stdout.strip()
+
+    async def _run(self, snapshot: Path | None, update: bool) -> dict[str, Any]:
+        """Main check method"""
+
+        try:
+            cases = self._get_cases(await self._get_arguments())
+            shapes, results = {}, {}
+            for name, case in cases.items():
+                plans = await self._explain(await self._capture(case))
+                shapes[name] = [self._describe(plan) for plan in plans]
+                results[name] = {
+                    "statements": len(plans),
+                    "violations": self._get_violations(case, plans),
+                }
+        finally:
+            await self._engine.dispose()
+
+        if snapshot is not None and update:
+            snapshot.write_text(json.dumps(shapes, indent=2) + "\n")
+        elif snapshot is not None and snapshot.exists():
+            previous = json.loads(snapshot.read_text())
+            for name, shape in shapes.items():
+                diff = list(
+                    difflib.unified_diff(
+                        self._flatten(previous.get(name, [])),
+                        self._flatten(shape),
+                        lineterm="",
+                        n=1,
+                    )
+                )
+                if diff:
+                    results[name]["diff"] = diff
+
+        return {
+            "commit": self._get_commit(),
+            "cases": results,
+            "failed": [
+                name
+                for name, result in results.items()
+                if result["violations"] or result.get("diff")
+            ],
+        }
+
+    @staticmethod
+    def _flatten(shape: list[list[str]]) -> list[str]:
+        """
+        Join the plans of a case into one listing numbering the statements.
+
+        :param shape: Plan lines of every statement.
+        :return: Lines of the listing.
+        """
+
+        return [
+            line
+            for number, lines in enumerate(shape, start=1)
+            for line in (f"#{number}", *lines)
+        ]
+
+    @classmethod
+    async def run(cls) -> None:
+        """Class method to run the check"""
+
+        parser = argparse.ArgumentParser(description=cls.__doc__.splitlines()[1])
+        parser.add_argument(
+            "--snapshot",
+            type=Path,
+            help="JSON file of the plan shapes to compare with, if it exists.",
+        )
+        parser.add_argument(
+            "--update",
+            action="store_true",
+            help="Write the plan shapes to the snapshot instead of comparing them.",
+        )
+        args = parser.parse_args()
+        if args.update and args.snapshot is None:
+            parser.error("--update requires --snapshot")
+
+        check = cls()
+        report = await check._run(snapshot=args.snapshot, update=args.update)
+        print(json.dumps(report, indent=2, default=str))  # noqa: T201
+
+        if report["failed"]:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(QueryPlanCheck.run())
@@ -0,0 +1,303 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.client.storages.postgres.core.deps import get_postgres_engine
+from src.client.storages.postgres.init.deps import get_psql_data_generator
+from src.common.constants.deps import get_error_codes
+from src.common.logger.constants.deps import get_logger_config
+from src.common.logger.deps import get_base_logger, get_logger_manager
+from src.modules.activity.adapters.repositories.postgres import ActivityPsqlRepo
+from src.modules.activity.models import ActivityModel
+from src.modules.building.adapters.caches.memory.deps import get_building_tile_cache
+from src.modules.building.adapters.repositories.postgres import BuildingPsqlRepo
+from src.modules.building.filters import BuildingCoordinatesFilter
+from src.modules.building.models import BuildingModel
+from src.modules.organization.adapters.repositories.postgres import (
+    OrganizationPsqlRepo,
+)
+from src.modules.organization.models import OrganizationModel
+
+# Rows sampled from the database as arguments of the benchmarked calls
+SAMPLE_SIZE = 1_000
+
+
+class RepositoriesBenchmark:
+    """
+    Times repository methods against a local PostgreSQL seeded at several scales.
+
+    Every method runs on its own with random arguments sampled from the database and
+    is reported with p50/p95/p99 latencies and rows returned per second, as JSON
+    tagged with the commit, so runs of different commits can be compared.
+
+    Scales are seeded with the synthetic data generator, which truncates the
+    directory tables, point the POSTGRES_* settings to a dedicated database. The
+    organization documents and the search view are not rebuilt, the benchmarked
+    methods read neither of them.
+    """
+
+    def __init__(self, iterations: int, boxes: Sequence[float], seed: int):
+        """
+        Initialize the benchmark.
+
+        :param iterations: Timed calls per method.
+        :param boxes: Sides in degrees of the boxes of ``get_filtered_all``.
+        :param seed: Seed of the generated rows and of the random arguments.
+        """
+
+        self._iterations = iterations
+        self._boxes = boxes
+        self._data_seed = seed
+        self._random = random.Random(seed)  # noqa: S311
+        self._session_factory = async_sessionmaker(
+            bind=get_postgres_engine().get(), expire_on_commit=False
+        )
+        self._logger = get_base_logger(get_logger_manager(get_logger_config()))
+
+    async def _seed(self, organizations: int) -> float:
+        """
+        Replace the directory tables with generated rows.
+
+        :param organizations: Number of organizations.
+        :return: Seeding time in seconds.
+        """
+
+        generator = get_psql_data_generator(
+            organizations=organizations, seed=self._data_seed
+        )
+        started = time.perf_counter()
+        await generator.generate(truncate=True)
+        return time.perf_counter() - started
+
+    @staticmethod
+    async def _sample_arguments() -> dict[str, list]:
+        """
+        Sample the arguments of the benchmarked calls from the database.
+
+        Names are sampled among the distinct ones, so most searches look for a given
+        organization rather than for the most frequent name tokens.
+
+        :return: Sampled rows keyed by kind.
+        """
+
+        names = select(OrganizationModel.name).distinct().subquery()
+        queries = {
+            "organizations": select(OrganizationModel.sid),
+            "names": select(names.c.name),
+            "roots": select(ActivityModel.name).where(
+                ActivityModel.parent_sid.is_(None)
+            ),
+            "activities": select(ActivityModel.sid).where(
+                ActivityModel.parent_sid.is_not(None)
+            ),
+            "locations": select(BuildingModel.latitude, BuildingModel.longitude),
+        }
+
+        async with get_postgres_engine().get().connect() as connection:
+            return {
+                kind: (
+                    await connection.execute(
+                        query.order_by(func.random()).limit(SAMPLE_SIZE)
+                    )
+                ).all()
+                for kind, query in queries.items()
+            }
+
+    @staticmethod
+    async def _count_organizations() -> int:
+        """Count the organizations of the database."""
+
+        async with get_postgres_engine().get().connect() as connection:
+            result = await connection.execute(
+                select(func.count()).select_from(OrganizationModel)
+            )
+            return result.scalar_one()
+
+    async def _measure(
+        self,
+        call: Callable[[AsyncSession], Awaitable[Any]],
+    ) -> dict[str, float]:
+        """
+        Time repeated calls of a repository method, each in its own transaction with
+        an empty identity map.
+
+        :param call: Coroutine function calling the method with random arguments.
+        :return: Latency percentiles in milliseconds and rows returned per second.
+        """
+
+        latencies, rows = [], 0
+        async with self._session_factory() as db:
+            for iteration in range(self._iterations + self._iterations // 10):
+                started = time.perf_counter()
+                result = await call(db)
+                elapsed = time.perf_counter() - started
+                await db.rollback()
+                db.expunge_all()
+
+                if iteration < self._iterations // 10:
+                    continue  # Warm up
+                latencies.append(elapsed)
+                if isinstance(result, Sequence):
+                    rows += len(result)
+                elif result is not None:
+                    rows += 1
+
+        quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        return {
+            "iterations": len(latencies),
+            "p50_ms": round(quantiles[49] * 1000, 3),
+            "p95_ms": round(quantiles[94] * 1000, 3),
+            "p99_ms": round(quantiles[98] * 1000, 3),
+            "rows_per_call": round(rows / len(latencies), 1),
+            "rows_per_s": round(rows / sum(latencies), 1),
+        }
+
+    def _get_cases(
+        self, arguments: dict[str, list]
+    ) -> dict[str, Callable[[AsyncSession], Awaitable[Any]]]:
+        """
+        Build the benchmarked calls with their random arguments.
+
+        :param arguments: Rows sampled from the database keyed by kind.
+        :return: Coroutine functions keyed by case name.
+        """
+
+        errors = get_error_codes()
+        rnd = self._random
+
+        def organization_repo(db: AsyncSession) -> OrganizationPsqlRepo:
+            return OrganizationPsqlRepo(db=db, errors=errors, logger=self._logger)
+
+        def pick(kind: str) -> Any:  # noqa: ANN401
+            return rnd.choice(arguments[kind])[0]
+
+        cases = {
+            "get": lambda db: organization_repo(db).get(sid=pick("organizations")),
+            "get_by_name": lambda db: organization_repo(db).get_by_name(
+                name=pick("names")
+            ),
+            "search_by_name": lambda db: organization_repo(db).search_by_name(
+                name=pick("names")
+            ),
+            "get_by_activity_sids": lambda db: organization_repo(
+                db
+            ).get_by_activity_sids(activity_sids=[pick("activities")]),
+            "get_all_descendant_activity_sids": lambda db: ActivityPsqlRepo(
+                db=db, errors=errors, logger=self._logger
+            ).get_all_descendant_activity_sids(activity_name=pick("roots")),
+        }
+
+        for side in self._boxes:
+
+            def get_filtered_all(db: AsyncSession, side: float = side) -> Awaitable:
+                latitude, longitude = rnd.choice(arguments["locations"])
+                return BuildingPsqlRepo(
+                    db=db,
+                    errors=errors,
+                    logger=self._logger,
+                    tile_cache=get_building_tile_cache(),
+                ).get_filtered_all(
+                    filters=BuildingCoordinatesFilter(
+                        latitudeGte=latitude - side / 2,
+                        latitudeLte=latitude + side / 2,
+                        longitudeGte=longitude - side / 2,
+                        longitudeLte=longitude + side / 2,
+                    )
+                )
+
+            cases[f"get_filtered_all[box={side}]"] = get_filtered_all
+
+        return cases
+
+    async def _run_scale(self, organizations: int | None) -> dict[str, Any]:
+        """
+        Seed a scale, if given, and time every case on it.
+
+        :param organizations: Number of organizations to seed, None to reuse the
+                seeded database.
+        :return: Results of the scale.
+        """
+
+        report: dict[str, Any] = {}
+        if organizations is not None:
+            report["seed_s"] = round(await self._seed(organizations), 1)
+        report["organizations"] = await self._count_organizations()
+
+        arguments = await self._sample_arguments()
+        report["results"] = {
+            case: await self._measure(call)
+            for case, call in self._get_cases(arguments).items()
+        }
+        return report
+
+    @staticmethod
+    def _get_commit() -> str | None:
+        """Get the commit of the working tree, None outside of a git checkout."""
+
+        try:
+            result = subprocess.run(  # noqa: S603
+                ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return result.stdout.strip()
+
+    async def _run(self, scales: Sequence[int] | None) -> dict[str, Any]:
+        """Main benchmark method"""
+
+        try:
+            runs = [await self._run_scale(scale) for scale in scales or (None,)]
+        finally:
+            await get_postgres_engine().get().dispose()
+
+        return {
+            "commit": self._get_commit(),
+            "iterations": self._iterations,
+            "runs": runs,
+        }
+
+    @classmethod
+    async def run(cls) -> None:
+        """Class method to run the benchmark"""
+
+        parser = argparse.ArgumentParser(description=cls.__doc__.splitlines()[1])
+        parser.add_argument(
+            "--scales",
+            type=int,
+            nargs="*",
+            help="Numbers of organizations to seed and benchmark, such as 10000 "
+            "1000000 10000000. Truncates the tables! Without it the already filled "
+            "database is benchmarked.",
+        )
+        parser.add_argument("--iterations", type=int, default=200)
+        parser.add_argument("--boxes", type=float, nargs="+", default=[0.01, 0.05, 0.2])
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--output", type=Path, help="File receiving the report.")
+        args = parser.parse_args()
+
+        benchmark = cls(iterations=args.iterations, boxes=args.boxes, seed=args.seed)
+        report = json.dumps(await benchmark._run(args.scales), indent=2)
+        if args.output is not None:
+            args.output.write_text(report + "\n")
+        print(report)  # noqa: T201
+
+
+if __name__ == "__main__":
+    asyncio.run(RepositoriesBenchmark.run())
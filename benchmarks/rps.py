@@ -0,0 +1,132 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from uuid import uuid4
+
+import httpx
+
+from src.config.settings.deps import get_settings
+from src.modules.organization.schemas import OrganizationFull
+from src.modules.organization.usecases.deps import get_organization_usecase
+from src.server.core.app import app
+
+ORGANIZATION = {
+    "sid": str(uuid4()),
+    "name": "ООО Рога и Копыта",
+    "address": {
+        "organizationSid": str(uuid4()),
+        "buildingSid": str(uuid4()),
+        "office": "101",
+        "building": {
+            "sid": str(uuid4()),
+            "address": "г. Москва, ул. Ленина, д. 1",
+            "latitude": 55.751244,
+            "longitude": 37.618423,
+        },
+    },
+    "activities": [{"sid": str(uuid4()), "name": "Еда", "parentSid": None}],
+    "phoneNumbers": [{"organizationSid": str(uuid4()), "phone": "2-222-222"}],
+}
+
+
+class StaticOrganizationUC:
+    """Organization usecase answering without a database, so only the stack is timed"""
+
+    async def get_by_sid(self, **_: object) -> OrganizationFull:
+        return OrganizationFull.model_validate(ORGANIZATION)
+
+
+class RequestsPerSecondBenchmark:
+    """
+    Measures requests per second of the in-process application on GET
+    /organizations/{sid}.
+
+    The organization usecase is replaced with a static one, so the numbers reflect
+    routing, middleware, dependency resolution and serialization, not the database.
+    """
+
+    def __init__(self, requests: int, concurrency: int):
+        """
+        Initialize the benchmark.
+
+        :param requests: Total number of requests to send.
+        :param concurrency: Number of concurrent clients.
+        """
+
+        self._requests = requests
+        self._concurrency = concurrency
+        self._path = (
+            f"{get_settings().project.API_V1_STR}/organizations/{ORGANIZATION['sid']}"
+        )
+        self._headers = {"X-APIKey-Auth": get_settings().project.SECRET_API_KEY}
+
+    async def _worker(self, client: httpx.AsyncClient, count: int) -> list[float]:
+        """
+        Send requests one after another.
+
+        :param client: HTTP client bound to the application.
+        :param count: Number of requests to send.
+        :return: Latencies of the requests in seconds.
+        """
+
+        latencies = []
+        for _ in range(count):
+            started = time.perf_counter()
+            response = await client.get(self._path, headers=self._headers)
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+        return latencies
+
+    async def _run(self) -> dict[str, float]:
+        """Main benchmark method"""
+
+        app.dependency_overrides[get_organization_usecase] = StaticOrganizationUC
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            await self._worker(client, count=100)  # Warm up
+
+            per_worker = self._requests // self._concurrency
+            started = time.perf_counter()
+            results = await asyncio.gather(
+                *(
+                    self._worker(client, count=per_worker)
+                    for _ in range(self._concurrency)
+                )
+            )
+            elapsed = time.perf_counter() - started
+
+        latencies = sorted(latency for result in results for latency in result)
+        quantiles = statistics.quantiles(latencies, n=100)
+        return {
+            "requests": len(latencies),
+            "concurrency": self._concurrency,
+            "rps": round(len(latencies) / elapsed, 1),
+            "p50_ms": round(quantiles[49] * 1000, 3),
+            "p99_ms": round(quantiles[98] * 1000, 3),
+        }
+
+    @classmethod
+    async def run(cls) -> None:
+        """Class method to run the benchmark"""
+
+        parser = argparse.ArgumentParser(description=cls.__doc__.splitlines()[1])
+        parser.add_argument("--requests", type=int, default=10_000)
+        parser.add_argument("--concurrency", type=int, default=16)
+        args = parser.parse_args()
+
+        benchmark = cls(requests=args.requests, concurrency=args.concurrency)
+        print(json.dumps(await benchmark._run(), indent=2))  # noqa: T201
+
+
+if __name__ == "__main__":
+    asyncio.run(RequestsPerSecondBenchmark.run())
@@ -0,0 +1,138 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import argparse
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from src.common.serializers import JSONSerializer
+from src.modules.organization.schemas import OrganizationFull
+
+
+class SerializationBenchmark:
+    """
+    Measures per-object cost of turning ORM rows into a JSON response body.
+
+    ``before`` is the default FastAPI path: ``model_validate`` in the service, then
+    re-validation against the route response model, ``jsonable_encoder`` and
+    ``json.dumps``. ``after`` is ``model_construct_trusted`` in the service and a
+    precompiled serializer dumping straight to bytes.
+    """
+
+    def __init__(self, objects: int, rounds: int):
+        """
+        Initialize the benchmark.
+
+        :param objects: Number of organizations per response.
+        :param rounds: Number of timed rounds, the best one is reported.
+        """
+
+        self._objects = objects
+        self._rounds = rounds
+        self._rows = [self._make_row() for _ in range(objects)]
+        self._field = create_model_field(
+            name="Response_bench", type_=list[OrganizationFull], mode="serialization"
+        )
+        self._serializer = JSONSerializer()
+        self._serializer.precompile(list[OrganizationFull])
+
+    @staticmethod
+    def _make_row() -> SimpleNamespace:
+        """Build an ORM-like organization row with its relationships loaded."""
+
+        organization_sid = uuid4()
+        building = SimpleNamespace(
+            sid=uuid4(),
+            address="г. Москва, ул. Ленина, д. 1",
+            latitude=55.751244,
+            longitude=37.618423,
+        )
+        return SimpleNamespace(
+            sid=organization_sid,
+            name="ООО Рога и Копыта",
+            address=SimpleNamespace(
+                organization_sid=organization_sid,
+                building_sid=building.sid,
+                office="101",
+                building=building,
+            ),
+            activities=[
+                SimpleNamespace(sid=uuid4(), name=name, parent_sid=uuid4())
+                for name in ("Еда", "Мясная продукция")
+            ],
+            phone_numbers=[
+                SimpleNamespace(organization_sid=organization_sid, phone=phone)
+                for phone in ("2-222-222", "8-923-666-13-13")
+            ],
+        )
+
+    async def _before(self) -> bytes:
+        """Serialize rows through the default validating path."""
+
+        items = [OrganizationFull.model_validate(row) for row in self._rows]
+        content = await serialize_response(
+            field=self._field, response_content=items, is_coroutine=True
+        )
+        return JSONResponse(content=content).body
+
+    async def _after(self) -> bytes:
+        """Serialize rows through the trusted path."""
+
+        items = [OrganizationFull.model_construct_trusted(row) for row in self._rows]
+        return self._serializer.response(items, list[OrganizationFull]).body
+
+    async def _measure(self, func) -> float:  # noqa: ANN001
+        """
+        Measure the best per-object time of a serialization path.
+
+        :param func: Coroutine function serializing all rows.
+        :return: Microseconds per object.
+        """
+
+        best = float("inf")
+        for _ in range(self._rounds):
+            started = time.perf_counter()
+            await func()
+            best = min(best, time.perf_counter() - started)
+        return best / self._objects * 1_000_000
+
+    async def _run(self) -> dict[str, float]:
+        """Main benchmark method"""
+
+        if json.loads(await self._before()) != json.loads(await self._after()):
+            msg = "Serialization paths produce different documents"
+            raise RuntimeError(msg)
+
+        before = await self._measure(self._before)
+        after = await self._measure(self._after)
+        return {
+            "objects": self._objects,
+            "before_us_per_object": round(before, 2),
+            "after_us_per_object": round(after, 2),
+            "speedup": round(before / after, 2),
+        }
+
+    @classmethod
+    async def run(cls) -> None:
+        """Class method to run the benchmark"""
+
+        parser = argparse.ArgumentParser(description=cls.__doc__.splitlines()[1])
+        parser.add_argument("--objects", type=int, default=1_000)
+        parser.add_argument("--rounds", type=int, default=20)
+        args = parser.parse_args()
+
+        benchmark = cls(objects=args.objects, rounds=args.rounds)
+        print(json.dumps(await benchmark._run(), indent=2))  # noqa: T201
+
+
+if __name__ == "__main__":
+    asyncio.run(SerializationBenchmark.run())
@@ -6,4 +6,10 @@ alembic upgrade head
 
 python3 scripts/initializer.py
 
-python3 run.py
\ No newline at end of file
+# Snapshots of the previous run would be summed into the new counters
+if [ -n "$METRICS_MULTIPROCESS_DIR" ]; then
+    rm -rf "$METRICS_MULTIPROCESS_DIR"
+    mkdir -p "$METRICS_MULTIPROCESS_DIR"
+fi
+
+python3 run.py
@@ -27,7 +27,7 @@ logger = logging.getLogger(__name__)
     after=after_log(logger, logging.WARNING),
 )
 async def init() -> None:
-    PostgresSessionContextManager.set_session_context(1)
+    PostgresSessionContextManager.open_session_context()
 
     session_provider = get_postgres_session_provider()
 
@@ -40,7 +40,7 @@ async def init() -> None:
         logger.error(e)  # noqa: TRY400
         raise e  # noqa: TRY201
     finally:
-        await db.close()
+        await PostgresSessionContextManager.close_session_context()
 
 
 async def main() -> None:
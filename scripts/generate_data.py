@@ -0,0 +1,116 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import argparse
+import asyncio
+import logging
+import time
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.client.storages.postgres.core.deps import get_postgres_engine
+from src.client.storages.postgres.init.deps import get_psql_data_generator
+from src.common.constants.deps import get_error_codes
+from src.common.logger.constants.deps import get_logger_config
+from src.common.logger.deps import get_logger_manager, get_organization_logger
+from src.modules.organization.adapters.repositories.postgres import (
+    OrganizationDocumentPsqlRepo,
+    OrganizationSearchPsqlRepo,
+)
+
+
+class DataGenerator:
+    """
+    Fills the directory with a reproducible synthetic dataset for load and scale
+    testing.
+
+    Rows are written with COPY with triggers off, then the organization documents
+    are rebuilt and the search view is refreshed, unless ``--skip-derived`` is given.
+    Turning triggers off takes the owner of the tables, such as the migration role.
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        """
+        Initialize the generator.
+
+        :param args: Parsed command line arguments.
+        """
+
+        self._args = args
+        self._logger = logging.getLogger(__name__)
+
+    async def _rebuild_derived(self) -> None:
+        """Rebuild the organization documents and refresh the search view"""
+
+        session_factory = async_sessionmaker(bind=get_postgres_engine().get())
+        logger = get_organization_logger(
+            manager=get_logger_manager(config=get_logger_config())
+        )
+
+        async with session_factory() as db:
+            await OrganizationDocumentPsqlRepo(
+                db=db, errors=get_error_codes(), logger=logger
+            ).rebuild()
+        async with session_factory() as db:
+            await OrganizationSearchPsqlRepo(
+                db=db, errors=get_error_codes(), logger=logger
+            ).refresh()
+
+    async def _generate(self) -> None:
+        """Main generation method"""
+
+        generator = get_psql_data_generator(
+            organizations=self._args.organizations,
+            fan_out=self._args.fan_out,
+            max_phones=self._args.max_phones,
+            max_activities=self._args.max_activities,
+            zipf_exponent=self._args.zipf_exponent,
+            seed=self._args.seed,
+        )
+
+        try:
+            started = time.perf_counter()
+            written = await generator.generate(truncate=self._args.truncate)
+            elapsed = time.perf_counter() - started
+            self._logger.info(
+                "Written %s in %.1f s, %.0f rows/min",
+                written,
+                elapsed,
+                sum(written.values()) / elapsed * 60,
+            )
+
+            if not self._args.skip_derived:
+                await self._rebuild_derived()
+        finally:
+            await get_postgres_engine().get().dispose()
+
+    @classmethod
+    async def run(cls) -> None:
+        """Class method to run the generation"""
+
+        parser = argparse.ArgumentParser(description=cls.__doc__.splitlines()[1])
+        parser.add_argument("--organizations", type=int, default=10_000)
+        parser.add_argument("--fan-out", type=int, default=10)
+        parser.add_argument("--max-phones", type=int, default=3)
+        parser.add_argument("--max-activities", type=int, default=3)
+        parser.add_argument("--zipf-exponent", type=float, default=1.1)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--truncate",
+            action="store_true",
+            help="Empty the directory tables first.",
+        )
+        parser.add_argument(
+            "--skip-derived",
+            action="store_true",
+            help="Do not rebuild organization documents and the search view.",
+        )
+
+        generator = cls(parser.parse_args())
+        await generator._generate()
+
+
+if __name__ == "__main__":
+    asyncio.run(DataGenerator.run())
@@ -1,4 +1,3 @@
-import random
 import sys
 from pathlib import Path
 
@@ -20,18 +19,15 @@ class DatabasesInitializer:
     async def _init_psql() -> None:
         """Initialize PostgreSQL database"""
 
-        id_context = random.randint(1, 100000)  # noqa: S311
+        PostgresSessionContextManager.open_session_context()
 
-        PostgresSessionContextManager.set_session_context(id_context)
-
-        session_provider = get_postgres_session_provider()
-
-        async for db in get_db(session_provider=session_provider):
+        try:
+            db = await get_db(session_provider=get_postgres_session_provider())
             psql_initializer = await get_psql_initializer(db=db)
 
             await psql_initializer.init()
-
-        PostgresSessionContextManager.remove_session_context()
+        finally:
+            await PostgresSessionContextManager.close_session_context()
 
     async def _initialize(self) -> None:
         """Main initialization method"""
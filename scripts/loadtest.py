@@ -0,0 +1,601 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import subprocess
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+from sqlalchemy import func, select
+
+from src.client.storages.postgres.core.deps import get_postgres_engine
+from src.config.settings.deps import get_settings
+from src.modules.activity.models import ActivityModel
+from src.modules.building.models import BuildingModel
+from src.modules.organization.models import OrganizationModel
+from src.server.core.app import app
+
+# Bits of the linear part of the histogram buckets, values are kept with a relative
+# error under 1 / 2 ** (SUB_BUCKET_BITS - 1), three significant digits
+SUB_BUCKET_BITS = 11
+# Percentiles of the latency reports
+PERCENTILES = (50, 75, 90, 95, 99, 99.9, 99.99)
+# Keys sampled from the database per kind
+SAMPLE_SIZE = 1_000
+# Default share of every endpoint in the request mix
+MIX = {
+    "organization": 40,
+    "organization_by_name": 15,
+    "organization_by_activity": 10,
+    "organization_by_descendant_activity": 5,
+    "organization_query": 10,
+    "building_organizations": 10,
+    "buildings_by_coordinates": 10,
+}
+# Side in degrees of the boxes of the coordinates endpoint
+BOX_SIDE = 0.01
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the manner of HdrHistogram: values are counted
+    in buckets whose width grows with their magnitude, so memory stays bounded while
+    every percentile is reported with three significant digits.
+    """
+
+    def __init__(self):
+        """Initialize an empty histogram of microsecond values."""
+
+        self.counts: Counter[int] = Counter()
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    @staticmethod
+    def _get_bucket(value: int) -> int:
+        """
+        Get the lowest value of the bucket counting a value.
+
+        :param value: Value in microseconds.
+        :return: Lowest equivalent value.
+        """
+
+        shift = max(value.bit_length() - SUB_BUCKET_BITS, 0)
+        return value >> shift << shift
+
+    @staticmethod
+    def _get_highest(bucket: int) -> int:
+        """
+        Get the highest value counted by a bucket.
+
+        :param bucket: Lowest equivalent value of the bucket.
+        :return: Highest equivalent value.
+        """
+
+        return bucket + (1 << max(bucket.bit_length() - SUB_BUCKET_BITS, 0)) - 1
+
+    def record(self, seconds: float) -> None:
+        """
+        Count a latency.
+
+        :param seconds: Latency in seconds.
+        """
+
+        value = round(seconds * 1_000_000)
+        self.counts[self._get_bucket(value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add the values of another histogram.
+
+        :param other: Merged histogram.
+        """
+
+        self.counts.update(other.counts)
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def get_percentiles(self) -> dict[str, float]:
+        """
+        Get the latency percentiles, mean and maximum.
+
+        :return: Values in milliseconds keyed by name, empty without values.
+        """
+
+        if not self.count:
+            return {}
+
+        buckets = sorted(self.counts.items())
+        cumulative = list(itertools.accumulate(count for _, count in buckets))
+        report = {}
+        for percentile in PERCENTILES:
+            rank = max(round(percentile / 100 * self.count), 1)
+            index = next(i for i, total in enumerate(cumulative) if total >= rank)
+            value = min(self._get_highest(buckets[index][0]), self.max)
+            report[f"p{percentile:g}"] = round(value / 1000, 3)
+
+        report["mean"] = round(self.total / self.count / 1000, 3)
+        report["max"] = round(self.max / 1000, 3)
+        return report
+
+
+class EndpointStats:
+    """Latencies and outcomes of the requests of an endpoint."""
+
+    def __init__(self):
+        """Initialize empty statistics."""
+
+        self.histogram = LatencyHistogram()
+        self.statuses: Counter[str] = Counter()
+        self.errors = 0
+
+    def merge(self, other: "EndpointStats") -> None:
+        """
+        Add the statistics of another endpoint.
+
+        :param other: Merged statistics.
+        """
+
+        self.histogram.merge(other.histogram)
+        self.statuses.update(other.statuses)
+        self.errors += other.errors
+
+    def get_report(self, elapsed: float) -> dict[str, Any]:
+        """
+        Get the report of the requests.
+
+        :param elapsed: Measured time in seconds.
+        :return: Requests, throughput, error rate, statuses and latencies.
+        """
+
+        requests = self.histogram.count
+        return {
+            "requests": requests,
+            "rps": round(requests / elapsed, 1),
+            "error_rate": round(self.errors / requests, 4) if requests else 0.0,
+            "statuses": dict(sorted(self.statuses.items())),
+            "latency_ms": self.histogram.get_percentiles(),
+        }
+
+
+class LoadTest:
+    """
+    Drives the organization and building endpoints with a weighted mix of requests.
+
+    The application runs in-process behind an ASGI transport, or is reached over a
+    socket with ``--url``. Keys are sampled from the database, or read from the
+    ``--keys`` file when it exists, and are picked with a Zipf skew so a few hot
+    organizations, names and areas get most of the traffic, as in production.
+
+    Reports HDR-style latency percentiles, throughput and error rates per endpoint,
+    and with ``--baseline`` flags the regressions against a previous report, exiting
+    with status 1 if any, so it can gate a pipeline.
+    """
+
+    def __init__(self, args: argparse.Namespace):
+        """
+        Initialize the load test.
+
+        :param args: Parsed command line arguments.
+        """
+
+        self._args = args
+        self._random = random.Random(args.seed)  # noqa: S311
+        self._prefix = get_settings().project.API_V1_STR
+        self._headers = {"X-APIKey-Auth": get_settings().project.SECRET_API_KEY}
+        self._endpoints: dict[str, Callable[[], tuple[str, dict[str, Any]]]] = {}
+
+    @staticmethod
+    async def _sample_keys() -> dict[str, list]:
+        """
+        Sample the request keys from the database.
+
+        :return: Sampled values keyed by kind.
+        """
+
+        queries = {
+            "organizations": select(OrganizationModel.sid, OrganizationModel.name),
+            "activities": select(ActivityModel.name),
+            "buildings": select(
+                BuildingModel.sid, BuildingModel.latitude, BuildingModel.longitude
+            ),
+        }
+
+        try:
+            async with get_postgres_engine().get().connect() as connection:
+                keys = {
+                    kind: (
+                        await connection.execute(
+                            query.order_by(func.random()).limit(SAMPLE_SIZE)
+                        )
+                    ).all()
+                    for kind, query in queries.items()
+                }
+        finally:
+            await get_postgres_engine().get().dispose()
+
+        return {
+            "organizations": [[str(sid), name] for sid, name in keys["organizations"]],
+            "activities": [name for (name,) in keys["activities"]],
+            "buildings": [
+                [str(sid), latitude, longitude]
+                for sid, latitude, longitude in keys["buildings"]
+            ],
+        }
+
+    async def _load_keys(self) -> dict[str, list]:
+        """
+        Read the request keys from the keys file, or sample them and write the file.
+
+        :return: Keys keyed by kind.
+        """
+
+        path: Path | None = self._args.keys
+        if path is not None and path.exists():
+            return json.loads(path.read_text())
+
+        keys = await self._sample_keys()
+        if path is not None:
+            path.write_text(json.dumps(keys, ensure_ascii=False))
+        return keys
+
+    def _get_picker(self, values: Sequence[Any]) -> Callable[[], Any]:
+        """
+        Build a Zipf-skewed picker of values, the first ones being the hottest.
+
+        :param values: Candidate values in random order.
+        :return: Function returning a value.
+        """
+
+        if not values:
+            msg = "No keys to build requests from, is the database filled?"
+            raise RuntimeError(msg)
+
+        weights = [1 / rank**self._args.skew for rank in range(1, len(values) + 1)]
+        cum_weights = list(itertools.accumulate(weights))
+        return lambda: self._random.choices(values, cum_weights=cum_weights)[0]
+
+    def _set_endpoints(self, keys: dict[str, list]) -> None:
+        """
+        Build the request factories of the endpoints.
+
+        :param keys: Request keys keyed by kind.
+        """
+
+        organization = self._get_picker(keys["organizations"])
+        activity = self._get_picker(keys["activities"])
+        building = self._get_picker(keys["buildings"])
+
+        def coordinates() -> dict[str, float]:
+            _, latitude, longitude = building()
+            return {
+                "latitudeGte": latitude - BOX_SIDE / 2,
+                "latitudeLte": latitude + BOX_SIDE / 2,
+                "longitudeGte": longitude - BOX_SIDE / 2,
+                "longitudeLte": longitude + BOX_SIDE / 2,
+            }
+
+        endpoints = {
+            "organization": lambda: (f"/organizations/{organization()[0]}", {}),
+            "organization_by_name": lambda: (
+                "/organizations/search/name",
+                {"name": organization()[1]},
+            ),
+            "organization_by_activity": lambda: (
+                "/organizations/search/activity",
+                {"activityName": activity()},
+            ),
+            "organization_by_descendant_activity": lambda: (
+                "/organizations/search/activity/descendant",
+                {"activityName": activity()},
+            ),
+            "organization_query": lambda: (
+                "/organizations/query",
+                {"name": organization()[1], "limit": 20},
+            ),
+            "building_organizations": lambda: (
+                f"/buildings/{building()[0]}/organizations",
+                {},
+            ),
+            "buildings_by_coordinates": lambda: (
+                "/buildings/coordinates",
+                coordinates(),
+            ),
+        }
+        self._endpoints = {name: endpoints[name] for name in self._args.mix}
+
+    async def _worker(
+        self, client: httpx.AsyncClient, deadline: float
+    ) -> dict[str, EndpointStats]:
+        """
+        Send requests one after another until the deadline.
+
+        :param client: HTTP client bound to the application.
+        :param deadline: ``time.perf_counter`` value to stop at.
+        :return: Statistics keyed by endpoint.
+        """
+
+        names = list(self._endpoints)
+        weights = [self._args.mix[name] for name in names]
+        stats = {name: EndpointStats() for name in names}
+
+        while time.perf_counter() < deadline:
+            name = self._random.choices(names, weights=weights)[0]
+            path, params = self._endpoints[name]()
+
+            started = time.perf_counter()
+            try:
+                response = await client.get(
+                    self._prefix + path, params=params, headers=self._headers
+                )
+            except httpx.HTTPError as exc:
+                status, error = type(exc).__name__, True
+            else:
+                status, error = str(response.status_code), response.is_error
+            elapsed = time.perf_counter() - started
+
+            stats[name].histogram.record(elapsed)
+            stats[name].statuses[status] += 1
+            stats[name].errors += error
+
+        return stats
+
+    async def _load(
+        self, client: httpx.AsyncClient, duration: float
+    ) -> tuple[float, list[dict[str, EndpointStats]]]:
+        """
+        Run the concurrent workers for a duration.
+
+        :param client: HTTP client bound to the application.
+        :param duration: Duration in seconds.
+        :return: Measured time in seconds and statistics of every worker.
+        """
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                self._worker(client, deadline=started + duration)
+                for _ in range(self._args.concurrency)
+            )
+        )
+        return time.perf_counter() - started, results
+
+    @asynccontextmanager
+    async def _get_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Get a client of the application, started in-process without ``--url``.
+
+        :return: HTTP client.
+        """
+
+        limits = httpx.Limits(max_connections=self._args.concurrency)
+        timeout = httpx.Timeout(self._args.timeout)
+        if self._args.url is not None:
+            async with httpx.AsyncClient(
+                base_url=self._args.url, limits=limits, timeout=timeout
+            ) as client:
+                yield client
+            return
+
+        async with (
+            app.router.lifespan_context(app),
+            httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://loadtest",
+                timeout=timeout,
+            ) as client,
+        ):
+            yield client
+
+    def _get_report(
+        self, elapsed: float, results: list[dict[str, EndpointStats]]
+    ) -> dict[str, Any]:
+        """
+        Merge the worker statistics into the report.
+
+        :param elapsed: Measured time in seconds.
+        :param results: Statistics of every worker.
+        :return: Report of the run.
+        """
+
+        endpoints = {name: EndpointStats() for name in self._endpoints}
+        for result in results:
+            for name, stats in result.items():
+                endpoints[name].merge(stats)
+        total = EndpointStats()
+        for stats in endpoints.values():
+            total.merge(stats)
+
+        return {
+            "commit": self._get_commit(),
+            "target": self._args.url or "in-process",
+            "concurrency": self._args.concurrency,
+            "skew": self._args.skew,
+            "duration_s": round(elapsed, 1),
+            "total": total.get_report(elapsed),
+            "endpoints": {
+                name: stats.get_report(elapsed)
+                for name, stats in endpoints.items()
+                if stats.histogram.count
+            },
+        }
+
+    def _compare(
+        self, report: dict[str, Any], baseline: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Compare a report with a baseline.
+
+        Latency percentiles and throughput regress when they change by more than
+        the tolerance, the error rate when it grows by more than a percentage point.
+
+        :param report: Report of the run.
+        :param baseline: Report of the baseline run.
+        :return: Compared metrics and the list of regressions.
+        """
+
+        tolerance = self._args.tolerance
+        sections = {"total": (report["total"], baseline["total"])} | {
+            name: (stats, baseline["endpoints"][name])
+            for name, stats in report["endpoints"].items()
+            if name in baseline["endpoints"]
+        }
+
+        comparison, regressions = {}, []
+        for section, (current, previous) in sections.items():
+            metrics = {
+                f"latency_ms.{key}": (current["latency_ms"][key], value, 1)
+                for key, value in previous["latency_ms"].items()
+                if key in ("p50", "p95", "p99") and key in current["latency_ms"]
+            }
+            metrics["rps"] = (current["rps"], previous["rps"], -1)
+
+            compared = {}
+            for metric, (value, previous_value, sign) in metrics.items():
+                change = (
+                    (value - previous_value) / previous_value if previous_value else 0
+                )
+                compared[metric] = {
+                    "baseline": previous_value,
+                    "current": value,
+                    "change": round(change, 4),
+                }
+                if change * sign > tolerance:
+                    regressions.append(f"{section}.{metric}")
+
+            error_rate = current["error_rate"] - previous["error_rate"]
+            compared["error_rate"] = {
+                "baseline": previous["error_rate"],
+                "current": current["error_rate"],
+                "change": round(error_rate, 4),
+            }
+            if error_rate > 0.01:  # noqa: PLR2004
+                regressions.append(f"{section}.error_rate")
+            comparison[section] = compared
+
+        return {
+            "tolerance": tolerance,
+            "metrics": comparison,
+            "regressions": regressions,
+        }
+
+    @staticmethod
+    def _get_commit() -> str | None:
+        """Get the commit of the working tree, None outside of a git checkout."""
+
+        try:
+            result = subprocess.run(  # noqa: S603
+                ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return result.stdout.strip()
+
+    async def _run(self) -> dict[str, Any]:
+        """Main load test method"""
+
+        self._set_endpoints(await self._load_keys())
+
+        async with self._get_client() as client:
+            if self._args.warmup:
+                await self._load(client, self._args.warmup)
+            elapsed, results = await self._load(client, self._args.duration)
+
+        report = self._get_report(elapsed, results)
+        if self._args.baseline is not None:
+            report["comparison"] = self._compare(
+                report, json.loads(self._args.baseline.read_text())
+            )
+        return report
+
+    @staticmethod
+    def _parse_mix(value: str) -> tuple[str, int]:
+        """
+        Parse an endpoint share of the mix.
+
+        :param value: ``endpoint=weight`` argument.
+        :return: Endpoint and weight.
+        """
+
+        name, _, weight = value.partition("=")
+        if name not in MIX or not weight.isdigit():
+            msg = f"expected endpoint=weight with an endpoint among {', '.join(MIX)}"
+            raise argparse.ArgumentTypeError(msg)
+        return name, int(weight)
+
+    @classmethod
+    async def run(cls) -> None:
+        """Class method to run the load test"""
+
+        parser = argparse.ArgumentParser(description=cls.__doc__.splitlines()[1])
+        parser.add_argument(
+            "--url",
+            help="Base URL of a running server, such as http://localhost:8000. "
+            "Without it the application runs in-process.",
+        )
+        parser.add_argument("--concurrency", type=int, default=16)
+        parser.add_argument("--duration", type=float, default=30, help="Seconds.")
+        parser.add_argument("--warmup", type=float, default=5, help="Seconds.")
+        parser.add_argument("--timeout", type=float, default=10, help="Seconds.")
+        parser.add_argument(
+            "--mix",
+            type=cls._parse_mix,
+            nargs="+",
+            default=list(MIX.items()),
+            help="Weighted endpoints, such as organization=80 "
+            "buildings_by_coordinates=20.",
+        )
+        parser.add_argument(
+            "--skew",
+            type=float,
+            default=1.1,
+            help="Zipf exponent of the key popularity, 0 for uniform keys.",
+        )
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--keys",
+            type=Path,
+            help="JSON file of the request keys, written from the database if "
+            "missing, so runs against other hosts reuse the same keys.",
+        )
+        parser.add_argument("--output", type=Path, help="File receiving the report.")
+        parser.add_argument("--baseline", type=Path, help="Report to compare with.")
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.1,
+            help="Relative change of latency or throughput flagged as a regression.",
+        )
+        args = parser.parse_args()
+        args.mix = dict(args.mix)
+
+        load_test = cls(args)
+        report = await load_test._run()
+        output = json.dumps(report, indent=2, ensure_ascii=False)
+        if args.output is not None:
+            args.output.write_text(output + "\n")
+        print(output)  # noqa: T201
+
+        if report.get("comparison", {}).get("regressions"):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(LoadTest.run())
@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.client.storages.postgres.core.deps import get_postgres_engine
+from src.common.constants.deps import get_error_codes
+from src.common.logger.constants.deps import get_logger_config
+from src.common.logger.deps import get_logger_manager, get_organization_logger
+from src.modules.organization.adapters.repositories.postgres import (
+    OrganizationDocumentPsqlRepo,
+)
+
+
+class DocumentsRebuilder:
+    """Backfills organization documents and repairs drift from the source tables"""
+
+    def __init__(self):
+        self._logger = logging.getLogger(__name__)
+
+    @staticmethod
+    async def _rebuild_psql() -> int:
+        """Rebuild organization documents in PostgreSQL"""
+
+        session_factory = async_sessionmaker(bind=get_postgres_engine().get())
+
+        async with session_factory() as db:
+            repo = OrganizationDocumentPsqlRepo(
+                db=db,
+                errors=get_error_codes(),
+                logger=get_organization_logger(
+                    manager=get_logger_manager(config=get_logger_config())
+                ),
+            )
+
+            return await repo.rebuild()
+
+    async def _rebuild(self) -> None:
+        """Main rebuild method"""
+
+        self._logger.info("Rebuild organization documents")
+        written = await self._rebuild_psql()
+        self._logger.info("End rebuild organization documents, written: %d", written)
+
+    @classmethod
+    async def run(cls) -> None:
+        """Class method to run the rebuild"""
+        rebuilder = cls()
+        await rebuilder._rebuild()
+
+
+if __name__ == "__main__":
+    asyncio.run(DocumentsRebuilder.run())
@@ -1,14 +1,14 @@
 from abc import ABC, abstractmethod
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class IPostgresSessionProvider(ABC):
     """
     Abstract interface for providing PostgreSQL async sessions.
 
-    Implementations of this interface must return an active AsyncSession instance,
-    typically used within a request lifecycle or a transactional scope.
+    Implementations of this interface must return the AsyncSession of the current
+    session scope, typically opened for a request lifecycle or a transactional scope.
 
     This abstraction helps decouple database access logic from concrete session
     creation, supporting better testability and adherence to the Dependency Inversion
@@ -16,10 +16,12 @@ class IPostgresSessionProvider(ABC):
     """
 
     @abstractmethod
-    def get_session(self) -> async_scoped_session[AsyncSession]:
+    def get_session(self) -> AsyncSession:
         """
-        Retrieve an active PostgreSQL async session.
+        Retrieve the PostgreSQL async session of the current scope, creating it on
+        first use.
 
         :return: Instance of AsyncSession for executing database operations.
+        :raises ValueError: If no session scope is currently open.
         """
         ...
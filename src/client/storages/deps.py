@@ -1,7 +1,8 @@
-from collections.abc import AsyncGenerator
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.client.interfaces import IPostgresSessionProvider
 from src.client.storages import PostgresSessionProvider
@@ -9,11 +10,13 @@ from src.client.storages.postgres.core.deps import (
     get_postgres_engine,
     get_postgres_session_context_manager,
 )
+from src.client.storages.postgres.interfaces import IPostgresSessionContextManager
 
 
+@lru_cache
 def get_postgres_session_provider() -> IPostgresSessionProvider:
     """
-    Construct and return an instance of IPostgresSessionProvider.
+    Provides the worker-wide instance of IPostgresSessionProvider.
 
     This function initializes a PostgresSessionProvider with a session context manager,
     allowing it to provide context-aware PostgreSQL sessions. Typically used as a
@@ -33,21 +36,52 @@ async def get_db(
     session_provider: Annotated[
         IPostgresSessionProvider, Depends(get_postgres_session_provider)
     ],
-) -> AsyncGenerator:
+) -> AsyncSession:
     """
-    Provides a PostgreSQL database session.
+    Provides the PostgreSQL database session of the current request.
 
     This dependency can be used to inject a PostgreSQL database session into FastAPI
     routes or services that need to interact with the database.
 
-    The session is automatically closed after the request lifecycle.
+    The session is closed by PostgresContextSessionMiddleware once the request is
+    handled, and it checks out a connection only when the first statement runs.
 
     :param session_provider: The provider responsible for providing PostgreSQL sessions.
     :return: A PostgreSQL database session instance.
     """
 
-    db = session_provider.get_session()
-    try:
-        yield db
-    finally:
-        await db.close()
+    return session_provider.get_session()
+
+
+def read_only_session(
+    context_manager: Annotated[
+        IPostgresSessionContextManager, Depends(get_postgres_session_context_manager)
+    ],
+) -> None:
+    """
+    Route dependency making the session of the request read-only.
+
+    Used as ``dependencies=[Depends(read_only_session)]`` on routes that only read
+    with a method other than GET, must be resolved before ``get_db``.
+
+    :param context_manager: Manager of the current session scope.
+    """
+
+    context_manager.set_session_read_only(read_only=True)
+
+
+def read_write_session(
+    context_manager: Annotated[
+        IPostgresSessionContextManager, Depends(get_postgres_session_context_manager)
+    ],
+) -> None:
+    """
+    Route dependency making the session of the request writable.
+
+    Used as ``dependencies=[Depends(read_write_session)]`` on GET routes that write,
+    must be resolved before ``get_db``.
+
+    :param context_manager: Manager of the current session scope.
+    """
+
+    context_manager.set_session_read_only(read_only=False)
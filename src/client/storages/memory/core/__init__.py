@@ -0,0 +1 @@
+from .cache import MemoryTTLCache
@@ -0,0 +1,98 @@
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from src.client.storages.memory.interfaces import IMemoryCache
+
+
+class MemoryTTLCache(IMemoryCache):
+    """
+    Process-local LRU cache with a per-entry time to live.
+
+    Entries are evicted lazily on access once expired, and the least recently used
+    entries are dropped when the cache grows over its capacity. The cache is meant
+    to be used from a single event loop, so no locking is performed.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        """
+        Initialize the cache.
+
+        :param ttl: Default time to live of an entry in seconds.
+        :param max_entries: Maximum number of entries kept in memory.
+        """
+
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Any | None:  # noqa: ANN401
+        """
+        Retrieve a non-expired value by its key and mark it as recently used.
+
+        :param key: Cache key.
+        :return: Cached value or None if the key is missing or expired.
+        """
+
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:  # noqa: ANN401
+        """
+        Store a value and evict the least recently used entries over capacity.
+
+        :param key: Cache key.
+        :param value: Value to store.
+        :param ttl: Optional time to live in seconds, overrides the default one.
+        """
+
+        self._entries[key] = (time.monotonic() + (ttl or self._ttl), value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove a value from the cache if it is present.
+
+        :param key: Cache key.
+        """
+
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all values from the cache.
+        """
+
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get cache usage counters.
+
+        :return: Dictionary with hits, misses and the current number of entries.
+        """
+
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "entries": len(self._entries),
+        }
@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+from collections.abc import Hashable
+from typing import Any
+
+
+class IMemoryCache(ABC):
+    """
+    Abstract interface for a process-local key/value cache with entry expiration.
+
+    Implementations keep values in the memory of the current worker, so they are
+    shared between requests served by that worker but not between workers.
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Any | None:  # noqa: ANN401
+        """
+        Retrieve a non-expired value by its key.
+
+        :param key: Cache key.
+        :return: Cached value or None if the key is missing or expired.
+        """
+        ...
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:  # noqa: ANN401
+        """
+        Store a value under the given key.
+
+        :param key: Cache key.
+        :param value: Value to store.
+        :param ttl: Optional time to live in seconds, overrides the default one.
+        """
+        ...
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove a value from the cache if it is present.
+
+        :param key: Cache key.
+        """
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all values from the cache.
+        """
+        ...
+
+    @abstractmethod
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get cache usage counters.
+
+        :return: Dictionary with hits, misses and the current number of entries.
+        """
+        ...
@@ -1,3 +1,6 @@
 from .engine import PostgresEngine
-from .ext import PostgresSessionContextManager
+from .ext import PostgresSessionContextManager, PostgresSessionScope
+from .metrics import CHECKOUT_WAIT_BUCKETS, HELD_TIME_BUCKETS, PostgresConnectionMetrics
+from .pool import TimedAsyncAdaptedQueuePool
 from .schemas import PostgresSchemas
+from .slow_queries import PostgresSlowQueryLog
@@ -1,21 +1,84 @@
+from functools import lru_cache
+
 from src.client.storages.postgres.core import (
+    CHECKOUT_WAIT_BUCKETS,
+    PostgresConnectionMetrics,
     PostgresEngine,
     PostgresSessionContextManager,
+    PostgresSlowQueryLog,
 )
 from src.client.storages.postgres.interfaces import (
+    IPostgresConnectionMetrics,
     IPostgresEngine,
     IPostgresSessionContextManager,
+    IPostgresSlowQueryLog,
 )
+from src.common.logger.constants.deps import get_logger_config
+from src.common.logger.deps import get_base_logger, get_logger_manager
+from src.config.settings.deps import get_settings
+
+
+@lru_cache
+def get_postgres_connection_metrics() -> IPostgresConnectionMetrics:
+    """
+    Provides the worker-wide metrics of connection held times.
+
+    :return: PostgresConnectionMetrics instance.
+    """
 
+    return PostgresConnectionMetrics()
+
+
+@lru_cache
+def get_postgres_checkout_wait_metrics() -> IPostgresConnectionMetrics:
+    """
+    Provides the worker-wide metrics of how long checkouts wait for a connection.
+
+    :return: PostgresConnectionMetrics instance.
+    """
 
+    return PostgresConnectionMetrics(buckets=CHECKOUT_WAIT_BUCKETS)
+
+
+@lru_cache
+def get_postgres_slow_query_log() -> IPostgresSlowQueryLog:
+    """
+    Provides the worker-wide log of slow statements.
+
+    :return: PostgresSlowQueryLog instance.
+    """
+
+    settings = get_settings().postgres
+
+    return PostgresSlowQueryLog(
+        logger=get_base_logger(
+            manager=get_logger_manager(config=get_logger_config()),
+        ),
+        threshold=settings.POSTGRES_SLOW_QUERY_THRESHOLD,
+        max_entries=settings.POSTGRES_SLOW_QUERY_LOG_SIZE,
+        explain_rate=settings.POSTGRES_SLOW_QUERY_EXPLAIN_RATE,
+    )
+
+
+@lru_cache
 def get_postgres_engine() -> IPostgresEngine:
     """
-    Create and return a PostgresEngine instance implementing IPostgresEngine.
+    Provides the worker-wide PostgresEngine instance implementing IPostgresEngine.
+
+    The engine owns the connection pool, so it is created once per process and shared
+    by all requests and background jobs of the worker.
 
     :return: PostgresEngine instance.
     """
 
-    return PostgresEngine()
+    return PostgresEngine(
+        metrics=get_postgres_connection_metrics(),
+        wait_metrics=get_postgres_checkout_wait_metrics(),
+        slow_query_log=get_postgres_slow_query_log(),
+        logger=get_base_logger(
+            manager=get_logger_manager(config=get_logger_config()),
+        ),
+    )
 
 
 def get_postgres_session_context_manager() -> IPostgresSessionContextManager:
@@ -1,7 +1,41 @@
+import asyncio
+import contextvars
+import json
+import logging
+import time
+from typing import Any
+from uuid import uuid4
+
+from pydantic import PostgresDsn
+from sqlalchemy import Connection, event
+from sqlalchemy.engine import ExecutionContext
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import ConnectionPoolEntry, NullPool, QueuePool
 
-from src.client.storages.postgres.interfaces import IPostgresEngine
+from src.client.storages.postgres.core.pool import TimedAsyncAdaptedQueuePool
+from src.client.storages.postgres.interfaces import (
+    IPostgresConnectionMetrics,
+    IPostgresEngine,
+    IPostgresSlowQueryLog,
+)
 from src.config.settings.deps import get_settings
+from src.server.constants import call_context, session_context
+from src.server.metrics.timings import TimingName, record_timing
+from src.server.query_budget.budget import get_orm_load, record_query
+from src.server.tracing.span import record_statement
+
+CHECKED_OUT_AT = "checked_out_at"
+QUERY_STARTED_AT = "query_started_at"
+# Execution option keeping the statements of a connection out of the slow query log
+SKIP_SLOW_QUERY_LOG = "skip_slow_query_log"
+
+# Execution options of read sessions per POSTGRES_READ_SESSION_MODE
+READ_SESSION_OPTIONS = {
+    "read_write": {},
+    "read_only": {"postgresql_readonly": True},
+    "autocommit": {"isolation_level": "AUTOCOMMIT"},
+}
 
 
 class PostgresEngine(IPostgresEngine):
@@ -10,16 +44,281 @@ class PostgresEngine(IPostgresEngine):
     PostgreSQL.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        metrics: IPostgresConnectionMetrics,
+        wait_metrics: IPostgresConnectionMetrics,
+        slow_query_log: IPostgresSlowQueryLog,
+        logger: logging.Logger,
+    ):
         """
         Initializes the PostgresEngine with settings from the application configuration.
+
+        The read engine shares the pool of the primary one unless a replica URL is
+        configured, it only differs by the execution options of its connections.
+
+        :param metrics: Metrics receiving the time every connection is held.
+        :param wait_metrics: Metrics receiving the time every checkout waits for a
+                connection.
+        :param slow_query_log: Log receiving every executed statement.
+        :param logger: Logger instance for plan capture failures.
+        """
+
+        settings = get_settings().postgres
+        self._metrics = metrics
+        self._wait_metrics = wait_metrics
+        self._slow_query_log = slow_query_log
+        self._logger = logger
+        self._explain_timeout = settings.POSTGRES_SLOW_QUERY_EXPLAIN_TIMEOUT
+        self._explain_tasks: set[asyncio.Task] = set()
+
+        self._psql_engine = self._create_engine(settings.POSTGRES_DATABASE_URL)
+        read_engine = (
+            self._create_engine(settings.POSTGRES_READ_DATABASE_URL)
+            if settings.POSTGRES_READ_DATABASE_URL is not None
+            else self._psql_engine
+        )
+        self._read_engine = read_engine.execution_options(
+            **READ_SESSION_OPTIONS[settings.POSTGRES_READ_SESSION_MODE]
+        )
+
+    def _create_engine(self, url: PostgresDsn) -> AsyncEngine:
+        """
+        Create an engine with its own pool and held time tracking.
+
+        :param url: Database URL.
+        :return: Created AsyncEngine instance.
+        """
+
+        engine = create_async_engine(
+            url=url.unicode_string(), pool_pre_ping=True, **self._get_pool_options()
+        )
+
+        event.listen(engine.sync_engine, "checkout", self._on_checkout)
+        event.listen(engine.sync_engine, "checkin", self._on_checkin)
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._on_executed)
+
+        return engine
+
+    def _get_pool_options(self) -> dict[str, Any]:
+        """
+        Build the pool and driver options of an engine.
+
+        Behind PgBouncer in transaction pooling mode consecutive transactions of one
+        client connection may run on different server connections, so a statement
+        prepared in one of them is unknown in the next. Prepared statements get unique
+        names, so they never clash with statements other clients prepared on the same
+        server connection, and statement caches are disabled unless PgBouncer tracks
+        prepared statements itself (``max_prepared_statements``, 1.21+). PgBouncer
+        already pools server connections, so the local pool is small or absent.
+
+        :return: Keyword arguments of ``create_async_engine``.
+        """
+
+        settings = get_settings().postgres
+        connect_args: dict[str, Any] = {
+            "server_settings": {"application_name": settings.POSTGRES_APPLICATION_NAME}
+        }
+        pool_options = {
+            "poolclass": TimedAsyncAdaptedQueuePool,
+            "wait_metrics": self._wait_metrics,
+            "pool_size": settings.POOL_SIZE,
+            "max_overflow": 0,
+            "connect_args": connect_args,
+        }
+
+        if not settings.POSTGRES_PGBOUNCER:
+            return pool_options
+
+        connect_args["prepared_statement_name_func"] = (
+            lambda: f"__asyncpg_{uuid4().hex}__"
+        )
+        if not settings.POSTGRES_PGBOUNCER_PREPARED_STATEMENTS:
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+
+        if settings.POSTGRES_PGBOUNCER_POOL_SIZE == 0:
+            return {"poolclass": NullPool, "connect_args": connect_args}
+
+        pool_options["pool_size"] = settings.POSTGRES_PGBOUNCER_POOL_SIZE
+        return pool_options
+
+    @staticmethod
+    def _on_checkout(
+        _dbapi_connection: object,
+        connection_record: ConnectionPoolEntry,
+        _connection_proxy: object,
+    ) -> None:
+        """
+        Remember when a connection was checked out of the pool.
+
+        :param _dbapi_connection: DBAPI connection.
+        :param connection_record: Pool entry of the connection.
+        :param _connection_proxy: Pooled connection proxy.
+        """
+
+        connection_record.info[CHECKED_OUT_AT] = time.monotonic()
+
+    def _on_checkin(
+        self,
+        _dbapi_connection: object,
+        connection_record: ConnectionPoolEntry,
+    ) -> None:
+        """
+        Record how long a connection was held once it is returned to the pool.
+
+        :param _dbapi_connection: DBAPI connection, None if it was invalidated.
+        :param connection_record: Pool entry of the connection.
+        """
+
+        checked_out_at = connection_record.info.pop(CHECKED_OUT_AT, None)
+        if checked_out_at is not None:
+            self._metrics.observe(time.monotonic() - checked_out_at)
+
+    @staticmethod
+    def _on_execute(connection: Connection, *_: object) -> None:
         """
+        Remember when a statement was sent to the database.
 
-        self._psql_engine = create_async_engine(
-            url=get_settings().postgres.POSTGRES_DATABASE_URL.unicode_string(),
-            pool_pre_ping=True,
-            pool_size=get_settings().postgres.POOL_SIZE,
-            max_overflow=0,
+        :param connection: Connection executing the statement.
+        """
+
+        connection.info[QUERY_STARTED_AT] = time.perf_counter()
+
+    def _on_executed(
+        self,
+        connection: Connection,
+        _cursor: object,
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: ExecutionContext,
+        executemany: bool,
+    ) -> None:
+        """
+        Add the time of an executed statement to the database time of the current
+        request, keep the statement with the current span of a traced request, log it
+        if it is slow and count it against the query budget of the request.
+
+        :param connection: Connection that executed the statement.
+        :param _cursor: DBAPI cursor.
+        :param statement: Executed SQL statement.
+        :param parameters: Bound parameters of the statement.
+        :param context: Execution context of the statement.
+        :param executemany: Whether the statement ran once per parameter set.
+        """
+
+        started_at = connection.info.pop(QUERY_STARTED_AT, None)
+        if started_at is None:
+            return
+
+        duration = time.perf_counter() - started_at
+        record_timing(TimingName.DB, duration)
+        record_statement(statement, started_at, duration)
+
+        if context.execution_options.get(SKIP_SLOW_QUERY_LOG):
+            return
+
+        scope = session_context.get()
+        entry = self._slow_query_log.observe(
+            statement=statement,
+            parameters=parameters,
+            duration=duration,
+            caller=call_context.get(),
+            request_id=scope.request_id if scope is not None else None,
+        )
+        if (
+            entry is not None
+            and not executemany
+            and not self._explain_tasks
+            and self._slow_query_log.should_explain(entry)
+        ):
+            self._schedule_explain(entry, statement, parameters)
+
+        # Last, as a strict budget raises once the statement has been accounted for
+        record_query(statement, load=get_orm_load(context))
+
+    def _schedule_explain(
+        self,
+        entry: dict[str, Any],
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+    ) -> None:
+        """
+        Capture the plan of a slow statement in the background.
+
+        At most one capture runs at a time. The task runs in an empty context, so its
+        statement is neither timed nor traced as part of the request that triggered
+        it.
+
+        :param entry: Slow query log entry receiving the plan.
+        :param statement: SQL statement.
+        :param parameters: Bound parameters of the statement.
+        """
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Executed outside of the event loop, such as by migrations
+
+        task = loop.create_task(
+            self._explain(entry, statement, parameters),
+            name="slow_query_explain",
+            context=contextvars.Context(),
+        )
+        self._explain_tasks.add(task)
+        task.add_done_callback(self._explain_tasks.discard)
+
+    async def _explain(
+        self,
+        entry: dict[str, Any],
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+    ) -> None:
+        """
+        Re-run a slow statement under EXPLAIN (ANALYZE, BUFFERS) in a read-only
+        transaction that is rolled back, bounded by a statement timeout.
+
+        The isolation level is forced, so in the autocommit read session mode the
+        statement still runs in a transaction, which the read-only mode, the local
+        statement timeout and the rollback rely on.
+
+        :param entry: Slow query log entry receiving the plan.
+        :param statement: SQL statement.
+        :param parameters: Bound parameters of the statement.
+        """
+
+        try:
+            explain_engine = self._read_engine.execution_options(
+                **{SKIP_SLOW_QUERY_LOG: True}
+            )
+            async with explain_engine.connect() as connection:
+                # Set on the connection, engine options would be overridden by the
+                # ones of the read engine when connecting
+                await connection.execution_options(
+                    isolation_level="READ COMMITTED", postgresql_readonly=True
+                )
+                transaction = await connection.begin()
+                try:
+                    await connection.exec_driver_sql(
+                        "SET LOCAL statement_timeout = "
+                        f"{int(self._explain_timeout * 1000)}"
+                    )
+                    result = await connection.exec_driver_sql(
+                        f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}",
+                        parameters,
+                    )
+                    plan = result.scalar()
+                finally:
+                    await transaction.rollback()
+        except (SQLAlchemyError, OSError):
+            self._logger.warning(
+                "Failed to capture the plan of a slow query", exc_info=True
+            )
+            return
+
+        self._slow_query_log.set_plan(
+            entry, json.loads(plan) if isinstance(plan, str) else plan
         )
 
     def get(self) -> AsyncEngine:
@@ -30,3 +329,41 @@ class PostgresEngine(IPostgresEngine):
         """
 
         return self._psql_engine
+
+    def get_pool_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get the current state of the worker pools.
+
+        :return: Dictionary keyed by ``primary`` and, with a replica, ``read`` with
+                the pool class, size, idle, checked out and overflow connections.
+        """
+
+        engines = {"primary": self._psql_engine}
+        if self._read_engine.pool is not self._psql_engine.pool:
+            engines["read"] = self._read_engine
+
+        stats = {}
+        for name, engine in engines.items():
+            pool = engine.pool
+            stats[name] = {"pool_class": type(pool).__name__}
+            if isinstance(pool, QueuePool):
+                stats[name].update(
+                    size=pool.size(),
+                    checked_in=pool.checkedin(),
+                    checked_out=pool.checkedout(),
+                    overflow=pool.overflow(),
+                )
+        return stats
+
+    def get_read(self) -> AsyncEngine:
+        """
+        Retrieve the engine of read-only sessions.
+
+        Its connections start transactions with ``BEGIN READ ONLY`` or run every
+        statement in autocommit, depending on POSTGRES_READ_SESSION_MODE, and point to
+        the replica if one is configured.
+
+        :return: Configured AsyncEngine instance.
+        """
+
+        return self._read_engine
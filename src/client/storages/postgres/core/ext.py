@@ -1,50 +1,123 @@
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
 from src.client.storages.postgres.interfaces import IPostgresSessionContextManager
 from src.server.constants import session_context
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class PostgresSessionScope:
+    """
+    Request-scoped holder of the PostgreSQL session.
+
+    The session is created by the session provider on first use, so requests that
+    never reach a repository never create it.
+    """
+
+    __slots__ = ("read_only", "request_id", "session")
+
+    def __init__(self, request_id: str, *, read_only: bool = False):
+        """
+        Initialize an empty scope.
+
+        :param request_id: Identifier of the request owning the scope.
+        :param read_only: Whether the session is bound to the read-only engine.
+        """
+
+        self.request_id = request_id
+        self.read_only = read_only
+        self.session: AsyncSession | None = None
+
 
 class PostgresSessionContextManager(IPostgresSessionContextManager):
     """
-    Concrete implementation of IPostgresSessionContextManager for managing session IDs
-    within the current execution context.
-
-    This class uses a thread-local or context-local variable (`session_context`)
-    to store a PostgreSQL session identifier. It provides static methods to set,
-    retrieve, and clear the session ID. This mechanism allows different components
-    to access the current session context without directly passing the session ID
-    through function arguments.
+    Concrete implementation of IPostgresSessionContextManager for managing the
+    request-scoped session within the current execution context.
+
+    This class uses a context-local variable (`session_context`) to store a
+    PostgresSessionScope. It provides static methods to open, retrieve, and close the
+    scope. This mechanism allows different components to access the session of the
+    current request without directly passing it through function arguments.
     """
 
     @staticmethod
-    def get_session_context() -> int:
+    def get_session_context() -> PostgresSessionScope:
         """
-        Retrieve the current PostgreSQL session ID from the context.
+        Retrieve the current session scope from the context.
 
-        :return: The current session ID as an integer.
-        :raises ValueError: If no session ID is currently set in the context.
+        :return: The current PostgresSessionScope.
+        :raises ValueError: If no session scope is currently open in the context.
         """
 
-        session_id = session_context.get()
+        scope = session_context.get()
 
-        if not session_id:
+        if scope is None:
             msg = "Currently no session is available"
             raise ValueError(msg)
 
-        return session_id
+        return scope
 
     @staticmethod
-    def set_session_context(session_id: int) -> None:
+    def open_session_context(
+        request_id: str | None = None, *, read_only: bool = False
+    ) -> PostgresSessionScope:
         """
-        Set the PostgreSQL session ID into the current execution context.
+        Open a new empty session scope in the current execution context.
 
-        :param session_id: The session ID to store.
+        :param request_id: Identifier of the request, a random one if not given.
+        :param read_only: Whether the session of the scope is read-only.
+        :return: The opened PostgresSessionScope.
         """
 
-        session_context.set(session_id)
+        scope = PostgresSessionScope(
+            request_id=request_id or uuid4().hex, read_only=read_only
+        )
+        session_context.set(scope)
+        return scope
+
+    @classmethod
+    def set_session_read_only(cls, *, read_only: bool) -> None:
+        """
+        Choose whether the session of the current scope is read-only.
+
+        The engine is picked when the session is created, so the mode can only be
+        changed before the first repository asks for the session.
+
+        :param read_only: Whether the session is bound to the read-only engine.
+        :raises ValueError: If no session scope is open, or its session already exists
+                and the mode differs from the one it was created with.
+        """
+
+        scope = cls.get_session_context()
+
+        if scope.session is not None and scope.read_only != read_only:
+            msg = "Session mode can not be changed after the session is created"
+            raise ValueError(msg)
+
+        scope.read_only = read_only
 
     @staticmethod
-    def remove_session_context() -> None:
+    async def release_session_context() -> None:
+        """
+        Close the session of the current scope if it was created, returning its
+        connection to the pool. The scope stays open, so the session can still be
+        used and released again.
+        """
+
+        scope = session_context.get()
+
+        if scope is not None and scope.session is not None:
+            await scope.session.close()
+
+    @classmethod
+    async def close_session_context(cls) -> None:
         """
-        Remove the session ID from the current execution context.
+        Release the session and remove the scope from the current execution context.
         """
 
-        session_context.set(None)
+        try:
+            await cls.release_session_context()
+        finally:
+            session_context.set(None)
@@ -0,0 +1,80 @@
+import bisect
+from typing import Any
+
+from src.client.storages.postgres.interfaces import IPostgresConnectionMetrics
+
+# Upper bounds of the held time histogram buckets in seconds
+HELD_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# Waits are near zero until the pool runs dry, so the low end is finer
+CHECKOUT_WAIT_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    5.0,
+)
+
+
+class PostgresConnectionMetrics(IPostgresConnectionMetrics):
+    """
+    Worker-wide histogram of connection pool durations, such as how long pooled
+    connections are held between checkout and checkin or how long a checkout waits.
+
+    Values are fed by pool events and only read by the event loop of the worker, so
+    no locking is performed.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = HELD_TIME_BUCKETS):
+        """
+        Initialize empty metrics.
+
+        :param buckets: Sorted upper bounds of histogram buckets in seconds.
+        """
+
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    def observe(self, duration: float) -> None:
+        """
+        Record a duration.
+
+        :param duration: Duration in seconds.
+        """
+
+        self._counts[bisect.bisect_left(self._buckets, duration)] += 1
+        self._count += 1
+        self._sum += duration
+        self._max = max(self._max, duration)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get the aggregated metrics.
+
+        :return: Dictionary with the number of observations, total and maximum
+                duration in seconds and cumulative histogram buckets.
+        """
+
+        buckets = {}
+        cumulative = 0
+        for bound, count in zip(
+            (*map(str, self._buckets), "+Inf"), self._counts, strict=True
+        ):
+            cumulative += count
+            buckets[bound] = cumulative
+
+        return {
+            "count": self._count,
+            "sum": self._sum,
+            "max": self._max,
+            "buckets": buckets,
+        }
@@ -0,0 +1,69 @@
+import time
+from typing import Any
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from src.client.storages.postgres.interfaces import IPostgresConnectionMetrics
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool recording how long every checkout waits for a connection,
+    including the wait for a connection to be returned when the pool is exhausted and
+    the connect time when a new connection is opened.
+    """
+
+    def __init__(
+        self,
+        creator: Any,  # noqa: ANN401
+        wait_metrics: IPostgresConnectionMetrics,
+        **kw: Any,  # noqa: ANN401
+    ):
+        """
+        Initialize the pool.
+
+        :param creator: Callable creating DBAPI connections.
+        :param wait_metrics: Metrics receiving the checkout wait times.
+        :param kw: Keyword arguments of AsyncAdaptedQueuePool.
+        """
+
+        super().__init__(creator, **kw)
+        self._wait_metrics = wait_metrics
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        """
+        Get a connection from the queue, timing the wait.
+
+        :return: Pool entry of the checked out connection.
+        """
+
+        started = time.monotonic()
+        try:
+            return super()._do_get()
+        finally:
+            self._wait_metrics.observe(time.monotonic() - started)
+
+    def recreate(self) -> "TimedAsyncAdaptedQueuePool":
+        """
+        Create a new pool with the same configuration, used when the engine is
+        disposed.
+
+        :return: New TimedAsyncAdaptedQueuePool instance.
+        """
+
+        self.logger.info("Pool recreating")
+        return self.__class__(
+            self._creator,
+            wait_metrics=self._wait_metrics,
+            pool_size=self._pool.maxsize,
+            max_overflow=self._max_overflow,
+            pre_ping=self._pre_ping,
+            use_lifo=self._pool.use_lifo,
+            timeout=self._timeout,
+            recycle=self._recycle,
+            echo=self.echo,
+            logging_name=self._orig_logging_name,
+            reset_on_return=self._reset_on_return,
+            _dispatch=self.dispatch,
+            dialect=self._dialect,
+        )
@@ -0,0 +1,123 @@
+import logging
+import random
+from collections import deque
+from datetime import UTC, datetime
+from typing import Any
+
+from src.client.storages.postgres.interfaces import IPostgresSlowQueryLog
+
+# Bound parameters longer than this are truncated in the log
+MAX_PARAMETERS_LENGTH = 2000
+# Statements re-run under EXPLAIN ANALYZE, others may modify data
+EXPLAINABLE_PREFIXES = ("select", "with")
+
+
+class PostgresSlowQueryLog(IPostgresSlowQueryLog):
+    """
+    Worker-wide ring buffer of the statements exceeding a duration threshold.
+
+    Every slow statement is logged as a warning with its bound parameters and the
+    repository method that issued it, and kept in memory for the internal endpoint,
+    the oldest entries are dropped once the buffer is full. A sampled share of slow
+    SELECT statements is marked for plan capture.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        threshold: float | None,
+        max_entries: int,
+        explain_rate: float,
+    ):
+        """
+        Initialize an empty log.
+
+        :param logger: Logger instance for slow statement warnings.
+        :param threshold: Minimum duration in seconds of a slow statement, None to
+                log nothing.
+        :param max_entries: Maximum number of entries kept in memory.
+        :param explain_rate: Share of slow SELECT statements whose plan is captured.
+        """
+
+        self._logger = logger
+        self._threshold = threshold
+        self._explain_rate = explain_rate
+        self._entries: deque[dict[str, Any]] = deque(maxlen=max_entries)
+
+    def observe(
+        self,
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        duration: float,
+        caller: str | None,
+        request_id: str | None,
+    ) -> dict[str, Any] | None:
+        """
+        Record an executed statement if it is slow.
+
+        :param statement: SQL statement.
+        :param parameters: Bound parameters of the statement.
+        :param duration: Execution time in seconds.
+        :param caller: Decorated repository method that issued the statement.
+        :param request_id: Id of the request that issued the statement.
+        :return: Logged entry or None if the statement is not slow.
+        """
+
+        if self._threshold is None or duration < self._threshold:
+            return None
+
+        rendered_parameters = repr(parameters)
+        if len(rendered_parameters) > MAX_PARAMETERS_LENGTH:
+            rendered_parameters = rendered_parameters[:MAX_PARAMETERS_LENGTH] + "..."
+
+        entry = {
+            "occurred_at": datetime.now(tz=UTC).replace(tzinfo=None),
+            "duration": duration,
+            "statement": statement,
+            "parameters": rendered_parameters,
+            "caller": caller,
+            "request_id": request_id,
+            "plan": None,
+        }
+        self._entries.append(entry)
+
+        self._logger.warning(
+            "Slow query took %.1f ms in %s: %s; parameters: %s",
+            duration * 1000,
+            caller or "unknown caller",
+            " ".join(statement.split()),
+            rendered_parameters,
+        )
+        return entry
+
+    def should_explain(self, entry: dict[str, Any]) -> bool:
+        """
+        Decide whether the plan of a logged statement is captured.
+
+        :param entry: Logged entry.
+        :return: True if the statement is sampled and safe to re-run.
+        """
+
+        return (
+            entry["statement"].lstrip().lower().startswith(EXPLAINABLE_PREFIXES)
+            and random.random() < self._explain_rate  # noqa: S311
+        )
+
+    def set_plan(self, entry: dict[str, Any], plan: Any) -> None:  # noqa: ANN401
+        """
+        Attach a captured plan to a logged entry.
+
+        :param entry: Logged entry.
+        :param plan: EXPLAIN output in the JSON format.
+        """
+
+        entry["plan"] = plan
+
+    def get_entries(self) -> list[dict[str, Any]]:
+        """
+        Get the logged entries, the most recent first.
+
+        :return: List of entries.
+        """
+
+        return list(reversed(self._entries))
@@ -1 +1,2 @@
+from .generator import PostgresDataGenerator
 from .init import PostgresInitializer
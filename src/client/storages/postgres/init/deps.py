@@ -1,12 +1,17 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.client.storages.postgres.init import PostgresInitializer
+from src.client.storages.postgres.core.deps import get_postgres_engine
+from src.client.storages.postgres.init import PostgresDataGenerator, PostgresInitializer
 from src.client.storages.postgres.init.constants.deps import get_init_consts
-from src.client.storages.postgres.interfaces import IPostgresInitializer
+from src.client.storages.postgres.interfaces import (
+    IPostgresDataGenerator,
+    IPostgresInitializer,
+)
 from src.common.constants.deps import get_error_codes
 from src.common.logger.constants.deps import get_logger_config
 from src.common.logger.deps import (
     get_activity_logger,
+    get_base_logger,
     get_building_logger,
     get_logger_manager,
     get_organization_logger,
@@ -15,6 +20,7 @@ from src.config.settings.deps import get_settings
 from src.modules.activity.adapters.repositories.postgres.deps import (
     get_activity_psql_repo,
 )
+from src.modules.building.adapters.caches.memory.deps import get_building_tile_cache
 from src.modules.building.adapters.repositories.postgres.deps import (
     get_building_psql_repo,
 )
@@ -57,6 +63,7 @@ async def get_psql_initializer(
             db=db,
             logger=get_building_logger(manager=logger_manager),
             error_codes=errors,
+            tile_cache=get_building_tile_cache(),
         ),
         activity_psql_repo=await get_activity_psql_repo(
             db=db,
@@ -84,3 +91,36 @@ async def get_psql_initializer(
             error_codes=errors,
         ),
     )
+
+
+def get_psql_data_generator(
+    organizations: int,
+    fan_out: int = 10,
+    max_phones: int = 3,
+    max_activities: int = 3,
+    zipf_exponent: float = 1.1,
+    seed: int = 42,
+) -> IPostgresDataGenerator:
+    """
+    Provides a PostgresDataGenerator writing to the primary database.
+
+    :param organizations: Number of organizations.
+    :param fan_out: Number of root activities and of children of every activity.
+    :param max_phones: Maximum number of phones of an organization.
+    :param max_activities: Maximum number of activities of an organization.
+    :param zipf_exponent: Exponent of the Zipf distributions of names and
+            activities.
+    :param seed: Seed of the generated data.
+    :return: PostgresDataGenerator instance.
+    """
+
+    return PostgresDataGenerator(
+        engine=get_postgres_engine().get(),
+        logger=get_base_logger(manager=get_logger_manager(config=get_logger_config())),
+        organizations=organizations,
+        fan_out=fan_out,
+        max_phones=max_phones,
+        max_activities=max_activities,
+        zipf_exponent=zipf_exponent,
+        seed=seed,
+    )
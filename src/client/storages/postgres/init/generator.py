@@ -0,0 +1,442 @@
+import logging
+import math
+import random
+import time
+from collections.abc import Sequence
+from itertools import accumulate
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Table, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.client.storages.postgres.interfaces import IPostgresDataGenerator
+from src.common.utils import CustomDateTime
+from src.modules.activity.models import ActivityModel
+from src.modules.building.models import BuildingModel
+from src.modules.organization.models import (
+    OrganizationActivityModel,
+    OrganizationAddressModel,
+    OrganizationModel,
+)
+from src.modules.organization.models.organization import PhoneNumberModel
+
+# Cities the buildings are clustered around: name, latitude, longitude and
+# population in millions, which weighs the share of buildings of the city
+CITIES = (
+    ("Москва", 55.7558, 37.6173, 13.1),
+    ("Санкт-Петербург", 59.9343, 30.3351, 5.6),
+    ("Новосибирск", 55.0084, 82.9357, 1.6),
+    ("Екатеринбург", 56.8389, 60.6057, 1.5),
+    ("Казань", 55.7963, 49.1088, 1.3),
+    ("Нижний Новгород", 56.2965, 43.9361, 1.2),
+    ("Челябинск", 55.1644, 61.4368, 1.2),
+    ("Красноярск", 56.0153, 92.8932, 1.2),
+    ("Самара", 53.1959, 50.1002, 1.2),
+    ("Уфа", 54.7388, 55.9721, 1.1),
+    ("Ростов-на-Дону", 47.2357, 39.7015, 1.1),
+    ("Омск", 54.9885, 73.3242, 1.1),
+)
+# Standard deviation of the distance of a building from its city center, in degrees
+# of latitude, about 9 km
+CITY_SPREAD = 0.08
+STREETS = (
+    "Ленина",
+    "Мира",
+    "Советская",
+    "Садовая",
+    "Гагарина",
+    "Пушкина",
+    "Школьная",
+    "Центральная",
+    "Молодёжная",
+    "Лесная",
+    "Новая",
+    "Набережная",
+    "Заводская",
+    "Кирова",
+    "Московская",
+)
+# Legal forms with their weights
+LEGAL_FORMS = (("ООО", 70), ("ИП", 20), ("АО", 7), ("ПАО", 3))
+# Share of organizations with an office number
+OFFICE_SHARE = 0.7
+# Name tokens in order of popularity, rank r is drawn with a weight of 1 / r^s
+NAME_WORDS = (
+    "Сервис",
+    "Торг",
+    "Строй",
+    "Авто",
+    "Мир",
+    "Групп",
+    "Альфа",
+    "Профи",
+    "Техно",
+    "Мастер",
+    "Центр",
+    "Стандарт",
+    "Гарант",
+    "Капитал",
+    "Союз",
+    "Вектор",
+    "Лидер",
+    "Ресурс",
+    "Регион",
+    "Сибирь",
+    "Волга",
+    "Урал",
+    "Нева",
+    "Дом",
+    "Агро",
+    "Мед",
+    "Транс",
+    "Энерго",
+    "Инвест",
+    "Консалт",
+    "Логистик",
+    "Маркет",
+    "Продукт",
+    "Молоко",
+    "Мясо",
+    "Хлеб",
+    "Рога",
+    "Копыта",
+    "Оптима",
+    "Эталон",
+)
+NAME_SUFFIXES = ("", " Плюс", " Про", " Трейд", "-М", " 24")
+# Root activities, further roots are numbered
+ACTIVITY_ROOTS = (
+    "Еда",
+    "Автомобили",
+    "Строительство",
+    "Медицина",
+    "Образование",
+    "Торговля",
+    "Услуги",
+    "Транспорт",
+    "Финансы",
+    "Развлечения",
+)
+
+# Models of the generated tables
+MODELS = (
+    ActivityModel,
+    BuildingModel,
+    OrganizationModel,
+    OrganizationAddressModel,
+    PhoneNumberModel,
+    OrganizationActivityModel,
+)
+
+
+class PostgresDataGenerator(IPostgresDataGenerator):
+    """
+    Generator of a reproducible synthetic directory written with COPY.
+
+    Organization names are built from name tokens of Zipf-distributed popularity,
+    activities form a three-level tree, buildings are clustered around the centers
+    of large cities and every organization has several phones and activities, the
+    popular activities again following a Zipf distribution. Rows are generated in
+    batches and written with binary COPY into the tables of the models, in one
+    transaction with the user triggers off, so the organization documents and the
+    search view are rebuilt afterwards. Turning the triggers off takes the table
+    owner, and the foreign keys are still checked.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        logger: logging.Logger,
+        organizations: int,
+        organizations_per_building: int = 10,
+        fan_out: int = 10,
+        max_phones: int = 3,
+        max_activities: int = 3,
+        zipf_exponent: float = 1.1,
+        batch_size: int = 100_000,
+        seed: int = 42,
+    ):
+        """
+        Initialize the generator.
+
+        :param engine: Engine of the database to fill.
+        :param logger: Logger instance for progress reports.
+        :param organizations: Number of organizations.
+        :param organizations_per_building: Average number of organizations in one
+                building.
+        :param fan_out: Number of root activities and of children of every activity.
+        :param max_phones: Maximum number of phones of an organization.
+        :param max_activities: Maximum number of activities of an organization.
+        :param zipf_exponent: Exponent of the Zipf distributions, larger values
+                concentrate names and activities on the most popular ones.
+        :param batch_size: Number of organizations generated and written at once.
+        :param seed: Seed of the generated data.
+        """
+
+        self._engine = engine
+        self._logger = logger
+        self._organizations = organizations
+        self._buildings = max(organizations // organizations_per_building, 1)
+        self._fan_out = fan_out
+        self._max_phones = max_phones
+        self._max_activities = max_activities
+        self._zipf_exponent = zipf_exponent
+        self._batch_size = batch_size
+        self._random = random.Random(seed)  # noqa: S311
+        self._now = CustomDateTime.get_utc_datetime()
+
+    async def generate(self, truncate: bool = False) -> dict[str, int]:
+        """
+        Generate and write the directory.
+
+        :param truncate: Whether to empty the directory tables first.
+        :return: Number of written rows keyed by table.
+        """
+
+        written: dict[str, int] = {}
+        started = time.perf_counter()
+
+        async with self._engine.begin() as connection:
+            if truncate:
+                await self._truncate(connection)
+            # Organization documents are rebuilt in one pass, the triggers are off
+            # only within this transaction
+            await self._set_triggers(connection, enabled=False)
+
+            activities = self._get_activities()
+            await self._copy(connection, ActivityModel, activities, written)
+            # Organizations are linked to the two lower levels of the tree
+            linked_activity_sids = [row[0] for row in activities[self._fan_out :]]
+
+            building_sids = []
+            for offset in range(0, self._buildings, self._batch_size):
+                buildings = self._get_buildings(
+                    min(self._batch_size, self._buildings - offset)
+                )
+                building_sids.extend(row[0] for row in buildings)
+                await self._copy(connection, BuildingModel, buildings, written)
+
+            for offset in range(0, self._organizations, self._batch_size):
+                batch = self._get_organizations(
+                    count=min(self._batch_size, self._organizations - offset),
+                    building_sids=building_sids,
+                    activity_sids=linked_activity_sids,
+                )
+                for model, rows in batch.items():
+                    await self._copy(connection, model, rows, written)
+
+                self._logger.info(
+                    "Generated %d of %d organizations, %.0f rows/s",
+                    offset + len(batch[OrganizationModel]),
+                    self._organizations,
+                    sum(written.values()) / (time.perf_counter() - started),
+                )
+
+            await self._set_triggers(connection, enabled=True)
+
+        async with self._engine.connect() as connection:
+            await connection.execution_options(isolation_level="AUTOCOMMIT")
+            for model in MODELS:
+                await connection.execute(
+                    text(f"ANALYZE {self._get_table(model).fullname}")
+                )
+
+        return written
+
+    async def _truncate(self, connection: AsyncConnection) -> None:
+        """
+        Empty the directory tables, with the organization documents referencing them.
+
+        :param connection: Connection of the generation transaction.
+        """
+
+        tables = ", ".join(self._get_table(model).fullname for model in MODELS)
+        await connection.execute(text(f"TRUNCATE {tables} CASCADE"))
+
+    async def _set_triggers(self, connection: AsyncConnection, enabled: bool) -> None:
+        """
+        Turn the user triggers of the directory tables on or off.
+
+        :param connection: Connection of the generation transaction.
+        :param enabled: Whether the triggers fire.
+        """
+
+        action = "ENABLE" if enabled else "DISABLE"
+        for model in MODELS:
+            await connection.execute(
+                text(
+                    f"ALTER TABLE {self._get_table(model).fullname} {action} TRIGGER USER"
+                )
+            )
+
+    async def _copy(
+        self,
+        connection: AsyncConnection,
+        model: type,
+        rows: list[tuple[Any, ...]],
+        written: dict[str, int],
+    ) -> None:
+        """
+        Write rows into the table of a model with binary COPY.
+
+        :param connection: Connection of the generation transaction.
+        :param model: Model of the table.
+        :param rows: Rows in the order of the columns of the table, without the
+                computed ones.
+        :param written: Written rows keyed by table, updated in place.
+        """
+
+        table = self._get_table(model)
+        columns = [column.name for column in table.columns if column.computed is None]
+
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name, schema_name=table.schema, columns=columns, records=rows
+        )
+        written[table.fullname] = written.get(table.fullname, 0) + len(rows)
+
+    @staticmethod
+    def _get_table(model: type) -> Table:
+        """
+        Get the table of a model.
+
+        :param model: Declarative model.
+        :return: Mapped table.
+        """
+
+        return model.__table__
+
+    def _get_sid(self) -> UUID:
+        """Draw a random version 4 UUID from the seeded generator."""
+
+        return UUID(int=self._random.getrandbits(128), version=4)
+
+    def _get_zipf_weights(self, size: int) -> list[float]:
+        """
+        Get the cumulative Zipf weights of ranks.
+
+        :param size: Number of ranks.
+        :return: Cumulative weights of the ranks in order.
+        """
+
+        return list(
+            accumulate(1 / rank**self._zipf_exponent for rank in range(1, size + 1))
+        )
+
+    def _get_activities(self) -> list[tuple[Any, ...]]:
+        """
+        Generate the activity tree, roots first, then their children and the leaves.
+
+        :return: Activity rows.
+        """
+
+        roots = [
+            (
+                self._get_sid(),
+                ACTIVITY_ROOTS[i] if i < len(ACTIVITY_ROOTS) else f"Категория {i + 1}",
+                None,
+            )
+            for i in range(self._fan_out)
+        ]
+        levels = [roots]
+        for _ in range(2):
+            levels.append(
+                [
+                    (self._get_sid(), f"{name} / {i + 1}", sid)
+                    for sid, name, _ in levels[-1]
+                    for i in range(self._fan_out)
+                ]
+            )
+
+        return [
+            (sid, name, parent_sid, self._now, self._now)
+            for level in levels
+            for sid, name, parent_sid in level
+        ]
+
+    def _get_buildings(self, count: int) -> list[tuple[Any, ...]]:
+        """
+        Generate buildings clustered around the city centers.
+
+        :param count: Number of buildings.
+        :return: Building rows.
+        """
+
+        rnd = self._random
+        cities = rnd.choices(CITIES, weights=[city[3] for city in CITIES], k=count)
+
+        rows = []
+        for city, latitude, longitude, _ in cities:
+            latitude = rnd.gauss(latitude, CITY_SPREAD)  # noqa: PLW2901
+            longitude = rnd.gauss(  # noqa: PLW2901
+                longitude, CITY_SPREAD / math.cos(math.radians(latitude))
+            )
+            address = f"г. {city}, ул. {rnd.choice(STREETS)}, д. {rnd.randint(1, 200)}"
+            rows.append(
+                (
+                    self._get_sid(),
+                    address,
+                    round(latitude, 6),
+                    round(longitude, 6),
+                    self._now,
+                    self._now,
+                )
+            )
+        return rows
+
+    def _get_organizations(
+        self,
+        count: int,
+        building_sids: Sequence[UUID],
+        activity_sids: Sequence[UUID],
+    ) -> dict[type, list[tuple[Any, ...]]]:
+        """
+        Generate organizations with their address, phones and activities.
+
+        :param count: Number of organizations.
+        :param building_sids: Sids of the generated buildings.
+        :param activity_sids: Sids of the activities organizations are linked to.
+        :return: Rows keyed by model.
+        """
+
+        rnd = self._random
+        now = self._now
+        tokens = [word + suffix for suffix in NAME_SUFFIXES for word in NAME_WORDS]
+        token_weights = self._get_zipf_weights(len(tokens))
+        activity_weights = self._get_zipf_weights(len(activity_sids))
+        forms, form_weights = zip(*LEGAL_FORMS, strict=True)
+        form_weights = list(accumulate(form_weights))
+
+        organizations, addresses, phones, activities = [], [], [], []
+        for _ in range(count):
+            sid = self._get_sid()
+            words = rnd.choices(tokens, cum_weights=token_weights, k=rnd.randint(1, 2))
+            form = rnd.choices(forms, cum_weights=form_weights)[0]
+            organizations.append((sid, f'{form} "{" ".join(words)}"', now, now))
+
+            office = str(rnd.randint(1, 500)) if rnd.random() < OFFICE_SHARE else None
+            addresses.append((sid, rnd.choice(building_sids), office, now, now))
+
+            for _ in range(rnd.randint(1, self._max_phones)):
+                phone = (
+                    f"8-9{rnd.randint(0, 99):02d}-{rnd.randint(0, 999):03d}-"
+                    f"{rnd.randint(0, 99):02d}-{rnd.randint(0, 99):02d}"
+                )
+                phones.append((self._get_sid(), sid, phone, now, now))
+
+            linked = rnd.choices(
+                activity_sids,
+                cum_weights=activity_weights,
+                k=rnd.randint(1, self._max_activities),
+            )
+            activities.extend(
+                (sid, activity_sid, now, now) for activity_sid in dict.fromkeys(linked)
+            )
+
+        return {
+            OrganizationModel: organizations,
+            OrganizationAddressModel: addresses,
+            PhoneNumberModel: phones,
+            OrganizationActivityModel: activities,
+        }
@@ -1,2 +1,7 @@
-from .core import IPostgresEngine, IPostgresSessionContextManager
-from .init import IPostgresInitializer
+from .core import (
+    IPostgresConnectionMetrics,
+    IPostgresEngine,
+    IPostgresSessionContextManager,
+    IPostgresSlowQueryLog,
+)
+from .init import IPostgresDataGenerator, IPostgresInitializer
@@ -1,50 +1,160 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.ext.asyncio import AsyncEngine
 
+if TYPE_CHECKING:
+    from src.client.storages.postgres.core.ext import PostgresSessionScope
+
 
 class IPostgresSessionContextManager(ABC):
     """
     Abstract interface for managing the PostgreSQL session context.
 
-    This interface defines methods to set, retrieve, and clear the session ID
-    from the current execution context. It is useful for propagating session
-    information across different layers of the application in a decoupled way,
+    This interface defines methods to open, retrieve, and close the request-scoped
+    session holder in the current execution context. It is useful for propagating
+    the session across different layers of the application in a decoupled way,
     improving testability and adherence to the Dependency Inversion Principle.
     """
 
     @staticmethod
     @abstractmethod
-    def get_session_context() -> int:
+    def get_session_context() -> "PostgresSessionScope":
         """
-        Retrieve the current session ID from the context.
+        Retrieve the current session scope from the context.
 
-        :return: Session ID as an integer.
-        :raises ValueError: If no session is currently set.
+        :return: The current session scope.
+        :raises ValueError: If no session scope is currently open.
         """
         ...
 
     @staticmethod
     @abstractmethod
-    def set_session_context(session_id: int) -> None:
+    def open_session_context(
+        request_id: str | None = None, *, read_only: bool = False
+    ) -> "PostgresSessionScope":
+        """
+        Open a new empty session scope in the current execution context.
+
+        :param request_id: Identifier of the request, a random one if not given.
+        :param read_only: Whether the session of the scope is read-only.
+        :return: The opened session scope.
+        """
+        ...
+
+    @staticmethod
+    @abstractmethod
+    def set_session_read_only(*, read_only: bool) -> None:
+        """
+        Choose whether the session of the current scope is read-only.
+
+        :param read_only: Whether the session is bound to the read-only engine.
+        :raises ValueError: If no session scope is open or its session already exists.
         """
-        Set the session ID into the current execution context.
+        ...
 
-        :param session_id: The session ID to associate with the context.
+    @staticmethod
+    @abstractmethod
+    async def release_session_context() -> None:
+        """
+        Close the session of the current scope if it was created, returning its
+        connection to the pool.
         """
         ...
 
     @staticmethod
     @abstractmethod
-    def remove_session_context() -> None:
+    async def close_session_context() -> None:
         """
-        Remove the session ID from the current execution context.
+        Release the session and remove the scope from the current execution context.
 
         This effectively resets the context to an empty state.
         """
         ...
 
 
+class IPostgresConnectionMetrics(ABC):
+    """
+    Interface for histograms of connection pool durations, such as held or checkout
+    wait times.
+    """
+
+    @abstractmethod
+    def observe(self, duration: float) -> None:
+        """
+        Record a duration.
+
+        :param duration: Duration in seconds.
+        """
+        ...
+
+    @abstractmethod
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get the aggregated metrics.
+
+        :return: Dictionary with the number of observations, total and maximum
+                duration in seconds and cumulative histogram buckets.
+        """
+        ...
+
+
+class IPostgresSlowQueryLog(ABC):
+    """
+    Interface for a bounded log of the statements exceeding a duration threshold.
+    """
+
+    @abstractmethod
+    def observe(
+        self,
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        duration: float,
+        caller: str | None,
+        request_id: str | None,
+    ) -> dict[str, Any] | None:
+        """
+        Record an executed statement if it is slow.
+
+        :param statement: SQL statement.
+        :param parameters: Bound parameters of the statement.
+        :param duration: Execution time in seconds.
+        :param caller: Decorated repository method that issued the statement.
+        :param request_id: Id of the request that issued the statement.
+        :return: Logged entry or None if the statement is not slow.
+        """
+        ...
+
+    @abstractmethod
+    def should_explain(self, entry: dict[str, Any]) -> bool:
+        """
+        Decide whether the plan of a logged statement is captured.
+
+        :param entry: Logged entry.
+        :return: True if the statement is sampled and safe to re-run.
+        """
+        ...
+
+    @abstractmethod
+    def set_plan(self, entry: dict[str, Any], plan: Any) -> None:  # noqa: ANN401
+        """
+        Attach a captured plan to a logged entry.
+
+        :param entry: Logged entry.
+        :param plan: EXPLAIN output in the JSON format.
+        """
+        ...
+
+    @abstractmethod
+    def get_entries(self) -> list[dict[str, Any]]:
+        """
+        Get the logged entries, the most recent first.
+
+        :return: List of entries.
+        """
+        ...
+
+
 class IPostgresEngine(ABC):
     """
     Interface for a class that manages the creation and access of an asynchronous
@@ -62,3 +172,21 @@ class IPostgresEngine(ABC):
         :return: An instance of AsyncEngine for performing database operations.
         """
         ...
+
+    @abstractmethod
+    def get_read(self) -> AsyncEngine:
+        """
+        Get the engine of read-only sessions, bound to a replica if one is configured.
+
+        :return: An instance of AsyncEngine for performing read-only operations.
+        """
+        ...
+
+    @abstractmethod
+    def get_pool_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Get the current state of the worker pools.
+
+        :return: Dictionary of pool statistics keyed by pool name.
+        """
+        ...
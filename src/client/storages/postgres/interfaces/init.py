@@ -14,3 +14,20 @@ class IPostgresInitializer(ABC):
         superuser account and committing changes to the database.
         """
         ...
+
+
+class IPostgresDataGenerator(ABC):
+    """
+    Interface for a generator filling the directory tables with synthetic data for
+    load and scale testing.
+    """
+
+    @abstractmethod
+    async def generate(self, truncate: bool = False) -> dict[str, int]:
+        """
+        Generate and write the directory.
+
+        :param truncate: Whether to empty the directory tables first.
+        :return: Number of written rows keyed by table.
+        """
+        ...
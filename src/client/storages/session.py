@@ -1,14 +1,16 @@
-from sqlalchemy.ext.asyncio import (
-    AsyncSession,
-    async_scoped_session,
-    async_sessionmaker,
-)
+import time
+
+from sqlalchemy import Result, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from src.client.interfaces import IPostgresSessionProvider
 from src.client.storages.postgres.interfaces import (
     IPostgresEngine,
     IPostgresSessionContextManager,
 )
+from src.server.constants import request_timings_context
+from src.server.metrics.timings import TimingName
 
 
 class PostgresSessionProvider(IPostgresSessionProvider):
@@ -38,16 +40,62 @@ class PostgresSessionProvider(IPostgresSessionProvider):
             autocommit=False,
             autoflush=False,
         )
+        self._read_session_factory = async_sessionmaker(
+            bind=psql_engine.get_read(),
+            autocommit=False,
+            autoflush=False,
+        )
         self._context_manager = context_manager
 
-    def get_session(self) -> async_scoped_session[AsyncSession]:
+        if not event.contains(Session, "do_orm_execute", self._on_orm_execute):
+            event.listen(Session, "do_orm_execute", self._on_orm_execute)
+
+    @staticmethod
+    def _on_orm_execute(orm_execute_state: ORMExecuteState) -> Result | None:
         """
-        Creates and returns a new asynchronous session for PostgreSQL.
+        Add the ORM time of a statement executed in a request to its timings.
+
+        Async sessions prebuffer ORM results, so rows are turned into objects before
+        the execution returns. The ORM time is the time of the execution without the
+        database round trips, which is statement compilation and object hydration.
 
-        :return: A new AsyncSession instance for PostgreSQL.
+        :param orm_execute_state: State of the ORM execution.
+        :return: Result of the execution, None outside of a request to let the
+                session execute the statement itself.
         """
 
-        return async_scoped_session(
-            session_factory=self._session_factory,
-            scopefunc=self._context_manager.get_session_context,
-        )
+        timings = request_timings_context.get()
+        if timings is None:
+            return None
+
+        db_duration = timings.durations.get(TimingName.DB, 0.0)
+        started = time.perf_counter()
+        result = orm_execute_state.invoke_statement()
+        elapsed = time.perf_counter() - started
+
+        db_duration = timings.durations.get(TimingName.DB, 0.0) - db_duration
+        timings.add(TimingName.ORM, max(elapsed - db_duration, 0.0))
+        return result
+
+    def get_session(self) -> AsyncSession:
+        """
+        Returns the asynchronous session of the current scope, creating it on first
+        use.
+
+        A new session holds no connection, one is checked out of the pool only when
+        the first statement is executed. Sessions of read-only scopes are bound to the
+        read-only engine.
+
+        :return: AsyncSession instance of the current scope.
+        :raises ValueError: If no session scope is currently open.
+        """
+
+        scope = self._context_manager.get_session_context()
+
+        if scope.session is None:
+            session_factory = (
+                self._read_session_factory if scope.read_only else self._session_factory
+            )
+            scope.session = session_factory(info={"request_id": scope.request_id})
+
+        return scope.session
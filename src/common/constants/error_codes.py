@@ -10,6 +10,9 @@ class CommonError(Enum):
     ACCESS_DENIED = (3, 403, "Access denied")
     API_KEY_NOT_FOUND = (4, 404, "API key not found")
     INVALID_API_KEY = (5, 500, "Invalid API key")
+    NUMBER_OUT_OF_BOUNDS = (6, 400, "Number out of bounds")
+    SERVICE_OVERLOADED = (7, 503, "Service is overloaded, retry later")
+    QUERY_BUDGET_EXCEEDED = (8, 500, "Request exceeded its database query budget")
 
 
 class ActivityError(Enum):
@@ -24,6 +27,12 @@ class BuildingError(Enum):
     BUILDING_NOT_FOUND = (200, 404, "Building not found")
 
 
+class OrganizationError(Enum):
+    INVALID_QUERY_FILTER = (300, 400, "Invalid organization query filter")
+    ORGANIZATION_NOT_FOUND = (301, 404, "Organization not found")
+    INVALID_FIELDSET = (302, 400, "Invalid organization fieldset")
+
+
 class ErrorCodesEnums:
     """Centralized container for all grouped domain-specific error enums."""
 
@@ -31,3 +40,4 @@ class ErrorCodesEnums:
         self.Common = CommonError
         self.Activity = ActivityError
         self.Building = BuildingError
+        self.Organization = OrganizationError
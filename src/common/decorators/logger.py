@@ -1,18 +1,29 @@
 import inspect
+import time
 from collections.abc import Callable
+from contextvars import Token
 from functools import wraps
 from typing import TYPE_CHECKING, Any
 
+from src.server.constants import call_context, span_context
+
 if TYPE_CHECKING:
     import logging
 
+    from src.server.tracing import Span
+
 
 class LoggingFunctionInfo:
     """
-    A decorator class for logging the execution of methods of a class instance.
+    A decorator class for logging and tracing the execution of methods of a class
+    instance.
 
     Requires the class instance to have a `_logger` attribute with `info` and `debug`
-    methods.
+    methods. Every call is timed on the monotonic clock and the name of its class and method is kept
+    in a context variable while it runs, so statements can be traced back to the
+    repository method issuing them. Within a sampled trace the call is recorded as a
+    span nested under the span of its caller, together with the SQL statements it
+    executes.
     """
 
     def __init__(self, description: str = ""):
@@ -26,7 +37,7 @@ class LoggingFunctionInfo:
 
     def __call__(self, func: Callable) -> Callable:
         """
-        Wrap the provided function with logging functionality.
+        Wrap the provided function with logging and tracing functionality.
 
         Logs the function execution before and after calling it.
         Determines if the function is async or sync and handles accordingly.
@@ -42,7 +53,7 @@ class LoggingFunctionInfo:
             @wraps(func)
             async def async_wrapper(instance: Any, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
                 """
-                Asynchronous wrapper to log function execution.
+                Asynchronous wrapper to log and trace function execution.
 
                 Logs the start and end of an asynchronous function call.
 
@@ -52,20 +63,22 @@ class LoggingFunctionInfo:
                 :return: The result of the function execution.
                 """
 
-                logger: logging.Logger = getattr(instance, "_logger", None)
-                if logger:
-                    logger.debug("→ %s() called. %s", func.__name__, self.description)
-                result = await func(instance, *args, **kwargs)
-                if logger:
-                    logger.debug("← %s() finished.", func.__name__)
-                return result
+                started, span, tokens = self._start(instance, func)
+                error = None
+                try:
+                    return await func(instance, *args, **kwargs)
+                except Exception as exc:
+                    error = exc
+                    raise
+                finally:
+                    self._finish(instance, func, started, span, tokens, error)
 
             return async_wrapper
 
         @wraps(func)
         def sync_wrapper(instance: Any, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
             """
-            Synchronous wrapper to log function execution.
+            Synchronous wrapper to log and trace function execution.
 
             Logs the start and end of a synchronous function call.
 
@@ -75,12 +88,83 @@ class LoggingFunctionInfo:
             :return: The result of the function execution.
             """
 
-            logger = getattr(instance, "_logger", None)
-            if logger:
-                logger.debug("→ %s() called. %s", func.__name__, self.description)
-            result = func(instance, *args, **kwargs)
-            if logger:
-                logger.debug("← %s() finished.", func.__name__)
-            return result
+            started, span, tokens = self._start(instance, func)
+            error = None
+            try:
+                return func(instance, *args, **kwargs)
+            except Exception as exc:
+                error = exc
+                raise
+            finally:
+                self._finish(instance, func, started, span, tokens, error)
 
         return sync_wrapper
+
+    def _start(
+        self,
+        instance: Any,  # noqa: ANN401
+        func: Callable,
+    ) -> tuple[float, "Span | None", tuple[Token, Token | None]]:
+        """
+        Log the call, mark it as the running method and start its span if the
+        current trace is sampled.
+
+        :param instance: The instance of the class calling the function.
+        :param func: The decorated function.
+        :return: Start time on the monotonic clock, the started span, None outside of
+                a trace, and the tokens restoring the running method and the span of
+                the caller.
+        """
+
+        logger: logging.Logger = getattr(instance, "_logger", None)
+        if logger:
+            logger.debug("→ %s() called. %s", func.__name__, self.description)
+
+        name = f"{type(instance).__name__}.{func.__name__}"
+        call_token = call_context.set(name)
+
+        span, span_token = None, None
+        parent = span_context.get()
+        if parent is not None:
+            span = parent.start_child(
+                name=name,
+                attributes={
+                    "code.namespace": type(instance).__module__,
+                    "code.function": func.__name__,
+                },
+            )
+            span_token = span_context.set(span)
+
+        return time.perf_counter(), span, (call_token, span_token)
+
+    @staticmethod
+    def _finish(
+        instance: Any,  # noqa: ANN401
+        func: Callable,
+        started: float,
+        span: "Span | None",
+        tokens: tuple[Token, Token | None],
+        error: BaseException | None,
+    ) -> None:
+        """
+        Log the call duration, restore the running method and end the span.
+
+        :param instance: The instance of the class calling the function.
+        :param func: The decorated function.
+        :param started: Start time on the monotonic clock.
+        :param span: Span of the call, None outside of a trace.
+        :param tokens: Tokens restoring the running method and the span of the caller.
+        :param error: Exception the call failed with, None on success.
+        """
+
+        duration = time.perf_counter() - started
+
+        call_token, span_token = tokens
+        call_context.reset(call_token)
+        if span is not None:
+            span_context.reset(span_token)
+            span.end(error)
+
+        logger: logging.Logger = getattr(instance, "_logger", None)
+        if logger:
+            logger.debug("← %s() finished in %.3f ms.", func.__name__, duration * 1000)
@@ -1,3 +1,4 @@
+import time
 from typing import Annotated
 
 from fastapi import Depends
@@ -7,6 +8,7 @@ from src.common.constants import ErrorCodesEnums
 from src.common.constants.deps import get_error_codes
 from src.common.errors import BackendException
 from src.config.settings.deps import get_settings
+from src.server.metrics.timings import TimingName, record_timing
 
 APIKey = Annotated[
     str,
@@ -25,8 +27,12 @@ async def get_api_key(
     error_codes: Annotated[ErrorCodesEnums, Depends(get_error_codes)],
     api_key: APIKey,
 ) -> str:
-    if not api_key:
-        raise BackendException(error_codes.Common.API_KEY_NOT_FOUND)
-    if api_key != get_settings().project.SECRET_API_KEY:
-        raise BackendException(error_codes.Common.INVALID_API_KEY)
-    return api_key
+    started = time.perf_counter()
+    try:
+        if not api_key:
+            raise BackendException(error_codes.Common.API_KEY_NOT_FOUND)
+        if api_key != get_settings().project.SECRET_API_KEY:
+            raise BackendException(error_codes.Common.INVALID_API_KEY)
+        return api_key
+    finally:
+        record_timing(TimingName.AUTH, time.perf_counter() - started)
@@ -1,3 +1,4 @@
 from .adapters import IPostgresBaseRepo
 from .logger import ILoggerManager
+from .serializers import IJSONSerializer
 from .utils import ICustomDateTime
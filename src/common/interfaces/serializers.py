@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from pydantic.main import IncEx
+
+from src.common.responses import FastJSONResponse
+
+
+class IJSONSerializer(ABC):
+    """
+    Interface for a JSON serializer backed by precompiled pydantic TypeAdapters.
+    """
+
+    @abstractmethod
+    def precompile(self, *types: Any) -> None:  # noqa: ANN401
+        """
+        Build serializers for the given types ahead of the first request.
+
+        :param types: Types to build serializers for.
+        """
+        ...
+
+    @abstractmethod
+    def dump_json(
+        self,
+        value: Any,  # noqa: ANN401
+        tp: Any,  # noqa: ANN401
+        exclude: IncEx | None = None,
+    ) -> bytes:
+        """
+        Dump a value of the given type to JSON bytes by alias.
+
+        :param value: Value to dump.
+        :param tp: Type of the value.
+        :param exclude: Fields to exclude, none if None.
+        :return: JSON bytes.
+        """
+        ...
+
+    @abstractmethod
+    def response(
+        self,
+        value: Any,  # noqa: ANN401
+        tp: Any,  # noqa: ANN401
+        exclude: IncEx | None = None,
+        status_code: int = 200,
+    ) -> FastJSONResponse:
+        """
+        Dump a value to a ready JSON response, so FastAPI skips re-validating it
+        against the route response model.
+
+        :param value: Value to dump.
+        :param tp: Type of the value.
+        :param exclude: Fields to exclude, none if None.
+        :param status_code: Response status code.
+        :return: FastJSONResponse with the dumped body.
+        """
+        ...
@@ -1 +1,3 @@
+from .formatters import JSONFormatter
+from .handlers import LogQueueHandler, RequestLogContext, SamplingFilter
 from .logger import LoggerManager
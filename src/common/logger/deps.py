@@ -1,12 +1,46 @@
+import atexit
 import logging
+import sys
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends
 
 from src.common.interfaces import ILoggerManager
-from src.common.logger import LoggerManager
+from src.common.logger import JSONFormatter, LoggerManager, LogQueueHandler
 from src.common.logger.constants import LoggerConfigEnums
 from src.common.logger.constants.deps import get_logger_config
+from src.config.settings.deps import get_settings
+
+
+@lru_cache
+def get_log_queue_handler() -> LogQueueHandler:
+    """
+    Provides the process-wide handler shared by all loggers, with its listener
+    thread writing the records to stdout started.
+
+    The listener is stopped at exit, so the records still queued are written out.
+
+    :return: Started LogQueueHandler instance.
+    """
+
+    settings = get_settings().project
+
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(
+        JSONFormatter()
+        if settings.LOG_FORMAT == "json"
+        else logging.Formatter(get_logger_config().Format.BASE)
+    )
+
+    handler = LogQueueHandler(
+        handlers=(output,),
+        max_size=settings.LOG_QUEUE_SIZE,
+        drop_policy=settings.LOG_QUEUE_DROP_POLICY,
+    )
+    handler.start()
+    atexit.register(handler.stop)
+    return handler
 
 
 def get_logger_manager(
@@ -18,7 +52,11 @@ def get_logger_manager(
     :param config: Logger configuration enums.
     :return: Initialized LoggerManager instance.
     """
-    return LoggerManager(config)
+    return LoggerManager(
+        config,
+        handler=get_log_queue_handler(),
+        sample_rates=get_settings().project.LOG_SAMPLE_RATES,
+    )
 
 
 def get_base_logger(
@@ -0,0 +1,62 @@
+import json
+import logging
+from datetime import UTC, datetime
+
+# Optional record attributes written when set, by LogQueueHandler or ``extra``
+RECORD_FIELDS = ("request_id", "route", "status", "latency_ms")
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Formats a record as one JSON object per line, the shape log collectors parse
+    without per-service patterns.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._second: int | None = None
+        self._second_prefix = ""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record.
+
+        :param record: Logged record.
+        :return: JSON line.
+        """
+
+        payload = {
+            "time": self._format_time(record.created),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "location": f"{record.filename}:{record.funcName}:{record.lineno}",
+        }
+        for field in RECORD_FIELDS:
+            value = record.__dict__.get(field)
+            if value is not None:
+                payload[field] = value
+
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+    def _format_time(self, created: float) -> str:
+        """
+        Format a record time in UTC with milliseconds, reusing the formatted second
+        of the previous record.
+
+        :param created: Record time as a Unix timestamp.
+        :return: ISO 8601 time.
+        """
+
+        second = int(created)
+        if second != self._second:
+            self._second = second
+            self._second_prefix = datetime.fromtimestamp(second, UTC).strftime(
+                "%Y-%m-%dT%H:%M:%S"
+            )
+        return f"{self._second_prefix}.{int((created - second) * 1000):03d}Z"
@@ -0,0 +1,173 @@
+import contextlib
+import copy
+import logging
+import queue
+import random
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Literal
+
+from src.server.constants import request_log_context, session_context
+
+DropPolicy = Literal["drop_new", "drop_oldest"]
+
+
+class RequestLogContext:
+    """Request fields attached to the records logged while an HTTP request runs."""
+
+    __slots__ = ("request_id", "scope", "started")
+
+    def __init__(self, scope: dict[str, Any]):
+        """
+        Initialize the context of a request.
+
+        :param scope: ASGI connection scope, the route is set on it once matched.
+        """
+
+        self.scope = scope
+        self.started = time.perf_counter()
+        # Set from the response, once the session scope holding it is closed
+        self.request_id: str | None = None
+
+    @property
+    def route(self) -> str | None:
+        """Path template of the matched route, None before matching."""
+
+        return getattr(self.scope.get("route"), "path", None)
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Handler putting records on a bounded queue emptied by a listener thread, so
+    formatting and writing to the output never block the event loop.
+
+    Records are stamped with the request id, route and latency of the current
+    request before they leave the loop thread. When the queue is full a record is
+    dropped according to the drop policy and counted, instead of blocking the caller.
+    """
+
+    def __init__(
+        self,
+        handlers: tuple[logging.Handler, ...],
+        max_size: int,
+        drop_policy: DropPolicy,
+    ):
+        """
+        Initialize the handler and its listener.
+
+        :param handlers: Handlers writing the records, run by the listener thread.
+        :param max_size: Maximum number of queued records.
+        :param drop_policy: ``drop_new`` drops the incoming record, ``drop_oldest``
+                drops the oldest queued one to make room for it.
+        """
+
+        super().__init__(queue.Queue(maxsize=max_size))
+        self._max_size = max_size
+        self._drop_policy = drop_policy
+        self._listener = QueueListener(
+            self.queue, *handlers, respect_handler_level=True
+        )
+        self._started = False
+        self.dropped = 0
+
+    def start(self) -> None:
+        """Start the listener thread writing the queued records."""
+
+        if not self._started:
+            self._listener.start()
+            self._started = True
+
+    def stop(self) -> None:
+        """Write the queued records and stop the listener thread."""
+
+        if self._started:
+            self._listener.stop()
+            self._started = False
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Copy a record with its message merged and the request fields set, so it no
+        longer depends on mutable arguments or on the context of the caller.
+
+        Exception info is kept, the traceback is formatted by the listener thread.
+
+        :param record: Logged record.
+        :return: Record to enqueue.
+        """
+
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+
+        context = request_log_context.get()
+        scope = session_context.get()
+        if scope is not None:
+            record.request_id = scope.request_id
+        elif context is not None:
+            record.request_id = context.request_id
+
+        if context is not None:
+            record.route = context.route
+            if getattr(record, "latency_ms", None) is None:
+                record.latency_ms = round(
+                    (time.perf_counter() - context.started) * 1000, 3
+                )
+
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Put a record on the queue without blocking, applying the drop policy when
+        it is full.
+
+        :param record: Prepared record.
+        """
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            if self._drop_policy == "drop_oldest":
+                # Lost if the listener or another thread raced for the slot
+                with contextlib.suppress(queue.Empty, queue.Full):
+                    self.queue.get_nowait()
+                    self.queue.put_nowait(record)
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get the queue usage.
+
+        :return: Dictionary with queued records, capacity and dropped records.
+        """
+
+        return {
+            "queued": self.queue.qsize(),
+            "capacity": self._max_size,
+            "dropped": self.dropped,
+        }
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a share of the records of a logger at or below a level."""
+
+    def __init__(self, rate: float, level: int = logging.DEBUG):
+        """
+        Initialize the filter.
+
+        :param rate: Share of the records kept, between 0 and 1.
+        :param level: Highest level sampled, records above it are always kept.
+        """
+
+        super().__init__()
+        self._rate = rate
+        self._level = level
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Decide whether a record is logged.
+
+        :param record: Logged record.
+        :return: True to log the record.
+        """
+
+        return record.levelno > self._level or random.random() < self._rate  # noqa: S311
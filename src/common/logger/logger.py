@@ -1,5 +1,4 @@
 import logging
-import sys
 
 from src.common.interfaces import ILoggerManager
 from src.common.logger.constants import (
@@ -7,6 +6,7 @@ from src.common.logger.constants import (
     LoggerConfigEnum,
     LoggerConfigEnums,
 )
+from src.common.logger.handlers import SamplingFilter
 
 
 class LoggerManager(ILoggerManager):
@@ -14,38 +14,44 @@ class LoggerManager(ILoggerManager):
     Centralized logger manager that provides configured loggers
     based on predefined configuration enums.
 
-    Each logger is configured once and cached for reuse.
+    Each logger is configured once and cached for reuse. All loggers share one
+    handler, which hands the records over to a background thread writing them out.
     """
 
     def __init__(
         self,
         config: LoggerConfigEnums,
+        handler: logging.Handler,
+        sample_rates: dict[str, float],
     ):
         """
         Initialize the LoggerManager with a logger configuration provider.
 
         :param config: Implementation of ILoggerConfigEnums with format, level, and
                 name enums.
+        :param handler: Handler shared by all loggers.
+        :param sample_rates: Share of the debug records kept, keyed by logger name.
         """
         self._config = config
+        self._handler = handler
+        self._sample_rates = sample_rates
         self._loggers: dict[str, logging.Logger] = {}
 
-    @staticmethod
-    def _configure_logger(logger: logging.Logger, level: str, fmt: str) -> None:
+    def _configure_logger(self, logger: logging.Logger, level: str) -> None:
         """
         Set up logging configuration for a logger instance.
 
         :param logger: Logger instance to configure.
         :param level: Logging level (e.g., 'INFO', 'DEBUG').
-        :param fmt: Format string for log messages.
         """
         logger.setLevel(level)
         logger.propagate = False
 
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(level)
-        console_handler.setFormatter(logging.Formatter(fmt))
-        logger.addHandler(console_handler)
+        rate = self._sample_rates.get(logger.name)
+        if rate is not None and rate < 1:
+            logger.addFilter(SamplingFilter(rate))
+
+        logger.addHandler(self._handler)
 
     def _get_logger(self, config: LoggerConfig) -> logging.Logger:
         """
@@ -60,7 +66,7 @@ class LoggerManager(ILoggerManager):
 
         logger = logging.getLogger(config.name)
         if not logger.hasHandlers():
-            self._configure_logger(logger, config.level, config.format)
+            self._configure_logger(logger, config.level)
 
         self._loggers[config.name] = logger
         return logger
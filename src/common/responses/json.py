@@ -0,0 +1,33 @@
+import time
+from typing import Any
+
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
+
+from src.server.metrics.timings import TimingName, record_timing
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered by the pydantic-core serializer.
+
+    Bytes are sent as is, so content already dumped by a precompiled serializer skips
+    rendering entirely. Other content is dumped straight to bytes without the
+    intermediate ``jsonable_encoder`` and ``json.dumps`` passes.
+    """
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        """
+        Render content to JSON bytes.
+
+        :param content: Bytes of a dumped JSON document or any JSON-serializable value.
+        :return: JSON bytes.
+        """
+
+        if isinstance(content, bytes):
+            return content
+
+        started = time.perf_counter()
+        rendered = to_json(content, by_alias=True)
+        record_timing(TimingName.SERIALIZATION, time.perf_counter() - started)
+        return rendered
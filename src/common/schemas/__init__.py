@@ -1,3 +1,3 @@
-from .core_schema import CoreSchema, SQLFilterBase
+from .core_schema import CoreSchema, NaiveDatetime, SQLFilterBase
 from .msg import Msg
 from .pagination import Pagination, PaginationResult
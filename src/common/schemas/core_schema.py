@@ -1,10 +1,33 @@
+import time
+from collections.abc import Mapping
 from datetime import datetime
-from typing import Any
-from uuid import UUID
+from functools import cache
+from types import NoneType, UnionType
+from typing import Annotated, Any, Self, Union, get_args, get_origin
 
 from fastapi_filter.contrib.sqlalchemy import Filter
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, field_validator
 from pydantic.alias_generators import to_camel, to_snake
+from pydantic.fields import FieldInfo
+
+from src.server.metrics.timings import TimingName, record_timing
+
+
+def to_naive_datetime(v: datetime) -> datetime:
+    """
+    Drop timezone info from an aware datetime, naive values are returned as is.
+
+    :param v: Datetime to convert.
+    :return: Naive datetime.
+    """
+
+    if v.tzinfo is not None:
+        v = v.replace(tzinfo=None)
+    return v
+
+
+# Use for datetime fields of schemas instead of validating every field of every model
+NaiveDatetime = Annotated[datetime, AfterValidator(to_naive_datetime)]
 
 
 class CamelModel(BaseModel):
@@ -14,21 +37,129 @@ class CamelModel(BaseModel):
 
 
 class CoreSchema(CamelModel):
-    @field_validator("*", mode="after")
-    def timezone_validate(cls, v: Any) -> Any:  # noqa: ANN401 N805
-        if isinstance(v, datetime) and v.tzinfo is not None:
-            v = v.replace(tzinfo=None)
-        return v
-
     model_config = ConfigDict(
         from_attributes=True,
         json_encoders={
-            UUID: lambda v: str(v),
             datetime: lambda v: v.isoformat() + "Z",
         },
         populate_by_name=True,
     )
 
+    @classmethod
+    def model_validate(cls, obj: Any, **kwargs: Any) -> Self:  # noqa: ANN401
+        """
+        Validate the schema from an object, adding the time taken to the validation
+        time of the current request.
+
+        :param obj: Object to validate.
+        :param kwargs: Keyword arguments of ``BaseModel.model_validate``.
+        :return: Validated schema instance.
+        """
+
+        started = time.perf_counter()
+        try:
+            return super().model_validate(obj, **kwargs)
+        finally:
+            record_timing(TimingName.VALIDATION, time.perf_counter() - started)
+
+    @classmethod
+    def model_construct_trusted(cls, obj: Any) -> Self:  # noqa: ANN401
+        """
+        Build the schema from trusted data without validation.
+
+        Meant for rows and payloads produced by our own database, which already match
+        the schema. Attributes are read from ORM objects, keys (by alias, then by
+        name) from mappings, nested schemas are constructed recursively. The time
+        taken is added to the validation time of the current request.
+
+        :param obj: ORM object or mapping to read field values from.
+        :return: Constructed schema instance.
+        """
+
+        started = time.perf_counter()
+        instance = _construct_trusted(cls, obj)
+        record_timing(TimingName.VALIDATION, time.perf_counter() - started)
+        return instance
+
+
+def _construct_trusted(model: type[CoreSchema], obj: Any) -> CoreSchema:  # noqa: ANN401
+    """
+    Build a schema and its nested schemas from trusted data without validation.
+
+    :param model: Schema class.
+    :param obj: ORM object or mapping to read field values from.
+    :return: Constructed schema instance.
+    """
+
+    is_mapping = isinstance(obj, Mapping)
+    values = {}
+    fields_set = set()
+
+    for name, alias, nested, is_list, field in _get_trusted_plan(model):
+        if is_mapping:
+            value = obj.get(alias, obj.get(name, _MISSING))
+        else:
+            value = getattr(obj, name, _MISSING)
+
+        if value is _MISSING:
+            if not field.is_required():
+                values[name] = field.get_default(call_default_factory=True)
+            continue
+
+        if nested is not None and value is not None:
+            if is_list:
+                value = [_construct_trusted(nested, item) for item in value]
+            else:
+                value = _construct_trusted(nested, value)
+
+        values[name] = value
+        fields_set.add(name)
+
+    # Same state model_construct sets up, without its generic per-call overhead
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+_MISSING = object()
+
+
+@cache
+def _get_trusted_plan(
+    model: type[CoreSchema],
+) -> tuple[tuple[str, str, type[CoreSchema] | None, bool, FieldInfo], ...]:
+    """
+    Precompute how each field of a schema is read by model_construct_trusted.
+
+    :param model: Schema class.
+    :return: Tuple of (field name, alias, nested schema or None, is list, field
+            info) per field.
+    """
+
+    plan = []
+
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) in (Union, UnionType):
+            args = [arg for arg in get_args(annotation) if arg is not NoneType]
+            annotation = args[0] if len(args) == 1 else Any
+
+        is_list = get_origin(annotation) is list
+        if is_list:
+            annotation = get_args(annotation)[0]
+
+        nested = (
+            annotation
+            if isinstance(annotation, type) and issubclass(annotation, CoreSchema)
+            else None
+        )
+        plan.append((name, field.alias or name, nested, is_list, field))
+
+    return tuple(plan)
+
 
 class SQLFilterBase(Filter):
     model_config = ConfigDict(populate_by_name=True, alias_generator=to_camel)
@@ -0,0 +1,18 @@
+from functools import lru_cache
+
+from src.common.interfaces import IJSONSerializer
+from src.common.serializers import JSONSerializer
+
+
+@lru_cache
+def get_json_serializer() -> IJSONSerializer:
+    """
+    Provides the worker-wide instance of JSONSerializer.
+
+    The instance is shared, so adapters precompiled at startup are reused by all
+    requests.
+
+    :return: Instance of IJSONSerializer.
+    """
+
+    return JSONSerializer()
@@ -11,5 +11,7 @@ class OpenApiTagsMetadata(IOpenApiTagsMetadata):
         return [
             {"name": "Building", "description": "Buildings module"},
             {"name": "Organization", "description": "Organization module"},
+            {"name": "Internal", "description": "Internal operational endpoints"},
+            {"name": "Health", "description": "Liveness and readiness probes"},
             # ...extend here as needed
         ]
@@ -0,0 +1,21 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class CacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="allow",
+    )
+
+    # Building coordinates tile cache
+    BUILDING_TILE_SIZE: float = Field(0.05)  # Tile edge in degrees
+    BUILDING_TILE_TTL: int = Field(60)  # Seconds, staleness of the other workers
+    BUILDING_TILE_MAX_ENTRIES: int = Field(10_000)
+    BUILDING_TILE_MAX_PER_REQUEST: int = Field(400)
+
+    # Organization search facets cache
+    ORGANIZATION_FACET_TTL: int = Field(30)  # Seconds
+    ORGANIZATION_FACET_MAX_ENTRIES: int = Field(1_000)
+    ORGANIZATION_FACET_MAX_VALUES: int = Field(20)  # Values returned per facet
@@ -0,0 +1,21 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class CompressionSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="allow",
+    )
+
+    # Response compression
+    COMPRESSION_ENABLED: bool = Field(True)
+    COMPRESSION_MIN_SIZE: int = Field(1_024)  # Bytes, smaller bodies are sent as is
+    COMPRESSION_GZIP_LEVEL: int = Field(6)
+    COMPRESSION_ZSTD_LEVEL: int = Field(3)  # Used only if zstandard is installed
+
+    # Precompressed bodies cache
+    COMPRESSION_CACHE_TTL: int = Field(60)  # Seconds
+    COMPRESSION_CACHE_MAX_ENTRIES: int = Field(512)
+    COMPRESSION_CACHE_MAX_BODY_SIZE: int = Field(1_048_576)  # Bytes
@@ -0,0 +1,26 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class MetricsSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="allow",
+    )
+
+    # Prometheus metrics
+    METRICS_ENABLED: bool = Field(True)
+    METRICS_LATENCY_BUCKETS: tuple[float, ...] = Field(
+        (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    )  # Seconds
+
+    # Aggregation across workers, a directory shared by the workers of one host and
+    # emptied before they start, unset for a single worker
+    METRICS_MULTIPROCESS_DIR: str | None = Field(None)
+    METRICS_FLUSH_INTERVAL: float = Field(5.0)  # Seconds
+
+    # Server-Timing response header, on every response or on requests carrying the
+    # debug header with a true value, such as "X-Debug-Timing: 1"
+    SERVER_TIMING_ENABLED: bool = Field(False)
+    SERVER_TIMING_DEBUG_HEADER: str | None = Field("X-Debug-Timing")
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field, PostgresDsn, field_validator
 from pydantic_core.core_schema import ValidationInfo
@@ -15,6 +15,7 @@ class PostgresSettings(BaseSettings):
     POSTGRES_USER: str = Field("referral")
     POSTGRES_PASSWORD: str = Field("referral")
     POSTGRES_DB: str = Field("referral")
+    POSTGRES_APPLICATION_NAME: str = Field("organization-directory")
 
     POSTGRES_DATABASE_URL: PostgresDsn | None = None
 
@@ -33,6 +34,15 @@ class PostgresSettings(BaseSettings):
         }
         return PostgresDsn.build(**options)
 
+    # Read-only sessions
+    POSTGRES_READ_DATABASE_URL: PostgresDsn | None = None  # Replica, primary if unset
+    # autocommit frees only the PgBouncer server connection between statements, the
+    # session keeps its pooled connection until the response starts
+    POSTGRES_READ_SESSION_MODE: Literal["read_write", "read_only", "autocommit"] = (
+        Field("read_only")
+    )
+    POSTGRES_READ_ONLY_SAFE_METHODS: bool = Field(True)  # GET and HEAD read only
+
     DB_POOL_SIZE: int = Field(20, alias="DB_POOL_SIZE")
     WEB_CONCURRENCY: int = Field(1, alias="WEB_CONCURRENCY")
     POOL_SIZE: int = Field(20, alias="DB_POOL_SIZE")
@@ -47,3 +57,30 @@ class PostgresSettings(BaseSettings):
         )
 
     TZ: str = Field("Europe/Moscow")
+
+    # PgBouncer in transaction pooling mode
+    POSTGRES_PGBOUNCER: bool = Field(False)
+    # PgBouncer 1.21+ with max_prepared_statements > 0 keeps statement caches usable
+    POSTGRES_PGBOUNCER_PREPARED_STATEMENTS: bool = Field(False)
+    POSTGRES_PGBOUNCER_POOL_SIZE: int = Field(0)  # 0 opens a connection per checkout
+
+    # Pool warmup and hot query priming at startup
+    POSTGRES_WARMUP_ENABLED: bool = Field(True)
+    POSTGRES_WARMUP_TIMEOUT: float = Field(30.0)  # Seconds
+
+    # Database telemetry endpoint
+    POSTGRES_STATS_TOP_STATEMENTS: int = Field(20)
+
+    # Slow query log, None disables it
+    POSTGRES_SLOW_QUERY_THRESHOLD: float | None = Field(0.2)  # Seconds
+    POSTGRES_SLOW_QUERY_LOG_SIZE: int = Field(200)  # Entries kept per worker
+    # Share of slow SELECT statements re-run under EXPLAIN (ANALYZE, BUFFERS)
+    POSTGRES_SLOW_QUERY_EXPLAIN_RATE: float = Field(0.0, ge=0, le=1)
+    POSTGRES_SLOW_QUERY_EXPLAIN_TIMEOUT: float = Field(5.0)  # Seconds
+
+    # Per-request query budget and repeated statement (N+1) detection. Violations
+    # are logged in local mode, fail the request in test mode and are not checked
+    # in production unless the mode is set explicitly
+    POSTGRES_QUERY_BUDGET_MODE: Literal["off", "warn", "raise"] | None = Field(None)
+    POSTGRES_QUERY_BUDGET_MAX_QUERIES: int = Field(20)  # Statements per request
+    POSTGRES_QUERY_BUDGET_MAX_REPEATS: int = Field(5)  # Executions of one statement
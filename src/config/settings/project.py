@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field, field_validator
 from pydantic_core.core_schema import ValidationInfo
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -22,6 +24,12 @@ class ProjectSettings(BaseSettings):
     PORT: int = Field(8000)
     MODE: str = Field(..., alias="SERVER_MODE")
     LOG_LEVEL: str = Field(..., alias="LOG_LEVEL")
+    # Records are written to stdout by a background thread through a bounded queue
+    LOG_FORMAT: Literal["json", "text"] = Field("json")
+    LOG_QUEUE_SIZE: int = Field(10_000)
+    LOG_QUEUE_DROP_POLICY: Literal["drop_new", "drop_oldest"] = Field("drop_new")
+    LOG_SAMPLE_RATES: dict[str, float] = Field({})  # Logger name: share of debug logs
+    LOG_ACCESS_ENABLED: bool = Field(False)  # One record per request with its latency
     IS_LOCAL_MODE: bool = False
     IS_TEST_MODE: bool = False
     IS_PROD_MODE: bool = False
@@ -41,3 +49,21 @@ class ProjectSettings(BaseSettings):
     TZ: str = Field("Europe/Moscow")
 
     ON_PRODUCTION: bool = Field(False)
+
+    # Admission control, limits default to the connection pool size
+    ADMISSION_ENABLED: bool = Field(True)
+    ADMISSION_MAX_CONCURRENCY: int | None = Field(None)
+    ADMISSION_MAX_QUEUE: int | None = Field(None)  # Four times the concurrency
+    ADMISSION_QUEUE_TIMEOUT: float = Field(1.0)  # Seconds
+    ADMISSION_RETRY_AFTER: int = Field(1)  # Seconds
+    ADMISSION_ROUTE_LIMITS: dict[str, int] = Field({})  # Route path template: limit
+    ADMISSION_EXCLUDED_PATHS: tuple[str, ...] = Field(
+        (
+            "/health",
+            "/internal",
+            "/metrics",
+            "/docs",
+            "/redoc",
+            "/api/v1/openapi.json",
+        )
+    )
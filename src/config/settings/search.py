@@ -0,0 +1,19 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class SearchSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="allow",
+    )
+
+    # Organization search materialized view
+    ORGANIZATION_SEARCH_VIEW_READS: bool = Field(False)
+    # Follows ORGANIZATION_SEARCH_VIEW_READS if unset
+    ORGANIZATION_SEARCH_VIEW_REFRESH_ENABLED: bool | None = Field(None)
+    ORGANIZATION_SEARCH_VIEW_REFRESH_INTERVAL: int = Field(60)  # Seconds
+
+    # Trigger-maintained organization documents
+    ORGANIZATION_DOCUMENT_READS: bool = Field(False)
@@ -1,7 +1,17 @@
+from .cache import CacheSettings
+from .compression import CompressionSettings
+from .metrics import MetricsSettings
 from .postgres import PostgresSettings
 from .project import ProjectSettings
+from .search import SearchSettings
+from .tracing import TracingSettings
 
 
 class Settings:
     project: ProjectSettings = ProjectSettings()
     postgres: PostgresSettings = PostgresSettings()
+    cache: CacheSettings = CacheSettings()
+    search: SearchSettings = SearchSettings()
+    compression: CompressionSettings = CompressionSettings()
+    metrics: MetricsSettings = MetricsSettings()
+    tracing: TracingSettings = TracingSettings()
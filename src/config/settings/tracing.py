@@ -0,0 +1,24 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class TracingSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="allow",
+    )
+
+    # Request tracing
+    TRACING_ENABLED: bool = Field(False)
+    TRACING_SERVICE_NAME: str = Field("organization-directory")
+    TRACING_SAMPLE_RATE: float = Field(0.01, ge=0, le=1)  # Share of traced requests
+    TRACING_MAX_STATEMENTS_PER_SPAN: int = Field(50)
+
+    # OTLP JSON export, to a file of one request per line and/or an OTLP/HTTP
+    # collector such as http://localhost:4318/v1/traces
+    TRACING_EXPORT_PATH: str | None = Field(None)
+    TRACING_EXPORT_ENDPOINT: str | None = Field(None)
+    TRACING_EXPORT_INTERVAL: float = Field(5.0)  # Seconds
+    TRACING_EXPORT_TIMEOUT: float = Field(5.0)  # Seconds
+    TRACING_MAX_QUEUE: int = Field(10_000)  # Finished spans waiting for export
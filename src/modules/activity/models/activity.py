@@ -18,7 +18,9 @@ class ActivityModel(CoreModel):
     sid: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     name: Mapped[str] = mapped_column(String(250), nullable=False, index=True)
     parent_sid: Mapped[UUID] = mapped_column(
-        ForeignKey(f"{PostgresSchemas.ACTIVITY}.activity.sid"), nullable=True
+        ForeignKey(f"{PostgresSchemas.ACTIVITY}.activity.sid"),
+        nullable=True,
+        index=True,
     )
 
     parent: Mapped["ActivityModel"] = relationship(
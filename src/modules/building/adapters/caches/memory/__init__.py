@@ -0,0 +1 @@
+from .building import BuildingTileMemoryCache
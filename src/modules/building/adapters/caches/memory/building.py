@@ -0,0 +1,156 @@
+import math
+from collections.abc import Sequence
+
+from src.client.storages.memory.interfaces import IMemoryCache
+from src.modules.building.filters import BuildingCoordinatesFilter
+from src.modules.building.interfaces import IBuildingTileCache
+from src.modules.building.schemas import BuildingLocation
+
+# Padding of tile bounds, so points on a tile edge are never lost to float rounding
+TILE_BOUNDS_EPSILON = 1e-9
+
+
+class BuildingTileMemoryCache(IBuildingTileCache):
+    """
+    In-memory cache of building locations quantized to a fixed tile grid.
+
+    A tile is addressed by the pair of integer indexes
+    ``(floor(latitude / tile_size), floor(longitude / tile_size))``. Only building
+    SIDs and coordinates are cached, organizations are always loaded from the
+    database, so the cache has to be invalidated only when buildings change.
+    """
+
+    def __init__(
+        self,
+        cache: IMemoryCache,
+        tile_size: float,
+        max_tiles: int,
+    ):
+        """
+        Initialize the tile cache.
+
+        :param cache: Memory cache used to store tiles.
+        :param tile_size: Tile edge length in degrees.
+        :param max_tiles: Maximum number of tiles a single request may be served from.
+        """
+
+        self._cache = cache
+        self._tile_size = tile_size
+        self._max_tiles = max_tiles
+
+    def _get_tile(self, latitude: float, longitude: float) -> tuple[int, int]:
+        """
+        Compute the key of the tile containing a point.
+
+        :param latitude: Latitude of the point.
+        :param longitude: Longitude of the point.
+        :return: Tile key.
+        """
+
+        return (
+            math.floor(latitude / self._tile_size),
+            math.floor(longitude / self._tile_size),
+        )
+
+    def get_tiles(
+        self, filters: BuildingCoordinatesFilter
+    ) -> list[tuple[int, int]] | None:
+        """
+        Compute the tiles overlapped by a coordinates filter.
+
+        :param filters: BuildingCoordinatesFilter instance with the bounding box.
+        :return: List of tile keys or None if the box spans more than the allowed
+                number of tiles.
+        """
+
+        lat_from, lon_from = self._get_tile(
+            filters.latitude__gte, filters.longitude__gte
+        )
+        lat_to, lon_to = self._get_tile(filters.latitude__lte, filters.longitude__lte)
+
+        tiles_count = max(lat_to - lat_from + 1, 0) * max(lon_to - lon_from + 1, 0)
+        if tiles_count > self._max_tiles:
+            return None
+
+        return [
+            (lat_index, lon_index)
+            for lat_index in range(lat_from, lat_to + 1)
+            for lon_index in range(lon_from, lon_to + 1)
+        ]
+
+    def get_tiles_bounds(
+        self, tiles: list[tuple[int, int]]
+    ) -> BuildingCoordinatesFilter:
+        """
+        Build a coordinates filter covering all given tiles.
+
+        :param tiles: List of tile keys.
+        :return: BuildingCoordinatesFilter for the rectangle enclosing the tiles.
+        """
+
+        lat_indexes = [lat_index for lat_index, _ in tiles]
+        lon_indexes = [lon_index for _, lon_index in tiles]
+
+        return BuildingCoordinatesFilter(
+            latitude__gte=min(lat_indexes) * self._tile_size - TILE_BOUNDS_EPSILON,
+            latitude__lte=(max(lat_indexes) + 1) * self._tile_size
+            + TILE_BOUNDS_EPSILON,
+            longitude__gte=min(lon_indexes) * self._tile_size - TILE_BOUNDS_EPSILON,
+            longitude__lte=(max(lon_indexes) + 1) * self._tile_size
+            + TILE_BOUNDS_EPSILON,
+        )
+
+    def get(self, tile: tuple[int, int]) -> list[BuildingLocation] | None:
+        """
+        Retrieve cached building locations of a tile.
+
+        :param tile: Tile key.
+        :return: List of BuildingLocation instances or None if the tile is not cached.
+        """
+
+        return self._cache.get(tile)
+
+    def fill(
+        self, tiles: list[tuple[int, int]], locations: Sequence[BuildingLocation]
+    ) -> dict[tuple[int, int], list[BuildingLocation]]:
+        """
+        Distribute building locations over the given tiles and cache every tile,
+        including the empty ones. Locations outside the given tiles are ignored.
+
+        :param tiles: List of tile keys that were fetched from the database.
+        :param locations: Building locations found inside the tiles bounds.
+        :return: Mapping of each tile key to the building locations inside it.
+        """
+
+        filled: dict[tuple[int, int], list[BuildingLocation]] = {
+            tile: [] for tile in tiles
+        }
+
+        for location in locations:
+            tile = self._get_tile(location.latitude, location.longitude)
+            if tile in filled:
+                filled[tile].append(location)
+
+        for tile, tile_locations in filled.items():
+            self._cache.set(tile, tile_locations)
+
+        return filled
+
+    def invalidate(self, latitude: float, longitude: float) -> None:
+        """
+        Drop the cached tile containing the given point.
+
+        :param latitude: Latitude of a changed building.
+        :param longitude: Longitude of a changed building.
+        """
+
+        self._cache.delete(self._get_tile(latitude, longitude))
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get cache usage counters.
+
+        :return: Dictionary with hits, misses and the current number of entries.
+        """
+
+        return self._cache.get_stats()
@@ -0,0 +1,29 @@
+from functools import lru_cache
+
+from src.client.storages.memory.core import MemoryTTLCache
+from src.config.settings.deps import get_settings
+from src.modules.building.adapters.caches.memory import BuildingTileMemoryCache
+from src.modules.building.interfaces import IBuildingTileCache
+
+
+@lru_cache
+def get_building_tile_cache() -> IBuildingTileCache:
+    """
+    Provides the worker-wide instance of BuildingTileMemoryCache.
+
+    The instance is created once per process, so all requests served by the worker
+    share the same cached tiles.
+
+    :return: Instance of IBuildingTileCache.
+    """
+
+    settings = get_settings()
+
+    return BuildingTileMemoryCache(
+        cache=MemoryTTLCache(
+            ttl=settings.cache.BUILDING_TILE_TTL,
+            max_entries=settings.cache.BUILDING_TILE_MAX_ENTRIES,
+        ),
+        tile_size=settings.cache.BUILDING_TILE_SIZE,
+        max_tiles=settings.cache.BUILDING_TILE_MAX_PER_REQUEST,
+    )
@@ -1,7 +1,9 @@
 import logging
 from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, event, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.base import ExecutableOption
 
@@ -9,9 +11,13 @@ from src.common.adapters.repositories.postgres import PostgresBaseRepo
 from src.common.constants import ErrorCodesEnums
 from src.common.decorators import LoggingFunctionInfo
 from src.modules.building.filters import BuildingCoordinatesFilter
-from src.modules.building.interfaces import IBuildingPsqlRepo
+from src.modules.building.interfaces import IBuildingPsqlRepo, IBuildingTileCache
 from src.modules.building.models import BuildingModel
-from src.modules.building.schemas import BuildingCreate, BuildingUpdate
+from src.modules.building.schemas import (
+    BuildingCreate,
+    BuildingLocation,
+    BuildingUpdate,
+)
 
 
 class BuildingPsqlRepo(
@@ -28,18 +34,22 @@ class BuildingPsqlRepo(
         db: AsyncSession,
         errors: ErrorCodesEnums,
         logger: logging.Logger,
+        tile_cache: IBuildingTileCache,
     ):
         """
-        Initializes the repository with database session, error codes, and logger.
+        Initializes the repository with database session, error codes, logger and
+        the tile cache to invalidate on building changes.
 
         :param db: AsyncSession instance for database connectivity.
         :param errors: Enumeration of error codes for handling repository errors.
         :param logger: Logger instance for logging repository operations.
+        :param tile_cache: Cache of building locations quantized to tiles.
         """
 
         super().__init__(db=db, model=BuildingModel, errors=errors, logger=logger)
         self._errors = errors
         self._logger = logger
+        self._tile_cache = tile_cache
 
     @LoggingFunctionInfo(
         description="Retrieves a building by address and geographic coordinates."
@@ -110,3 +120,146 @@ class BuildingPsqlRepo(
         query = filters.filter(query)
 
         return await self._get_all_results(query)
+
+    @LoggingFunctionInfo(
+        description="Retrieves SIDs and coordinates of buildings filtered by "
+        "coordinates."
+    )
+    async def get_filtered_locations(
+        self,
+        filters: BuildingCoordinatesFilter,
+    ) -> Sequence[BuildingLocation]:
+        """
+        Executes a query selecting only SIDs and coordinates of buildings filtered by
+        coordinates, without loading full models.
+
+        :param filters: BuildingCoordinatesFilter containing the filtering logic to apply.
+        :return: Sequence of BuildingLocation records matching the filters.
+        """
+
+        query = filters.filter(
+            select(self._model.sid, self._model.latitude, self._model.longitude)
+        )
+
+        result = await self._db.execute(query)
+        return [BuildingLocation.model_validate(row) for row in result.all()]
+
+    @LoggingFunctionInfo(description="Retrieves buildings by a list of SIDs.")
+    async def get_by_sids(
+        self,
+        sids: list[UUID],
+        custom_options: tuple[ExecutableOption, ...] | None = None,
+    ) -> Sequence[BuildingModel]:
+        """
+        Executes a query to retrieve buildings with the given SIDs.
+
+        :param sids: List of building UUIDs.
+        :param custom_options: Optional SQLAlchemy execution options.
+        :return: Sequence of BuildingModel records with the given SIDs.
+        """
+
+        query = await self._apply_options(
+            query=select(self._model).where(self._model.sid.in_(sids)),
+            options=custom_options,
+        )
+
+        return await self._get_all_results(query)
+
+    def _invalidate_tiles(
+        self, *locations: tuple[float, float], with_commit: bool
+    ) -> None:
+        """
+        Drop the cached tiles of changed locations once the change is committed, so
+        a concurrent request cannot cache the uncommitted rows again meanwhile.
+
+        Only the tiles of the current worker are dropped, the other workers serve
+        their cached tiles until BUILDING_TILE_TTL expires.
+
+        :param locations: Latitude and longitude pairs of the changed buildings.
+        :param with_commit: Whether the change has already been committed.
+        """
+
+        def invalidate(*_: object) -> None:
+            for location in locations:
+                self._tile_cache.invalidate(*location)
+
+        if with_commit:
+            invalidate()
+        else:
+            event.listen(self._db.sync_session, "after_commit", invalidate, once=True)
+
+    @LoggingFunctionInfo(
+        description="Create a new building and invalidate its location tile."
+    )
+    async def create(
+        self, *, obj_in: BuildingCreate, with_commit: bool = True
+    ) -> BuildingModel:
+        """
+        Creates a new building and drops the cached tile of its location.
+
+        :param obj_in: BuildingCreate instance containing new building data.
+        :param with_commit: Whether to commit the transaction immediately.
+        :return: Created BuildingModel instance.
+        """
+
+        building = await super().create(obj_in=obj_in, with_commit=with_commit)
+        self._invalidate_tiles(
+            (building.latitude, building.longitude), with_commit=with_commit
+        )
+
+        return building
+
+    @LoggingFunctionInfo(
+        description="Update a building and invalidate its old and new location tiles."
+    )
+    async def update(
+        self,
+        *,
+        db_obj: BuildingModel,
+        obj_in: BuildingUpdate | dict[str, Any],
+        with_commit: bool = True,
+    ) -> BuildingModel:
+        """
+        Updates a building and drops the cached tiles of both its previous and its
+        new location.
+
+        :param db_obj: The current building model instance.
+        :param obj_in: Input data as dict or BuildingUpdate.
+        :param with_commit: Whether to commit the transaction.
+        :return: Updated BuildingModel instance.
+        """
+
+        previous_location = (db_obj.latitude, db_obj.longitude)
+
+        building = await super().update(
+            db_obj=db_obj, obj_in=obj_in, with_commit=with_commit
+        )
+        self._invalidate_tiles(
+            previous_location,
+            (building.latitude, building.longitude),
+            with_commit=with_commit,
+        )
+
+        return building
+
+    @LoggingFunctionInfo(
+        description="Delete a building and invalidate its location tile."
+    )
+    async def delete(
+        self, *, sid: UUID, with_commit: bool = True
+    ) -> BuildingModel | None:
+        """
+        Deletes a building by its SID and drops the cached tile of its location.
+
+        :param sid: Unique identifier of the building to delete.
+        :param with_commit: Whether to commit the transaction immediately.
+        :return: Deleted BuildingModel instance or None if not found.
+        """
+
+        building = await super().delete(sid=sid, with_commit=with_commit)
+        if building:
+            self._invalidate_tiles(
+                (building.latitude, building.longitude), with_commit=with_commit
+            )
+
+        return building
@@ -8,14 +8,16 @@ from src.client.storages.deps import get_db
 from src.common.constants import ErrorCodesEnums
 from src.common.constants.deps import get_error_codes
 from src.common.logger.deps import get_building_logger
+from src.modules.building.adapters.caches.memory.deps import get_building_tile_cache
 from src.modules.building.adapters.repositories.postgres import BuildingPsqlRepo
-from src.modules.building.interfaces import IBuildingPsqlRepo
+from src.modules.building.interfaces import IBuildingPsqlRepo, IBuildingTileCache
 
 
 async def get_building_psql_repo(
     db: Annotated[AsyncSession, Depends(get_db)],
     logger: Annotated[logging.Logger, Depends(get_building_logger)],
     error_codes: Annotated[ErrorCodesEnums, Depends(get_error_codes)],
+    tile_cache: Annotated[IBuildingTileCache, Depends(get_building_tile_cache)],
 ) -> IBuildingPsqlRepo:
     """
     Provides an instance of BuildingPsqlRepo using injected dependencies.
@@ -23,7 +25,10 @@ async def get_building_psql_repo(
     :param db: AsyncSession dependency for database operations.
     :param logger: Logger dependency configured for building logs.
     :param error_codes: ErrorCodesEnums dependency for error handling.
+    :param tile_cache: Building tile cache dependency invalidated on changes.
     :return: Instance of IBuildingPsqlRepo.
     """
 
-    return BuildingPsqlRepo(db=db, errors=error_codes, logger=logger)
+    return BuildingPsqlRepo(
+        db=db, errors=error_codes, logger=logger, tile_cache=tile_cache
+    )
@@ -5,6 +5,9 @@ from fastapi import APIRouter, Depends, Path
 from fastapi_filter import FilterDepends
 
 from src.common.dependencies import APIKey, get_api_key
+from src.common.interfaces import IJSONSerializer
+from src.common.responses import FastJSONResponse
+from src.common.serializers.deps import get_json_serializer
 from src.modules.building.controllers.constants import BuildingCtrlEnums
 from src.modules.building.filters import BuildingCoordinatesFilter
 from src.modules.building.interfaces import IBuildingUC
@@ -43,6 +46,10 @@ class BuildingCtrl(IBuildingCtrl):
     def _add_controllers(self) -> None:
         """Register building-related routes to the controller."""
 
+        get_json_serializer().precompile(
+            BuildingWithOrganizations, list[BuildingWithOrganizations | None]
+        )
+
         self._controller.add_api_route(
             path=self._enums.CtrlPath.organizations_by_building,
             endpoint=self.get_organizations_by_building_sid,
@@ -60,8 +67,9 @@ class BuildingCtrl(IBuildingCtrl):
     async def get_organizations_by_building_sid(
         api_key: Annotated[APIKey, Depends(get_api_key)],
         building_usecase: Annotated[IBuildingUC, Depends(get_building_usecase)],
+        serializer: Annotated[IJSONSerializer, Depends(get_json_serializer)],
         building_sid: UUID = Path(..., alias="buildingSid"),
-    ) -> BuildingWithOrganizations:
+    ) -> FastJSONResponse:
         """
         Retrieves organizations associated with a specific building by its SID.
 
@@ -71,12 +79,13 @@ class BuildingCtrl(IBuildingCtrl):
                 UUID of the building, passed as a path parameter with alias "buildingSid".
 
         Returns:
-            BuildingWithOrganizations:
-                Data structure containing building details and its associated organizations.
+            FastJSONResponse:
+                BuildingWithOrganizations data structure containing building details and its associated organizations.
         """
 
-        return await building_usecase.get_organizations_by_sid(
-            building_sid=building_sid
+        return serializer.response(
+            await building_usecase.get_organizations_by_sid(building_sid=building_sid),
+            BuildingWithOrganizations,
         )
 
     @staticmethod
@@ -86,7 +95,8 @@ class BuildingCtrl(IBuildingCtrl):
             BuildingCoordinatesFilter, FilterDepends(BuildingCoordinatesFilter)
         ],
         building_usecase: Annotated[IBuildingUC, Depends(get_building_usecase)],
-    ) -> list[BuildingWithOrganizations | None]:
+        serializer: Annotated[IJSONSerializer, Depends(get_json_serializer)],
+    ) -> FastJSONResponse:
         """
         Retrieves a filtered list of buildings with their associated organizations
         based on provided coordinate filters.
@@ -97,10 +107,11 @@ class BuildingCtrl(IBuildingCtrl):
                 Filter parameters to specify the geographic area of interest.
 
         Returns:
-            list[BuildingWithOrganizations | None]:
+            FastJSONResponse:
                 List of buildings along with their organizations matching the filters.
         """
 
-        return await building_usecase.get_filtered_list(
-            filters=coordinates,
+        return serializer.response(
+            await building_usecase.get_filtered_list(filters=coordinates),
+            list[BuildingWithOrganizations | None],
         )
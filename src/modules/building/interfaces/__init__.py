@@ -1,3 +1,3 @@
-from .adapters import IBuildingPsqlRepo
+from .adapters import IBuildingPsqlRepo, IBuildingTileCache
 from .services import IBuildingSrv
 from .usecases import IBuildingUC
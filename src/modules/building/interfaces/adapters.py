@@ -1,12 +1,17 @@
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
+from uuid import UUID
 
 from sqlalchemy.sql.base import ExecutableOption
 
 from src.common.interfaces import IPostgresBaseRepo
 from src.modules.building.filters import BuildingCoordinatesFilter
 from src.modules.building.models import BuildingModel
-from src.modules.building.schemas import BuildingCreate, BuildingUpdate
+from src.modules.building.schemas import (
+    BuildingCreate,
+    BuildingLocation,
+    BuildingUpdate,
+)
 
 
 class IBuildingPsqlRepo(
@@ -52,3 +57,109 @@ class IBuildingPsqlRepo(
         :return: Sequence of BuildingModel instances matching the filters.
         """
         ...
+
+    @abstractmethod
+    async def get_filtered_locations(
+        self,
+        filters: BuildingCoordinatesFilter,
+    ) -> Sequence[BuildingLocation]:
+        """
+        Abstract method to retrieve only SIDs and coordinates of buildings filtered by
+        specified coordinates.
+
+        :param filters: BuildingCoordinatesFilter instance containing filtering criteria.
+        :return: Sequence of BuildingLocation instances matching the filters.
+        """
+        ...
+
+    @abstractmethod
+    async def get_by_sids(
+        self,
+        sids: list[UUID],
+        custom_options: tuple[ExecutableOption, ...] | None = None,
+    ) -> Sequence[BuildingModel]:
+        """
+        Abstract method to retrieve buildings by a list of SIDs.
+
+        :param sids: List of building UUIDs.
+        :param custom_options: Optional tuple of SQLAlchemy ExecutableOptions for query customization.
+        :return: Sequence of BuildingModel instances with the given SIDs.
+        """
+        ...
+
+
+class IBuildingTileCache(ABC):
+    """
+    Interface for a cache of building locations quantized to a fixed tile grid.
+
+    Coordinate filters are snapped to the tiles they overlap, so that slightly
+    different bounding boxes share the same cached tiles. Each tile holds the SIDs and
+    coordinates of the buildings located inside it.
+    """
+
+    @abstractmethod
+    def get_tiles(
+        self, filters: BuildingCoordinatesFilter
+    ) -> list[tuple[int, int]] | None:
+        """
+        Abstract method to compute the tiles overlapped by a coordinates filter.
+
+        :param filters: BuildingCoordinatesFilter instance with the bounding box.
+        :return: List of tile keys or None if the box spans too many tiles to be
+                served from the cache.
+        """
+        ...
+
+    @abstractmethod
+    def get_tiles_bounds(
+        self, tiles: list[tuple[int, int]]
+    ) -> BuildingCoordinatesFilter:
+        """
+        Abstract method to build a coordinates filter covering all given tiles.
+
+        :param tiles: List of tile keys.
+        :return: BuildingCoordinatesFilter for the rectangle enclosing the tiles.
+        """
+        ...
+
+    @abstractmethod
+    def get(self, tile: tuple[int, int]) -> list[BuildingLocation] | None:
+        """
+        Abstract method to retrieve cached building locations of a tile.
+
+        :param tile: Tile key.
+        :return: List of BuildingLocation instances or None if the tile is not cached.
+        """
+        ...
+
+    @abstractmethod
+    def fill(
+        self, tiles: list[tuple[int, int]], locations: Sequence[BuildingLocation]
+    ) -> dict[tuple[int, int], list[BuildingLocation]]:
+        """
+        Abstract method to distribute building locations over tiles and cache them.
+
+        :param tiles: List of tile keys that were fetched from the database.
+        :param locations: Building locations found inside the tiles bounds.
+        :return: Mapping of each tile key to the building locations inside it.
+        """
+        ...
+
+    @abstractmethod
+    def invalidate(self, latitude: float, longitude: float) -> None:
+        """
+        Abstract method to drop the cached tile containing the given point.
+
+        :param latitude: Latitude of a changed building.
+        :param longitude: Longitude of a changed building.
+        """
+        ...
+
+    @abstractmethod
+    def get_stats(self) -> dict[str, int]:
+        """
+        Abstract method to get cache usage counters.
+
+        :return: Dictionary with hits, misses and the current number of entries.
+        """
+        ...
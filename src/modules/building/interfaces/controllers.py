@@ -4,9 +4,10 @@ from uuid import UUID
 from fastapi import APIRouter
 
 from src.common.dependencies import APIKey
+from src.common.interfaces import IJSONSerializer
+from src.common.responses import FastJSONResponse
 from src.modules.building.filters import BuildingCoordinatesFilter
 from src.modules.building.interfaces import IBuildingUC
-from src.modules.organization.schemas import BuildingWithOrganizations
 
 
 class IBuildingCtrl(ABC):
@@ -31,7 +32,8 @@ class IBuildingCtrl(ABC):
         api_key: APIKey,
         building_sid: UUID,
         building_usecase: IBuildingUC,
-    ) -> BuildingWithOrganizations:
+        serializer: IJSONSerializer,
+    ) -> FastJSONResponse:
         """
         Abstract static method to retrieve organizations associated with a specific
         building SID.
@@ -39,7 +41,8 @@ class IBuildingCtrl(ABC):
         :param api_key: API key
         :param building_sid: UUID of the building.
         :param building_usecase: Instance of IBuildingUC usecase interface.
-        :return: BuildingWithOrganizations instance containing related organizations.
+        :param serializer: JSON serializer dumping the response body.
+        :return: JSON response with the BuildingWithOrganizations data.
         """
         ...
 
@@ -49,7 +52,8 @@ class IBuildingCtrl(ABC):
         api_key: APIKey,
         coordinates: BuildingCoordinatesFilter,
         building_usecase: IBuildingUC,
-    ) -> list[BuildingWithOrganizations | None]:
+        serializer: IJSONSerializer,
+    ) -> FastJSONResponse:
         """
         Abstract static method to retrieve buildings and their organizations filtered
         by coordinates.
@@ -59,6 +63,7 @@ class IBuildingCtrl(ABC):
                 parameters.
         :param building_usecase: Instance of IBuildingUC usecase for building
                 operations.
-        :return: List of BuildingWithOrganizations or None.
+        :param serializer: JSON serializer dumping the response body.
+        :return: JSON response with the list of BuildingWithOrganizations or None.
         """
         ...
@@ -4,6 +4,7 @@ from uuid import UUID
 from sqlalchemy.sql.base import ExecutableOption
 
 from src.modules.building.filters import BuildingCoordinatesFilter
+from src.modules.building.schemas import BuildingLocation
 from src.modules.organization.schemas import BuildingWithOrganizations
 
 
@@ -43,3 +44,34 @@ class IBuildingSrv(ABC):
         :return: List of BuildingWithOrganizations instances or None.
         """
         ...
+
+    @abstractmethod
+    async def get_locations(
+        self,
+        filters: BuildingCoordinatesFilter,
+    ) -> list[BuildingLocation]:
+        """
+        Abstract method to retrieve SIDs and coordinates of buildings filtered by
+        specified coordinates.
+
+        :param filters: BuildingCoordinatesFilter instance with filtering criteria.
+        :return: List of BuildingLocation instances.
+        """
+        ...
+
+    @abstractmethod
+    async def get_by_sids(
+        self,
+        building_sids: list[UUID],
+        custom_options: tuple[ExecutableOption, ...] = None,
+    ) -> list[BuildingWithOrganizations]:
+        """
+        Abstract method to retrieve buildings by their SIDs, returning a list of
+        BuildingWithOrganizations models.
+
+        :param building_sids: List of building UUIDs.
+        :param custom_options: Optional tuple of SQLAlchemy ExecutableOptions for query
+                customization.
+        :return: List of BuildingWithOrganizations instances.
+        """
+        ...
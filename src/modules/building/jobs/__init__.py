@@ -0,0 +1 @@
+from .warmup import BuildingWarmupJob
@@ -0,0 +1,21 @@
+from src.common.constants.deps import get_error_codes
+from src.common.logger.constants.deps import get_logger_config
+from src.common.logger.deps import get_logger_manager
+from src.modules.building.adapters.caches.memory.deps import get_building_tile_cache
+from src.modules.building.jobs import BuildingWarmupJob
+from src.modules.building.usecases.constants.deps import get_building_uc_consts
+
+
+def get_building_warmup_job() -> BuildingWarmupJob:
+    """
+    Provides an instance of BuildingWarmupJob.
+
+    :return: Configured BuildingWarmupJob instance.
+    """
+
+    return BuildingWarmupJob(
+        consts=get_building_uc_consts(),
+        errors=get_error_codes(),
+        logger_manager=get_logger_manager(config=get_logger_config()),
+        tile_cache=get_building_tile_cache(),
+    )
@@ -0,0 +1,58 @@
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.constants import ErrorCodesEnums
+from src.common.interfaces import ILoggerManager
+from src.modules.building.adapters.repositories.postgres import BuildingPsqlRepo
+from src.modules.building.filters import BuildingCoordinatesFilter
+from src.modules.building.interfaces import IBuildingTileCache
+from src.modules.building.usecases.constants import BuildingUCConsts
+
+
+class BuildingWarmupJob:
+    """
+    Startup job priming the building hot-path queries on a pooled connection.
+
+    The bounding box is empty, so the queries return nothing and no tile is cached.
+    """
+
+    def __init__(
+        self,
+        consts: BuildingUCConsts,
+        errors: ErrorCodesEnums,
+        logger_manager: ILoggerManager,
+        tile_cache: IBuildingTileCache,
+    ):
+        """
+        Initialize the job.
+
+        :param consts: BuildingUCConsts instance with the query options.
+        :param errors: ErrorCodesEnums instance for error handling.
+        :param logger_manager: Logger manager providing the building logger.
+        :param tile_cache: Cache of building locations, required by the repository.
+        """
+
+        self._consts = consts
+        self._errors = errors
+        self._logger = logger_manager.get_building_logger()
+        self._tile_cache = tile_cache
+
+    async def __call__(self, db: AsyncSession) -> None:
+        """
+        Run the bounding box queries and the query by SIDs once.
+
+        :param db: Session bound to the connection being warmed up.
+        """
+
+        repo = BuildingPsqlRepo(
+            db=db, errors=self._errors, logger=self._logger, tile_cache=self._tile_cache
+        )
+        options = self._consts.Options.with_organizations()
+        filters = BuildingCoordinatesFilter(
+            latitude__gte=1, latitude__lte=0, longitude__gte=1, longitude__lte=0
+        )
+
+        await repo.get_filtered_locations(filters=filters)
+        await repo.get_filtered_all(filters=filters, custom_options=options)
+        await repo.get_by_sids(sids=[uuid4()], custom_options=options)
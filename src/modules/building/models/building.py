@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Float, String
+from sqlalchemy import Computed, Float, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.client.storages.postgres.core import PostgresSchemas
@@ -11,14 +11,25 @@ from src.common.models import CoreModel
 if TYPE_CHECKING:
     from src.modules.organization.models import OrganizationAddressModel
 
+# Addresses are stored as "г. <city>, <street>", the city is the first part of it
+CITY_EXPRESSION = (
+    r"btrim(regexp_replace(split_part(address, ',', 1), '^\s*г\.\s*', ''))"
+)
+
 
 class BuildingModel(CoreModel):
-    __table_args__ = table_args(schema=PostgresSchemas.BUILDING)
+    __table_args__ = (
+        Index("ix_building_building_latitude_longitude", "latitude", "longitude"),
+        table_args(schema=PostgresSchemas.BUILDING),
+    )
 
     sid: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     address: Mapped[str] = mapped_column(String(150), nullable=False, index=True)
     latitude: Mapped[float] = mapped_column(Float, nullable=False)
     longitude: Mapped[float] = mapped_column(Float, nullable=False)
+    city: Mapped[str] = mapped_column(
+        String(150), Computed(CITY_EXPRESSION, persisted=True), index=True
+    )
 
     addresses: Mapped[list["OrganizationAddressModel"]] = relationship(
         "OrganizationAddressModel", back_populates="building"
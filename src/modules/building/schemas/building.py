@@ -21,3 +21,9 @@ class BuildingUpdate(BuildingBase):
 
 class Building(BuildingBase):
     sid: UUID
+
+
+class BuildingLocation(CoreSchema):
+    sid: UUID
+    latitude: float
+    longitude: float
@@ -7,6 +7,7 @@ from src.common.constants import ErrorCodesEnums
 from src.common.decorators.logger import LoggingFunctionInfo
 from src.modules.building.filters import BuildingCoordinatesFilter
 from src.modules.building.interfaces import IBuildingPsqlRepo, IBuildingSrv
+from src.modules.building.schemas import BuildingLocation
 from src.modules.organization.schemas import BuildingWithOrganizations
 from src.server.middleware.exception import BackendException
 
@@ -59,7 +60,7 @@ class BuildingSrv(IBuildingSrv):
             raise BackendException(self._errors.Building.BUILDING_NOT_FOUND)
 
         self._logger.debug("Building successfully retrieved with SID: %s", building_sid)
-        return BuildingWithOrganizations.model_validate(building)
+        return BuildingWithOrganizations.model_construct_trusted(building)
 
     @LoggingFunctionInfo(
         description="Retrieves buildings filtered by coordinates and returns them with "
@@ -88,5 +89,62 @@ class BuildingSrv(IBuildingSrv):
         )
 
         return [
-            BuildingWithOrganizations.model_validate(building) for building in buildings
+            BuildingWithOrganizations.model_construct_trusted(building)
+            for building in buildings
+        ]
+
+    @LoggingFunctionInfo(
+        description="Retrieves SIDs and coordinates of buildings filtered by "
+        "coordinates."
+    )
+    async def get_locations(
+        self,
+        filters: BuildingCoordinatesFilter,
+    ) -> list[BuildingLocation]:
+        """
+        Retrieves only SIDs and coordinates of buildings matching the coordinate
+        filters.
+
+        :param filters: BuildingCoordinatesFilter instance specifying filter criteria.
+        :return: List of BuildingLocation instances.
+        """
+
+        locations = await self._building_psql_repo.get_filtered_locations(
+            filters=filters
+        )
+
+        self._logger.debug(
+            "Filtered and retrieved %d building locations", len(locations)
+        )
+
+        return list(locations)
+
+    @LoggingFunctionInfo(
+        description="Retrieves buildings by SIDs and returns them with associated "
+        "organizations."
+    )
+    async def get_by_sids(
+        self,
+        building_sids: list[UUID],
+        custom_options: tuple[ExecutableOption, ...] = None,
+    ) -> list[BuildingWithOrganizations]:
+        """
+        Retrieves buildings with the given SIDs and converts them to
+        BuildingWithOrganizations models.
+
+        :param building_sids: List of building UUIDs.
+        :param custom_options: Optional SQLAlchemy execution options.
+        :return: List of BuildingWithOrganizations instances.
+        """
+
+        if not building_sids:
+            return []
+
+        buildings = await self._building_psql_repo.get_by_sids(
+            sids=building_sids, custom_options=custom_options
+        )
+
+        return [
+            BuildingWithOrganizations.model_construct_trusted(building)
+            for building in buildings
         ]
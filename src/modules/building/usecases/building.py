@@ -4,7 +4,12 @@ from uuid import UUID
 from src.common.constants import ErrorCodesEnums
 from src.common.decorators import LoggingFunctionInfo
 from src.modules.building.filters import BuildingCoordinatesFilter
-from src.modules.building.interfaces import IBuildingSrv, IBuildingUC
+from src.modules.building.interfaces import (
+    IBuildingSrv,
+    IBuildingTileCache,
+    IBuildingUC,
+)
+from src.modules.building.schemas import BuildingLocation
 from src.modules.building.usecases.constants import BuildingUCConsts
 from src.modules.organization.schemas import BuildingWithOrganizations
 
@@ -18,6 +23,7 @@ class BuildingUC(IBuildingUC):
         logger: logging.Logger,
         errors: ErrorCodesEnums,
         building_service: IBuildingSrv,
+        building_tile_cache: IBuildingTileCache,
     ):
         """
         Initialize the BuildingUC.
@@ -26,12 +32,64 @@ class BuildingUC(IBuildingUC):
         :param logger: Logger instance for logging usecase operations.
         :param errors: ErrorCodesEnums instance for error handling.
         :param building_service: Service handling building-related business logic.
+        :param building_tile_cache: Cache of building locations quantized to tiles.
         """
 
         self._consts = consts
         self._logger = logger
         self._errors = errors
         self._building_service = building_service
+        self._building_tile_cache = building_tile_cache
+
+    @staticmethod
+    def _in_box(location: BuildingLocation, filters: BuildingCoordinatesFilter) -> bool:
+        """
+        Check whether a building location lies inside the exact filter bounding box.
+
+        :param location: BuildingLocation to check.
+        :param filters: BuildingCoordinatesFilter with the bounding box.
+        :return: True if the location is inside the box.
+        """
+
+        return (
+            filters.latitude__gte <= location.latitude <= filters.latitude__lte
+            and filters.longitude__gte <= location.longitude <= filters.longitude__lte
+        )
+
+    async def _get_tiles_locations(
+        self, tiles: list[tuple[int, int]]
+    ) -> list[BuildingLocation]:
+        """
+        Collect building locations of the given tiles, reading cached tiles from
+        memory and loading all missing tiles with a single database query.
+
+        :param tiles: List of tile keys.
+        :return: List of building locations inside the tiles.
+        """
+
+        locations: list[BuildingLocation] = []
+        missing_tiles: list[tuple[int, int]] = []
+
+        for tile in tiles:
+            tile_locations = self._building_tile_cache.get(tile)
+            if tile_locations is None:
+                missing_tiles.append(tile)
+            else:
+                locations.extend(tile_locations)
+
+        self._logger.debug(
+            "Building tiles requested: %d, missing: %d", len(tiles), len(missing_tiles)
+        )
+
+        if missing_tiles:
+            fetched = await self._building_service.get_locations(
+                filters=self._building_tile_cache.get_tiles_bounds(missing_tiles)
+            )
+            filled = self._building_tile_cache.fill(missing_tiles, fetched)
+            for tile_locations in filled.values():
+                locations.extend(tile_locations)
+
+        return locations
 
     @LoggingFunctionInfo(
         description="Retrieves organizations for a building by its SID."
@@ -63,11 +121,30 @@ class BuildingUC(IBuildingUC):
         """
         Gets a filtered list of buildings enriched with associated organizations.
 
+        The bounding box is snapped to the tile grid and building SIDs are taken from
+        the tile cache, then trimmed to the exact box. Boxes spanning too many tiles
+        are queried directly.
+
         :param filters: BuildingCoordinatesFilter instance for filtering buildings.
         :return: List of validated BuildingWithOrganizations models.
         """
 
-        return await self._building_service.get_filtered_all(
-            filters=filters,
+        tiles = self._building_tile_cache.get_tiles(filters=filters)
+
+        if tiles is None:
+            self._logger.debug("Bounding box is too large for the tile cache")
+            return await self._building_service.get_filtered_all(
+                filters=filters,
+                custom_options=self._consts.Options.with_organizations(),
+            )
+
+        locations = await self._get_tiles_locations(tiles=tiles)
+
+        return await self._building_service.get_by_sids(
+            building_sids=[
+                location.sid
+                for location in locations
+                if self._in_box(location=location, filters=filters)
+            ],
             custom_options=self._consts.Options.with_organizations(),
         )
@@ -6,7 +6,12 @@ from fastapi import Depends
 from src.common.constants import ErrorCodesEnums
 from src.common.constants.deps import get_error_codes
 from src.common.logger.deps import get_building_logger
-from src.modules.building.interfaces import IBuildingSrv, IBuildingUC
+from src.modules.building.adapters.caches.memory.deps import get_building_tile_cache
+from src.modules.building.interfaces import (
+    IBuildingSrv,
+    IBuildingTileCache,
+    IBuildingUC,
+)
 from src.modules.building.services.deps import get_building_service
 from src.modules.building.usecases import BuildingUC
 from src.modules.building.usecases.constants import BuildingUCConsts
@@ -18,6 +23,9 @@ async def get_building_usecase(
     logger: Annotated[logging.Logger, Depends(get_building_logger)],
     error_codes: Annotated[ErrorCodesEnums, Depends(get_error_codes)],
     building_service: Annotated[IBuildingSrv, Depends(get_building_service)],
+    building_tile_cache: Annotated[
+        IBuildingTileCache, Depends(get_building_tile_cache)
+    ],
 ) -> IBuildingUC:
     """
     Factory function to create and return a BuildingUC instance.
@@ -26,6 +34,7 @@ async def get_building_usecase(
     :param logger: Logger instance for building use case logs.
     :param error_codes: ErrorCodesEnums instance for error handling.
     :param building_service: Service instance for building business logic.
+    :param building_tile_cache: Worker-wide cache of building location tiles.
     :return: Configured BuildingUC instance.
     """
 
@@ -34,4 +43,5 @@ async def get_building_usecase(
         logger=logger,
         errors=error_codes,
         building_service=building_service,
+        building_tile_cache=building_tile_cache,
     )
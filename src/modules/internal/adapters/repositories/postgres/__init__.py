@@ -0,0 +1 @@
+from .database_stats import DatabaseStatsPsqlRepo
@@ -0,0 +1,118 @@
+import logging
+from contextlib import nullcontext
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.constants import ErrorCodesEnums
+from src.common.decorators import LoggingFunctionInfo
+from src.modules.internal.interfaces import IDatabaseStatsPsqlRepo
+
+
+class DatabaseStatsPsqlRepo(IDatabaseStatsPsqlRepo):
+    """
+    Repository reading PostgreSQL statistics views.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        errors: ErrorCodesEnums,
+        logger: logging.Logger,
+    ):
+        """
+        Initializes the DatabaseStatsPsqlRepo with database session, error codes, and
+        logger.
+
+        :param db: AsyncSession instance for interacting with the database.
+        :param errors: Enumeration of error codes for handling repository exceptions.
+        :param logger: Logger instance for logging repository operations.
+        """
+
+        self._db = db
+        self._errors = errors
+        self._logger = logger
+
+    @LoggingFunctionInfo(
+        description="Counts server connections of an application by state."
+    )
+    async def get_activity(self, application_name: str) -> dict[str, Any]:
+        """
+        Counts backends of the application in pg_stat_activity by state and finds the
+        oldest open transaction.
+
+        :param application_name: Application name reported by the connections.
+        :return: Dictionary with the total, per state counts and the age of the
+                oldest transaction in seconds.
+        """
+
+        result = await self._db.execute(
+            text(
+                "SELECT coalesce(state, 'unknown') AS state, count(*) AS count, "
+                "extract(epoch FROM max(now() - xact_start)) AS oldest_xact "
+                "FROM pg_stat_activity WHERE application_name = :application_name "
+                "GROUP BY state"
+            ),
+            {"application_name": application_name},
+        )
+        rows = result.all()
+
+        return {
+            "total": sum(row.count for row in rows),
+            "states": {row.state: row.count for row in rows},
+            "oldest_xact_seconds": max(
+                (float(row.oldest_xact) for row in rows if row.oldest_xact is not None),
+                default=None,
+            ),
+        }
+
+    @LoggingFunctionInfo(
+        description="Retrieves the most expensive statements from pg_stat_statements."
+    )
+    async def get_top_statements(self, limit: int) -> list[dict[str, Any]] | None:
+        """
+        Fetches statements of the current database with the highest total execution
+        time.
+
+        Reading the view fails unless the extension is both created and preloaded.
+        Only superusers can read shared_preload_libraries, so the view is read in a
+        savepoint instead, and a failure does not abort the transaction. Autocommit
+        sessions have no transaction to abort and read it directly.
+
+        :param limit: Maximum number of statements.
+        :return: List of statement statistics or None if the extension is unavailable.
+        """
+
+        created = await self._db.scalar(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_extension "
+                "WHERE extname = 'pg_stat_statements')"
+            )
+        )
+        if not created:
+            self._logger.debug("pg_stat_statements is not created")
+            return None
+
+        connection = await self._db.connection()
+        options = connection.sync_connection.get_execution_options()
+        autocommit = options.get("isolation_level") == "AUTOCOMMIT"
+        try:
+            async with nullcontext() if autocommit else self._db.begin_nested():
+                result = await self._db.execute(
+                    text(
+                        "SELECT query, calls, total_exec_time, mean_exec_time, rows, "
+                        "shared_blks_hit, shared_blks_read "
+                        "FROM pg_stat_statements "
+                        "WHERE dbid = (SELECT oid FROM pg_database "
+                        "WHERE datname = current_database()) "
+                        "ORDER BY total_exec_time DESC LIMIT :limit"
+                    ),
+                    {"limit": limit},
+                )
+        except DBAPIError as e:
+            self._logger.debug("pg_stat_statements is not readable: %s", e.orig)
+            return None
+
+        return [dict(row) for row in result.mappings().all()]
@@ -0,0 +1,29 @@
+import logging
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.client.storages.deps import get_db
+from src.common.constants import ErrorCodesEnums
+from src.common.constants.deps import get_error_codes
+from src.common.logger.deps import get_base_logger
+from src.modules.internal.adapters.repositories.postgres import DatabaseStatsPsqlRepo
+from src.modules.internal.interfaces import IDatabaseStatsPsqlRepo
+
+
+async def get_database_stats_psql_repo(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    logger: Annotated[logging.Logger, Depends(get_base_logger)],
+    error_codes: Annotated[ErrorCodesEnums, Depends(get_error_codes)],
+) -> IDatabaseStatsPsqlRepo:
+    """
+    Provides an instance of DatabaseStatsPsqlRepo using injected dependencies.
+
+    :param db: AsyncSession dependency for database operations.
+    :param logger: Logger dependency for repository logs.
+    :param error_codes: ErrorCodesEnums dependency for error handling.
+    :return: Instance of IDatabaseStatsPsqlRepo.
+    """
+
+    return DatabaseStatsPsqlRepo(db=db, errors=error_codes, logger=logger)
@@ -0,0 +1 @@
+from .internal import InternalCtrl
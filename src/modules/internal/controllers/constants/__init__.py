@@ -0,0 +1 @@
+from .enums import InternalCtrlEnums
@@ -0,0 +1,19 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.common.constants import CommonEnums
+from src.common.constants.deps import get_common_enums
+from src.modules.internal.controllers.constants import InternalCtrlEnums
+
+
+def get_internal_ctrl_enums(
+    common_enums: Annotated[CommonEnums, Depends(get_common_enums)],
+) -> InternalCtrlEnums:
+    """
+    Dependency provider for InternalCtrlEnums.
+
+    :return: Instance of InternalCtrlEnums.
+    """
+
+    return InternalCtrlEnums(common_enums=common_enums)
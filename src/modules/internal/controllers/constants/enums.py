@@ -0,0 +1,28 @@
+from enum import StrEnum
+
+from src.common.constants import CommonEnums
+
+
+class CtrlPath(StrEnum):
+    """Enum defining route paths for internal controller endpoints."""
+
+    db_stats = "/db/stats"
+    admission_stats = "/admission/stats"
+    slow_queries = "/db/slow-queries"
+
+
+class InternalCtrlEnums:
+    """Container for enums used in the internal controller layer."""
+
+    def __init__(
+        self,
+        common_enums: CommonEnums,
+    ):
+        """
+        Initialize InternalCtrlEnums with shared application enums.
+
+        :param common_enums: CommonEnums instance used across multiple modules.
+        """
+
+        self.CtrlPath = CtrlPath
+        self.Common = common_enums
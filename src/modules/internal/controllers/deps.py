@@ -0,0 +1,21 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.modules.internal.controllers import InternalCtrl
+from src.modules.internal.controllers.constants import InternalCtrlEnums
+from src.modules.internal.controllers.constants.deps import get_internal_ctrl_enums
+from src.modules.internal.interfaces.controllers import IInternalCtrl
+
+
+def get_internal_controllers(
+    enums: Annotated[InternalCtrlEnums, Depends(get_internal_ctrl_enums)],
+) -> IInternalCtrl:
+    """
+    Dependency provider for the internal controller.
+
+    :param enums: Enum container used within internal controller logic.
+    :return: Instance of IInternalCtrl.
+    """
+
+    return InternalCtrl(enums=enums)
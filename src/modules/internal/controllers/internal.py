@@ -0,0 +1,136 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from src.common.dependencies import APIKey, get_api_key
+from src.common.interfaces import IJSONSerializer
+from src.common.responses import FastJSONResponse
+from src.common.serializers.deps import get_json_serializer
+from src.modules.internal.controllers.constants import InternalCtrlEnums
+from src.modules.internal.interfaces import (
+    IAdmissionStatsUC,
+    IDatabaseStatsUC,
+    ISlowQueriesUC,
+)
+from src.modules.internal.interfaces.controllers import IInternalCtrl
+from src.modules.internal.schemas import AdmissionStats, DatabaseStats, SlowQueries
+from src.modules.internal.usecases.deps import (
+    get_admission_stats_usecase,
+    get_database_stats_usecase,
+    get_slow_queries_usecase,
+)
+
+
+class InternalCtrl(IInternalCtrl):
+    """Controller of internal operational endpoints, protected by the API key."""
+
+    def __init__(
+        self,
+        enums: InternalCtrlEnums,
+    ):
+        """
+        Initialize the InternalCtrl with necessary enums and setup routes.
+
+        :param enums: Controller-specific enums including route paths and request types.
+        """
+
+        self._controller = APIRouter()
+        self._enums = enums
+        self._add_controllers()
+
+    @property
+    def controller(self) -> APIRouter:
+        """
+        Return the API router instance.
+
+        :return: Configured APIRouter with internal routes.
+        """
+
+        return self._controller
+
+    def _add_controllers(self) -> None:
+        """Register internal routes to the controller."""
+
+        get_json_serializer().precompile(DatabaseStats, AdmissionStats, SlowQueries)
+
+        self._controller.add_api_route(
+            path=self._enums.CtrlPath.db_stats,
+            endpoint=self.get_db_stats,
+            methods=[self._enums.Common.RequestTypes.GET],
+            response_model=DatabaseStats,
+        )
+        self._controller.add_api_route(
+            path=self._enums.CtrlPath.admission_stats,
+            endpoint=self.get_admission_stats,
+            methods=[self._enums.Common.RequestTypes.GET],
+            response_model=AdmissionStats,
+        )
+        self._controller.add_api_route(
+            path=self._enums.CtrlPath.slow_queries,
+            endpoint=self.get_slow_queries,
+            methods=[self._enums.Common.RequestTypes.GET],
+            response_model=SlowQueries,
+        )
+
+    @staticmethod
+    async def get_db_stats(
+        api_key: Annotated[APIKey, Depends(get_api_key)],
+        database_stats_usecase: Annotated[
+            IDatabaseStatsUC, Depends(get_database_stats_usecase)
+        ],
+        serializer: Annotated[IJSONSerializer, Depends(get_json_serializer)],
+    ) -> FastJSONResponse:
+        """
+        Controller to retrieve database telemetry of the worker serving the request.
+
+        Returns:
+            FastJSONResponse:
+                Pool size, checked out and overflow connections, checkout wait and
+                held time histograms, pg_stat_activity counts of the application and
+                top pg_stat_statements entries when the extension is available.
+        """
+
+        return serializer.response(
+            await database_stats_usecase.get_stats(), DatabaseStats
+        )
+
+    @staticmethod
+    async def get_admission_stats(
+        api_key: Annotated[APIKey, Depends(get_api_key)],
+        admission_stats_usecase: Annotated[
+            IAdmissionStatsUC, Depends(get_admission_stats_usecase)
+        ],
+        serializer: Annotated[IJSONSerializer, Depends(get_json_serializer)],
+    ) -> FastJSONResponse:
+        """
+        Controller to retrieve admission control figures of the worker serving the
+        request.
+
+        Returns:
+            FastJSONResponse:
+                Limit, active and queued requests, peak queue depth, admitted and
+                shed counts and total queue time of the worker and route limiters.
+        """
+
+        return serializer.response(admission_stats_usecase.get_stats(), AdmissionStats)
+
+    @staticmethod
+    async def get_slow_queries(
+        api_key: Annotated[APIKey, Depends(get_api_key)],
+        slow_queries_usecase: Annotated[
+            ISlowQueriesUC, Depends(get_slow_queries_usecase)
+        ],
+        serializer: Annotated[IJSONSerializer, Depends(get_json_serializer)],
+    ) -> FastJSONResponse:
+        """
+        Controller to retrieve the slow statements logged by the worker serving the
+        request.
+
+        Returns:
+            FastJSONResponse:
+                Statements over the slow query threshold, the most recent first, with
+                their duration, bound parameters, calling repository method, request
+                id and the EXPLAIN (ANALYZE, BUFFERS) plan when one was captured.
+        """
+
+        return serializer.response(slow_queries_usecase.get_slow_queries(), SlowQueries)
@@ -0,0 +1,2 @@
+from .adapters import IDatabaseStatsPsqlRepo
+from .usecases import IAdmissionStatsUC, IDatabaseStatsUC, ISlowQueriesUC
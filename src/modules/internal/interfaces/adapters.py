@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class IDatabaseStatsPsqlRepo(ABC):
+    """
+    Interface for the repository reading PostgreSQL statistics views.
+    """
+
+    @abstractmethod
+    async def get_activity(self, application_name: str) -> dict[str, Any]:
+        """
+        Counts backends of the application in pg_stat_activity by state.
+
+        :param application_name: Application name reported by the connections.
+        :return: Dictionary with the total, per state counts and the age of the
+                oldest transaction in seconds.
+        """
+        ...
+
+    @abstractmethod
+    async def get_top_statements(self, limit: int) -> list[dict[str, Any]] | None:
+        """
+        Fetches statements with the highest total execution time.
+
+        :param limit: Maximum number of statements.
+        :return: List of statement statistics or None if pg_stat_statements is
+                unavailable.
+        """
+        ...
@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+
+from fastapi import APIRouter
+
+from src.common.dependencies import APIKey
+from src.common.interfaces import IJSONSerializer
+from src.common.responses import FastJSONResponse
+from src.modules.internal.interfaces import IAdmissionStatsUC, IDatabaseStatsUC
+
+
+class IInternalCtrl(ABC):
+    """
+    Interface for the controller of internal operational endpoints.
+    """
+
+    @property
+    @abstractmethod
+    def controller(self) -> APIRouter:
+        """
+        Get the API router instance that exposes internal endpoints.
+
+        :return: APIRouter instance with internal routes
+        """
+
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def get_db_stats(
+        api_key: APIKey,
+        database_stats_usecase: IDatabaseStatsUC,
+        serializer: IJSONSerializer,
+    ) -> FastJSONResponse:
+        """
+        Abstract static method to retrieve database telemetry of the worker.
+
+        :param api_key: API key
+        :param database_stats_usecase: Instance of IDatabaseStatsUC usecase.
+        :param serializer: JSON serializer dumping the response body.
+        :return: JSON response with the DatabaseStats data.
+        """
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def get_admission_stats(
+        api_key: APIKey,
+        admission_stats_usecase: IAdmissionStatsUC,
+        serializer: IJSONSerializer,
+    ) -> FastJSONResponse:
+        """
+        Abstract static method to retrieve admission control figures of the worker.
+
+        :param api_key: API key
+        :param admission_stats_usecase: Instance of IAdmissionStatsUC usecase.
+        :param serializer: JSON serializer dumping the response body.
+        :return: JSON response with the AdmissionStats data.
+        """
+        ...
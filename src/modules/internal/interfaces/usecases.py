@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+
+from src.modules.internal.schemas import AdmissionStats, DatabaseStats, SlowQueries
+
+
+class IDatabaseStatsUC(ABC):
+    """Interface for the use case collecting database telemetry of the worker."""
+
+    @abstractmethod
+    async def get_stats(self) -> DatabaseStats:
+        """
+        Collect pool state, pool timings and server-side statistics.
+
+        :return: DatabaseStats of the current worker.
+        """
+        ...
+
+
+class IAdmissionStatsUC(ABC):
+    """Interface for the use case reporting admission control figures."""
+
+    @abstractmethod
+    def get_stats(self) -> AdmissionStats:
+        """
+        Collect queue depth and shedding figures of the worker limiters.
+
+        :return: AdmissionStats of the current worker.
+        """
+        ...
+
+
+class ISlowQueriesUC(ABC):
+    """Interface for the use case reporting the slow statement log."""
+
+    @abstractmethod
+    def get_slow_queries(self) -> SlowQueries:
+        """
+        Collect the slow statements of the worker, the most recent first.
+
+        :return: SlowQueries of the current worker.
+        """
+        ...
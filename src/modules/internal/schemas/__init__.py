@@ -0,0 +1,3 @@
+from .admission_stats import *
+from .database_stats import *
+from .slow_queries import *
@@ -0,0 +1,17 @@
+from src.common.schemas import CoreSchema
+
+
+class AdmissionLimiterStats(CoreSchema):
+    limit: int
+    active: int
+    queued: int
+    max_queued: int
+    admitted: int
+    shed: int
+    queue_time: float
+
+
+class AdmissionStats(CoreSchema):
+    worker_pid: int
+    worker: AdmissionLimiterStats
+    routes: dict[str, AdmissionLimiterStats]
@@ -0,0 +1,26 @@
+from typing import Any
+
+from src.common.schemas import CoreSchema
+
+
+class DatabasePoolStats(CoreSchema):
+    pool_class: str
+    size: int | None = None
+    checked_in: int | None = None
+    checked_out: int | None = None
+    overflow: int | None = None
+
+
+class DatabaseActivity(CoreSchema):
+    total: int
+    states: dict[str, int]
+    oldest_xact_seconds: float | None
+
+
+class DatabaseStats(CoreSchema):
+    worker_pid: int
+    pools: dict[str, DatabasePoolStats]
+    checkout_wait: dict[str, Any]
+    held_time: dict[str, Any]
+    activity: DatabaseActivity
+    statements: list[dict[str, Any]] | None
@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Any
+
+from src.common.schemas import CoreSchema
+
+
+class SlowQuery(CoreSchema):
+    occurred_at: datetime
+    duration: float
+    statement: str
+    parameters: str
+    caller: str | None
+    request_id: str | None
+    plan: list[dict[str, Any]] | None
+
+
+class SlowQueries(CoreSchema):
+    worker_pid: int
+    threshold: float | None
+    entries: list[SlowQuery]
@@ -0,0 +1,3 @@
+from .admission_stats import AdmissionStatsUC
+from .database_stats import DatabaseStatsUC
+from .slow_queries import SlowQueriesUC
@@ -0,0 +1,43 @@
+import os
+
+from src.modules.internal.interfaces import IAdmissionStatsUC
+from src.modules.internal.schemas import AdmissionLimiterStats, AdmissionStats
+from src.server.interfaces import IAdmissionLimiter
+
+
+class AdmissionStatsUC(IAdmissionStatsUC):
+    """
+    Use case reporting queue depth and shedding figures of the admission limiters of
+    the worker serving the request.
+    """
+
+    def __init__(
+        self,
+        limiter: IAdmissionLimiter,
+        route_limiters: dict[str, IAdmissionLimiter],
+    ):
+        """
+        Initialize the AdmissionStatsUC.
+
+        :param limiter: Worker-wide limiter.
+        :param route_limiters: Limiters keyed by route path template.
+        """
+
+        self._limiter = limiter
+        self._route_limiters = route_limiters
+
+    def get_stats(self) -> AdmissionStats:
+        """
+        Collect queue depth and shedding figures of the worker limiters.
+
+        :return: AdmissionStats of the current worker.
+        """
+
+        return AdmissionStats(
+            worker_pid=os.getpid(),
+            worker=AdmissionLimiterStats(**self._limiter.get_stats()),
+            routes={
+                path: AdmissionLimiterStats(**limiter.get_stats())
+                for path, limiter in self._route_limiters.items()
+            },
+        )
@@ -0,0 +1,88 @@
+import logging
+import os
+
+from src.client.storages.postgres.interfaces import (
+    IPostgresConnectionMetrics,
+    IPostgresEngine,
+)
+from src.common.constants import ErrorCodesEnums
+from src.common.decorators import LoggingFunctionInfo
+from src.modules.internal.interfaces import IDatabaseStatsPsqlRepo, IDatabaseStatsUC
+from src.modules.internal.schemas import (
+    DatabaseActivity,
+    DatabasePoolStats,
+    DatabaseStats,
+)
+
+
+class DatabaseStatsUC(IDatabaseStatsUC):
+    """
+    Use case collecting the database telemetry of the worker serving the request.
+
+    Pool figures and timings are per worker, server-side counts cover all workers of
+    the application, together they show whether DB_POOL_SIZE and WEB_CONCURRENCY fit
+    the load.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        errors: ErrorCodesEnums,
+        psql_engine: IPostgresEngine,
+        held_time_metrics: IPostgresConnectionMetrics,
+        checkout_wait_metrics: IPostgresConnectionMetrics,
+        database_stats_psql_repo: IDatabaseStatsPsqlRepo,
+        application_name: str,
+        top_statements: int,
+    ):
+        """
+        Initialize the DatabaseStatsUC.
+
+        :param logger: Logger instance for use case logs.
+        :param errors: ErrorCodesEnums instance for error handling.
+        :param psql_engine: Engine owning the worker pools.
+        :param held_time_metrics: Histogram of connection held times.
+        :param checkout_wait_metrics: Histogram of checkout wait times.
+        :param database_stats_psql_repo: Repository reading statistics views.
+        :param application_name: Application name reported by the connections.
+        :param top_statements: Number of top statements to report.
+        """
+
+        self._logger = logger
+        self._errors = errors
+        self._psql_engine = psql_engine
+        self._held_time_metrics = held_time_metrics
+        self._checkout_wait_metrics = checkout_wait_metrics
+        self._database_stats_psql_repo = database_stats_psql_repo
+        self._application_name = application_name
+        self._top_statements = top_statements
+
+    @LoggingFunctionInfo(description="Collects database telemetry of the worker.")
+    async def get_stats(self) -> DatabaseStats:
+        """
+        Collect pool state, pool timings and server-side statistics.
+
+        Pool figures are read before the statistics queries check out a connection,
+        so the request itself is not counted.
+
+        :return: DatabaseStats of the current worker.
+        """
+
+        pools = self._psql_engine.get_pool_stats()
+        checkout_wait = self._checkout_wait_metrics.get_stats()
+        held_time = self._held_time_metrics.get_stats()
+
+        return DatabaseStats(
+            worker_pid=os.getpid(),
+            pools={name: DatabasePoolStats(**stats) for name, stats in pools.items()},
+            checkout_wait=checkout_wait,
+            held_time=held_time,
+            activity=DatabaseActivity(
+                **await self._database_stats_psql_repo.get_activity(
+                    application_name=self._application_name
+                )
+            ),
+            statements=await self._database_stats_psql_repo.get_top_statements(
+                limit=self._top_statements
+            ),
+        )
@@ -0,0 +1,89 @@
+import logging
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.client.storages.postgres.core.deps import (
+    get_postgres_checkout_wait_metrics,
+    get_postgres_connection_metrics,
+    get_postgres_engine,
+    get_postgres_slow_query_log,
+)
+from src.common.constants import ErrorCodesEnums
+from src.common.constants.deps import get_error_codes
+from src.common.logger.deps import get_base_logger
+from src.config.settings.deps import get_settings
+from src.modules.internal.adapters.repositories.postgres.deps import (
+    get_database_stats_psql_repo,
+)
+from src.modules.internal.interfaces import (
+    IAdmissionStatsUC,
+    IDatabaseStatsPsqlRepo,
+    IDatabaseStatsUC,
+    ISlowQueriesUC,
+)
+from src.modules.internal.usecases import (
+    AdmissionStatsUC,
+    DatabaseStatsUC,
+    SlowQueriesUC,
+)
+from src.server.admission.deps import (
+    get_admission_limiter,
+    get_admission_route_limiters,
+)
+
+
+async def get_database_stats_usecase(
+    logger: Annotated[logging.Logger, Depends(get_base_logger)],
+    error_codes: Annotated[ErrorCodesEnums, Depends(get_error_codes)],
+    database_stats_psql_repo: Annotated[
+        IDatabaseStatsPsqlRepo, Depends(get_database_stats_psql_repo)
+    ],
+) -> IDatabaseStatsUC:
+    """
+    Factory function to create and return a DatabaseStatsUC instance.
+
+    :param logger: Logger instance for use case logs.
+    :param error_codes: ErrorCodesEnums instance for error handling.
+    :param database_stats_psql_repo: Repository reading statistics views.
+    :return: Configured DatabaseStatsUC instance.
+    """
+
+    settings = get_settings().postgres
+
+    return DatabaseStatsUC(
+        logger=logger,
+        errors=error_codes,
+        psql_engine=get_postgres_engine(),
+        held_time_metrics=get_postgres_connection_metrics(),
+        checkout_wait_metrics=get_postgres_checkout_wait_metrics(),
+        database_stats_psql_repo=database_stats_psql_repo,
+        application_name=settings.POSTGRES_APPLICATION_NAME,
+        top_statements=settings.POSTGRES_STATS_TOP_STATEMENTS,
+    )
+
+
+def get_admission_stats_usecase() -> IAdmissionStatsUC:
+    """
+    Factory function to create and return an AdmissionStatsUC instance.
+
+    :return: Configured AdmissionStatsUC instance.
+    """
+
+    return AdmissionStatsUC(
+        limiter=get_admission_limiter(),
+        route_limiters=get_admission_route_limiters(),
+    )
+
+
+def get_slow_queries_usecase() -> ISlowQueriesUC:
+    """
+    Factory function to create and return a SlowQueriesUC instance.
+
+    :return: Configured SlowQueriesUC instance.
+    """
+
+    return SlowQueriesUC(
+        slow_query_log=get_postgres_slow_query_log(),
+        threshold=get_settings().postgres.POSTGRES_SLOW_QUERY_THRESHOLD,
+    )
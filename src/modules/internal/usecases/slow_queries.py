@@ -0,0 +1,38 @@
+import os
+
+from src.client.storages.postgres.interfaces import IPostgresSlowQueryLog
+from src.modules.internal.interfaces import ISlowQueriesUC
+from src.modules.internal.schemas import SlowQueries, SlowQuery
+
+
+class SlowQueriesUC(ISlowQueriesUC):
+    """
+    Use case reporting the slow statements logged by the worker serving the request.
+    """
+
+    def __init__(self, slow_query_log: IPostgresSlowQueryLog, threshold: float | None):
+        """
+        Initialize the SlowQueriesUC.
+
+        :param slow_query_log: Worker-wide log of slow statements.
+        :param threshold: Minimum duration in seconds of a slow statement.
+        """
+
+        self._slow_query_log = slow_query_log
+        self._threshold = threshold
+
+    def get_slow_queries(self) -> SlowQueries:
+        """
+        Collect the slow statements of the worker, the most recent first.
+
+        :return: SlowQueries of the current worker.
+        """
+
+        return SlowQueries(
+            worker_pid=os.getpid(),
+            threshold=self._threshold,
+            entries=[
+                SlowQuery.model_construct_trusted(entry)
+                for entry in self._slow_query_log.get_entries()
+            ],
+        )
@@ -0,0 +1 @@
+from .organization import OrganizationFacetMemoryCache
@@ -0,0 +1,26 @@
+from functools import lru_cache
+
+from src.client.storages.memory.core import MemoryTTLCache
+from src.config.settings.deps import get_settings
+from src.modules.organization.adapters.caches.memory import (
+    OrganizationFacetMemoryCache,
+)
+from src.modules.organization.interfaces import IOrganizationFacetCache
+
+
+@lru_cache
+def get_organization_facet_cache() -> IOrganizationFacetCache:
+    """
+    Provides the worker-wide instance of OrganizationFacetMemoryCache.
+
+    :return: Instance of IOrganizationFacetCache.
+    """
+
+    settings = get_settings()
+
+    return OrganizationFacetMemoryCache(
+        cache=MemoryTTLCache(
+            ttl=settings.cache.ORGANIZATION_FACET_TTL,
+            max_entries=settings.cache.ORGANIZATION_FACET_MAX_ENTRIES,
+        ),
+    )
@@ -0,0 +1,71 @@
+from collections.abc import Hashable
+
+from src.client.storages.memory.interfaces import IMemoryCache
+from src.modules.organization.filters import OrganizationQueryFilter
+from src.modules.organization.interfaces import IOrganizationFacetCache
+from src.modules.organization.schemas import OrganizationFacets
+
+
+class OrganizationFacetMemoryCache(IOrganizationFacetCache):
+    """
+    In-memory cache of organization search facets keyed by the normalized filter.
+
+    Entries are not invalidated on writes, staleness is bounded by the TTL of the
+    underlying cache.
+    """
+
+    def __init__(self, cache: IMemoryCache):
+        """
+        Initialize the facet cache.
+
+        :param cache: Memory cache used to store facets.
+        """
+
+        self._cache = cache
+
+    @staticmethod
+    def _get_key(filters: OrganizationQueryFilter) -> Hashable:
+        """
+        Build the normalized cache key of a filter.
+
+        The sort order does not affect facets and the name is matched case
+        insensitively, so both are normalized away.
+
+        :param filters: Organization query filter.
+        :return: Hashable cache key.
+        """
+
+        criteria = filters.model_dump(exclude={"order_by"}, exclude_none=True)
+        if "name" in criteria:
+            criteria["name"] = criteria["name"].lower()
+
+        return tuple(sorted(criteria.items()))
+
+    def get(self, filters: OrganizationQueryFilter) -> OrganizationFacets | None:
+        """
+        Retrieve cached facets of a query.
+
+        :param filters: Organization query filter.
+        :return: Cached OrganizationFacets or None if absent or expired.
+        """
+
+        return self._cache.get(self._get_key(filters))
+
+    def set(self, filters: OrganizationQueryFilter, facets: OrganizationFacets) -> None:
+        """
+        Store facets of a query.
+
+        :param filters: Organization query filter.
+        :param facets: Facets computed for the filter.
+        """
+
+        self._cache.set(self._get_key(filters), facets)
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get cache usage counters.
+
+        :return: Dictionary with hits, misses and the current number of entries.
+        """
+
+        return self._cache.get_stats()
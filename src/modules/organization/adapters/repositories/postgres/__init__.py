@@ -1,4 +1,6 @@
 from .organization import OrganizationPsqlRepo
 from .organization_activity import OrganizationActivityPsqlRepo
 from .organization_address import OrganizationAddressPsqlRepo
+from .organization_document import OrganizationDocumentPsqlRepo
+from .organization_search import OrganizationSearchPsqlRepo
 from .phone_number import PhoneNumberPsqlRepo
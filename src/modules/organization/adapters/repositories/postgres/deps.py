@@ -11,13 +11,17 @@ from src.common.logger.deps import get_organization_logger
 from src.modules.organization.adapters.repositories.postgres import (
     OrganizationActivityPsqlRepo,
     OrganizationAddressPsqlRepo,
+    OrganizationDocumentPsqlRepo,
     OrganizationPsqlRepo,
+    OrganizationSearchPsqlRepo,
     PhoneNumberPsqlRepo,
 )
 from src.modules.organization.interfaces import (
     IOrganizationActivityPsqlRepo,
     IOrganizationAddressPsqlRepo,
+    IOrganizationDocumentPsqlRepo,
     IOrganizationPsqlRepo,
+    IOrganizationSearchPsqlRepo,
     IPhoneNumberPsqlRepo,
 )
 
@@ -88,3 +92,37 @@ async def get_organization_activity_psql_repo(
     """
 
     return OrganizationActivityPsqlRepo(db=db, errors=error_codes, logger=logger)
+
+
+async def get_organization_search_psql_repo(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    logger: Annotated[logging.Logger, Depends(get_organization_logger)],
+    error_codes: Annotated[ErrorCodesEnums, Depends(get_error_codes)],
+) -> IOrganizationSearchPsqlRepo:
+    """
+    Provides an instance of OrganizationSearchPsqlRepo using injected dependencies.
+
+    :param db: AsyncSession dependency for database operations.
+    :param logger: Logger dependency configured for organization logs.
+    :param error_codes: ErrorCodesEnums dependency for error handling.
+    :return: Instance of IOrganizationSearchPsqlRepo.
+    """
+
+    return OrganizationSearchPsqlRepo(db=db, errors=error_codes, logger=logger)
+
+
+async def get_organization_document_psql_repo(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    logger: Annotated[logging.Logger, Depends(get_organization_logger)],
+    error_codes: Annotated[ErrorCodesEnums, Depends(get_error_codes)],
+) -> IOrganizationDocumentPsqlRepo:
+    """
+    Provides an instance of OrganizationDocumentPsqlRepo using injected dependencies.
+
+    :param db: AsyncSession dependency for database operations.
+    :param logger: Logger dependency configured for organization logs.
+    :param error_codes: ErrorCodesEnums dependency for error handling.
+    :return: Instance of IOrganizationDocumentPsqlRepo.
+    """
+
+    return OrganizationDocumentPsqlRepo(db=db, errors=error_codes, logger=logger)
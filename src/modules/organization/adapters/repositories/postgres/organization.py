@@ -1,18 +1,60 @@
 import logging
+import math
 from uuid import UUID
 
-from sqlalchemy import Sequence, select
+from sqlalchemy import (
+    JSON,
+    ColumnElement,
+    ScalarSelect,
+    Select,
+    Sequence,
+    Uuid,
+    any_,
+    distinct,
+    exists,
+    func,
+    literal,
+    literal_column,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql.base import ExecutableOption
 
 from src.common.adapters.repositories.postgres import PostgresBaseRepo
 from src.common.constants import ErrorCodesEnums
 from src.common.decorators import LoggingFunctionInfo
+from src.common.schemas import Pagination
 from src.modules.activity.models import ActivityModel
+from src.modules.building.models import BuildingModel
+from src.modules.organization.filters import (
+    OrganizationQueryFilter,
+    OrganizationQueryOrderEnum,
+)
 from src.modules.organization.interfaces import IOrganizationPsqlRepo
-from src.modules.organization.models import OrganizationModel
+from src.modules.organization.models import (
+    OrganizationActivityModel,
+    OrganizationAddressModel,
+    OrganizationModel,
+)
+from src.modules.organization.models.organization import PhoneNumberModel
 from src.modules.organization.schemas import OrganizationCreate, OrganizationUpdate
 
+EARTH_RADIUS_METERS = 6_371_000
+METERS_PER_LATITUDE_DEGREE = 111_320
+# Not a backslash, so the ESCAPE literal does not depend on standard_conforming_strings
+LIKE_ESCAPE = "/"
+
+# Lower rank goes first: predicates backed by the most selective index drive the plan
+QUERY_PREDICATE_RANKS = {
+    "phone_prefix": 0,
+    "geo": 1,
+    "activity": 2,
+    "name": 3,
+}
+
 
 class OrganizationPsqlRepo(
     PostgresBaseRepo[OrganizationModel, OrganizationCreate, OrganizationUpdate],
@@ -109,3 +151,429 @@ class OrganizationPsqlRepo(
         query = await self._apply_options(query=query, options=custom_options)
 
         return await self._get_all_results(query)
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        """
+        Escape LIKE wildcards in a user provided value.
+
+        :param value: Raw value.
+        :return: Value safe to embed into a LIKE pattern escaped with LIKE_ESCAPE.
+        """
+
+        for char in (LIKE_ESCAPE, "%", "_"):
+            value = value.replace(char, LIKE_ESCAPE + char)
+        return value
+
+    @staticmethod
+    def _get_activity_sids_query(
+        activity_name: str, include_descendants: bool
+    ) -> Select:
+        """
+        Build a query selecting SIDs of the named activity and, optionally, of its
+        whole subtree using a recursive CTE.
+
+        :param activity_name: Name of the root activity.
+        :param include_descendants: Whether to include descendant activities.
+        :return: Select statement returning activity SIDs.
+        """
+
+        root = select(ActivityModel.sid).where(ActivityModel.name == activity_name)
+
+        if not include_descendants:
+            return root
+
+        subtree = root.cte("activity_subtree", recursive=True)
+        child = aliased(ActivityModel)
+        subtree = subtree.union_all(
+            select(child.sid).join(subtree, child.parent_sid == subtree.c.sid)
+        )
+
+        return select(subtree.c.sid)
+
+    def _get_geo_predicate(
+        self, filters: OrganizationQueryFilter
+    ) -> ColumnElement[bool]:
+        """
+        Build the semi-join predicate matching organizations located inside the
+        bounding box or within the radius of the filter.
+
+        The radius search is prefiltered by its enclosing box, so the composite
+        coordinates index is used before the exact haversine distance is computed.
+
+        :param filters: Organization query filter with a geographic criterion.
+        :return: EXISTS predicate over organization addresses and buildings.
+        """
+
+        if filters.has_bbox:
+            bounds = (
+                filters.latitude_gte,
+                filters.latitude_lte,
+                filters.longitude_gte,
+                filters.longitude_lte,
+            )
+            distance_clauses = ()
+        else:
+            lat_delta = filters.radius / METERS_PER_LATITUDE_DEGREE
+            lon_delta = filters.radius / (
+                METERS_PER_LATITUDE_DEGREE
+                * max(math.cos(math.radians(filters.latitude)), 1e-6)
+            )
+            bounds = (
+                filters.latitude - lat_delta,
+                filters.latitude + lat_delta,
+                filters.longitude - lon_delta,
+                filters.longitude + lon_delta,
+            )
+            half_lat = func.radians(BuildingModel.latitude - filters.latitude) * 0.5
+            half_lon = func.radians(BuildingModel.longitude - filters.longitude) * 0.5
+            haversine = func.power(func.sin(half_lat), 2) + func.cos(
+                math.radians(filters.latitude)
+            ) * func.cos(func.radians(BuildingModel.latitude)) * func.power(
+                func.sin(half_lon), 2
+            )
+            distance_clauses = (
+                2 * EARTH_RADIUS_METERS * func.asin(func.sqrt(haversine))
+                <= filters.radius,
+            )
+
+        return exists(
+            select(OrganizationAddressModel.organization_sid)
+            .join(
+                BuildingModel,
+                BuildingModel.sid == OrganizationAddressModel.building_sid,
+            )
+            .where(
+                OrganizationAddressModel.organization_sid == self._model.sid,
+                BuildingModel.latitude.between(bounds[0], bounds[1]),
+                BuildingModel.longitude.between(bounds[2], bounds[3]),
+                *distance_clauses,
+            )
+        )
+
+    async def _get_query_predicates(
+        self, filters: OrganizationQueryFilter
+    ) -> list[ColumnElement[bool]]:
+        """
+        Compile the filter criteria into predicates ordered by selectivity rank.
+
+        The SIDs of the activity filter are looked up first. Within the page query
+        the planner overestimates the rows of the recursive subtree and scans the
+        organization links, with the SIDs as an array it uses their index.
+
+        :param filters: Organization query filter.
+        :return: List of predicates, the most selective one first.
+        """
+
+        ranked: list[tuple[int, ColumnElement[bool]]] = []
+
+        if filters.phone_prefix:
+            ranked.append(
+                (
+                    QUERY_PREDICATE_RANKS["phone_prefix"],
+                    exists(
+                        select(PhoneNumberModel.sid).where(
+                            PhoneNumberModel.organization_sid == self._model.sid,
+                            PhoneNumberModel.phone.like(
+                                f"{self._escape_like(filters.phone_prefix)}%",
+                                escape=LIKE_ESCAPE,
+                            ),
+                        )
+                    ),
+                )
+            )
+
+        if filters.has_bbox or filters.has_radius:
+            ranked.append(
+                (QUERY_PREDICATE_RANKS["geo"], self._get_geo_predicate(filters))
+            )
+
+        if filters.activity_name:
+            activity_sids = await self._db.scalars(
+                self._get_activity_sids_query(
+                    activity_name=filters.activity_name,
+                    include_descendants=filters.include_descendants,
+                )
+            )
+            ranked.append(
+                (
+                    QUERY_PREDICATE_RANKS["activity"],
+                    exists(
+                        select(OrganizationActivityModel.activity_sid).where(
+                            OrganizationActivityModel.organization_sid
+                            == self._model.sid,
+                            OrganizationActivityModel.activity_sid
+                            == any_(literal(list(activity_sids), ARRAY(Uuid))),
+                        )
+                    ),
+                )
+            )
+
+        if filters.name:
+            ranked.append(
+                (
+                    QUERY_PREDICATE_RANKS["name"],
+                    self._model.name.ilike(
+                        f"%{self._escape_like(filters.name)}%", escape=LIKE_ESCAPE
+                    ),
+                )
+            )
+
+        ranked.sort(key=lambda item: item[0])
+        return [predicate for _, predicate in ranked]
+
+    def _get_query_order(
+        self, order_by: OrganizationQueryOrderEnum
+    ) -> tuple[ColumnElement, ...]:
+        """
+        Build ORDER BY clauses for the query sort order with a stable tie-breaker.
+
+        :param order_by: Requested sort order.
+        :return: Tuple of ordering clauses.
+        """
+
+        orders = {
+            OrganizationQueryOrderEnum.NAME: self._model.name.asc(),
+            OrganizationQueryOrderEnum.NAME_DESC: self._model.name.desc(),
+            OrganizationQueryOrderEnum.CREATED_AT: self._model.created_at.asc(),
+            OrganizationQueryOrderEnum.CREATED_AT_DESC: self._model.created_at.desc(),
+        }
+
+        return orders[order_by], self._model.sid.asc()
+
+    def _get_page_query(
+        self,
+        predicates: list[ColumnElement[bool]],
+        filters: OrganizationQueryFilter,
+        pagination: Pagination,
+        *columns: ColumnElement,
+    ) -> Select:
+        """
+        Build the page query selecting matching organizations with a window count
+        of all matches and optional extra columns.
+
+        :param predicates: Compiled filter predicates.
+        :param filters: Organization query filter, used for the sort order.
+        :param pagination: Pagination parameters containing limit and offset.
+        :param columns: Extra columns to select alongside each organization.
+        :return: Select statement for the page.
+        """
+
+        return (
+            select(self._model, func.count().over().label("total"), *columns)
+            .where(*predicates)
+            .order_by(*self._get_query_order(filters.order_by))
+            .limit(pagination.limit)
+            .offset(pagination.offset)
+        )
+
+    def _get_facets_query(
+        self, predicates: list[ColumnElement[bool]], facet_limit: int
+    ) -> ScalarSelect:
+        """
+        Build a scalar subquery aggregating facet counts of all matching
+        organizations into a single JSON object.
+
+        Activity and city counts are computed in one pass over the matches with
+        ``GROUPING SETS`` and each facet is capped to its most frequent values.
+
+        :param predicates: Compiled filter predicates.
+        :param facet_limit: Maximum number of values returned per facet.
+        :return: Scalar subquery returning ``{"activities": [...], "cities": [...]}``.
+        """
+
+        matched = (
+            select(self._model.sid.label("organization_sid"))
+            .where(*predicates)
+            .cte("matched_organization")
+        )
+
+        is_activity = func.grouping(BuildingModel.city)
+        counts = (
+            select(
+                ActivityModel.sid.label("activity_sid"),
+                ActivityModel.name.label("activity_name"),
+                BuildingModel.city.label("city"),
+                is_activity.label("is_activity"),
+                func.count(distinct(matched.c.organization_sid)).label("count"),
+            )
+            .select_from(matched)
+            .outerjoin(
+                OrganizationActivityModel,
+                OrganizationActivityModel.organization_sid
+                == matched.c.organization_sid,
+            )
+            .outerjoin(
+                ActivityModel,
+                ActivityModel.sid == OrganizationActivityModel.activity_sid,
+            )
+            .outerjoin(
+                OrganizationAddressModel,
+                OrganizationAddressModel.organization_sid == matched.c.organization_sid,
+            )
+            .outerjoin(
+                BuildingModel,
+                BuildingModel.sid == OrganizationAddressModel.building_sid,
+            )
+            .group_by(
+                func.grouping_sets(
+                    tuple_(ActivityModel.sid, ActivityModel.name),
+                    tuple_(BuildingModel.city),
+                )
+            )
+            .cte("facet_count")
+        )
+
+        ranked = select(
+            counts,
+            func.row_number()
+            .over(
+                partition_by=counts.c.is_activity,
+                order_by=(
+                    counts.c.count.desc(),
+                    counts.c.activity_name,
+                    counts.c.city,
+                ),
+            )
+            .label("rank"),
+        ).where(
+            # Organizations without an activity or an address form NULL groups
+            (counts.c.activity_sid.is_not(None) & (counts.c.is_activity == 1))
+            | (counts.c.city.is_not(None) & (counts.c.is_activity == 0))
+        )
+        ranked = ranked.cte("facet_rank")
+
+        empty = literal_column("'[]'::json")
+        activities = func.json_agg(
+            aggregate_order_by(
+                func.json_build_object(
+                    "sid",
+                    ranked.c.activity_sid,
+                    "name",
+                    ranked.c.activity_name,
+                    "count",
+                    ranked.c.count,
+                ),
+                ranked.c.rank,
+            )
+        ).filter(ranked.c.is_activity == 1)
+        cities = func.json_agg(
+            aggregate_order_by(
+                func.json_build_object("city", ranked.c.city, "count", ranked.c.count),
+                ranked.c.rank,
+            )
+        ).filter(ranked.c.is_activity == 0)
+
+        return (
+            select(
+                func.json_build_object(
+                    "activities",
+                    func.coalesce(activities, empty),
+                    "cities",
+                    func.coalesce(cities, empty),
+                    type_=JSON,
+                )
+            )
+            .where(ranked.c.rank <= facet_limit)
+            .scalar_subquery()
+        )
+
+    @LoggingFunctionInfo(
+        description="Retrieve a page of organizations matching combined criteria with "
+        "a single query."
+    )
+    async def get_filtered_page(
+        self,
+        filters: OrganizationQueryFilter,
+        pagination: Pagination,
+        custom_options: tuple[ExecutableOption, ...] | None = None,
+    ) -> tuple[Sequence[OrganizationModel], int]:
+        """
+        Compiles all filter criteria into one statement returning the requested page
+        together with the total number of matches via a window count.
+
+        :param filters: Organization query filter with the criteria to combine.
+        :param pagination: Pagination parameters containing limit and offset.
+        :param custom_options: Optional SQLAlchemy execution options.
+        :return: A tuple with the page of organizations and the total number of
+                matches.
+        """
+
+        predicates = await self._get_query_predicates(filters)
+
+        query = await self._apply_options(
+            query=self._get_page_query(predicates, filters, pagination),
+            options=custom_options,
+        )
+
+        result = await self._db.execute(query)
+        rows = result.all()
+
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+
+        total = 0
+        if pagination.offset:
+            # The page is past the end, the window count is not available
+            total = await self._get_single_result(
+                select(func.count()).select_from(self._model).where(*predicates)
+            )
+
+        self._logger.debug("Organization query matched no rows on the page")
+        return [], total
+
+    @LoggingFunctionInfo(
+        description="Retrieve a page of organizations matching combined criteria with "
+        "facet counts in a single query."
+    )
+    async def get_filtered_page_with_facets(
+        self,
+        filters: OrganizationQueryFilter,
+        pagination: Pagination,
+        facet_limit: int,
+        custom_options: tuple[ExecutableOption, ...] | None = None,
+    ) -> tuple[Sequence[OrganizationModel], int, dict]:
+        """
+        Compiles all filter criteria into one statement returning the requested page,
+        the total number of matches and the facet counts of all matches, which are
+        attached to every row as an uncorrelated subquery evaluated once.
+
+        :param filters: Organization query filter with the criteria to combine.
+        :param pagination: Pagination parameters containing limit and offset.
+        :param facet_limit: Maximum number of values returned per facet.
+        :param custom_options: Optional SQLAlchemy execution options.
+        :return: A tuple with the page of organizations, the total number of matches
+                and the facets keyed by facet name.
+        """
+
+        predicates = await self._get_query_predicates(filters)
+        facets = self._get_facets_query(predicates, facet_limit)
+
+        query = await self._apply_options(
+            query=self._get_page_query(
+                predicates, filters, pagination, facets.label("facets")
+            ),
+            options=custom_options,
+        )
+
+        result = await self._db.execute(query)
+        rows = result.all()
+
+        if rows:
+            return [row[0] for row in rows], rows[0].total, rows[0].facets
+
+        # No rows to attach the facets to, fetch them with the total alone
+        result = await self._db.execute(
+            select(
+                select(func.count())
+                .select_from(self._model)
+                .where(*predicates)
+                .scalar_subquery()
+                .label("total"),
+                facets.label("facets"),
+            )
+        )
+        row = result.one()
+
+        self._logger.debug("Organization query matched no rows on the page")
+        return [], row.total, row.facets
@@ -0,0 +1,93 @@
+import logging
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.constants import ErrorCodesEnums
+from src.common.decorators import LoggingFunctionInfo
+from src.modules.organization.interfaces import IOrganizationDocumentPsqlRepo
+from src.modules.organization.models import (
+    OrganizationDocumentModel,
+    OrganizationModel,
+)
+
+
+class OrganizationDocumentPsqlRepo(IOrganizationDocumentPsqlRepo):
+    """
+    Repository reading organization documents maintained by database triggers.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        errors: ErrorCodesEnums,
+        logger: logging.Logger,
+    ):
+        """
+        Initializes the OrganizationDocumentPsqlRepo with database session, error
+        codes, and logger.
+
+        :param db: AsyncSession instance for interacting with the database.
+        :param errors: Enumeration of error codes for handling repository exceptions.
+        :param logger: Logger instance for logging repository operations.
+        """
+
+        self._db = db
+        self._model = OrganizationDocumentModel
+        self._errors = errors
+        self._logger = logger
+
+    @LoggingFunctionInfo(description="Retrieves an organization document by SID.")
+    async def get_payload(self, sid: UUID) -> dict | None:
+        """
+        Fetches the document payload of an organization with a single primary key
+        lookup, no joins involved.
+
+        :param sid: UUID of the organization.
+        :return: OrganizationFull payload or None if not found.
+        """
+
+        result = await self._db.execute(
+            select(self._model.payload).where(self._model.sid == sid)
+        )
+
+        return result.scalars().first()
+
+    @LoggingFunctionInfo(description="Rebuilds documents of all organizations.")
+    async def rebuild(self) -> int:
+        """
+        Rebuilds documents of all organizations with the same database function the
+        triggers use. Only missing documents and documents that differ from the
+        freshly built payload are written.
+
+        :return: Number of documents written.
+        """
+
+        build = func.organization.build_organization_document
+        now = func.timezone("utc", func.now())
+
+        query = insert(self._model).from_select(
+            ["sid", "payload", "created_at", "updated_at"],
+            select(
+                OrganizationModel.sid,
+                build(OrganizationModel.sid, type_=JSONB),
+                now,
+                now,
+            ),
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[self._model.sid],
+            set_={
+                "payload": query.excluded.payload,
+                "updated_at": query.excluded.updated_at,
+            },
+            where=self._model.payload.is_distinct_from(query.excluded.payload),
+        )
+
+        result = await self._db.execute(query)
+        await self._db.commit()
+
+        self._logger.info("Rebuilt %d organization document(s)", result.rowcount)
+        return result.rowcount
@@ -0,0 +1,167 @@
+import logging
+from collections.abc import Sequence
+from datetime import timedelta
+from uuid import UUID
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.constants import ErrorCodesEnums
+from src.common.decorators import LoggingFunctionInfo
+from src.common.utils import CustomDateTime
+from src.modules.organization.interfaces import IOrganizationSearchPsqlRepo
+from src.modules.organization.models import (
+    OrganizationSearchRefreshModel,
+    OrganizationSearchView,
+)
+
+# Advisory lock key, so only one worker of the deployment refreshes the view at once
+REFRESH_LOCK_KEY = 7_310_429_001
+
+
+class OrganizationSearchPsqlRepo(IOrganizationSearchPsqlRepo):
+    """
+    Repository reading the denormalized organization search materialized view.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        errors: ErrorCodesEnums,
+        logger: logging.Logger,
+    ):
+        """
+        Initializes the OrganizationSearchPsqlRepo with database session, error codes,
+        and logger.
+
+        :param db: AsyncSession instance for interacting with the database.
+        :param errors: Enumeration of error codes for handling repository exceptions.
+        :param logger: Logger instance for logging repository operations.
+        """
+
+        self._db = db
+        self._view = OrganizationSearchView
+        self._errors = errors
+        self._logger = logger
+
+    @LoggingFunctionInfo(
+        description="Retrieves an organization payload from the search view by SID."
+    )
+    async def get_payload(self, sid: UUID) -> dict | None:
+        """
+        Fetches the ready-to-serve payload of an organization with a primary key
+        lookup on the view.
+
+        :param sid: UUID of the organization.
+        :return: OrganizationFull payload or None if not found.
+        """
+
+        result = await self._db.execute(
+            select(self._view.c.payload).where(self._view.c.sid == sid)
+        )
+
+        return result.scalars().first()
+
+    @LoggingFunctionInfo(
+        description="Retrieve organization payloads from the search view by activity "
+        "SIDs."
+    )
+    async def get_payloads_by_activity_sids(
+        self, activity_sids: list[UUID]
+    ) -> Sequence[dict]:
+        """
+        Retrieves payloads of organizations whose activities overlap the given SIDs,
+        served by the GIN index on the activity SIDs array.
+
+        :param activity_sids: List of activity UUIDs.
+        :return: Sequence of OrganizationFull payloads.
+        """
+
+        result = await self._db.execute(
+            select(self._view.c.payload).where(
+                self._view.c.activity_sids.overlap(activity_sids)
+            )
+        )
+
+        return result.scalars().all()
+
+    @LoggingFunctionInfo(
+        description="Search organization payloads in the search view by name."
+    )
+    async def search_payloads_by_name(self, name: str) -> Sequence[dict]:
+        """
+        Performs a case-insensitive partial name search, served by the trigram index
+        on the view.
+
+        :param name: Name pattern to look for.
+        :return: Sequence of OrganizationFull payloads.
+        """
+
+        result = await self._db.execute(
+            select(self._view.c.payload).where(self._view.c.name.ilike(f"%{name}%"))
+        )
+
+        return result.scalars().all()
+
+    @LoggingFunctionInfo(
+        description="Refresh the organization search view concurrently."
+    )
+    async def refresh(self, min_interval: float | None = None) -> bool:
+        """
+        Refreshes the view with ``REFRESH MATERIALIZED VIEW CONCURRENTLY``, so reads
+        are not blocked. A transaction-level advisory lock makes concurrent calls from
+        other workers skip the refresh instead of queueing behind it.
+
+        The refresh time is recorded under the lock, so with a minimum interval the
+        workers of a deployment refresh the view once per interval between them.
+
+        :param min_interval: Seconds since the last refresh below which the refresh
+                is skipped, None to always refresh.
+        :return: True if the view was refreshed, False if another refresh is
+                already running or the last one is too recent.
+        """
+
+        locked = await self._db.scalar(
+            select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_KEY))
+        )
+
+        if not locked:
+            await self._db.rollback()
+            self._logger.debug("Organization search view refresh is already running")
+            return False
+
+        now = CustomDateTime.get_utc_datetime()
+        if min_interval is not None:
+            refreshed_at = await self._db.scalar(
+                select(OrganizationSearchRefreshModel.refreshed_at).where(
+                    OrganizationSearchRefreshModel.sid == self._view.name
+                )
+            )
+            if refreshed_at is not None and now - refreshed_at < timedelta(
+                seconds=min_interval
+            ):
+                await self._db.rollback()
+                self._logger.debug("Organization search view was refreshed recently")
+                return False
+
+        await self._db.execute(
+            text(
+                "REFRESH MATERIALIZED VIEW CONCURRENTLY "
+                f"{self._view.schema}.{self._view.name}"
+            )
+        )
+        await self._db.execute(
+            insert(OrganizationSearchRefreshModel)
+            .values(
+                sid=self._view.name, refreshed_at=now, created_at=now, updated_at=now
+            )
+            .on_conflict_do_update(
+                index_elements=[OrganizationSearchRefreshModel.sid],
+                set_={"refreshed_at": now, "updated_at": now},
+            )
+        )
+        await self._db.commit()
+
+        self._logger.info("Organization search view refreshed")
+        return True
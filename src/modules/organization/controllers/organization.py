@@ -4,10 +4,18 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query
 
 from src.common.dependencies import APIKey, get_api_key
+from src.common.interfaces import IJSONSerializer
+from src.common.responses import FastJSONResponse
+from src.common.schemas import Pagination
+from src.common.serializers.deps import get_json_serializer
 from src.modules.organization.controllers.constants import OrganizationCtrlEnums
+from src.modules.organization.filters import (
+    OrganizationFieldset,
+    OrganizationQueryFilter,
+)
 from src.modules.organization.interfaces import IOrganizationUC
 from src.modules.organization.interfaces.controllers import IOrganizationCtrl
-from src.modules.organization.schemas import OrganizationFull
+from src.modules.organization.schemas import OrganizationFull, OrganizationQueryResult
 from src.modules.organization.usecases.deps import get_organization_usecase
 
 
@@ -43,6 +51,17 @@ class OrganizationCtrl(IOrganizationCtrl):
     def _add_controllers(self) -> None:
         """Register organization-related routes to the controller."""
 
+        get_json_serializer().precompile(
+            OrganizationFull, list[OrganizationFull], OrganizationQueryResult
+        )
+
+        # Registered before the SID route so "/query" is not matched as a SID
+        self._controller.add_api_route(
+            path=self._enums.CtrlPath.query,
+            endpoint=self.query,
+            methods=[self._enums.Common.RequestTypes.GET],
+            response_model=OrganizationQueryResult,
+        )
         self._controller.add_api_route(
             path=self._enums.CtrlPath.sid,
             endpoint=self.get_by_sid,
@@ -75,7 +94,9 @@ class OrganizationCtrl(IOrganizationCtrl):
         organization_usecase: Annotated[
             IOrganizationUC, Depends(get_organization_usecase)
         ],
-    ) -> OrganizationFull:
+        serializer: Annotated[IJSONSerializer, Depends(get_json_serializer)],
+        fieldset: Annotated[OrganizationFieldset, Depends()],
+    ) -> FastJSONResponse:
         """
         Controller to retrieve full organization details by SID.
 
@@ -83,13 +104,19 @@ class OrganizationCtrl(IOrganizationCtrl):
 
             - sid (UUID):
                 UUID of the organization to fetch.
+            - fields (str, optional):
+                Comma-separated organization fields to return, all if omitted.
 
         Returns:
-            OrganizationFull:
-                Detailed organization data for the given SID.
+            FastJSONResponse:
+                Detailed OrganizationFull data for the given SID.
         """
 
-        return await organization_usecase.get_by_sid(sid=sid)
+        return serializer.response(
+            await organization_usecase.get_by_sid(sid=sid, fieldset=fieldset),
+            OrganizationFull,
+            exclude=fieldset.exclude,
+        )
 
     @staticmethod
     async def search_by_descendant_activity(
@@ -97,8 +124,10 @@ class OrganizationCtrl(IOrganizationCtrl):
         organization_usecase: Annotated[
             IOrganizationUC, Depends(get_organization_usecase)
         ],
+        serializer: Annotated[IJSONSerializer, Depends(get_json_serializer)],
+        fieldset: Annotated[OrganizationFieldset, Depends()],
         activity_name: str = Query(..., alias="activityName"),
-    ) -> list[OrganizationFull]:
+    ) -> FastJSONResponse:
         """
         Controller to search organizations by activity and its descendant activities
         using a provided name.
@@ -107,14 +136,20 @@ class OrganizationCtrl(IOrganizationCtrl):
 
             - activityName (str):
                 Name of the activity to search by.
+            - fields (str, optional):
+                Comma-separated organization fields to return, all if omitted.
 
         Returns:
-            List[OrganizationFull]:
-                List of organizations matching the activity represented by the SID.
+            FastJSONResponse:
+                List of OrganizationFull matching the activity.
         """
 
-        return await organization_usecase.search_by_descendant_activity(
-            activity_name=activity_name
+        return serializer.response(
+            await organization_usecase.search_by_descendant_activity(
+                activity_name=activity_name, fieldset=fieldset
+            ),
+            list[OrganizationFull],
+            exclude=fieldset.exclude_many,
         )
 
     @staticmethod
@@ -123,8 +158,10 @@ class OrganizationCtrl(IOrganizationCtrl):
         organization_usecase: Annotated[
             IOrganizationUC, Depends(get_organization_usecase)
         ],
+        serializer: Annotated[IJSONSerializer, Depends(get_json_serializer)],
+        fieldset: Annotated[OrganizationFieldset, Depends()],
         activity_name: str = Query(..., alias="activityName"),
-    ) -> list[OrganizationFull]:
+    ) -> FastJSONResponse:
         """
         Controller to search organizations by activity using a provided name.
 
@@ -132,14 +169,20 @@ class OrganizationCtrl(IOrganizationCtrl):
 
             - activityName (str):
                 Name of the activity to search by.
+            - fields (str, optional):
+                Comma-separated organization fields to return, all if omitted.
 
         Returns:
-            List[OrganizationFull]:
-                List of organizations matching the activity represented by the SID.
+            FastJSONResponse:
+                List of OrganizationFull matching the activity.
         """
 
-        return await organization_usecase.search_by_activity(
-            activity_name=activity_name
+        return serializer.response(
+            await organization_usecase.search_by_activity(
+                activity_name=activity_name, fieldset=fieldset
+            ),
+            list[OrganizationFull],
+            exclude=fieldset.exclude_many,
         )
 
     @staticmethod
@@ -149,15 +192,83 @@ class OrganizationCtrl(IOrganizationCtrl):
         organization_usecase: Annotated[
             IOrganizationUC, Depends(get_organization_usecase)
         ],
-    ) -> list[OrganizationFull]:
+        serializer: Annotated[IJSONSerializer, Depends(get_json_serializer)],
+        fieldset: Annotated[OrganizationFieldset, Depends()],
+    ) -> FastJSONResponse:
         """
         Controller method to search organizations by name.
 
         Parameters:
         - name: The name or partial name of the organizations to search for.
+        - fields: Comma-separated organization fields to return, all if omitted.
+
+        Returns:
+        - JSON response with the OrganizationFull list matching the search criteria.
+        """
+
+        return serializer.response(
+            await organization_usecase.search_by_name(name=name, fieldset=fieldset),
+            list[OrganizationFull],
+            exclude=fieldset.exclude_many,
+        )
+
+    @staticmethod
+    async def query(
+        api_key: Annotated[APIKey, Depends(get_api_key)],
+        filters: Annotated[OrganizationQueryFilter, Depends()],
+        pagination: Annotated[Pagination, Depends()],
+        organization_usecase: Annotated[
+            IOrganizationUC, Depends(get_organization_usecase)
+        ],
+        serializer: Annotated[IJSONSerializer, Depends(get_json_serializer)],
+        fieldset: Annotated[OrganizationFieldset, Depends()],
+        facets: bool = Query(False),
+    ) -> FastJSONResponse:
+        """
+        Controller to query organizations by any combination of name, activity
+        subtree, geographic area and phone prefix in a single database round trip.
+
+        Parameters:
+
+            - name (str, optional):
+                Partial organization name.
+            - activityName (str, optional):
+                Activity name to filter by.
+            - includeDescendants (bool):
+                Whether descendant activities match as well (default: true).
+            - latitudeGte, latitudeLte, longitudeGte, longitudeLte (float, optional):
+                Bounding box bounds, all four are required together.
+            - latitude, longitude, radius (float, optional):
+                Point and radius in meters, all three are required together.
+            - phonePrefix (str, optional):
+                Leading part of any organization phone number.
+            - orderBy (str):
+                One of name, -name, createdAt, -createdAt (default: name).
+            - limit, offset (int):
+                Pagination parameters.
+            - facets (bool):
+                Whether to return activity and city counts of all matches, the
+                search endpoints never return them.
+            - fields (str, optional):
+                Comma-separated organization fields to return, all if omitted.
 
         Returns:
-        - List of OrganizationFull instances matching the search criteria.
+            FastJSONResponse:
+                OrganizationQueryResult page of matching organizations with the total number of matches and,
+                if requested, facet counts.
         """
 
-        return await organization_usecase.search_by_name(name=name)
+        return serializer.response(
+            await organization_usecase.query(
+                filters=filters,
+                pagination=pagination,
+                with_facets=facets,
+                fieldset=fieldset,
+            ),
+            OrganizationQueryResult,
+            exclude=(
+                None
+                if fieldset.exclude_many is None
+                else {"items": fieldset.exclude_many}
+            ),
+        )
@@ -0,0 +1,192 @@
+from enum import StrEnum
+from typing import Self
+
+from pydantic import Field, PrivateAttr, model_validator
+from pydantic.alias_generators import to_snake
+
+from src.common.constants import ErrorCodesEnums
+from src.common.errors import BackendException
+from src.common.schemas import CoreSchema
+
+
+class OrganizationQueryOrderEnum(StrEnum):
+    """Defines available sort orders of the organization query."""
+
+    NAME = "name"
+    NAME_DESC = "-name"
+    CREATED_AT = "createdAt"
+    CREATED_AT_DESC = "-createdAt"
+
+
+class OrganizationFieldEnum(StrEnum):
+    """Defines organization fields that can be selected by a sparse fieldset."""
+
+    SID = "sid"
+    NAME = "name"
+    ADDRESS = "address"
+    ACTIVITIES = "activities"
+    PHONE_NUMBERS = "phoneNumbers"
+
+
+class OrganizationQueryFilter(CoreSchema):
+    """
+    Multi-criteria organization filter compiled into a single SQL query.
+
+    All given criteria are combined with AND. The geographic criterion is either a
+    bounding box (all four ``latitude*``/``longitude*`` bounds) or a radius in meters
+    around a point (``latitude``, ``longitude`` and ``radius``).
+    """
+
+    name: str | None = Field(None, min_length=1)
+    activity_name: str | None = Field(None, min_length=1)
+    include_descendants: bool = True
+    latitude_gte: float | None = None
+    latitude_lte: float | None = None
+    longitude_gte: float | None = None
+    longitude_lte: float | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    radius: float | None = Field(None, gt=0)
+    phone_prefix: str | None = Field(None, min_length=1)
+    order_by: OrganizationQueryOrderEnum = OrganizationQueryOrderEnum.NAME
+
+    @property
+    def has_bbox(self) -> bool:
+        """
+        Check whether the bounding box criterion is set.
+
+        :return: True if all bounding box bounds are given.
+        """
+
+        return None not in (
+            self.latitude_gte,
+            self.latitude_lte,
+            self.longitude_gte,
+            self.longitude_lte,
+        )
+
+    @property
+    def has_radius(self) -> bool:
+        """
+        Check whether the radius criterion is set.
+
+        :return: True if the point and the radius are given.
+        """
+
+        return None not in (self.latitude, self.longitude, self.radius)
+
+    @model_validator(mode="after")
+    def validate_geo(self) -> Self:
+        """
+        Validate that geographic criteria are complete and not mixed.
+
+        :return: The validated filter.
+        """
+
+        bbox = (
+            self.latitude_gte,
+            self.latitude_lte,
+            self.longitude_gte,
+            self.longitude_lte,
+        )
+        radius = (self.latitude, self.longitude, self.radius)
+
+        if any(v is not None for v in bbox) and not self.has_bbox:
+            raise BackendException(
+                error=ErrorCodesEnums().Organization.INVALID_QUERY_FILTER,
+                cause="Bounding box requires all four bounds",
+            )
+
+        if any(v is not None for v in radius) and not self.has_radius:
+            raise BackendException(
+                error=ErrorCodesEnums().Organization.INVALID_QUERY_FILTER,
+                cause="Radius search requires latitude, longitude and radius",
+            )
+
+        if self.has_bbox and self.has_radius:
+            raise BackendException(
+                error=ErrorCodesEnums().Organization.INVALID_QUERY_FILTER,
+                cause="Bounding box and radius cannot be combined",
+            )
+
+        return self
+
+
+class OrganizationFieldset(CoreSchema):
+    """
+    Sparse fieldset of organization responses.
+
+    ``fields`` is a comma-separated list of organization fields, e.g.
+    ``sid,name,address``. Only the selected fields are loaded and returned, ``sid`` is
+    always returned. Without ``fields`` the full organization is returned.
+    """
+
+    fields: str | None = Field(None, min_length=1)
+
+    _selected: frozenset[OrganizationFieldEnum] | None = PrivateAttr(None)
+
+    @property
+    def selected(self) -> frozenset[OrganizationFieldEnum] | None:
+        """
+        Get the selected fields.
+
+        :return: Selected fields, or None if the full organization is requested.
+        """
+
+        return self._selected
+
+    @property
+    def exclude(self) -> set[str] | None:
+        """
+        Get the fields outside the fieldset as schema field names to exclude on dump.
+
+        :return: Set of schema field names, or None if nothing is excluded.
+        """
+
+        if self._selected is None:
+            return None
+        return {
+            to_snake(field) for field in set(OrganizationFieldEnum) - self._selected
+        }
+
+    @property
+    def exclude_many(self) -> dict[str, set[str]] | None:
+        """
+        Get the fields to exclude on dump of an organization list.
+
+        :return: Exclude mapping applied to every list item, or None if nothing is
+                excluded.
+        """
+
+        exclude = self.exclude
+        return None if exclude is None else {"__all__": exclude}
+
+    @model_validator(mode="after")
+    def validate_fields(self) -> Self:
+        """
+        Parse the comma-separated fields and validate that all of them are known.
+
+        :return: The validated fieldset.
+        """
+
+        if self.fields is None:
+            return self
+
+        names = {name.strip() for name in self.fields.split(",") if name.strip()}
+        if not names:
+            raise BackendException(
+                error=ErrorCodesEnums().Organization.INVALID_FIELDSET,
+                cause="No fields given",
+            )
+
+        unknown = names - set(OrganizationFieldEnum)
+        if unknown:
+            raise BackendException(
+                error=ErrorCodesEnums().Organization.INVALID_FIELDSET,
+                cause=f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+
+        self._selected = frozenset(
+            {OrganizationFieldEnum.SID, *map(OrganizationFieldEnum, names)}
+        )
+        return self
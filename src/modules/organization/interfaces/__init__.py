@@ -1,7 +1,10 @@
 from .adapters import (
     IOrganizationActivityPsqlRepo,
     IOrganizationAddressPsqlRepo,
+    IOrganizationDocumentPsqlRepo,
+    IOrganizationFacetCache,
     IOrganizationPsqlRepo,
+    IOrganizationSearchPsqlRepo,
     IPhoneNumberPsqlRepo,
 )
 from .services import IOrganizationSrv
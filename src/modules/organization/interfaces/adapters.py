@@ -5,6 +5,8 @@ from uuid import UUID
 from sqlalchemy.sql.base import ExecutableOption
 
 from src.common.interfaces import IPostgresBaseRepo
+from src.common.schemas import Pagination
+from src.modules.organization.filters import OrganizationQueryFilter
 from src.modules.organization.models.organization import (
     OrganizationActivityModel,
     OrganizationAddressModel,
@@ -17,6 +19,7 @@ from src.modules.organization.schemas import (
     OrganizationAddressCreate,
     OrganizationAddressUpdate,
     OrganizationCreate,
+    OrganizationFacets,
     OrganizationUpdate,
     PhoneNumberCreate,
     PhoneNumberUpdate,
@@ -73,6 +76,46 @@ class IOrganizationPsqlRepo(
         :return: Sequence of matching OrganizationModel or None.
         """
 
+    @abstractmethod
+    async def get_filtered_page(
+        self,
+        filters: OrganizationQueryFilter,
+        pagination: Pagination,
+        custom_options: tuple[ExecutableOption, ...] | None = None,
+    ) -> tuple[Sequence[OrganizationModel], int]:
+        """
+        Abstract method to retrieve a page of organizations matching all the given
+        criteria together with the total number of matches.
+
+        :param filters: Organization query filter with the criteria to combine.
+        :param pagination: Pagination parameters containing limit and offset.
+        :param custom_options: Optional SQLAlchemy execution options.
+        :return: A tuple with the page of organizations and the total number of
+                matches.
+        """
+        ...
+
+    @abstractmethod
+    async def get_filtered_page_with_facets(
+        self,
+        filters: OrganizationQueryFilter,
+        pagination: Pagination,
+        facet_limit: int,
+        custom_options: tuple[ExecutableOption, ...] | None = None,
+    ) -> tuple[Sequence[OrganizationModel], int, dict]:
+        """
+        Abstract method to retrieve a page of organizations matching all the given
+        criteria together with the total number of matches and the facet counts.
+
+        :param filters: Organization query filter with the criteria to combine.
+        :param pagination: Pagination parameters containing limit and offset.
+        :param facet_limit: Maximum number of values returned per facet.
+        :param custom_options: Optional SQLAlchemy execution options.
+        :return: A tuple with the page of organizations, the total number of matches
+                and the facets keyed by facet name.
+        """
+        ...
+
 
 class IPhoneNumberPsqlRepo(
     IPostgresBaseRepo[PhoneNumberModel, PhoneNumberCreate, PhoneNumberUpdate], ABC
@@ -167,3 +210,121 @@ class IOrganizationActivityPsqlRepo(
         :return: OrganizationActivityModel instance matching the criteria or None.
         """
         ...
+
+
+class IOrganizationFacetCache(ABC):
+    """
+    Interface for a cache of organization search facets.
+
+    Facets depend only on the filter criteria, not on the requested page or sort
+    order, so entries are keyed by the normalized filter.
+    """
+
+    @abstractmethod
+    def get(self, filters: OrganizationQueryFilter) -> OrganizationFacets | None:
+        """
+        Abstract method to retrieve cached facets of a query.
+
+        :param filters: Organization query filter.
+        :return: Cached OrganizationFacets or None if absent or expired.
+        """
+        ...
+
+    @abstractmethod
+    def set(self, filters: OrganizationQueryFilter, facets: OrganizationFacets) -> None:
+        """
+        Abstract method to store facets of a query.
+
+        :param filters: Organization query filter.
+        :param facets: Facets computed for the filter.
+        """
+        ...
+
+    @abstractmethod
+    def get_stats(self) -> dict[str, int]:
+        """
+        Abstract method to get cache usage counters.
+
+        :return: Dictionary with hits, misses and the current number of entries.
+        """
+        ...
+
+
+class IOrganizationSearchPsqlRepo(ABC):
+    """
+    Interface for a repository reading the denormalized organization search view.
+
+    Each row of the view holds pre-joined search columns of one organization and its
+    ready-to-serve OrganizationFull payload.
+    """
+
+    @abstractmethod
+    async def get_payload(self, sid: UUID) -> dict | None:
+        """
+        Abstract method to retrieve the payload of an organization by its SID.
+
+        :param sid: UUID of the organization.
+        :return: OrganizationFull payload or None if not found.
+        """
+        ...
+
+    @abstractmethod
+    async def get_payloads_by_activity_sids(
+        self, activity_sids: list[UUID]
+    ) -> Sequence[dict]:
+        """
+        Abstract method to retrieve payloads of organizations linked to any of the
+        provided activity SIDs.
+
+        :param activity_sids: List of UUIDs for the activities.
+        :return: Sequence of OrganizationFull payloads.
+        """
+        ...
+
+    @abstractmethod
+    async def search_payloads_by_name(self, name: str) -> Sequence[dict]:
+        """
+        Abstract method to search payloads of organizations by a partial name match.
+
+        :param name: Partial or full name to search by.
+        :return: Sequence of OrganizationFull payloads.
+        """
+        ...
+
+    @abstractmethod
+    async def refresh(self, min_interval: float | None = None) -> bool:
+        """
+        Abstract method to refresh the view without blocking concurrent reads.
+
+        :param min_interval: Seconds since the last refresh below which the refresh
+                is skipped, None to always refresh.
+        :return: True if the view was refreshed, False if another refresh is
+                already running or the last one is too recent.
+        """
+        ...
+
+
+class IOrganizationDocumentPsqlRepo(ABC):
+    """
+    Interface for a repository reading trigger-maintained organization documents.
+    """
+
+    @abstractmethod
+    async def get_payload(self, sid: UUID) -> dict | None:
+        """
+        Abstract method to retrieve the document payload of an organization.
+
+        :param sid: UUID of the organization.
+        :return: OrganizationFull payload or None if not found.
+        """
+        ...
+
+    @abstractmethod
+    async def rebuild(self) -> int:
+        """
+        Abstract method to rebuild documents of all organizations, adding missing ones
+        and repairing those drifted from the source tables.
+
+        :return: Number of documents written.
+        """
+        ...
@@ -4,8 +4,14 @@ from uuid import UUID
 from fastapi import APIRouter
 
 from src.common.dependencies import APIKey
+from src.common.interfaces import IJSONSerializer
+from src.common.responses import FastJSONResponse
+from src.common.schemas import Pagination
+from src.modules.organization.filters import (
+    OrganizationFieldset,
+    OrganizationQueryFilter,
+)
 from src.modules.organization.interfaces import IOrganizationUC
-from src.modules.organization.schemas import OrganizationFull
 
 
 class IOrganizationCtrl(ABC):
@@ -31,7 +37,9 @@ class IOrganizationCtrl(ABC):
         api_key: APIKey,
         sid: UUID,
         organization_usecase: IOrganizationUC,
-    ) -> OrganizationFull:
+        serializer: IJSONSerializer,
+        fieldset: OrganizationFieldset,
+    ) -> FastJSONResponse:
         """
         Abstract static method to retrieve full organization details by SID using the
         given use case.
@@ -40,7 +48,9 @@ class IOrganizationCtrl(ABC):
         :param sid: UUID of the organization.
         :param organization_usecase: Instance of IOrganizationUC use case for
                 organization logic.
-        :return: OrganizationFull instance containing detailed organization data.
+        :param serializer: JSON serializer dumping the response body.
+        :param fieldset: Sparse fieldset selecting organization fields to return.
+        :return: JSON response with the OrganizationFull data.
         """
         ...
 
@@ -49,16 +59,20 @@ class IOrganizationCtrl(ABC):
     async def search_by_descendant_activity(
         api_key: APIKey,
         organization_usecase: IOrganizationUC,
+        serializer: IJSONSerializer,
+        fieldset: OrganizationFieldset,
         activity_name: str,
-    ) -> list[OrganizationFull]:
+    ) -> FastJSONResponse:
         """
         Abstract static method to search organizations by activity name using the
         provided organization use case.
 
         :param api_key: API key.
         :param organization_usecase: Instance of IOrganizationUC use case interface.
+        :param serializer: JSON serializer dumping the response body.
+        :param fieldset: Sparse fieldset selecting organization fields to return.
         :param activity_name: Activity name string to search organizations by.
-        :return: List of OrganizationFull instances representing matching organizations.
+        :return: JSON response with the list of matching OrganizationFull data.
         """
         ...
 
@@ -67,16 +81,20 @@ class IOrganizationCtrl(ABC):
     async def search_by_activity(
         api_key: APIKey,
         organization_usecase: IOrganizationUC,
+        serializer: IJSONSerializer,
+        fieldset: OrganizationFieldset,
         activity_name: str,
-    ) -> list[OrganizationFull]:
+    ) -> FastJSONResponse:
         """
         Abstract static method to search organizations by activity name using the
         provided organization use case.
 
         :param api_key: API key.
         :param organization_usecase: Instance of IOrganizationUC use case interface.
+        :param serializer: JSON serializer dumping the response body.
+        :param fieldset: Sparse fieldset selecting organization fields to return.
         :param activity_name: Activity name string to search organizations by.
-        :return: List of OrganizationFull instances representing matching organizations.
+        :return: JSON response with the list of matching OrganizationFull data.
         """
         ...
 
@@ -86,7 +104,9 @@ class IOrganizationCtrl(ABC):
         api_key: APIKey,
         name: str,
         organization_usecase: IOrganizationUC,
-    ) -> list[OrganizationFull]:
+        serializer: IJSONSerializer,
+        fieldset: OrganizationFieldset,
+    ) -> FastJSONResponse:
         """
         Abstract static method to search organizations by name using the given
         organization use case.
@@ -94,6 +114,35 @@ class IOrganizationCtrl(ABC):
         :param api_key: API key.
         :param name: Name or partial name of organizations to search for.
         :param organization_usecase: Instance of IOrganizationUC for business logic.
-        :return: List of OrganizationFull instances matching the name search.
+        :param serializer: JSON serializer dumping the response body.
+        :param fieldset: Sparse fieldset selecting organization fields to return.
+        :return: JSON response with the list of OrganizationFull data matching the
+                name search.
+        """
+        ...
+
+    @staticmethod
+    @abstractmethod
+    async def query(
+        api_key: APIKey,
+        filters: OrganizationQueryFilter,
+        pagination: Pagination,
+        organization_usecase: IOrganizationUC,
+        serializer: IJSONSerializer,
+        fieldset: OrganizationFieldset,
+        facets: bool,
+    ) -> FastJSONResponse:
+        """
+        Abstract static method to query organizations by combined criteria using the
+        given organization use case.
+
+        :param api_key: API key.
+        :param filters: Organization query filter with the criteria to combine.
+        :param pagination: Pagination parameters containing limit and offset.
+        :param organization_usecase: Instance of IOrganizationUC for business logic.
+        :param serializer: JSON serializer dumping the response body.
+        :param fieldset: Sparse fieldset selecting organization fields to return.
+        :param facets: Whether to return activity and city facet counts.
+        :return: JSON response with the OrganizationQueryResult data.
         """
         ...
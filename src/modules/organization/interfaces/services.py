@@ -3,7 +3,9 @@ from uuid import UUID
 
 from sqlalchemy.sql.base import ExecutableOption
 
-from src.modules.organization.schemas import OrganizationFull
+from src.common.schemas import Pagination
+from src.modules.organization.filters import OrganizationQueryFilter
+from src.modules.organization.schemas import OrganizationFull, OrganizationQueryResult
 
 
 class IOrganizationSrv(ABC):
@@ -54,3 +56,25 @@ class IOrganizationSrv(ABC):
         :return: List of OrganizationFull instances matching the name.
         """
         ...
+
+    @abstractmethod
+    async def query(
+        self,
+        filters: OrganizationQueryFilter,
+        pagination: Pagination,
+        facet_limit: int | None = None,
+        custom_options: tuple[ExecutableOption, ...] = None,
+    ) -> OrganizationQueryResult:
+        """
+        Abstract method to retrieve a page of organizations matching combined
+        criteria, optionally with facet counts.
+
+        :param filters: Organization query filter with the criteria to combine.
+        :param pagination: Pagination parameters containing limit and offset.
+        :param facet_limit: Maximum number of values per facet, facets are not
+                computed if None.
+        :param custom_options: Optional SQLAlchemy execution options.
+        :return: OrganizationQueryResult with OrganizationFull items and the total
+                count.
+        """
+        ...
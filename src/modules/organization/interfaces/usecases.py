@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
-from src.modules.organization.schemas import OrganizationFull
+from src.common.schemas import Pagination
+from src.modules.organization.filters import (
+    OrganizationFieldset,
+    OrganizationQueryFilter,
+)
+from src.modules.organization.schemas import OrganizationFull, OrganizationQueryResult
 
 
 class IOrganizationUC(ABC):
@@ -10,45 +15,75 @@ class IOrganizationUC(ABC):
     """
 
     @abstractmethod
-    async def get_by_sid(self, sid: UUID) -> OrganizationFull:
+    async def get_by_sid(
+        self, sid: UUID, fieldset: OrganizationFieldset | None = None
+    ) -> OrganizationFull:
         """
         Abstract method to fetch full organization details by SID.
 
         :param sid: UUID of the organization.
+        :param fieldset: Sparse fieldset selecting relations to load, all if None.
         :return: OrganizationFull instance with detailed organization data.
         """
         ...
 
     @abstractmethod
     async def search_by_descendant_activity(
-        self, activity_name: str
+        self, activity_name: str, fieldset: OrganizationFieldset | None = None
     ) -> list[OrganizationFull]:
         """
         Abstract method to search organizations by descendant activity name.
 
         :param activity_name: Name of the activity to search organizations by,
                 including descendants.
+        :param fieldset: Sparse fieldset selecting relations to load, all if None.
         :return: List of OrganizationFull instances matching the activity and its
                 descendants.
         """
         ...
 
     @abstractmethod
-    async def search_by_activity(self, activity_name: str) -> list[OrganizationFull]:
+    async def search_by_activity(
+        self, activity_name: str, fieldset: OrganizationFieldset | None = None
+    ) -> list[OrganizationFull]:
         """
         Abstract method to search organizations by activity name.
 
         :param activity_name: Name of the activity to search organizations by.
+        :param fieldset: Sparse fieldset selecting relations to load, all if None.
         :return: List of OrganizationFull instances matching the activity.
         """
         ...
 
     @abstractmethod
-    async def search_by_name(self, name: str) -> list[OrganizationFull]:
+    async def search_by_name(
+        self, name: str, fieldset: OrganizationFieldset | None = None
+    ) -> list[OrganizationFull]:
         """
         Abstract method to search organizations by name with full option.
 
         :param name: Name or partial name of organizations to search for.
+        :param fieldset: Sparse fieldset selecting relations to load, all if None.
         :return: List of OrganizationFull instances matching the name.
         """
         ...
+
+    @abstractmethod
+    async def query(
+        self,
+        filters: OrganizationQueryFilter,
+        pagination: Pagination,
+        with_facets: bool = False,
+        fieldset: OrganizationFieldset | None = None,
+    ) -> OrganizationQueryResult:
+        """
+        Abstract method to query organizations by combined criteria with full option.
+
+        :param filters: Organization query filter with the criteria to combine.
+        :param pagination: Pagination parameters containing limit and offset.
+        :param with_facets: Whether to return activity and city facet counts.
+        :param fieldset: Sparse fieldset selecting relations to load, all if None.
+        :return: OrganizationQueryResult with OrganizationFull items and the total
+                count.
+        """
+        ...
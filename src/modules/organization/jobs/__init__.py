@@ -0,0 +1,2 @@
+from .organization_search import OrganizationSearchRefreshJob
+from .warmup import OrganizationWarmupJob
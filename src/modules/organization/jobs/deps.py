@@ -0,0 +1,53 @@
+from src.client.storages.postgres.core.deps import get_postgres_engine
+from src.common.constants.deps import get_error_codes
+from src.common.logger.constants.deps import get_logger_config
+from src.common.logger.deps import get_logger_manager
+from src.config.settings.deps import get_settings
+from src.modules.organization.jobs import (
+    OrganizationSearchRefreshJob,
+    OrganizationWarmupJob,
+)
+from src.modules.organization.usecases.constants.deps import get_organization_uc_consts
+
+
+def get_organization_search_refresh_job() -> OrganizationSearchRefreshJob:
+    """
+    Provides an instance of OrganizationSearchRefreshJob.
+
+    :return: Configured OrganizationSearchRefreshJob instance.
+    """
+
+    return OrganizationSearchRefreshJob(
+        psql_engine=get_postgres_engine(),
+        errors=get_error_codes(),
+        logger_manager=get_logger_manager(config=get_logger_config()),
+        interval=get_settings().search.ORGANIZATION_SEARCH_VIEW_REFRESH_INTERVAL,
+    )
+
+
+def get_organization_search_refresh_enabled() -> bool:
+    """
+    Returns whether the organization search view is refreshed in the background,
+    by default only when requests read it.
+
+    :return: True to schedule the refresh job.
+    """
+
+    settings = get_settings().search
+    if settings.ORGANIZATION_SEARCH_VIEW_REFRESH_ENABLED is not None:
+        return settings.ORGANIZATION_SEARCH_VIEW_REFRESH_ENABLED
+    return settings.ORGANIZATION_SEARCH_VIEW_READS
+
+
+def get_organization_warmup_job() -> OrganizationWarmupJob:
+    """
+    Provides an instance of OrganizationWarmupJob.
+
+    :return: Configured OrganizationWarmupJob instance.
+    """
+
+    return OrganizationWarmupJob(
+        consts=get_organization_uc_consts(),
+        errors=get_error_codes(),
+        logger_manager=get_logger_manager(config=get_logger_config()),
+    )
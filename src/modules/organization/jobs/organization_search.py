@@ -0,0 +1,55 @@
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.client.storages.postgres.interfaces import IPostgresEngine
+from src.common.constants import ErrorCodesEnums
+from src.common.interfaces import ILoggerManager
+from src.modules.organization.adapters.repositories.postgres import (
+    OrganizationSearchPsqlRepo,
+)
+
+# Share of the interval a refresh must be older than, the margin absorbs the drift
+# between the ticks of the workers
+REFRESH_AGE_SHARE = 0.9
+
+
+class OrganizationSearchRefreshJob:
+    """
+    Background job refreshing the organization search materialized view.
+
+    Every worker runs the job, the refresh is skipped when another worker refreshed
+    the view during the current interval. The job runs outside of any request, so it
+    opens its own short-lived session.
+    """
+
+    def __init__(
+        self,
+        psql_engine: IPostgresEngine,
+        errors: ErrorCodesEnums,
+        logger_manager: ILoggerManager,
+        interval: int,
+    ):
+        """
+        Initialize the job.
+
+        :param psql_engine: Engine used to open sessions for the refresh.
+        :param errors: ErrorCodesEnums instance for error handling.
+        :param logger_manager: Logger manager providing the organization logger.
+        :param interval: Seconds between two runs of the job.
+        """
+
+        self._session_factory = async_sessionmaker(
+            bind=psql_engine.get(), autoflush=False
+        )
+        self._errors = errors
+        self._logger = logger_manager.get_organization_logger()
+        self._interval = interval
+
+    async def __call__(self) -> None:
+        """
+        Refresh the view concurrently, unless it was refreshed during the interval.
+        """
+
+        async with self._session_factory() as db:
+            await OrganizationSearchPsqlRepo(
+                db=db, errors=self._errors, logger=self._logger
+            ).refresh(min_interval=self._interval * REFRESH_AGE_SHARE)
@@ -0,0 +1,134 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.constants import ErrorCodesEnums
+from src.common.interfaces import ILoggerManager
+from src.common.schemas import Pagination
+from src.modules.activity.adapters.repositories.postgres import ActivityPsqlRepo
+from src.modules.activity.models import ActivityModel
+from src.modules.building.models import BuildingModel
+from src.modules.organization.adapters.repositories.postgres import (
+    OrganizationDocumentPsqlRepo,
+    OrganizationPsqlRepo,
+    OrganizationSearchPsqlRepo,
+)
+from src.modules.organization.filters import OrganizationQueryFilter
+from src.modules.organization.models import (
+    OrganizationActivityModel,
+    OrganizationAddressModel,
+    OrganizationModel,
+)
+from src.modules.organization.services.deps import get_organization_service
+from src.modules.organization.usecases.constants import OrganizationUCConsts
+
+
+class OrganizationWarmupJob:
+    """
+    Startup job priming the organization hot-path queries on a pooled connection.
+
+    The queries are run by the organization service built as for requests, so the
+    document and search view reads are primed when they are switched on. They are
+    run for one existing organization, so the SELECT IN statements of the eager
+    loads are executed and prepared as well.
+    """
+
+    def __init__(
+        self,
+        consts: OrganizationUCConsts,
+        errors: ErrorCodesEnums,
+        logger_manager: ILoggerManager,
+    ):
+        """
+        Initialize the job.
+
+        :param consts: OrganizationUCConsts instance with the query options.
+        :param errors: ErrorCodesEnums instance for error handling.
+        :param logger_manager: Logger manager providing the module loggers.
+        """
+
+        self._consts = consts
+        self._errors = errors
+        self._organization_logger = logger_manager.get_organization_logger()
+        self._activity_logger = logger_manager.get_activity_logger()
+
+    async def __call__(self, db: AsyncSession) -> None:
+        """
+        Run the organization queries by SID, by name, by descendant activities and
+        the filtered page queries once, for an existing organization.
+
+        :param db: Session bound to the connection being warmed up.
+        """
+
+        row = (
+            await db.execute(
+                select(
+                    OrganizationModel.sid,
+                    OrganizationModel.name,
+                    ActivityModel.name,
+                    BuildingModel.latitude,
+                    BuildingModel.longitude,
+                )
+                .join(
+                    OrganizationActivityModel,
+                    OrganizationActivityModel.organization_sid == OrganizationModel.sid,
+                )
+                .join(
+                    ActivityModel,
+                    ActivityModel.sid == OrganizationActivityModel.activity_sid,
+                )
+                .join(
+                    OrganizationAddressModel,
+                    OrganizationAddressModel.organization_sid == OrganizationModel.sid,
+                )
+                .join(
+                    BuildingModel,
+                    BuildingModel.sid == OrganizationAddressModel.building_sid,
+                )
+                .limit(1)
+            )
+        ).first()
+        if row is None:
+            self._organization_logger.debug("No organization to prime queries with")
+            return
+        sid, name, activity_name, latitude, longitude = row
+
+        organization_service = await get_organization_service(
+            logger=self._organization_logger,
+            error_codes=self._errors,
+            organization_psql_repo=OrganizationPsqlRepo(
+                db=db, errors=self._errors, logger=self._organization_logger
+            ),
+            organization_search_psql_repo=OrganizationSearchPsqlRepo(
+                db=db, errors=self._errors, logger=self._organization_logger
+            ),
+            organization_document_psql_repo=OrganizationDocumentPsqlRepo(
+                db=db, errors=self._errors, logger=self._organization_logger
+            ),
+        )
+        activity_repo = ActivityPsqlRepo(
+            db=db, errors=self._errors, logger=self._activity_logger
+        )
+        options = self._consts.Options.by_fieldset(None)
+
+        await organization_service.get_by_sid(sid=sid, custom_options=options)
+        await organization_service.search_by_name(name=name, custom_options=options)
+
+        activity_sids = await activity_repo.get_all_descendant_activity_sids(
+            activity_name=activity_name
+        )
+        await organization_service.get_by_activity_sids(
+            activity_sids=activity_sids, custom_options=options
+        )
+
+        for filters in (
+            OrganizationQueryFilter(activity_name=activity_name),
+            OrganizationQueryFilter(
+                latitude_gte=latitude,
+                latitude_lte=latitude,
+                longitude_gte=longitude,
+                longitude_lte=longitude,
+            ),
+        ):
+            await organization_service.query(
+                filters=filters, pagination=Pagination(), custom_options=options
+            )
@@ -3,3 +3,5 @@ from .organization import (
     OrganizationAddressModel,
     OrganizationModel,
 )
+from .organization_document import OrganizationDocumentModel
+from .organization_search import OrganizationSearchRefreshModel, OrganizationSearchView
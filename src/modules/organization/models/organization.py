@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.client.storages.postgres.core import PostgresSchemas
@@ -14,7 +14,15 @@ if TYPE_CHECKING:
 
 
 class OrganizationModel(CoreModel):
-    __table_args__ = table_args(schema=PostgresSchemas.ORGANIZATION)
+    __table_args__ = (
+        Index(
+            "ix_organization_organization_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        table_args(schema=PostgresSchemas.ORGANIZATION),
+    )
 
     sid: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     name: Mapped[str] = mapped_column(String(250), nullable=False, index=True)
@@ -33,11 +41,20 @@ class OrganizationModel(CoreModel):
 
 
 class PhoneNumberModel(CoreModel):
-    __table_args__ = table_args(schema=PostgresSchemas.ORGANIZATION)
+    __table_args__ = (
+        Index(
+            "ix_organization_phone_number_phone",
+            "phone",
+            postgresql_ops={"phone": "varchar_pattern_ops"},
+        ),
+        table_args(schema=PostgresSchemas.ORGANIZATION),
+    )
 
     sid: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     organization_sid: Mapped[UUID] = mapped_column(
-        ForeignKey(f"{PostgresSchemas.ORGANIZATION}.organization.sid"), nullable=False
+        ForeignKey(f"{PostgresSchemas.ORGANIZATION}.organization.sid"),
+        nullable=False,
+        index=True,
     )
     phone: Mapped[str] = mapped_column(String(25), nullable=False)
 
@@ -53,7 +70,9 @@ class OrganizationAddressModel(CoreModel):
         ForeignKey(f"{PostgresSchemas.ORGANIZATION}.organization.sid"), primary_key=True
     )
     building_sid: Mapped[UUID] = mapped_column(
-        ForeignKey(f"{PostgresSchemas.BUILDING}.building.sid"), primary_key=True
+        ForeignKey(f"{PostgresSchemas.BUILDING}.building.sid"),
+        primary_key=True,
+        index=True,
     )
     office: Mapped[str] = mapped_column(String(25), nullable=True)
 
@@ -0,0 +1,30 @@
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.client.storages.postgres.core import PostgresSchemas
+from src.client.storages.postgres.utils import table_args
+from src.common.models import CoreModel
+
+
+class OrganizationDocumentModel(CoreModel):
+    """
+    Ready-to-serve OrganizationFull payload of an organization.
+
+    Rows are written only by database triggers on the organization tables, see the
+    migration adding this table. A document is rebuilt under a lock on its
+    organization row, so concurrent writes to one organization do not leave it stale.
+    """
+
+    __table_args__ = table_args(schema=PostgresSchemas.ORGANIZATION)
+
+    sid: Mapped[UUID] = mapped_column(
+        ForeignKey(
+            f"{PostgresSchemas.ORGANIZATION}.organization.sid", ondelete="CASCADE"
+        ),
+        primary_key=True,
+    )
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, String, Uuid, column, table
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.client.storages.postgres.core import PostgresSchemas
+from src.client.storages.postgres.utils import table_args
+from src.common.models import CoreModel
+
+# Read-only materialized view maintained by migrations, so it is kept out of the
+# declarative metadata and never autogenerated as a table
+OrganizationSearchView = table(
+    "organization_search",
+    column("sid", Uuid),
+    column("name", String),
+    column("created_at", DateTime),
+    column("building_sid", Uuid),
+    column("latitude", Float),
+    column("longitude", Float),
+    column("city", String),
+    column("activity_sids", ARRAY(Uuid)),
+    column("phones", ARRAY(String)),
+    column("payload", JSONB),
+    schema=PostgresSchemas.ORGANIZATION,
+)
+
+
+class OrganizationSearchRefreshModel(CoreModel):
+    """
+    Time of the last refresh of a materialized view, read under the refresh lock so
+    the workers of a deployment refresh it once per interval between them.
+    """
+
+    __table_args__ = table_args(schema=PostgresSchemas.ORGANIZATION)
+
+    sid: Mapped[str] = mapped_column(String(63), primary_key=True)  # View name
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(), nullable=False)
@@ -1,7 +1,7 @@
 from uuid import UUID
 
 from src.common.decorators import partial_schema
-from src.common.schemas import CoreSchema
+from src.common.schemas import CoreSchema, PaginationResult
 from src.modules.activity.schemas import Activity
 from src.modules.building.schemas import Building
 
@@ -95,3 +95,23 @@ class OrganizationFull(Organization):
     address: AddressWithBuilding
     activities: list[Activity]
     phone_numbers: list[PhoneNumberBase]
+
+
+class ActivityFacet(CoreSchema):
+    sid: UUID
+    name: str
+    count: int
+
+
+class CityFacet(CoreSchema):
+    city: str
+    count: int
+
+
+class OrganizationFacets(CoreSchema):
+    activities: list[ActivityFacet]
+    cities: list[CityFacet]
+
+
+class OrganizationQueryResult(PaginationResult[OrganizationFull]):
+    facets: OrganizationFacets | None = None
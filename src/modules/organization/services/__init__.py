@@ -1 +1,3 @@
 from .organization import OrganizationSrv
+from .organization_document import OrganizationDocumentSrv
+from .organization_search import OrganizationSearchSrv
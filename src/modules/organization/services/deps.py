@@ -6,14 +6,23 @@ from fastapi import Depends
 from src.common.constants import ErrorCodesEnums
 from src.common.constants.deps import get_error_codes
 from src.common.logger.deps import get_organization_logger
+from src.config.settings.deps import get_settings
 from src.modules.organization.adapters.repositories.postgres.deps import (
+    get_organization_document_psql_repo,
     get_organization_psql_repo,
+    get_organization_search_psql_repo,
 )
 from src.modules.organization.interfaces import (
+    IOrganizationDocumentPsqlRepo,
     IOrganizationPsqlRepo,
+    IOrganizationSearchPsqlRepo,
     IOrganizationSrv,
 )
-from src.modules.organization.services import OrganizationSrv
+from src.modules.organization.services import (
+    OrganizationDocumentSrv,
+    OrganizationSearchSrv,
+    OrganizationSrv,
+)
 
 
 async def get_organization_service(
@@ -22,18 +31,53 @@ async def get_organization_service(
     organization_psql_repo: Annotated[
         IOrganizationPsqlRepo, Depends(get_organization_psql_repo)
     ],
+    organization_search_psql_repo: Annotated[
+        IOrganizationSearchPsqlRepo, Depends(get_organization_search_psql_repo)
+    ],
+    organization_document_psql_repo: Annotated[
+        IOrganizationDocumentPsqlRepo, Depends(get_organization_document_psql_repo)
+    ],
 ) -> IOrganizationSrv:
     """
     Factory function to create and return a OrganizationSrv instance.
 
+    When reads from the search view are switched on, the service is wrapped into
+    OrganizationSearchSrv serving hot reads from the view. When reads from
+    organization documents are switched on, reads by SID are served by
+    OrganizationDocumentSrv on top of that.
+
     :param logger: Logger instance for building logs.
     :param error_codes: ErrorCodesEnums instance for error handling.
     :param organization_psql_repo: Repository instance for building persistence.
+    :param organization_search_psql_repo: Repository instance reading the search
+            view.
+    :param organization_document_psql_repo: Repository instance reading organization
+            documents.
     :return: Configured OrganizationSrv instance.
     """
 
-    return OrganizationSrv(
+    settings = get_settings()
+
+    organization_service: IOrganizationSrv = OrganizationSrv(
         errors=error_codes,
         logger=logger,
         organization_psql_repo=organization_psql_repo,
     )
+
+    if settings.search.ORGANIZATION_SEARCH_VIEW_READS:
+        organization_service = OrganizationSearchSrv(
+            errors=error_codes,
+            logger=logger,
+            organization_search_psql_repo=organization_search_psql_repo,
+            organization_service=organization_service,
+        )
+
+    if settings.search.ORGANIZATION_DOCUMENT_READS:
+        organization_service = OrganizationDocumentSrv(
+            errors=error_codes,
+            logger=logger,
+            organization_document_psql_repo=organization_document_psql_repo,
+            organization_service=organization_service,
+        )
+
+    return organization_service
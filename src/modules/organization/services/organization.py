@@ -5,8 +5,14 @@ from sqlalchemy.sql.base import ExecutableOption
 
 from src.common.constants import ErrorCodesEnums
 from src.common.decorators.logger import LoggingFunctionInfo
+from src.common.schemas import Pagination
+from src.modules.organization.filters import OrganizationQueryFilter
 from src.modules.organization.interfaces import IOrganizationPsqlRepo, IOrganizationSrv
-from src.modules.organization.schemas import OrganizationFull
+from src.modules.organization.schemas import (
+    OrganizationFacets,
+    OrganizationFull,
+    OrganizationQueryResult,
+)
 from src.server.middleware.exception import BackendException
 
 
@@ -53,11 +59,11 @@ class OrganizationSrv(IOrganizationSrv):
 
         if not organization:
             self._logger.error("Organization not found with SID: %s", sid)
-            raise BackendException(self._errors.Building.BUILDING_NOT_FOUND)
+            raise BackendException(self._errors.Organization.ORGANIZATION_NOT_FOUND)
 
         self._logger.debug("Organization successfully retrieved with SID: %s", sid)
 
-        return OrganizationFull.model_validate(organization)
+        return OrganizationFull.model_construct_trusted(organization)
 
     @LoggingFunctionInfo(
         description="Retrieve full organizations by activity SIDs and validate models."
@@ -80,7 +86,7 @@ class OrganizationSrv(IOrganizationSrv):
         )
 
         return [
-            OrganizationFull.model_validate(organization)
+            OrganizationFull.model_construct_trusted(organization)
             for organization in organizations
         ]
 
@@ -107,6 +113,64 @@ class OrganizationSrv(IOrganizationSrv):
         )
 
         return [
-            OrganizationFull.model_validate(organization)
+            OrganizationFull.model_construct_trusted(organization)
             for organization in organizations
         ]
+
+    @LoggingFunctionInfo(
+        description="Query organizations by combined criteria and validate the page "
+        "with OrganizationFull models."
+    )
+    async def query(
+        self,
+        filters: OrganizationQueryFilter,
+        pagination: Pagination,
+        facet_limit: int | None = None,
+        custom_options: tuple[ExecutableOption, ...] = None,
+    ) -> OrganizationQueryResult:
+        """
+        Retrieves a page of organizations matching all the given criteria with a
+        single repository query and wraps it into a query result. Facet counts are
+        computed in the same query when a facet limit is given.
+
+        :param filters: Organization query filter with the criteria to combine.
+        :param pagination: Pagination parameters containing limit and offset.
+        :param facet_limit: Maximum number of values per facet, facets are not
+                computed if None.
+        :param custom_options: Optional execution options for the query.
+        :return: OrganizationQueryResult with validated OrganizationFull items.
+        """
+
+        facets = None
+
+        if facet_limit is None:
+            organizations, total = await self._organization_psql_repo.get_filtered_page(
+                filters=filters, pagination=pagination, custom_options=custom_options
+            )
+        else:
+            (
+                organizations,
+                total,
+                raw_facets,
+            ) = await self._organization_psql_repo.get_filtered_page_with_facets(
+                filters=filters,
+                pagination=pagination,
+                facet_limit=facet_limit,
+                custom_options=custom_options,
+            )
+            facets = OrganizationFacets.model_validate(raw_facets)
+
+        self._logger.debug(
+            "Organization query returned %d of %d matches", len(organizations), total
+        )
+
+        return OrganizationQueryResult(
+            items=[
+                OrganizationFull.model_construct_trusted(organization)
+                for organization in organizations
+            ],
+            limit=pagination.limit,
+            offset=pagination.offset,
+            total=total,
+            facets=facets,
+        )
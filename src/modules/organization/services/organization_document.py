@@ -0,0 +1,131 @@
+import logging
+from uuid import UUID
+
+from sqlalchemy.sql.base import ExecutableOption
+
+from src.common.constants import ErrorCodesEnums
+from src.common.decorators.logger import LoggingFunctionInfo
+from src.common.schemas import Pagination
+from src.modules.organization.filters import OrganizationQueryFilter
+from src.modules.organization.interfaces import (
+    IOrganizationDocumentPsqlRepo,
+    IOrganizationSrv,
+)
+from src.modules.organization.schemas import OrganizationFull, OrganizationQueryResult
+from src.server.middleware.exception import BackendException
+
+
+class OrganizationDocumentSrv(IOrganizationSrv):
+    """
+    Organization service serving reads by SID from trigger-maintained documents.
+
+    Documents are updated in the same transaction as the source rows, so reads are
+    always consistent with writes. All other reads are delegated to the wrapped
+    organization service.
+    """
+
+    def __init__(
+        self,
+        errors: ErrorCodesEnums,
+        logger: logging.Logger,
+        organization_document_psql_repo: IOrganizationDocumentPsqlRepo,
+        organization_service: IOrganizationSrv,
+    ):
+        """
+        Initialize the OrganizationDocumentSrv.
+
+        :param errors: ErrorCodesEnums instance for error handling.
+        :param logger: Logger instance for logging service actions.
+        :param organization_document_psql_repo: Repository reading organization
+                documents.
+        :param organization_service: Organization service used for all other reads.
+        """
+
+        self._errors = errors
+        self._logger = logger
+        self._organization_document_psql_repo = organization_document_psql_repo
+        self._organization_service = organization_service
+
+    @LoggingFunctionInfo(
+        description="Retrieves an organization by SID from its document."
+    )
+    async def get_by_sid(
+        self,
+        sid: UUID,
+        custom_options: tuple[ExecutableOption, ...] = None,  # noqa: ARG002
+    ) -> OrganizationFull:
+        """
+        Fetches the organization document by SID and validates it.
+
+        :param sid: UUID of the organization to retrieve.
+        :param custom_options: Ignored, the document is already joined.
+        :raises BackendException: If organization is not found.
+        :return: Validated OrganizationFull instance of the retrieved organization.
+        """
+
+        payload = await self._organization_document_psql_repo.get_payload(sid=sid)
+
+        if not payload:
+            self._logger.error("Organization not found with SID: %s", sid)
+            raise BackendException(self._errors.Organization.ORGANIZATION_NOT_FOUND)
+
+        return OrganizationFull.model_construct_trusted(payload)
+
+    async def get_by_activity_sids(
+        self,
+        activity_sids: list[UUID],
+        custom_options: tuple[ExecutableOption, ...] = None,
+    ) -> list[OrganizationFull]:
+        """
+        Delegates the activity lookup to the wrapped organization service.
+
+        :param activity_sids: List of activity UUIDs for filtering.
+        :param custom_options: Optional query execution options.
+        :return: List of OrganizationFull validated instances.
+        """
+
+        return await self._organization_service.get_by_activity_sids(
+            activity_sids=activity_sids, custom_options=custom_options
+        )
+
+    async def search_by_name(
+        self,
+        name: str,
+        custom_options: tuple[ExecutableOption, ...] = None,
+    ) -> list[OrganizationFull]:
+        """
+        Delegates the name search to the wrapped organization service.
+
+        :param name: Name filter for searching organizations.
+        :param custom_options: Optional execution options for the query.
+        :return: List of validated OrganizationFull instances.
+        """
+
+        return await self._organization_service.search_by_name(
+            name=name, custom_options=custom_options
+        )
+
+    async def query(
+        self,
+        filters: OrganizationQueryFilter,
+        pagination: Pagination,
+        facet_limit: int | None = None,
+        custom_options: tuple[ExecutableOption, ...] = None,
+    ) -> OrganizationQueryResult:
+        """
+        Delegates the combined criteria query to the wrapped organization service.
+
+        :param filters: Organization query filter with the criteria to combine.
+        :param pagination: Pagination parameters containing limit and offset.
+        :param facet_limit: Maximum number of values per facet, facets are not
+                computed if None.
+        :param custom_options: Optional execution options for the query.
+        :return: OrganizationQueryResult with validated OrganizationFull items.
+        """
+
+        return await self._organization_service.query(
+            filters=filters,
+            pagination=pagination,
+            facet_limit=facet_limit,
+            custom_options=custom_options,
+        )
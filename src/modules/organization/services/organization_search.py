@@ -0,0 +1,147 @@
+import logging
+from uuid import UUID
+
+from sqlalchemy.sql.base import ExecutableOption
+
+from src.common.constants import ErrorCodesEnums
+from src.common.decorators.logger import LoggingFunctionInfo
+from src.common.schemas import Pagination
+from src.modules.organization.filters import OrganizationQueryFilter
+from src.modules.organization.interfaces import (
+    IOrganizationSearchPsqlRepo,
+    IOrganizationSrv,
+)
+from src.modules.organization.schemas import OrganizationFull, OrganizationQueryResult
+from src.server.middleware.exception import BackendException
+
+
+class OrganizationSearchSrv(IOrganizationSrv):
+    """
+    Organization service serving hot reads from the denormalized search view.
+
+    Payloads in the view are already joined, so query options are ignored. Reads may
+    lag behind writes by up to the refresh interval of the view. Combined criteria
+    queries are delegated to the regular organization service.
+    """
+
+    def __init__(
+        self,
+        errors: ErrorCodesEnums,
+        logger: logging.Logger,
+        organization_search_psql_repo: IOrganizationSearchPsqlRepo,
+        organization_service: IOrganizationSrv,
+    ):
+        """
+        Initialize the OrganizationSearchSrv.
+
+        :param errors: ErrorCodesEnums instance for error handling.
+        :param logger: Logger instance for logging service actions.
+        :param organization_search_psql_repo: Repository reading the search view.
+        :param organization_service: Regular organization service used for reads the
+                view does not cover.
+        """
+
+        self._errors = errors
+        self._logger = logger
+        self._organization_search_psql_repo = organization_search_psql_repo
+        self._organization_service = organization_service
+
+    @LoggingFunctionInfo(
+        description="Retrieves an organization by SID from the search view."
+    )
+    async def get_by_sid(
+        self,
+        sid: UUID,
+        custom_options: tuple[ExecutableOption, ...] = None,  # noqa: ARG002
+    ) -> OrganizationFull:
+        """
+        Fetches an organization payload by SID from the search view and validates it.
+
+        :param sid: UUID of the organization to retrieve.
+        :param custom_options: Ignored, the payload is already joined.
+        :raises BackendException: If organization is not found.
+        :return: Validated OrganizationFull instance of the retrieved organization.
+        """
+
+        payload = await self._organization_search_psql_repo.get_payload(sid=sid)
+
+        if not payload:
+            self._logger.error("Organization not found with SID: %s", sid)
+            raise BackendException(self._errors.Organization.ORGANIZATION_NOT_FOUND)
+
+        return OrganizationFull.model_construct_trusted(payload)
+
+    @LoggingFunctionInfo(
+        description="Retrieve full organizations by activity SIDs from the search view."
+    )
+    async def get_by_activity_sids(
+        self,
+        activity_sids: list[UUID],
+        custom_options: tuple[ExecutableOption, ...] = None,  # noqa: ARG002
+    ) -> list[OrganizationFull]:
+        """
+        Fetch organization payloads linked to the given activity SIDs from the search
+        view and validate them as OrganizationFull models.
+
+        :param activity_sids: List of activity UUIDs for filtering.
+        :param custom_options: Ignored, the payload is already joined.
+        :return: List of OrganizationFull validated instances.
+        """
+
+        payloads = (
+            await self._organization_search_psql_repo.get_payloads_by_activity_sids(
+                activity_sids=activity_sids
+            )
+        )
+
+        return [
+            OrganizationFull.model_construct_trusted(payload) for payload in payloads
+        ]
+
+    @LoggingFunctionInfo(description="Search organizations by name in the search view.")
+    async def search_by_name(
+        self,
+        name: str,
+        custom_options: tuple[ExecutableOption, ...] = None,  # noqa: ARG002
+    ) -> list[OrganizationFull]:
+        """
+        Performs a search for organization payloads by name in the search view and
+        validates the results.
+
+        :param name: Name filter for searching organizations.
+        :param custom_options: Ignored, the payload is already joined.
+        :return: List of validated OrganizationFull instances.
+        """
+
+        payloads = await self._organization_search_psql_repo.search_payloads_by_name(
+            name=name
+        )
+
+        return [
+            OrganizationFull.model_construct_trusted(payload) for payload in payloads
+        ]
+
+    async def query(
+        self,
+        filters: OrganizationQueryFilter,
+        pagination: Pagination,
+        facet_limit: int | None = None,
+        custom_options: tuple[ExecutableOption, ...] = None,
+    ) -> OrganizationQueryResult:
+        """
+        Delegates the combined criteria query to the regular organization service.
+
+        :param filters: Organization query filter with the criteria to combine.
+        :param pagination: Pagination parameters containing limit and offset.
+        :param facet_limit: Maximum number of values per facet, facets are not
+                computed if None.
+        :param custom_options: Optional execution options for the query.
+        :return: OrganizationQueryResult with validated OrganizationFull items.
+        """
+
+        return await self._organization_service.query(
+            filters=filters,
+            pagination=pagination,
+            facet_limit=facet_limit,
+            custom_options=custom_options,
+        )
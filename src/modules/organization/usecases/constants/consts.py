@@ -1,7 +1,11 @@
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, noload, selectinload
 from sqlalchemy.sql.base import ExecutableOption
 
+from src.modules.activity.models import ActivityModel
+from src.modules.building.models import BuildingModel
+from src.modules.organization.filters import OrganizationFieldEnum, OrganizationFieldset
 from src.modules.organization.models import OrganizationAddressModel, OrganizationModel
+from src.modules.organization.models.organization import PhoneNumberModel
 
 
 class CustomOptions:
@@ -19,13 +23,72 @@ class CustomOptions:
             selectinload(OrganizationModel.phone_numbers),
         ]
 
+    @staticmethod
+    def by_fieldset(fieldset: OrganizationFieldset | None) -> list[ExecutableOption]:
+        """
+        Returns SQLAlchemy options loading only the columns and relations selected by
+        a sparse fieldset.
+
+        Relations outside the fieldset are not loaded at all, so their SELECT IN
+        queries are never executed.
+
+        :param fieldset: Sparse fieldset, None or an empty one loads everything.
+        :return: List of ExecutableOption for query customization.
+        """
+
+        if fieldset is None or fieldset.selected is None:
+            return CustomOptions.full()
+
+        selected = fieldset.selected
+        options = [load_only(OrganizationModel.sid, OrganizationModel.name)]
+
+        if OrganizationFieldEnum.ADDRESS in selected:
+            options.append(
+                selectinload(OrganizationModel.address)
+                .load_only(OrganizationAddressModel.office)
+                .selectinload(OrganizationAddressModel.building)
+                .load_only(
+                    BuildingModel.address,
+                    BuildingModel.latitude,
+                    BuildingModel.longitude,
+                )
+            )
+        else:
+            options.append(noload(OrganizationModel.address))
+
+        if OrganizationFieldEnum.ACTIVITIES in selected:
+            options.append(
+                selectinload(OrganizationModel.activities).load_only(
+                    ActivityModel.name, ActivityModel.parent_sid
+                )
+            )
+        else:
+            options.append(noload(OrganizationModel.activities))
+
+        if OrganizationFieldEnum.PHONE_NUMBERS in selected:
+            options.append(
+                selectinload(OrganizationModel.phone_numbers).load_only(
+                    PhoneNumberModel.organization_sid, PhoneNumberModel.phone
+                )
+            )
+        else:
+            options.append(noload(OrganizationModel.phone_numbers))
+
+        return options
+
 
 class OrganizationUCConsts:
     """Constants holder class for Organization Use Case options."""
 
     def __init__(
         self,
+        facet_limit: int,
     ):
-        """Initializes the OrganizationUCConsts."""
+        """
+        Initializes the OrganizationUCConsts.
+
+        :param facet_limit: Maximum number of values returned per search facet.
+        """
 
         self.Options = CustomOptions
+        self.FACET_LIMIT = facet_limit
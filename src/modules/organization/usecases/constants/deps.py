@@ -1,3 +1,4 @@
+from src.config.settings.deps import get_settings
 from src.modules.organization.usecases.constants import OrganizationUCConsts
 
 
@@ -8,4 +9,6 @@ def get_organization_uc_consts() -> OrganizationUCConsts:
     :return: OrganizationUCConsts instance with predefined constant options.
     """
 
-    return OrganizationUCConsts()
+    return OrganizationUCConsts(
+        facet_limit=get_settings().cache.ORGANIZATION_FACET_MAX_VALUES,
+    )
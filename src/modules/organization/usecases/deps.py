@@ -8,7 +8,11 @@ from src.common.constants.deps import get_error_codes
 from src.common.logger.deps import get_organization_logger
 from src.modules.activity.interfaces import IActivitySrv
 from src.modules.activity.services.deps import get_activity_service
+from src.modules.organization.adapters.caches.memory.deps import (
+    get_organization_facet_cache,
+)
 from src.modules.organization.interfaces import (
+    IOrganizationFacetCache,
     IOrganizationSrv,
     IOrganizationUC,
 )
@@ -28,6 +32,9 @@ async def get_organization_usecase(
     organization_service: Annotated[
         IOrganizationSrv, Depends(get_organization_service)
     ],
+    organization_facet_cache: Annotated[
+        IOrganizationFacetCache, Depends(get_organization_facet_cache)
+    ],
 ) -> IOrganizationUC:
     """
     Factory function to create and return a OrganizationUC instance.
@@ -37,6 +44,7 @@ async def get_organization_usecase(
     :param error_codes: ErrorCodesEnums instance for error handling.
     :param activity_service: Service instance for activity business logic.
     :param organization_service: Service instance for organization business logic.
+    :param organization_facet_cache: Worker-wide cache of search facets.
     :return: Configured OrganizationUC instance.
     """
 
@@ -46,4 +54,5 @@ async def get_organization_usecase(
         errors=error_codes,
         activity_service=activity_service,
         organization_service=organization_service,
+        organization_facet_cache=organization_facet_cache,
     )
@@ -3,12 +3,18 @@ from uuid import UUID
 
 from src.common.constants import ErrorCodesEnums
 from src.common.decorators import LoggingFunctionInfo
+from src.common.schemas import Pagination
 from src.modules.activity.interfaces import IActivitySrv
+from src.modules.organization.filters import (
+    OrganizationFieldset,
+    OrganizationQueryFilter,
+)
 from src.modules.organization.interfaces import (
+    IOrganizationFacetCache,
     IOrganizationSrv,
     IOrganizationUC,
 )
-from src.modules.organization.schemas import OrganizationFull
+from src.modules.organization.schemas import OrganizationFull, OrganizationQueryResult
 from src.modules.organization.usecases.constants import OrganizationUCConsts
 
 
@@ -24,6 +30,7 @@ class OrganizationUC(IOrganizationUC):
         errors: ErrorCodesEnums,
         activity_service: IActivitySrv,
         organization_service: IOrganizationSrv,
+        organization_facet_cache: IOrganizationFacetCache,
     ):
         """
         Initialize the BuildingUC.
@@ -34,6 +41,7 @@ class OrganizationUC(IOrganizationUC):
         :param activity_service: Service handling activity-related business logic.
         :param organization_service: Service handling organization-related business
                 logic.
+        :param organization_facet_cache: Worker-wide cache of search facets.
         """
 
         self._consts = consts
@@ -41,34 +49,39 @@ class OrganizationUC(IOrganizationUC):
         self._errors = errors
         self._activity_service = activity_service
         self._organization_service = organization_service
+        self._organization_facet_cache = organization_facet_cache
 
     @LoggingFunctionInfo(
         description="Fetches full organization details by SID using custom options."
     )
-    async def get_by_sid(self, sid: UUID) -> OrganizationFull:
+    async def get_by_sid(
+        self, sid: UUID, fieldset: OrganizationFieldset | None = None
+    ) -> OrganizationFull:
         """
         Retrieves a detailed representation of the organization by SID.
 
         :param sid: UUID of the organization.
+        :param fieldset: Sparse fieldset selecting relations to load, all if None.
         :return: OrganizationFull instance enriched with full data.
         """
 
         return await self._organization_service.get_by_sid(
             sid=sid,
-            custom_options=self._consts.Options.full(),
+            custom_options=self._consts.Options.by_fieldset(fieldset),
         )
 
     @LoggingFunctionInfo(
         description="Search organizations by activity with recursive descendant lookup."
     )
     async def search_by_descendant_activity(
-        self, activity_name: str
+        self, activity_name: str, fieldset: OrganizationFieldset | None = None
     ) -> list[OrganizationFull]:
         """
         Searches organizations linked to the specified activity and its descendant
         activities.
 
         :param activity_name: The root activity name to search organizations by.
+        :param fieldset: Sparse fieldset selecting relations to load, all if None.
         :return: List of fully detailed OrganizationFull objects.
         """
 
@@ -78,17 +91,20 @@ class OrganizationUC(IOrganizationUC):
 
         return await self._organization_service.get_by_activity_sids(
             activity_sids=activity_sids,
-            custom_options=self._consts.Options.full(),
+            custom_options=self._consts.Options.by_fieldset(fieldset),
         )
 
     @LoggingFunctionInfo(
         description="Search organizations by a specific activity name."
     )
-    async def search_by_activity(self, activity_name: str) -> list[OrganizationFull]:
+    async def search_by_activity(
+        self, activity_name: str, fieldset: OrganizationFieldset | None = None
+    ) -> list[OrganizationFull]:
         """
         Searches organizations linked to the specified activity name.
 
         :param activity_name: The activity name to search organizations by.
+        :param fieldset: Sparse fieldset selecting relations to load, all if None.
         :return: List of OrganizationFull instances related to the specified activity.
         """
 
@@ -98,22 +114,72 @@ class OrganizationUC(IOrganizationUC):
 
         return await self._organization_service.get_by_activity_sids(
             activity_sids=[activity.sid],
-            custom_options=self._consts.Options.full(),
+            custom_options=self._consts.Options.by_fieldset(fieldset),
         )
 
     @LoggingFunctionInfo(
-        description="Retrieve organizations by name using full loading options."
+        description="Retrieve organizations by name using fieldset loading options."
     )
-    async def search_by_name(self, name: str) -> list[OrganizationFull]:
+    async def search_by_name(
+        self, name: str, fieldset: OrganizationFieldset | None = None
+    ) -> list[OrganizationFull]:
         """
-        Delegates the search by name to the organization service with default
-        full-loading options.
+        Delegates the search by name to the organization service with loading options
+        derived from the fieldset.
 
         :param name: Name to search organizations by.
+        :param fieldset: Sparse fieldset selecting relations to load, all if None.
         :return: List of OrganizationFull models matching the name.
         """
 
         return await self._organization_service.search_by_name(
             name=name,
-            custom_options=self._consts.Options.full(),
+            custom_options=self._consts.Options.by_fieldset(fieldset),
         )
+
+    @LoggingFunctionInfo(
+        description="Query organizations by combined criteria using fieldset loading "
+        "options and cached facets."
+    )
+    async def query(
+        self,
+        filters: OrganizationQueryFilter,
+        pagination: Pagination,
+        with_facets: bool = False,
+        fieldset: OrganizationFieldset | None = None,
+    ) -> OrganizationQueryResult:
+        """
+        Delegates the combined criteria query to the organization service with loading
+        options derived from the fieldset.
+
+        Facets are served from the cache when the same criteria were queried recently,
+        otherwise they are computed in the page query and cached.
+
+        :param filters: Organization query filter with the criteria to combine.
+        :param pagination: Pagination parameters containing limit and offset.
+        :param with_facets: Whether to return activity and city facet counts.
+        :param fieldset: Sparse fieldset selecting relations to load, all if None.
+        :return: OrganizationQueryResult with OrganizationFull items and the total
+                count.
+        """
+
+        facets = None
+        if with_facets:
+            facets = self._organization_facet_cache.get(filters)
+
+        result = await self._organization_service.query(
+            filters=filters,
+            pagination=pagination,
+            facet_limit=(
+                self._consts.FACET_LIMIT if with_facets and facets is None else None
+            ),
+            custom_options=self._consts.Options.by_fieldset(fieldset),
+        )
+
+        if facets is not None:
+            self._logger.debug("Organization facets served from cache")
+            result.facets = facets
+        elif result.facets is not None:
+            self._organization_facet_cache.set(filters, result.facets)
+
+        return result
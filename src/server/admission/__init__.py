@@ -0,0 +1 @@
+from .limiter import AdmissionLimiter
@@ -0,0 +1,61 @@
+from functools import lru_cache
+
+from src.config.settings.deps import get_settings
+from src.server.admission import AdmissionLimiter
+from src.server.interfaces import IAdmissionLimiter
+
+# Waiting requests allowed per slot when the queue size is not configured
+QUEUE_PER_SLOT = 4
+
+
+def _create_limiter(limit: int) -> IAdmissionLimiter:
+    """
+    Create a limiter with the configured or the default queue size.
+
+    :param limit: Maximum number of requests holding a slot at once.
+    :return: Instance of IAdmissionLimiter.
+    """
+
+    max_queue = get_settings().project.ADMISSION_MAX_QUEUE
+    return AdmissionLimiter(
+        limit=limit,
+        max_queue=max_queue if max_queue is not None else limit * QUEUE_PER_SLOT,
+    )
+
+
+@lru_cache
+def get_admission_limiter() -> IAdmissionLimiter:
+    """
+    Provides the worker-wide admission limiter.
+
+    The concurrency defaults to the connection pool size, so admitted requests do not
+    wait on the pool checkout. Behind PgBouncer without a local pool (NullPool), the
+    checkout never waits and DB_POOL_SIZE stands for the pool size of PgBouncer.
+
+    :return: Instance of IAdmissionLimiter.
+    """
+
+    settings = get_settings()
+    limit = settings.project.ADMISSION_MAX_CONCURRENCY
+    pool_size = (
+        settings.postgres.POSTGRES_PGBOUNCER_POOL_SIZE
+        if settings.postgres.POSTGRES_PGBOUNCER
+        and settings.postgres.POSTGRES_PGBOUNCER_POOL_SIZE > 0
+        else settings.postgres.POOL_SIZE
+    )
+
+    return _create_limiter(limit if limit is not None else max(pool_size, 1))
+
+
+@lru_cache
+def get_admission_route_limiters() -> dict[str, IAdmissionLimiter]:
+    """
+    Provides the worker-wide admission limiters of routes with their own limit.
+
+    :return: Dictionary of IAdmissionLimiter keyed by route path template.
+    """
+
+    return {
+        path: _create_limiter(limit)
+        for path, limit in get_settings().project.ADMISSION_ROUTE_LIMITS.items()
+    }
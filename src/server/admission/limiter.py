@@ -0,0 +1,94 @@
+import asyncio
+import time
+from typing import Any
+
+from src.server.interfaces import IAdmissionLimiter
+
+
+class AdmissionLimiter(IAdmissionLimiter):
+    """
+    Semaphore with a bounded waiting queue and a wait time budget.
+
+    A request arriving while the queue is full is shed at once, a queued request is
+    shed when its budget runs out. The limiter lives in the event loop of the worker,
+    so counters are updated without locking.
+    """
+
+    def __init__(self, limit: int, max_queue: int):
+        """
+        Initialize the limiter.
+
+        :param limit: Maximum number of requests holding a slot at once.
+        :param max_queue: Maximum number of requests waiting for a slot.
+        """
+
+        self._limit = limit
+        self._max_queue = max_queue
+        self._semaphore = asyncio.Semaphore(limit)
+        self._active = 0
+        self._queued = 0
+        self._max_queued = 0
+        self._admitted = 0
+        self._shed = 0
+        self._queue_time = 0.0
+
+    async def acquire(self, budget: float) -> bool:
+        """
+        Take a slot, waiting in the queue for at most the given time.
+
+        :param budget: Maximum time in seconds to wait for a slot.
+        :return: True if a slot was taken, False if the request must be shed.
+        """
+
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            self._active += 1
+            self._admitted += 1
+            return True
+
+        if self._queued >= self._max_queue or budget <= 0:
+            self._shed += 1
+            return False
+
+        self._queued += 1
+        self._max_queued = max(self._max_queued, self._queued)
+        started = time.monotonic()
+        try:
+            async with asyncio.timeout(budget):
+                await self._semaphore.acquire()
+        except TimeoutError:
+            self._shed += 1
+            return False
+        finally:
+            self._queued -= 1
+            self._queue_time += time.monotonic() - started
+
+        self._active += 1
+        self._admitted += 1
+        return True
+
+    def release(self) -> None:
+        """
+        Return a slot taken by ``acquire``.
+        """
+
+        self._active -= 1
+        self._semaphore.release()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get the current and cumulative limiter figures.
+
+        :return: Dictionary with the limit, active and queued requests, the peak
+                queue depth, admitted and shed counts and the total queue time.
+        """
+
+        return {
+            "limit": self._limit,
+            "active": self._active,
+            "queued": self._queued,
+            "max_queued": self._max_queued,
+            "admitted": self._admitted,
+            "shed": self._shed,
+            "queue_time": self._queue_time,
+        }
@@ -0,0 +1 @@
+from .compressors import GzipCompressor, ZstdCompressor
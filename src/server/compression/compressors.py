@@ -0,0 +1,181 @@
+import gzip
+import zlib
+
+from src.server.interfaces import ICompressionStream, ICompressor
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency
+    zstandard = None
+
+
+class GzipStream(ICompressionStream):
+    """Incremental gzip compression of a streamed body."""
+
+    def __init__(self, level: int):
+        """
+        Initialize the stream.
+
+        :param level: Compression level from 1 to 9.
+        """
+
+        # wbits 16 + MAX_WBITS writes the gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress the next chunk and flush it, so the client can decode it right away.
+
+        :param data: Next chunk of the body.
+        :return: Compressed bytes ready to be sent.
+        """
+
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        """
+        End the compressed stream.
+
+        :return: Remaining compressed bytes.
+        """
+
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class GzipCompressor(ICompressor):
+    """Gzip compressor, always available."""
+
+    def __init__(self, level: int):
+        """
+        Initialize the compressor.
+
+        :param level: Compression level from 1 to 9.
+        """
+
+        self._level = level
+
+    @property
+    def encoding(self) -> str:
+        """
+        Get the content encoding token of the compressor.
+
+        :return: "gzip".
+        """
+
+        return "gzip"
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress a complete body.
+
+        The header timestamp is zeroed, so equal bodies compress to equal bytes.
+
+        :param data: Body to compress.
+        :return: Compressed body.
+        """
+
+        return gzip.compress(data, compresslevel=self._level, mtime=0)
+
+    def stream(self) -> ICompressionStream:
+        """
+        Start an incremental compression of a streamed body.
+
+        :return: New gzip stream.
+        """
+
+        return GzipStream(level=self._level)
+
+
+class ZstdStream(ICompressionStream):
+    """Incremental zstd compression of a streamed body."""
+
+    def __init__(self, level: int):
+        """
+        Initialize the stream.
+
+        A zstandard compressor runs one operation at a time, so every stream owns
+        its own compressor.
+
+        :param level: Compression level.
+        """
+
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress the next chunk and flush it, so the client can decode it right away.
+
+        :param data: Next chunk of the body.
+        :return: Compressed bytes ready to be sent.
+        """
+
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self) -> bytes:
+        """
+        End the compressed stream.
+
+        :return: Remaining compressed bytes.
+        """
+
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+class ZstdCompressor(ICompressor):
+    """Zstandard compressor, available when the zstandard package is installed."""
+
+    def __init__(self, level: int):
+        """
+        Initialize the compressor.
+
+        :param level: Compression level.
+        """
+
+        self._level = level
+        self._compressor = zstandard.ZstdCompressor(level=level)
+
+    @property
+    def encoding(self) -> str:
+        """
+        Get the content encoding token of the compressor.
+
+        :return: "zstd".
+        """
+
+        return "zstd"
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress a complete body.
+
+        The call is synchronous, so a shared compressor never runs two operations at
+        once within the event loop.
+
+        :param data: Body to compress.
+        :return: Compressed body.
+        """
+
+        return self._compressor.compress(data)
+
+    def stream(self) -> ICompressionStream:
+        """
+        Start an incremental compression of a streamed body.
+
+        :return: New zstd stream.
+        """
+
+        return ZstdStream(level=self._level)
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+        Check whether the optional zstandard package is installed.
+
+        :return: True if zstd compression can be used.
+        """
+
+        return zstandard is not None
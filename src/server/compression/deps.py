@@ -0,0 +1,42 @@
+from functools import lru_cache
+
+from src.client.storages.memory.core import MemoryTTLCache
+from src.client.storages.memory.interfaces import IMemoryCache
+from src.config.settings.deps import get_settings
+from src.server.compression import GzipCompressor, ZstdCompressor
+from src.server.interfaces import ICompressor
+
+
+@lru_cache
+def get_compressors() -> tuple[ICompressor, ...]:
+    """
+    Provides the available compressors in order of server preference.
+
+    zstd is preferred when the optional zstandard package is installed.
+
+    :return: Tuple of ICompressor instances.
+    """
+
+    settings = get_settings().compression
+    compressors = []
+
+    if ZstdCompressor.is_available():
+        compressors.append(ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL))
+    compressors.append(GzipCompressor(level=settings.COMPRESSION_GZIP_LEVEL))
+
+    return tuple(compressors)
+
+
+@lru_cache
+def get_compression_cache() -> IMemoryCache:
+    """
+    Provides the worker-wide cache of precompressed response bodies.
+
+    :return: Instance of IMemoryCache.
+    """
+
+    settings = get_settings().compression
+    return MemoryTTLCache(
+        ttl=settings.COMPRESSION_CACHE_TTL,
+        max_entries=settings.COMPRESSION_CACHE_MAX_ENTRIES,
+    )
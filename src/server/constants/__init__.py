@@ -1 +1,8 @@
-from .consts import session_context
+from .consts import (
+    call_context,
+    query_budget_context,
+    request_log_context,
+    request_timings_context,
+    session_context,
+    span_context,
+)
@@ -1,3 +1,25 @@
 from contextvars import ContextVar
+from typing import TYPE_CHECKING
 
-session_context: ContextVar[int | None] = ContextVar("session_context", default=None)
+if TYPE_CHECKING:
+    from src.client.storages.postgres.core.ext import PostgresSessionScope
+    from src.common.logger.handlers import RequestLogContext
+    from src.server.metrics.timings import RequestTimings
+    from src.server.query_budget.budget import QueryBudget
+    from src.server.tracing.span import Span
+
+session_context: ContextVar["PostgresSessionScope | None"] = ContextVar(
+    "session_context", default=None
+)
+request_timings_context: ContextVar["RequestTimings | None"] = ContextVar(
+    "request_timings_context", default=None
+)
+span_context: ContextVar["Span | None"] = ContextVar("span_context", default=None)
+# Class and method name of the innermost running LoggingFunctionInfo decorated call
+call_context: ContextVar[str | None] = ContextVar("call_context", default=None)
+query_budget_context: ContextVar["QueryBudget | None"] = ContextVar(
+    "query_budget_context", default=None
+)
+request_log_context: ContextVar["RequestLogContext | None"] = ContextVar(
+    "request_log_context", default=None
+)
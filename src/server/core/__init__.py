@@ -1,2 +1,2 @@
 from .app import app
-from .controllers import api_controller
+from .controllers import api_controller, internal_controller
@@ -1,4 +1,7 @@
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
@@ -8,15 +11,37 @@ from fastapi.routing import APIRoute
 from fastapi_pagination import add_pagination
 
 from src.common.errors import BackendException
+from src.common.responses import FastJSONResponse
 from src.config.docs.deps import get_app_description, get_tags_metadata
 from src.config.settings.deps import get_settings
-from src.server.core.controllers import api_controller
+from src.modules.building.jobs.deps import get_building_warmup_job
+from src.modules.organization.jobs.deps import (
+    get_organization_search_refresh_enabled,
+    get_organization_search_refresh_job,
+    get_organization_warmup_job,
+)
+from src.server.core.controllers import api_controller, internal_controller
+from src.server.core.health import health_controller
+from src.server.core.metrics import metrics_controller
+from src.server.metrics.deps import get_metrics_collectors, get_metrics_registry
 from src.server.middleware.deps import (
+    get_admission_middleware,
+    get_app_timing_middleware,
+    get_compression_middleware,
     get_exception_handler,
     get_exception_middleware,
+    get_metrics_middleware,
     get_postgres_context_session_middleware,
+    get_query_budget_middleware,
+    get_query_budget_mode,
+    get_request_log_middleware,
+    get_server_timing_middleware,
+    get_tracing_middleware,
     get_validation_exception_handler,
 )
+from src.server.scheduler.deps import get_scheduler
+from src.server.tracing.deps import get_tracer
+from src.server.warmup.deps import get_pool_warmup
 
 # === Constants === #
 origins = [
@@ -29,14 +54,38 @@ def custom_generate_unique_id(route: APIRoute) -> str:
     return route.name
 
 
+# === FastAPI App Lifespan === #
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """
+    Runs the background scheduler for the lifetime of the application and warms up
+    the connection pool in the background, readiness is reported once it is over.
+    The last metrics snapshot and the spans still queued are published on shutdown.
+    """
+    scheduler = get_scheduler()
+    await scheduler.start()
+    warmup = asyncio.create_task(get_pool_warmup().run(), name="pool_warmup")
+    try:
+        yield
+    finally:
+        warmup.cancel()
+        await asyncio.gather(warmup, return_exceptions=True)
+        await scheduler.stop()
+        get_metrics_registry().flush()
+        if get_settings().tracing.TRACING_ENABLED:
+            await get_tracer().flush()
+
+
 # === FastAPI App Initialization === #
 app = FastAPI(
+    lifespan=lifespan,
     debug=True,
     title=get_settings().project.PROJECT_NAME,
     version=get_settings().project.PROJECT_VERSION,
     openapi_url=f"{get_settings().project.API_V1_STR}/openapi.json",
     openapi_tags=get_tags_metadata().get_tags_metadata(),
     exception_handlers={BackendException: get_exception_handler().handle},
+    default_response_class=FastJSONResponse,
     description=get_app_description().build_description(),
     swagger_ui_parameters={
         "defaultModelsExpandDepth": -1,
@@ -49,8 +98,26 @@ app = FastAPI(
 # === Middleware Setup === #
 def setup_middleware():
     """
-    Configures middleware for CORS and session handling.
+    Configures middleware for query budgets, compression, CORS, session handling,
+    admission control, request tracing, Server-Timing, request metrics and the log
+    context of requests.
     """
+    server_timing = (
+        get_settings().metrics.SERVER_TIMING_ENABLED
+        or get_settings().metrics.SERVER_TIMING_DEBUG_HEADER is not None
+    )
+    # Wraps the router, the rest of the Server-Timing total is middleware time
+    if server_timing:
+        app.add_middleware(get_app_timing_middleware)
+
+    # Wraps the router, so only the statements issued by endpoints are counted
+    if get_query_budget_mode() != "off":
+        app.add_middleware(get_query_budget_middleware)
+
+    # Added next to wrap the router and see plain, unchunked responses
+    if get_settings().compression.COMPRESSION_ENABLED:
+        app.add_middleware(get_compression_middleware)
+
     app.add_middleware(
         CORSMiddleware,
         allow_origins=origins,
@@ -59,8 +126,26 @@ def setup_middleware():
         allow_headers=["*"],
     )
 
-    app.middleware("http")(get_exception_middleware())
-    app.middleware("http")(get_postgres_context_session_middleware())
+    app.add_middleware(get_exception_middleware)
+    app.add_middleware(get_postgres_context_session_middleware)
+
+    # Outermost, so shed requests cost neither a session scope nor error handling
+    if get_settings().project.ADMISSION_ENABLED:
+        app.add_middleware(get_admission_middleware)
+
+    # Wraps admission, so the root span includes the time spent in the queue
+    if get_settings().tracing.TRACING_ENABLED:
+        app.add_middleware(get_tracing_middleware)
+
+    if server_timing:
+        app.add_middleware(get_server_timing_middleware)
+
+    # Wraps admission, so shed requests are counted with their status as well
+    if get_settings().metrics.METRICS_ENABLED:
+        app.add_middleware(get_metrics_middleware)
+
+    # Outermost, so the access record covers the whole middleware stack
+    app.add_middleware(get_request_log_middleware)
 
     app.exception_handler(RequestValidationError)(
         get_validation_exception_handler().handle,
@@ -73,6 +158,10 @@ def include_routers():
     Includes all application routes with API versioning.
     """
     app.include_router(api_controller, prefix=get_settings().project.API_V1_STR)
+    app.include_router(internal_controller)
+    app.include_router(health_controller, tags=["Health"])
+    if get_settings().metrics.METRICS_ENABLED:
+        app.include_router(metrics_controller, tags=["Health"])
 
 
 # === Pagination Setup === #
@@ -83,6 +172,70 @@ def setup_pagination():
     add_pagination(app)
 
 
+# === Scheduler Setup === #
+def setup_scheduler():
+    """
+    Registers periodic background jobs.
+    """
+    if get_organization_search_refresh_enabled():
+        get_scheduler().add_job(
+            name="organization_search_view_refresh",
+            interval=get_settings().search.ORGANIZATION_SEARCH_VIEW_REFRESH_INTERVAL,
+            job=get_organization_search_refresh_job(),
+        )
+
+
+# === Warmup Setup === #
+def setup_warmup():
+    """
+    Registers hot-path queries primed on every pooled connection at startup.
+    """
+    get_pool_warmup().add_query(
+        name="organization", query=get_organization_warmup_job()
+    )
+    get_pool_warmup().add_query(name="building", query=get_building_warmup_job())
+
+
+# === Metrics Setup === #
+def setup_metrics():
+    """
+    Registers the collectors read on every scrape and, with several workers, the
+    job publishing the metrics of this worker to the others.
+    """
+    if not get_settings().metrics.METRICS_ENABLED:
+        return
+
+    registry = get_metrics_registry()
+    for collector in get_metrics_collectors():
+        registry.add_collector(collector)
+
+    if get_settings().metrics.METRICS_MULTIPROCESS_DIR:
+
+        async def flush_metrics() -> None:
+            registry.flush()
+
+        get_scheduler().add_job(
+            name="metrics_flush",
+            interval=get_settings().metrics.METRICS_FLUSH_INTERVAL,
+            job=flush_metrics,
+        )
+
+
+# === Tracing Setup === #
+def setup_tracing():
+    """
+    Registers the job exporting the finished spans of sampled requests.
+    """
+    if not get_settings().tracing.TRACING_ENABLED:
+        return
+
+    get_scheduler().add_job(
+        name="tracing_export",
+        interval=get_settings().tracing.TRACING_EXPORT_INTERVAL,
+        job=get_tracer().flush,
+    )
+
+
 def set_gunicorn_logs() -> None:
     gunicorn_error_logger = logging.getLogger("gunicorn.error")
     gunicorn_logger = logging.getLogger("gunicorn")
@@ -100,6 +253,10 @@ def initialize_app():
     setup_middleware()
     include_routers()
     setup_pagination()
+    setup_scheduler()
+    setup_warmup()
+    setup_metrics()
+    setup_tracing()
 
     if get_settings().project.IS_PROD_MODE:
         set_gunicorn_logs()
@@ -3,6 +3,8 @@ from fastapi import APIRouter
 from src.common.constants.deps import get_common_enums
 from src.modules.building.controllers.constants.deps import get_building_ctrl_enums
 from src.modules.building.controllers.deps import get_building_controllers
+from src.modules.internal.controllers.constants.deps import get_internal_ctrl_enums
+from src.modules.internal.controllers.deps import get_internal_controllers
 from src.modules.organization.controllers.constants.deps import (
     get_organization_ctrl_enums,
 )
@@ -29,3 +31,16 @@ api_controller.include_router(
     tags=["Organization"],
     prefix="/organizations",
 )
+
+# Operational endpoints, not versioned with the public API
+internal_controller = APIRouter()
+
+internal_controller.include_router(
+    get_internal_controllers(
+        get_internal_ctrl_enums(
+            get_common_enums(),
+        ),
+    ).controller,
+    tags=["Internal"],
+    prefix="/internal",
+)
@@ -0,0 +1,28 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.server.warmup.deps import get_pool_warmup
+
+health_controller = APIRouter()
+
+
+@health_controller.get("/health/live", response_class=PlainTextResponse)
+async def live() -> PlainTextResponse:
+    """
+    Liveness probe, answers as soon as the worker serves requests.
+    """
+
+    return PlainTextResponse("OK")
+
+
+@health_controller.get("/health/ready", response_class=PlainTextResponse)
+async def ready() -> PlainTextResponse:
+    """
+    Readiness probe, fails until the connection pool warmup is over, so rolling
+    deploys route traffic only to warmed up workers.
+    """
+
+    if not get_pool_warmup().is_ready:
+        return PlainTextResponse("Warming up", status_code=503)
+
+    return PlainTextResponse("OK")
@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.server.metrics.deps import get_metrics_registry
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+metrics_controller = APIRouter()
+
+
+@metrics_controller.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """
+    Prometheus scrape endpoint, aggregated over all workers of the host in
+    multiprocess mode.
+    """
+
+    return PlainTextResponse(get_metrics_registry().render(), media_type=CONTENT_TYPE)
@@ -1,6 +1,20 @@
+from .admission import IAdmissionLimiter
+from .compression import ICompressionStream, ICompressor
+from .metrics import IMetricsCollector, IMetricsRegistry
 from .middleware import (
+    IAdmissionMiddleware,
+    IAppTimingMiddleware,
+    ICompressionMiddleware,
     IExceptionHandler,
     IExceptionMiddleware,
+    IMetricsMiddleware,
     IPostgresContextSessionMiddleware,
+    IQueryBudgetMiddleware,
+    IRequestLogMiddleware,
+    IServerTimingMiddleware,
+    ITracingMiddleware,
     IValidationExceptionHandler,
 )
+from .scheduler import IScheduler
+from .tracing import ISpanExporter, ITracer
+from .warmup import IPoolWarmup
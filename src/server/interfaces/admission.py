@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class IAdmissionLimiter(ABC):
+    """
+    Interface for a bounded concurrency limiter with a bounded waiting queue.
+
+    Used by the admission middleware to shed load before requests pile up on the
+    connection pool checkout.
+    """
+
+    @abstractmethod
+    async def acquire(self, budget: float) -> bool:
+        """
+        Take a slot, waiting in the queue for at most the given time.
+
+        :param budget: Maximum time in seconds to wait for a slot.
+        :return: True if a slot was taken, False if the request must be shed.
+        """
+        ...
+
+    @abstractmethod
+    def release(self) -> None:
+        """
+        Return a slot taken by ``acquire``.
+        """
+        ...
+
+    @abstractmethod
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get the current and cumulative limiter figures.
+
+        :return: Dictionary with the limit, active and queued requests, the peak
+                queue depth, admitted and shed counts and the total queue time.
+        """
+        ...
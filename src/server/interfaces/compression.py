@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+
+
+class ICompressionStream(ABC):
+    """
+    Interface for an incremental compression of a streamed response body.
+    """
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress the next chunk and flush it, so the client can decode it right away.
+
+        :param data: Next chunk of the body.
+        :return: Compressed bytes ready to be sent.
+        """
+        ...
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """
+        End the compressed stream.
+
+        :return: Remaining compressed bytes.
+        """
+        ...
+
+
+class ICompressor(ABC):
+    """
+    Interface for a response body compressor of a single content encoding.
+    """
+
+    @property
+    @abstractmethod
+    def encoding(self) -> str:
+        """
+        Get the content encoding token of the compressor.
+
+        :return: Token used in Accept-Encoding and Content-Encoding headers.
+        """
+        ...
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compress a complete body.
+
+        :param data: Body to compress.
+        :return: Compressed body.
+        """
+        ...
+
+    @abstractmethod
+    def stream(self) -> ICompressionStream:
+        """
+        Start an incremental compression of a streamed body.
+
+        :return: New compression stream.
+        """
+        ...
@@ -0,0 +1,111 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.server.metrics.metrics import Counter, Gauge, Histogram, MetricFamily
+
+
+class IMetricsCollector(ABC):
+    """
+    Interface for a source of metrics read at scrape time, such as pool or cache
+    figures already counted elsewhere.
+    """
+
+    @abstractmethod
+    def collect(self) -> list["MetricFamily"]:
+        """
+        Take a snapshot of the metrics.
+
+        :return: List of collected metric families.
+        """
+        ...
+
+
+class IMetricsRegistry(ABC):
+    """
+    Interface for a worker-wide registry of metrics rendered in the Prometheus text
+    exposition format.
+    """
+
+    @abstractmethod
+    def counter(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> "Counter":
+        """
+        Register a counter or retrieve the one registered under the name.
+
+        :param name: Metric name without the ``_total`` suffix.
+        :param documentation: Help text of the metric.
+        :param labelnames: Names of the labels.
+        :return: Counter instance.
+        """
+        ...
+
+    @abstractmethod
+    def gauge(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> "Gauge":
+        """
+        Register a gauge or retrieve the one registered under the name.
+
+        :param name: Metric name.
+        :param documentation: Help text of the metric.
+        :param labelnames: Names of the labels.
+        :return: Gauge instance.
+        """
+        ...
+
+    @abstractmethod
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = (),
+    ) -> "Histogram":
+        """
+        Register a histogram or retrieve the one registered under the name.
+
+        :param name: Metric name.
+        :param documentation: Help text of the metric.
+        :param labelnames: Names of the labels.
+        :param buckets: Sorted upper bounds of the buckets.
+        :return: Histogram instance.
+        """
+        ...
+
+    @abstractmethod
+    def add_collector(self, collector: IMetricsCollector) -> None:
+        """
+        Register a collector read on every scrape.
+
+        :param collector: Collector to register.
+        """
+        ...
+
+    @abstractmethod
+    def collect(self) -> list["MetricFamily"]:
+        """
+        Take a snapshot of the metrics and collectors of the current worker.
+
+        :return: List of collected metric families.
+        """
+        ...
+
+    @abstractmethod
+    def flush(self) -> None:
+        """
+        Publish the snapshot of the current worker to the other workers, does
+        nothing unless multiprocess aggregation is enabled.
+        """
+        ...
+
+    @abstractmethod
+    def render(self) -> str:
+        """
+        Render the metrics in the Prometheus text format, aggregated over all
+        workers in multiprocess mode.
+
+        :return: Exposition text.
+        """
+        ...
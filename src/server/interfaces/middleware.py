@@ -1,10 +1,9 @@
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable
 
 from fastapi import Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
-from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
 
 
 class IExceptionHandler(ABC):
@@ -37,13 +36,14 @@ class IExceptionMiddleware(ABC):
     """
 
     @abstractmethod
-    async def __call__(self, request: Request, call_next):  # noqa: ANN001
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Handles unhandled exceptions and processes the request accordingly.
+        Handles unhandled exceptions and processes the request accordingly, sending a
+        JSON response with error details if an exception occurs.
 
-        :param request: The incoming HTTP request.
-        :param call_next: The next handler to process the request.
-        :return: A JSONResponse with error details if an exception occurs.
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
         """
         ...
 
@@ -82,14 +82,158 @@ class IPostgresContextSessionMiddleware(ABC):
     """
 
     @abstractmethod
-    async def __call__(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Handle an incoming HTTP request, injecting the session context.
 
-        :param request: The incoming request object.
-        :param call_next: The next request handler in the ASGI middleware chain.
-        :return: The response object resulting from handling the request.
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        ...
+
+
+class ICompressionMiddleware(ABC):
+    """
+    Abstract interface for a pure ASGI middleware compressing response bodies.
+
+    The middleware negotiates the content encoding with the client, leaves small and
+    already encoded responses untouched and compresses streamed bodies chunk by chunk.
+    """
+
+    @abstractmethod
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, compressing the HTTP response body if possible.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        ...
+
+
+class IAdmissionMiddleware(ABC):
+    """
+    Abstract interface for a pure ASGI middleware limiting the number of requests
+    handled at once and shedding the excess.
+    """
+
+    @abstractmethod
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, admitting the HTTP request or rejecting it.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        ...
+
+
+class IMetricsMiddleware(ABC):
+    """
+    Abstract interface for a pure ASGI middleware recording request metrics.
+    """
+
+    @abstractmethod
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, timing the HTTP request.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        ...
+
+
+class ITracingMiddleware(ABC):
+    """
+    Abstract interface for a pure ASGI middleware starting the root span of sampled
+    requests.
+    """
+
+    @abstractmethod
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, tracing the HTTP request if it is sampled.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        ...
+
+
+class IServerTimingMiddleware(ABC):
+    """
+    Abstract interface for a pure ASGI middleware reporting request phase timings
+    in the Server-Timing response header.
+    """
+
+    @abstractmethod
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, adding the Server-Timing header to the response if
+        it is requested.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        ...
+
+
+class IAppTimingMiddleware(ABC):
+    """
+    Abstract interface for a pure ASGI middleware timing the application wrapped
+    by the middleware stack.
+    """
+
+    @abstractmethod
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, timing the application.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        ...
+
+
+class IQueryBudgetMiddleware(ABC):
+    """
+    Abstract interface for a pure ASGI middleware checking the number of statements
+    executed by every request against a budget.
+    """
+
+    @abstractmethod
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, counting the statements of the HTTP request.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        ...
+
+
+class IRequestLogMiddleware(ABC):
+    """
+    Abstract interface for a pure ASGI middleware exposing the request fields to
+    the records logged while a request runs.
+    """
+
+    @abstractmethod
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, setting the log context of the HTTP request.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
         """
         ...
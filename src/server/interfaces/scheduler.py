@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+
+class IScheduler(ABC):
+    """
+    Interface for an in-process scheduler running periodic background jobs.
+
+    Jobs are registered before the application starts and run within the event loop
+    of the worker for the whole application lifespan.
+    """
+
+    @abstractmethod
+    def add_job(
+        self, name: str, interval: float, job: Callable[[], Awaitable[None]]
+    ) -> None:
+        """
+        Register a periodic job.
+
+        :param name: Unique name of the job, used in logs.
+        :param interval: Delay between job runs in seconds.
+        :param job: Coroutine function to run.
+        """
+        ...
+
+    @abstractmethod
+    async def start(self) -> None:
+        """
+        Start running all registered jobs.
+        """
+        ...
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """
+        Cancel all running jobs and wait for them to finish.
+        """
+        ...
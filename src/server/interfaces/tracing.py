@@ -0,0 +1,82 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.server.tracing.span import Span, SpanKind
+
+
+class ISpanExporter(ABC):
+    """
+    Interface for a destination of finished spans in the OTLP JSON encoding.
+    """
+
+    @abstractmethod
+    async def export(self, request: dict[str, Any]) -> None:
+        """
+        Send a batch of spans.
+
+        :param request: OTLP ``ExportTraceServiceRequest`` in the JSON encoding.
+        """
+        ...
+
+
+class ITracer(ABC):
+    """
+    Interface for a tracer starting sampled traces and exporting their spans in
+    batches.
+    """
+
+    @property
+    @abstractmethod
+    def max_statements(self) -> int:
+        """
+        Maximum number of statements kept per span.
+
+        :return: Number of statements.
+        """
+        ...
+
+    @abstractmethod
+    def start_trace(
+        self,
+        name: str,
+        kind: "SpanKind",
+        attributes: dict[str, Any] | None = None,
+        traceparent: str | None = None,
+    ) -> "Span | None":
+        """
+        Start the root span of a trace if it is sampled.
+
+        :param name: Span name.
+        :param kind: Span kind.
+        :param attributes: Initial span attributes.
+        :param traceparent: W3C ``traceparent`` header of the caller, whose trace is
+                continued and whose sampling decision is followed.
+        :return: Started span or None if the trace is not sampled.
+        """
+        ...
+
+    @abstractmethod
+    def on_end(self, span: "Span") -> None:
+        """
+        Queue a finished span for export.
+
+        :param span: Finished span.
+        """
+        ...
+
+    @abstractmethod
+    async def flush(self) -> None:
+        """
+        Export all queued spans.
+        """
+        ...
+
+    @abstractmethod
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get the export counters.
+
+        :return: Dictionary with queued, exported and dropped span counts.
+        """
+        ...
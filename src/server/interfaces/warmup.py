@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class IPoolWarmup(ABC):
+    """
+    Interface for the startup phase filling the connection pool and priming the hot
+    queries on every connection.
+
+    Queries are registered before the application starts, the worker reports
+    readiness only once the warmup is over.
+    """
+
+    @abstractmethod
+    def add_query(
+        self, name: str, query: Callable[[AsyncSession], Awaitable[None]]
+    ) -> None:
+        """
+        Register a hot-path query executed once per pooled connection.
+
+        :param name: Unique name of the query, used in logs.
+        :param query: Coroutine function running the query in the given session.
+        """
+        ...
+
+    @property
+    @abstractmethod
+    def is_ready(self) -> bool:
+        """
+        Whether the warmup is over and the worker may receive traffic.
+
+        :return: True once the warmup has finished or failed.
+        """
+        ...
+
+    @abstractmethod
+    async def run(self) -> None:
+        """
+        Open the pool connections and run every registered query on each of them.
+        """
+        ...
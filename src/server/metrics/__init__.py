@@ -0,0 +1,3 @@
+from .metrics import Counter, Gauge, Histogram, MetricFamily, Sample
+from .registry import MetricsRegistry
+from .timings import RequestTimings, TimingName, record_timing
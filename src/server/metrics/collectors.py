@@ -0,0 +1,261 @@
+from collections.abc import Callable
+
+from src.client.storages.postgres.interfaces import (
+    IPostgresConnectionMetrics,
+    IPostgresEngine,
+)
+from src.server.interfaces import IAdmissionLimiter, IMetricsCollector
+from src.server.metrics.metrics import (
+    COUNTER,
+    GAUGE,
+    HISTOGRAM,
+    MetricFamily,
+    Sample,
+    format_value,
+)
+
+# Pool figures exposed as gauges, keyed by their name in the pool stats
+POOL_GAUGES = {
+    "size": "Configured number of pooled connections.",
+    "checked_in": "Idle connections in the pool.",
+    "checked_out": "Connections checked out of the pool.",
+    "overflow": "Connections opened over the pool size.",
+}
+# Admission limiter figures keyed by their name in the limiter stats, with the
+# metric name, kind and help text
+ADMISSION_METRICS = {
+    "limit": ("admission_limit", GAUGE, "Requests allowed to be handled at once."),
+    "active": ("admission_active", GAUGE, "Requests being handled."),
+    "queued": ("admission_queued", GAUGE, "Requests waiting for a slot."),
+    "admitted": ("admission_admitted", COUNTER, "Requests admitted."),
+    "shed": ("admission_shed", COUNTER, "Requests rejected because of overload."),
+    "queue_time": (
+        "admission_queue_seconds",
+        COUNTER,
+        "Total time requests waited for a slot.",
+    ),
+}
+
+
+class PostgresPoolCollector(IMetricsCollector):
+    """
+    Collects the state of the connection pools and the histograms of connection
+    held and checkout wait times.
+    """
+
+    def __init__(
+        self,
+        psql_engine: IPostgresEngine,
+        held_metrics: IPostgresConnectionMetrics,
+        wait_metrics: IPostgresConnectionMetrics,
+    ):
+        """
+        Initialize the collector.
+
+        :param psql_engine: Engine owning the pools.
+        :param held_metrics: Metrics of connection held times.
+        :param wait_metrics: Metrics of checkout wait times.
+        """
+
+        self._psql_engine = psql_engine
+        self._held_metrics = held_metrics
+        self._wait_metrics = wait_metrics
+
+    def collect(self) -> list[MetricFamily]:
+        """
+        Take a snapshot of the pool metrics.
+
+        :return: List of collected metric families.
+        """
+
+        pools = self._psql_engine.get_pool_stats()
+        families = [
+            MetricFamily(
+                name=f"db_pool_{name}",
+                kind=GAUGE,
+                documentation=documentation,
+                samples=[
+                    Sample("", (("pool", pool),), stats[name])
+                    for pool, stats in pools.items()
+                    if name in stats
+                ],
+            )
+            for name, documentation in POOL_GAUGES.items()
+        ]
+
+        families.append(
+            self._get_histogram(
+                name="db_connection_held_seconds",
+                documentation="Time connections are held between checkout and checkin.",
+                stats=self._held_metrics.get_stats(),
+            )
+        )
+        families.append(
+            self._get_histogram(
+                name="db_pool_checkout_wait_seconds",
+                documentation="Time checkouts wait for a pooled connection.",
+                stats=self._wait_metrics.get_stats(),
+            )
+        )
+        return families
+
+    @staticmethod
+    def _get_histogram(name: str, documentation: str, stats: dict) -> MetricFamily:
+        """
+        Convert connection metrics stats into a histogram family.
+
+        :param name: Metric name.
+        :param documentation: Help text of the metric.
+        :param stats: Stats with cumulative buckets, count and sum.
+        :return: Histogram metric family.
+        """
+
+        samples = [
+            Sample("_bucket", (("le", format_value(float(bound))),), count)
+            for bound, count in stats["buckets"].items()
+        ]
+        samples.append(Sample("_count", (), stats["count"]))
+        samples.append(Sample("_sum", (), stats["sum"]))
+
+        return MetricFamily(
+            name=name, kind=HISTOGRAM, documentation=documentation, samples=samples
+        )
+
+
+class CacheCollector(IMetricsCollector):
+    """
+    Collects hits, misses, entries and the hit ratio of the process-local caches.
+    """
+
+    def __init__(self, caches: dict[str, Callable[[], dict[str, int]]]):
+        """
+        Initialize the collector.
+
+        :param caches: Functions returning the usage counters of a cache, keyed by
+                the cache name.
+        """
+
+        self._caches = caches
+
+    def collect(self) -> list[MetricFamily]:
+        """
+        Take a snapshot of the cache metrics.
+
+        :return: List of collected metric families.
+        """
+
+        hits, misses, entries, ratios = [], [], [], []
+        for cache, get_stats in self._caches.items():
+            stats = get_stats()
+            labels = (("cache", cache),)
+            hits.append(Sample("_total", labels, stats["hits"]))
+            misses.append(Sample("_total", labels, stats["misses"]))
+            entries.append(Sample("", labels, stats["entries"]))
+
+            lookups = stats["hits"] + stats["misses"]
+            ratios.append(Sample("", labels, stats["hits"] / lookups if lookups else 0))
+
+        return [
+            MetricFamily("cache_hits", COUNTER, "Cache lookups served.", hits),
+            MetricFamily("cache_misses", COUNTER, "Cache lookups missed.", misses),
+            MetricFamily("cache_entries", GAUGE, "Entries held by a cache.", entries),
+            MetricFamily(
+                "cache_hit_ratio",
+                GAUGE,
+                "Share of cache lookups served since the worker started.",
+                ratios,
+            ),
+        ]
+
+
+class AdmissionCollector(IMetricsCollector):
+    """
+    Collects the state and the counters of the admission limiters.
+    """
+
+    def __init__(
+        self,
+        limiter: IAdmissionLimiter,
+        route_limiters: dict[str, IAdmissionLimiter],
+    ):
+        """
+        Initialize the collector.
+
+        :param limiter: Worker-wide limiter.
+        :param route_limiters: Limiters keyed by route path template.
+        """
+
+        self._limiters = {"*": limiter, **route_limiters}
+
+    def collect(self) -> list[MetricFamily]:
+        """
+        Take a snapshot of the admission metrics.
+
+        :return: List of collected metric families.
+        """
+
+        stats = {
+            route: limiter.get_stats() for route, limiter in self._limiters.items()
+        }
+
+        return [
+            MetricFamily(
+                name=metric,
+                kind=kind,
+                documentation=documentation,
+                samples=[
+                    Sample(
+                        "_total" if kind == COUNTER else "",
+                        (("route", route),),
+                        route_stats[name],
+                    )
+                    for route, route_stats in stats.items()
+                ],
+            )
+            for name, (metric, kind, documentation) in ADMISSION_METRICS.items()
+        ]
+
+
+class LogQueueCollector(IMetricsCollector):
+    """
+    Collects the usage of the log queue and the records dropped when it was full.
+    """
+
+    def __init__(self, get_stats: Callable[[], dict[str, int]]):
+        """
+        Initialize the collector.
+
+        :param get_stats: Function returning the usage counters of the log queue.
+        """
+
+        self._get_stats = get_stats
+
+    def collect(self) -> list[MetricFamily]:
+        """
+        Take a snapshot of the log queue metrics.
+
+        :return: List of collected metric families.
+        """
+
+        stats = self._get_stats()
+
+        return [
+            MetricFamily(
+                "log_queue_records",
+                GAUGE,
+                "Records waiting to be written.",
+                [Sample("", (), stats["queued"])],
+            ),
+            MetricFamily(
+                "log_queue_capacity",
+                GAUGE,
+                "Records the log queue holds.",
+                [Sample("", (), stats["capacity"])],
+            ),
+            MetricFamily(
+                "log_records_dropped",
+                COUNTER,
+                "Records dropped because the log queue was full.",
+                [Sample("_total", (), stats["dropped"])],
+            ),
+        ]
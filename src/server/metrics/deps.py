@@ -0,0 +1,74 @@
+from functools import lru_cache
+
+from src.client.storages.postgres.core.deps import (
+    get_postgres_checkout_wait_metrics,
+    get_postgres_connection_metrics,
+    get_postgres_engine,
+)
+from src.common.logger.deps import get_log_queue_handler
+from src.config.settings.deps import get_settings
+from src.modules.building.adapters.caches.memory.deps import get_building_tile_cache
+from src.modules.organization.adapters.caches.memory.deps import (
+    get_organization_facet_cache,
+)
+from src.server.admission.deps import (
+    get_admission_limiter,
+    get_admission_route_limiters,
+)
+from src.server.compression.deps import get_compression_cache
+from src.server.interfaces import IMetricsCollector, IMetricsRegistry
+from src.server.metrics import MetricsRegistry
+from src.server.metrics.collectors import (
+    AdmissionCollector,
+    CacheCollector,
+    LogQueueCollector,
+    PostgresPoolCollector,
+)
+
+
+@lru_cache
+def get_metrics_registry() -> IMetricsRegistry:
+    """
+    Provides the worker-wide metrics registry.
+
+    :return: Instance of IMetricsRegistry.
+    """
+
+    return MetricsRegistry(
+        multiprocess_dir=get_settings().metrics.METRICS_MULTIPROCESS_DIR
+    )
+
+
+def get_metrics_collectors() -> list[IMetricsCollector]:
+    """
+    Provides the collectors of figures counted outside of the registry, read on
+    every scrape.
+
+    :return: List of IMetricsCollector instances.
+    """
+
+    collectors = [
+        PostgresPoolCollector(
+            psql_engine=get_postgres_engine(),
+            held_metrics=get_postgres_connection_metrics(),
+            wait_metrics=get_postgres_checkout_wait_metrics(),
+        ),
+        CacheCollector(
+            caches={
+                "building_tile": get_building_tile_cache().get_stats,
+                "organization_facet": get_organization_facet_cache().get_stats,
+                "compression": get_compression_cache().get_stats,
+            }
+        ),
+        LogQueueCollector(get_stats=get_log_queue_handler().get_stats),
+    ]
+
+    if get_settings().project.ADMISSION_ENABLED:
+        collectors.append(
+            AdmissionCollector(
+                limiter=get_admission_limiter(),
+                route_limiters=get_admission_route_limiters(),
+            )
+        )
+
+    return collectors
@@ -0,0 +1,335 @@
+import bisect
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from typing import NamedTuple
+
+# Kinds of metric families, as named in the Prometheus text format
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+
+class Sample(NamedTuple):
+    """Single value of a metric family, such as a bucket or the sum of a histogram."""
+
+    suffix: str
+    labels: tuple[tuple[str, str], ...]
+    value: float
+
+
+class MetricFamily(NamedTuple):
+    """Collected snapshot of a metric with all its samples."""
+
+    name: str
+    kind: str
+    documentation: str
+    samples: list[Sample]
+
+
+class _CounterChild:
+    """Value of a counter for one combination of label values."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the counter.
+
+        :param amount: Non-negative increment.
+        """
+
+        self.value += amount
+
+
+class _GaugeChild:
+    """Value of a gauge for one combination of label values."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """
+        Set the gauge.
+
+        :param value: New value.
+        """
+
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the gauge.
+
+        :param amount: Increment, negative to decrease.
+        """
+
+        self.value += amount
+
+
+class _HistogramChild:
+    """Buckets of a histogram for one combination of label values."""
+
+    __slots__ = ("buckets", "count", "counts", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Record a value.
+
+        :param value: Observed value, such as a duration in seconds.
+        """
+
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class BaseMetric(ABC):
+    """
+    Base of the metric types, keeping one child per combination of label values.
+
+    Children are plain objects updated from a single event loop, so recording a value
+    is a dictionary lookup and an addition, without locking.
+    """
+
+    kind: str
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        """
+        Initialize the metric.
+
+        :param name: Metric name.
+        :param documentation: Help text of the metric.
+        :param labelnames: Names of the labels, in the order of ``labels`` arguments.
+        """
+
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._children: dict[tuple[str, ...], object] = {}
+
+    @abstractmethod
+    def _create_child(self) -> object:
+        """Create the value holder of a new label combination."""
+        ...
+
+    def labels(self, *values: str) -> object:
+        """
+        Retrieve the child of a combination of label values, creating it on first use.
+
+        :param values: Label values in the order of the label names.
+        :return: Child recording values of the combination.
+        """
+
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                msg = f"Metric {self.name} expects labels {self.labelnames}"
+                raise ValueError(msg)
+            child = self._children[values] = self._create_child()
+        return child
+
+    def _iter_children(self) -> Iterator[tuple[tuple[tuple[str, str], ...], object]]:
+        """
+        Iterate over the children with their labels.
+
+        :return: Iterator of label pairs and children.
+        """
+
+        for values, child in list(self._children.items()):
+            yield tuple(zip(self.labelnames, values, strict=True)), child
+
+    @abstractmethod
+    def collect(self) -> MetricFamily:
+        """
+        Take a snapshot of the metric.
+
+        :return: MetricFamily with a sample per child.
+        """
+        ...
+
+
+class Counter(BaseMetric):
+    """Monotonically increasing value, such as a number of requests."""
+
+    kind = COUNTER
+
+    def _create_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def labels(self, *values: str) -> _CounterChild:
+        return super().labels(*values)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the counter of a metric without labels.
+
+        :param amount: Non-negative increment.
+        """
+
+        self.labels().inc(amount)
+
+    def collect(self) -> MetricFamily:
+        return MetricFamily(
+            name=self.name,
+            kind=self.kind,
+            documentation=self.documentation,
+            samples=[
+                Sample("_total", labels, child.value)
+                for labels, child in self._iter_children()
+            ],
+        )
+
+
+class Gauge(BaseMetric):
+    """Value going up and down, such as a number of open connections."""
+
+    kind = GAUGE
+
+    def _create_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def labels(self, *values: str) -> _GaugeChild:
+        return super().labels(*values)
+
+    def set(self, value: float) -> None:
+        """
+        Set the gauge of a metric without labels.
+
+        :param value: New value.
+        """
+
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the gauge of a metric without labels.
+
+        :param amount: Increment, negative to decrease.
+        """
+
+        self.labels().inc(amount)
+
+    def collect(self) -> MetricFamily:
+        return MetricFamily(
+            name=self.name,
+            kind=self.kind,
+            documentation=self.documentation,
+            samples=[
+                Sample("", labels, child.value)
+                for labels, child in self._iter_children()
+            ],
+        )
+
+
+class Histogram(BaseMetric):
+    """Distribution of values over fixed buckets, such as request latencies."""
+
+    kind = HISTOGRAM
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = (),
+    ):
+        """
+        Initialize the histogram.
+
+        :param name: Metric name.
+        :param documentation: Help text of the metric.
+        :param labelnames: Names of the labels, in the order of ``labels`` arguments.
+        :param buckets: Sorted upper bounds of the buckets, ``+Inf`` is implied.
+        """
+
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(map(float, buckets)))
+
+    def _create_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def labels(self, *values: str) -> _HistogramChild:
+        return super().labels(*values)
+
+    def observe(self, value: float) -> None:
+        """
+        Record a value of a metric without labels.
+
+        :param value: Observed value.
+        """
+
+        self.labels().observe(value)
+
+    def collect(self) -> MetricFamily:
+        samples = []
+        for labels, child in self._iter_children():
+            samples.extend(
+                get_histogram_samples(
+                    labels=labels,
+                    buckets=child.buckets,
+                    counts=child.counts,
+                    total=child.sum,
+                )
+            )
+
+        return MetricFamily(
+            name=self.name,
+            kind=self.kind,
+            documentation=self.documentation,
+            samples=samples,
+        )
+
+
+def get_histogram_samples(
+    labels: tuple[tuple[str, str], ...],
+    buckets: tuple[float, ...],
+    counts: list[int],
+    total: float,
+) -> list[Sample]:
+    """
+    Build the cumulative bucket, count and sum samples of a histogram.
+
+    :param labels: Labels of the histogram child.
+    :param buckets: Upper bounds of the buckets without ``+Inf``.
+    :param counts: Non-cumulative counts per bucket, the last one is ``+Inf``.
+    :param total: Sum of the observed values.
+    :return: List of samples.
+    """
+
+    samples = []
+    cumulative = 0
+    for bound, count in zip((*map(format_value, buckets), "+Inf"), counts, strict=True):
+        cumulative += count
+        samples.append(Sample("_bucket", (*labels, ("le", bound)), cumulative))
+    samples.append(Sample("_count", labels, cumulative))
+    samples.append(Sample("_sum", labels, total))
+    return samples
+
+
+def format_value(value: float) -> str:
+    """
+    Format a sample value or a bucket bound as Prometheus expects it.
+
+    :param value: Value to format.
+    :return: Integral values without a fraction, others in shortest repr.
+    """
+
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
@@ -0,0 +1,274 @@
+import json
+import os
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+
+from src.server.interfaces import IMetricsCollector, IMetricsRegistry
+from src.server.metrics.metrics import (
+    GAUGE,
+    BaseMetric,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricFamily,
+    Sample,
+    format_value,
+)
+
+FILE_PREFIX = "metrics_"
+
+
+class MetricsRegistry(IMetricsRegistry):
+    """
+    Worker-wide registry of metrics rendered in the Prometheus text format.
+
+    Every worker records into its own metrics. With a multiprocess directory each
+    worker periodically writes a snapshot to its own file there, and a scrape served
+    by any worker sums counters and histograms over all files. Gauges describe the
+    state of one process, so they are kept per worker under a ``pid`` label and
+    dropped once the worker is gone. Counters of exited workers are kept, so totals
+    never go back when a worker is replaced.
+    """
+
+    def __init__(self, multiprocess_dir: str | None = None):
+        """
+        Initialize an empty registry.
+
+        :param multiprocess_dir: Directory shared by the workers of the host, None
+                to serve the metrics of the current worker only.
+        """
+
+        self._metrics: dict[str, BaseMetric] = {}
+        self._collectors: list[IMetricsCollector] = []
+        self._dir = Path(multiprocess_dir) if multiprocess_dir else None
+
+    def _register(self, metric: BaseMetric) -> BaseMetric:
+        """
+        Register a metric unless an equal one is already registered.
+
+        :param metric: Metric to register.
+        :return: Registered metric.
+        """
+
+        registered = self._metrics.get(metric.name)
+        if registered is None:
+            self._metrics[metric.name] = metric
+            return metric
+
+        if (registered.kind, registered.labelnames) != (metric.kind, metric.labelnames):
+            msg = f"Metric {metric.name} is already registered with another type"
+            raise ValueError(msg)
+        return registered
+
+    def counter(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> Counter:
+        """
+        Register a counter or retrieve the one registered under the name.
+
+        :param name: Metric name without the ``_total`` suffix.
+        :param documentation: Help text of the metric.
+        :param labelnames: Names of the labels.
+        :return: Counter instance.
+        """
+
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> Gauge:
+        """
+        Register a gauge or retrieve the one registered under the name.
+
+        :param name: Metric name.
+        :param documentation: Help text of the metric.
+        :param labelnames: Names of the labels.
+        :return: Gauge instance.
+        """
+
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = (),
+    ) -> Histogram:
+        """
+        Register a histogram or retrieve the one registered under the name.
+
+        :param name: Metric name.
+        :param documentation: Help text of the metric.
+        :param labelnames: Names of the labels.
+        :param buckets: Sorted upper bounds of the buckets.
+        :return: Histogram instance.
+        """
+
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: IMetricsCollector) -> None:
+        """
+        Register a collector read on every scrape.
+
+        :param collector: Collector to register.
+        """
+
+        self._collectors.append(collector)
+
+    def collect(self) -> list[MetricFamily]:
+        """
+        Take a snapshot of the metrics and collectors of the current worker.
+
+        :return: List of collected metric families.
+        """
+
+        families = [metric.collect() for metric in list(self._metrics.values())]
+        for collector in self._collectors:
+            families.extend(collector.collect())
+        return families
+
+    def flush(self) -> None:
+        """
+        Write the snapshot of the current worker to its file in the multiprocess
+        directory.
+
+        The file is replaced atomically, so readers never see a partial snapshot.
+        """
+
+        if self._dir is None:
+            return
+
+        self._dir.mkdir(parents=True, exist_ok=True)
+        snapshot = [
+            [family.name, family.kind, family.documentation, family.samples]
+            for family in self.collect()
+        ]
+
+        fd, tmp_path = tempfile.mkstemp(dir=self._dir, prefix=".tmp_")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(snapshot, file, separators=(",", ":"))
+            Path(tmp_path).replace(self._dir / f"{FILE_PREFIX}{os.getpid()}.json")
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def render(self) -> str:
+        """
+        Render the metrics in the Prometheus text format, aggregated over all
+        workers in multiprocess mode.
+
+        :return: Exposition text.
+        """
+
+        if self._dir is None:
+            return self._render(self.collect())
+
+        self.flush()
+        return self._render(self._collect_multiprocess())
+
+    def _collect_multiprocess(self) -> list[MetricFamily]:
+        """
+        Merge the snapshots of all workers.
+
+        :return: List of aggregated metric families.
+        """
+
+        families: dict[str, MetricFamily] = {}
+        values: dict[str, dict[tuple, float]] = {}
+
+        for path in sorted(self._dir.glob(f"{FILE_PREFIX}*.json")):
+            pid = path.stem.removeprefix(FILE_PREFIX)
+            try:
+                snapshot = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue  # Removed or being replaced, the next scrape reads it
+            alive = self._is_alive(int(pid))
+
+            for name, kind, documentation, samples in snapshot:
+                if kind == GAUGE and not alive:
+                    continue
+                family = families.setdefault(
+                    name, MetricFamily(name, kind, documentation, [])
+                )
+                merged = values.setdefault(family.name, {})
+                for suffix, sample_labels, value in samples:
+                    labels = tuple(map(tuple, sample_labels))
+                    if kind == GAUGE:
+                        labels = (*labels, ("pid", pid))
+                    key = (suffix, labels)
+                    merged[key] = merged.get(key, 0.0) + value
+
+        for name, family in families.items():
+            family.samples.extend(
+                Sample(suffix, labels, value)
+                for (suffix, labels), value in values[name].items()
+            )
+        return list(families.values())
+
+    @staticmethod
+    def _is_alive(pid: int) -> bool:
+        """
+        Check whether a worker process is still running.
+
+        :param pid: Process id of the worker.
+        :return: True if the process exists.
+        """
+
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    @classmethod
+    def _render(cls, families: Iterable[MetricFamily]) -> str:
+        """
+        Render metric families in the Prometheus text format version 0.0.4.
+
+        :param families: Metric families to render.
+        :return: Exposition text.
+        """
+
+        lines = []
+        for family in families:
+            documentation = family.documentation.replace("\\", r"\\").replace(
+                "\n", r"\n"
+            )
+            lines.append(f"# HELP {family.name} {documentation}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for suffix, labels, value in family.samples:
+                lines.append(
+                    f"{family.name}{suffix}{cls._render_labels(labels)} "
+                    f"{format_value(float(value))}"
+                )
+        lines.append("")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _render_labels(labels: tuple[tuple[str, str], ...]) -> str:
+        """
+        Render the labels of a sample with escaped values.
+
+        :param labels: Label names and values.
+        :return: Labels in braces or an empty string without labels.
+        """
+
+        if not labels:
+            return ""
+
+        rendered = ",".join(
+            '{}="{}"'.format(
+                name,
+                str(value)
+                .replace("\\", r"\\")
+                .replace("\n", r"\n")
+                .replace('"', r"\""),
+            )
+            for name, value in labels
+        )
+        return f"{{{rendered}}}"
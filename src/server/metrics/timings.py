@@ -0,0 +1,57 @@
+from enum import StrEnum
+
+from src.server.constants import request_timings_context
+
+
+class TimingName(StrEnum):
+    """Phases of a request timed by the application layers."""
+
+    AUTH = "auth"
+    DB = "db"
+    ORM = "orm"
+    VALIDATION = "validation"
+    SERIALIZATION = "serialization"
+    APP = "app"
+
+
+class RequestTimings:
+    """
+    Durations of the phases of one request, set in a context variable by the
+    metrics middleware and filled by the layers doing the work.
+
+    Phases may be entered several times per request, such as one database round trip
+    per query, so durations and entry counts are summed per phase.
+    """
+
+    __slots__ = ("counts", "durations")
+
+    def __init__(self):
+        """Initialize empty timings."""
+
+        self.durations: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+
+    def add(self, name: str, duration: float) -> None:
+        """
+        Add a duration to a phase.
+
+        :param name: Phase name.
+        :param duration: Duration in seconds.
+        """
+
+        self.durations[name] = self.durations.get(name, 0.0) + duration
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+
+def record_timing(name: str, duration: float) -> None:
+    """
+    Add a duration to a phase of the current request, does nothing outside of a
+    request, such as in background jobs.
+
+    :param name: Phase name.
+    :param duration: Duration in seconds.
+    """
+
+    timings = request_timings_context.get()
+    if timings is not None:
+        timings.add(name, duration)
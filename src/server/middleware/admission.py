@@ -0,0 +1,139 @@
+import time
+
+from starlette.requests import Request
+from starlette.routing import Match, Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.common.constants import ErrorCodesEnums
+from src.common.errors import BackendException
+from src.server.interfaces import IAdmissionLimiter, IAdmissionMiddleware
+from src.server.middleware.exception import BackendExceptionHandler
+
+
+class AdmissionMiddleware(IAdmissionMiddleware):
+    """
+    Pure ASGI middleware bounding the number of requests handled at once by the
+    worker, so spikes are shed with ``503`` and ``Retry-After`` instead of queueing
+    silently on the connection pool checkout until clients time out.
+
+    A request takes a slot of its route limiter, if the route has one, and then a
+    slot of the worker limiter, both within one queue time budget. Slots are returned
+    as soon as the response starts, when the session has already given its connection
+    back to the pool.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        errors: ErrorCodesEnums,
+        limiter: IAdmissionLimiter,
+        route_limiters: dict[str, IAdmissionLimiter],
+        queue_timeout: float,
+        retry_after: int,
+        excluded_paths: tuple[str, ...],
+    ):
+        """
+        Initialize the middleware.
+
+        :param app: Wrapped ASGI application.
+        :param errors: Enum class containing standardized error codes and status codes.
+        :param limiter: Worker-wide limiter.
+        :param route_limiters: Limiters keyed by route path template.
+        :param queue_timeout: Queue time budget of a request in seconds.
+        :param retry_after: Value of the Retry-After header of shed requests.
+        :param excluded_paths: Path prefixes never limited, such as health probes.
+        """
+
+        self._app = app
+        self._errors = errors
+        self._limiter = limiter
+        self._route_limiters = route_limiters
+        self._queue_timeout = queue_timeout
+        self._retry_after = retry_after
+        self._excluded_paths = excluded_paths
+        self._routes: list[tuple[Route, IAdmissionLimiter]] | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, admitting the HTTP request or rejecting it.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+
+        if scope["type"] != "http" or scope["path"].startswith(self._excluded_paths):
+            await self._app(scope, receive, send)
+            return
+
+        limiters = [self._limiter]
+        route_limiter = self._get_route_limiter(scope)
+        if route_limiter is not None:
+            limiters.insert(0, route_limiter)
+
+        acquired: list[IAdmissionLimiter] = []
+        deadline = time.monotonic() + self._queue_timeout
+
+        def release() -> None:
+            while acquired:
+                acquired.pop().release()
+
+        for limiter in limiters:
+            if not await limiter.acquire(budget=deadline - time.monotonic()):
+                release()
+                await self._reject(scope, receive, send)
+                return
+            acquired.append(limiter)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                release()
+            await send(message)
+
+        try:
+            await self._app(scope, receive, send_wrapper)
+        finally:
+            release()
+
+    def _get_route_limiter(self, scope: Scope) -> IAdmissionLimiter | None:
+        """
+        Find the limiter of the route matching the request.
+
+        Routes with a limit are collected from the application on the first request,
+        when all routers are included.
+
+        :param scope: ASGI connection scope.
+        :return: Route limiter or None if the route has no limit.
+        """
+
+        if not self._route_limiters:
+            return None
+
+        if self._routes is None:
+            self._routes = [
+                (route, self._route_limiters[route.path])
+                for route in scope["app"].router.routes
+                if isinstance(route, Route) and route.path in self._route_limiters
+            ]
+
+        for route, limiter in self._routes:
+            match, _ = route.matches(scope)
+            if match is Match.FULL:
+                return limiter
+
+        return None
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Send the overload error with a Retry-After header.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+
+        response = await BackendExceptionHandler.handle(
+            Request(scope), BackendException(self._errors.Common.SERVICE_OVERLOADED)
+        )
+        response.headers["Retry-After"] = str(self._retry_after)
+        await response(scope, receive, send)
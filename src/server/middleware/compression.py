@@ -0,0 +1,305 @@
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.client.storages.memory.interfaces import IMemoryCache
+from src.server.interfaces import (
+    ICompressionMiddleware,
+    ICompressionStream,
+    ICompressor,
+)
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+# Event streams are read as they are sent, buffering them would delay the events
+EXCLUDED_CONTENT_TYPES = ("text/event-stream",)
+
+
+class CompressionMiddleware(ICompressionMiddleware):
+    """
+    Pure ASGI middleware compressing response bodies with gzip or zstd.
+
+    Bodies with a known length are compressed at once and stored in a cache keyed by
+    the body digest, so hot responses are not recompressed on every hit. Bodies
+    without a length are buffered up to the size threshold and then compressed chunk
+    by chunk, every chunk is flushed so streaming clients are not delayed. Event
+    streams are never compressed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        compressors: tuple[ICompressor, ...],
+        cache: IMemoryCache,
+        min_size: int,
+        max_cached_size: int,
+    ):
+        """
+        Initialize the middleware.
+
+        :param app: Wrapped ASGI application.
+        :param compressors: Available compressors in order of server preference.
+        :param cache: Cache of precompressed bodies.
+        :param min_size: Minimum body size in bytes worth compressing.
+        :param max_cached_size: Maximum body size in bytes stored in the cache.
+        """
+
+        self._app = app
+        self._compressors = {
+            compressor.encoding: compressor for compressor in compressors
+        }
+        self._cache = cache
+        self._min_size = min_size
+        self._max_cached_size = max_cached_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, compressing the HTTP response body if possible.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        compressor = self._negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if compressor is None:
+            await self._app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            send=send,
+            compressor=compressor,
+            cache=self._cache,
+            min_size=self._min_size,
+            max_cached_size=self._max_cached_size,
+        )
+        await self._app(scope, receive, responder.send)
+
+    def _negotiate(self, accept_encoding: str) -> ICompressor | None:
+        """
+        Choose the compressor with the highest client quality value.
+
+        Ties are resolved by server preference, ``*`` matches every encoding and a
+        zero quality value rules an encoding out.
+
+        :param accept_encoding: Value of the Accept-Encoding request header.
+        :return: Chosen compressor or None if the client accepts none of them.
+        """
+
+        qualities = {}
+        for item in accept_encoding.lower().split(","):
+            token, _, params = item.partition(";")
+            token = token.strip()
+            if not token:
+                continue
+
+            quality = 1.0
+            params = params.strip()
+            if params.startswith("q="):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    continue
+            qualities[token] = quality
+
+        best, best_quality = None, 0.0
+        for encoding, compressor in self._compressors.items():
+            quality = qualities.get(encoding, qualities.get("*", 0.0))
+            if quality > best_quality:
+                best, best_quality = compressor, quality
+
+        return best
+
+
+class _CompressionResponder:
+    """Per-response state of CompressionMiddleware wrapping the ASGI send channel."""
+
+    def __init__(
+        self,
+        send: Send,
+        compressor: ICompressor,
+        cache: IMemoryCache,
+        min_size: int,
+        max_cached_size: int,
+    ):
+        """
+        Initialize the responder.
+
+        :param send: Original ASGI send channel.
+        :param compressor: Negotiated compressor.
+        :param cache: Cache of precompressed bodies.
+        :param min_size: Minimum body size in bytes worth compressing.
+        :param max_cached_size: Maximum body size in bytes stored in the cache.
+        """
+
+        self._send = send
+        self._compressor = compressor
+        self._cache = cache
+        self._min_size = min_size
+        self._max_cached_size = max_cached_size
+
+        self._start: Message | None = None
+        self._content_length: int | None = None
+        self._passthrough = False
+        self._chunks: list[bytes] = []
+        self._buffered = 0
+        self._stream: ICompressionStream | None = None
+
+    async def send(self, message: Message) -> None:
+        """
+        Intercept response messages and compress the body.
+
+        :param message: ASGI message sent by the application.
+        """
+
+        if self._passthrough:
+            await self._send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            self._on_start(message)
+            if self._passthrough:
+                await self._send(message)
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self._stream is not None:
+            await self._send_stream_chunk(message)
+            return
+
+        self._chunks.append(message.get("body", b""))
+        self._buffered += len(self._chunks[-1])
+        more_body = message.get("more_body", False)
+
+        if not more_body:
+            await self._send_complete(b"".join(self._chunks))
+        elif self._content_length is None and self._buffered >= self._min_size:
+            await self._start_stream()
+
+    def _on_start(self, message: Message) -> None:
+        """
+        Decide from the response headers whether the body may be compressed.
+
+        :param message: ASGI response start message.
+        """
+
+        self._start = message
+        headers = Headers(raw=message["headers"])
+
+        content_type = headers.get("content-type", "")
+        if (
+            "content-encoding" in headers
+            or message["status"] in (204, 304)
+            or not content_type.startswith(COMPRESSIBLE_CONTENT_TYPES)
+            or content_type.startswith(EXCLUDED_CONTENT_TYPES)
+        ):
+            self._passthrough = True
+            return
+
+        content_length = headers.get("content-length")
+        if content_length is not None:
+            self._content_length = int(content_length)
+            if self._content_length < self._min_size:
+                self._passthrough = True
+
+    async def _send_complete(self, body: bytes) -> None:
+        """
+        Send a fully buffered body, compressed if it is large enough.
+
+        :param body: Complete response body.
+        """
+
+        if len(body) < self._min_size:
+            await self._send(self._start)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        compressed = self._compress(body)
+
+        headers = self._get_compressed_headers()
+        headers["Content-Length"] = str(len(compressed))
+
+        await self._send(self._start)
+        await self._send({"type": "http.response.body", "body": compressed})
+
+    def _compress(self, body: bytes) -> bytes:
+        """
+        Compress a complete body, reusing a precompressed copy of an equal body.
+
+        :param body: Complete response body.
+        :return: Compressed body.
+        """
+
+        if len(body) > self._max_cached_size:
+            return self._compressor.compress(body)
+
+        key = (
+            self._compressor.encoding,
+            hashlib.blake2b(body, digest_size=16).digest(),
+        )
+        compressed = self._cache.get(key)
+        if compressed is None:
+            compressed = self._compressor.compress(body)
+            self._cache.set(key, compressed)
+
+        return compressed
+
+    async def _start_stream(self) -> None:
+        """Send the response start and the buffered chunks as a compressed stream."""
+
+        self._stream = self._compressor.stream()
+
+        headers = self._get_compressed_headers()
+        del headers["Content-Length"]
+
+        await self._send(self._start)
+        await self._send(
+            {
+                "type": "http.response.body",
+                "body": self._stream.compress(b"".join(self._chunks)),
+                "more_body": True,
+            }
+        )
+        self._chunks = []
+
+    async def _send_stream_chunk(self, message: Message) -> None:
+        """
+        Compress and send the next chunk of a streamed body.
+
+        :param message: ASGI response body message.
+        """
+
+        body = self._stream.compress(message.get("body", b""))
+        more_body = message.get("more_body", False)
+        if not more_body:
+            body += self._stream.finish()
+
+        if body or not more_body:
+            await self._send(
+                {"type": "http.response.body", "body": body, "more_body": more_body}
+            )
+
+    def _get_compressed_headers(self) -> MutableHeaders:
+        """
+        Set the encoding headers of a compressed response on the start message.
+
+        :return: Mutable headers of the start message.
+        """
+
+        headers = MutableHeaders(scope=self._start)
+        headers["Content-Encoding"] = self._compressor.encoding
+        headers.add_vary_header("Accept-Encoding")
+        return headers
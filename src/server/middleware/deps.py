@@ -1,20 +1,48 @@
+from starlette.types import ASGIApp
+
 from src.client.storages.deps import get_postgres_session_provider
 from src.client.storages.postgres.core.deps import get_postgres_session_context_manager
 from src.common.constants.deps import get_error_codes
 from src.common.logger.constants.deps import get_logger_config
 from src.common.logger.deps import get_base_logger, get_logger_manager
+from src.config.settings.deps import get_settings
+from src.server.admission.deps import (
+    get_admission_limiter,
+    get_admission_route_limiters,
+)
+from src.server.compression.deps import get_compression_cache, get_compressors
 from src.server.interfaces import (
+    IAdmissionMiddleware,
+    IAppTimingMiddleware,
+    ICompressionMiddleware,
     IExceptionHandler,
     IExceptionMiddleware,
+    IMetricsMiddleware,
     IPostgresContextSessionMiddleware,
+    IQueryBudgetMiddleware,
+    IRequestLogMiddleware,
+    IServerTimingMiddleware,
+    ITracingMiddleware,
     IValidationExceptionHandler,
 )
+from src.server.metrics.deps import get_metrics_registry
+from src.server.middleware.admission import AdmissionMiddleware
+from src.server.middleware.compression import CompressionMiddleware
 from src.server.middleware.exception import (
     BackendExceptionHandler,
     ExceptionMiddleware,
     ValidationExceptionHandler,
 )
+from src.server.middleware.metrics import MetricsMiddleware
 from src.server.middleware.psql_context_manager import PostgresContextSessionMiddleware
+from src.server.middleware.query_budget import QueryBudgetMiddleware
+from src.server.middleware.request_log import RequestLogMiddleware
+from src.server.middleware.server_timing import (
+    AppTimingMiddleware,
+    ServerTimingMiddleware,
+)
+from src.server.middleware.tracing import TracingMiddleware
+from src.server.tracing.deps import get_tracer
 
 
 def get_exception_handler() -> IExceptionHandler:
@@ -31,7 +59,7 @@ def get_exception_handler() -> IExceptionHandler:
     return BackendExceptionHandler()
 
 
-def get_exception_middleware() -> IExceptionMiddleware:
+def get_exception_middleware(app: ASGIApp) -> IExceptionMiddleware:
     """
     Returns an instance of ExceptionMiddleware.
 
@@ -39,11 +67,13 @@ def get_exception_middleware() -> IExceptionMiddleware:
     during the request-response cycle. It logs the exception and returns a default
     error response when an unhandled error occurs.
 
+    :param app: ASGI application to wrap.
     :return: An instance of `ExceptionMiddleware`, which handles uncaught exceptions in
             FastAPI.
     """
 
     return ExceptionMiddleware(
+        app=app,
         logger=get_base_logger(get_logger_manager(get_logger_config())),
         errors=get_error_codes(),
     )
@@ -67,20 +97,174 @@ def get_validation_exception_handler() -> IValidationExceptionHandler:
     )
 
 
-def get_postgres_context_session_middleware() -> IPostgresContextSessionMiddleware:
+def get_postgres_context_session_middleware(
+    app: ASGIApp,
+) -> IPostgresContextSessionMiddleware:
     """
-    Returns an instance of ValidationExceptionHandler.
+    Returns an instance of PostgresContextSessionMiddleware wrapping the given
+    application.
 
-    This function provides the exception handler specifically for validation errors.
-    It catches validation errors raised during request parsing and returns a structured
-    JSON response with the error details.
+    This function provides the middleware that sets up the PostgreSQL session context
+    for every request and cleans it up once the request is handled.
 
-    :return: An instance of `ValidationExceptionHandler`, which handles validation
-            errors in FastAPI.
+    :param app: ASGI application to wrap.
+    :return: An instance of `PostgresContextSessionMiddleware`.
     """
 
     return PostgresContextSessionMiddleware(
+        app=app,
         errors=get_error_codes(),
         postgres_session_provider=get_postgres_session_provider(),
         postgres_session_context_manager=get_postgres_session_context_manager(),
+        read_only_safe_methods=get_settings().postgres.POSTGRES_READ_ONLY_SAFE_METHODS,
+    )
+
+
+def get_compression_middleware(app: ASGIApp) -> ICompressionMiddleware:
+    """
+    Returns an instance of CompressionMiddleware wrapping the given application.
+
+    Passed to ``add_middleware`` as the middleware factory, so the application is
+    wrapped together with the worker-wide compressors and precompressed bodies cache.
+
+    :param app: ASGI application to wrap.
+    :return: An instance of `CompressionMiddleware`.
+    """
+
+    settings = get_settings().compression
+
+    return CompressionMiddleware(
+        app=app,
+        compressors=get_compressors(),
+        cache=get_compression_cache(),
+        min_size=settings.COMPRESSION_MIN_SIZE,
+        max_cached_size=settings.COMPRESSION_CACHE_MAX_BODY_SIZE,
+    )
+
+
+def get_admission_middleware(app: ASGIApp) -> IAdmissionMiddleware:
+    """
+    Returns an instance of AdmissionMiddleware wrapping the given application.
+
+    :param app: ASGI application to wrap.
+    :return: An instance of `AdmissionMiddleware`.
+    """
+
+    settings = get_settings().project
+
+    return AdmissionMiddleware(
+        app=app,
+        errors=get_error_codes(),
+        limiter=get_admission_limiter(),
+        route_limiters=get_admission_route_limiters(),
+        queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT,
+        retry_after=settings.ADMISSION_RETRY_AFTER,
+        excluded_paths=settings.ADMISSION_EXCLUDED_PATHS,
+    )
+
+
+def get_metrics_middleware(app: ASGIApp) -> IMetricsMiddleware:
+    """
+    Returns an instance of MetricsMiddleware wrapping the given application.
+
+    :param app: ASGI application to wrap.
+    :return: An instance of `MetricsMiddleware`.
+    """
+
+    return MetricsMiddleware(
+        app=app,
+        registry=get_metrics_registry(),
+        latency_buckets=get_settings().metrics.METRICS_LATENCY_BUCKETS,
+    )
+
+
+def get_tracing_middleware(app: ASGIApp) -> ITracingMiddleware:
+    """
+    Returns an instance of TracingMiddleware wrapping the given application.
+
+    :param app: ASGI application to wrap.
+    :return: An instance of `TracingMiddleware`.
+    """
+
+    return TracingMiddleware(app=app, tracer=get_tracer())
+
+
+def get_server_timing_middleware(app: ASGIApp) -> IServerTimingMiddleware:
+    """
+    Returns an instance of ServerTimingMiddleware wrapping the given application.
+
+    :param app: ASGI application to wrap.
+    :return: An instance of `ServerTimingMiddleware`.
+    """
+
+    settings = get_settings().metrics
+
+    return ServerTimingMiddleware(
+        app=app,
+        enabled=settings.SERVER_TIMING_ENABLED,
+        debug_header=settings.SERVER_TIMING_DEBUG_HEADER,
+    )
+
+
+def get_app_timing_middleware(app: ASGIApp) -> IAppTimingMiddleware:
+    """
+    Returns an instance of AppTimingMiddleware wrapping the given application.
+
+    :param app: ASGI application to wrap.
+    :return: An instance of `AppTimingMiddleware`.
+    """
+
+    return AppTimingMiddleware(app=app)
+
+
+def get_query_budget_mode() -> str:
+    """
+    Returns the query budget mode, by default violations are logged in local mode,
+    fail the request in test mode and are not checked in production.
+
+    :return: One of ``off``, ``warn`` and ``raise``.
+    """
+
+    settings = get_settings()
+    if settings.postgres.POSTGRES_QUERY_BUDGET_MODE is not None:
+        return settings.postgres.POSTGRES_QUERY_BUDGET_MODE
+    if settings.project.IS_TEST_MODE:
+        return "raise"
+    if settings.project.IS_LOCAL_MODE:
+        return "warn"
+    return "off"
+
+
+def get_query_budget_middleware(app: ASGIApp) -> IQueryBudgetMiddleware:
+    """
+    Returns an instance of QueryBudgetMiddleware wrapping the given application.
+
+    :param app: ASGI application to wrap.
+    :return: An instance of `QueryBudgetMiddleware`.
+    """
+
+    settings = get_settings().postgres
+
+    return QueryBudgetMiddleware(
+        app=app,
+        logger=get_base_logger(get_logger_manager(get_logger_config())),
+        errors=get_error_codes(),
+        max_queries=settings.POSTGRES_QUERY_BUDGET_MAX_QUERIES,
+        max_repeats=settings.POSTGRES_QUERY_BUDGET_MAX_REPEATS,
+        strict=get_query_budget_mode() == "raise",
+    )
+
+
+def get_request_log_middleware(app: ASGIApp) -> IRequestLogMiddleware:
+    """
+    Returns an instance of RequestLogMiddleware wrapping the given application.
+
+    :param app: ASGI application to wrap.
+    :return: An instance of `RequestLogMiddleware`.
+    """
+
+    return RequestLogMiddleware(
+        app=app,
+        logger=get_base_logger(get_logger_manager(get_logger_config())),
+        access_log=get_settings().project.LOG_ACCESS_ENABLED,
     )
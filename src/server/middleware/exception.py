@@ -3,6 +3,7 @@ import logging
 from fastapi import Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.common.constants import ErrorCodesEnums
 from src.common.errors import BackendException
@@ -41,49 +42,73 @@ class BackendExceptionHandler(IExceptionHandler):
 
 class ExceptionMiddleware(IExceptionMiddleware):
     """
-    Middleware for handling unhandled exceptions globally in the application.
+    Pure ASGI middleware for handling unhandled exceptions globally in the application.
 
     This middleware catches any uncaught exceptions during the request processing
     and logs them while returning a structured error response with error details.
+    Messages are passed through untouched, so streamed responses are not buffered.
     """
 
     def __init__(
         self,
+        app: ASGIApp,
         logger: logging.Logger,
         errors: ErrorCodesEnums,
     ):
         """
-        Initialize the middleware with a logger and error codes.
+        Initialize the middleware with the wrapped application, a logger and error
+        codes.
 
+        :param app: Wrapped ASGI application.
         :param logger: The logger used for logging exceptions.
         :param errors: An instance of IErrorCodesEnums to retrieve error codes.
         """
 
+        self._app = app
         self._logger = logger
         self._errors = errors
 
-    async def __call__(self, request: Request, call_next):  # noqa: ANN001
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request and handle any unhandled exceptions globally.
 
-        :param request: The incoming HTTP request.
-        :param call_next: The next handler to process the request.
-        :return: A JSONResponse with error details in case of an unhandled exception.
+        An error response is sent only if the response has not started yet,
+        otherwise the exception is logged and propagated to the server.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
         """
 
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            return await call_next(request)
+            await self._app(scope, receive, send_wrapper)
         except Exception:
             self._logger.exception("Unknown exception")
+            if response_started:
+                raise
+
             undefined_error = BackendException(self._errors.Common.UNDEFINED)
 
-            return JSONResponse(
+            response = JSONResponse(
                 content={
                     "code": undefined_error.error_code,
                     "detail": undefined_error.description,
                 },
                 status_code=undefined_error.status_code,
             )
+            await response(scope, receive, send)
 
 
 class ValidationExceptionHandler(IValidationExceptionHandler):
@@ -0,0 +1,124 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.server.constants import request_timings_context
+from src.server.interfaces import IMetricsMiddleware, IMetricsRegistry
+from src.server.metrics import RequestTimings, TimingName
+
+# Route label of requests not matching any route, so unknown paths do not create
+# a series each
+UNMATCHED_ROUTE = "<unmatched>"
+# Upper bounds of the queries per request histogram buckets
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class MetricsMiddleware(IMetricsMiddleware):
+    """
+    Pure ASGI middleware recording the latency of every HTTP request along with the
+    database and serialization time it took.
+
+    Requests are labelled by the path template of the matched route rather than the
+    path, so the number of series stays bounded.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        registry: IMetricsRegistry,
+        latency_buckets: tuple[float, ...],
+    ):
+        """
+        Initialize the middleware and register its metrics.
+
+        :param app: Wrapped ASGI application.
+        :param registry: Worker-wide metrics registry.
+        :param latency_buckets: Upper bounds of the duration histogram buckets in
+                seconds.
+        """
+
+        self._app = app
+        self._in_progress = registry.gauge(
+            "http_requests_in_progress", "Requests being handled."
+        )
+        self._duration = registry.histogram(
+            "http_request_duration_seconds",
+            "Time from receiving a request to sending the last byte of its response.",
+            labelnames=("method", "route", "status"),
+            buckets=latency_buckets,
+        )
+        self._db_duration = registry.histogram(
+            "http_request_db_seconds",
+            "Time a request spent waiting on database queries.",
+            labelnames=("route",),
+            buckets=latency_buckets,
+        )
+        self._db_queries = registry.histogram(
+            "http_request_db_queries",
+            "Database queries executed by a request.",
+            labelnames=("route",),
+            buckets=QUERY_COUNT_BUCKETS,
+        )
+        self._serialization_duration = registry.histogram(
+            "http_request_serialization_seconds",
+            "Time a request spent dumping its response body.",
+            labelnames=("route",),
+            buckets=latency_buckets,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, timing the HTTP request.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        timings = RequestTimings()
+        token = request_timings_context.set(timings)
+        self._in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self._app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - started
+            self._in_progress.inc(-1)
+            request_timings_context.reset(token)
+            self._observe(scope, status, duration, timings)
+
+    def _observe(
+        self, scope: Scope, status: int, duration: float, timings: RequestTimings
+    ) -> None:
+        """
+        Record the metrics of a handled request.
+
+        :param scope: ASGI connection scope, holding the matched route.
+        :param status: Response status code.
+        :param duration: Request duration in seconds.
+        :param timings: Phase timings filled while handling the request.
+        """
+
+        route = scope.get("route")
+        path = getattr(route, "path", UNMATCHED_ROUTE)
+
+        self._duration.labels(scope["method"], path, str(status)).observe(duration)
+        self._db_duration.labels(path).observe(
+            timings.durations.get(TimingName.DB, 0.0)
+        )
+        self._db_queries.labels(path).observe(timings.counts.get(TimingName.DB, 0))
+        self._serialization_duration.labels(path).observe(
+            timings.durations.get(TimingName.SERIALIZATION, 0.0)
+        )
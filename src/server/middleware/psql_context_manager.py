@@ -1,21 +1,28 @@
-from collections.abc import Awaitable, Callable
-
-from starlette.requests import Request
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.client.interfaces import IPostgresSessionProvider
 from src.client.storages.postgres.interfaces import IPostgresSessionContextManager
 from src.common.constants import ErrorCodesEnums
+from src.common.errors import BackendException
 from src.server.interfaces import IPostgresContextSessionMiddleware
 
+REQUEST_ID_HEADER = "X-Request-ID"
+SAFE_METHODS = frozenset(("GET", "HEAD"))
+
 
 class PostgresContextSessionMiddleware(IPostgresContextSessionMiddleware):
     """
-    ASGI middleware that manages PostgreSQL session context per request.
+    Pure ASGI middleware that manages PostgreSQL session context per request.
 
     This middleware is responsible for:
-    - Setting a unique session context identifier (based on the request hash).
-    - Ensuring that database session resources are properly initialized and disposed.
+    - Opening a session scope tied to the request id (taken from the X-Request-ID
+      header or generated) and echoing the id in the response.
+    - Marking the session of GET and HEAD requests read-only when enabled, routes can
+      still override it with the ``read_write_session`` dependency.
+    - Closing the session as soon as the response starts, so its connection is back
+      in the pool while the body is sent, and removing the scope afterwards.
     - Handling unexpected errors gracefully with standardized error responses.
 
     It integrates with a session provider and a context manager to make the session
@@ -25,50 +32,76 @@ class PostgresContextSessionMiddleware(IPostgresContextSessionMiddleware):
 
     def __init__(
         self,
+        app: ASGIApp,
         errors: ErrorCodesEnums,
         postgres_session_provider: IPostgresSessionProvider,
         postgres_session_context_manager: IPostgresSessionContextManager,
+        read_only_safe_methods: bool,
     ):
         """
         Initialize the middleware with dependencies for error handling and session
         management.
 
+        :param app: Wrapped ASGI application.
         :param errors: Enum class containing standardized error codes and status codes.
         :param postgres_session_provider: Provider responsible for returning the current
                 DB session.
         :param postgres_session_context_manager: Manages the current session context
                 identifier.
+        :param read_only_safe_methods: Whether GET and HEAD requests get read-only
+                sessions.
         """
 
+        self._app = app
         self._errors = errors
         self._postgres_session_provider = postgres_session_provider
         self._postgres_session_context_manager = postgres_session_context_manager
+        self._read_only_safe_methods = read_only_safe_methods
 
-    async def __call__(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process an incoming HTTP request.
 
-        Sets a unique session context ID based on the request hash, invokes the next
-        handler, and ensures cleanup of session resources regardless of success or
-        failure.
+        Opens a session scope for the request, invokes the wrapped application, and
+        ensures cleanup of session resources regardless of success or failure.
 
-        :param request: Incoming HTTP request.
-        :param call_next: The next handler in the ASGI middleware stack.
-        :return: HTTP response from the next handler or a generic error response.
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
         """
 
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        response_started = False
+        session_scope = self._postgres_session_context_manager.open_session_context(
+            request_id=Headers(scope=scope).get(REQUEST_ID_HEADER),
+            read_only=self._read_only_safe_methods and scope["method"] in SAFE_METHODS,
+        )
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                # The handler is done with the database once the response starts
+                await self._postgres_session_context_manager.release_session_context()
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = (
+                    session_scope.request_id
+                )
+            await send(message)
+
         try:
-            self._postgres_session_context_manager.set_session_context(
-                session_id=hash(request)
-            )
+            await self._app(scope, receive, send_wrapper)
 
-            return await call_next(request)
+        except Exception:
+            if response_started:
+                raise
 
-        except Exception:  # noqa: BLE001
-            return Response(
-                "Internal server error", status_code=self._errors.Common.UNDEFINED
+            response = Response(
+                "Internal server error",
+                status_code=BackendException(self._errors.Common.UNDEFINED).status_code,
             )
+            await response(scope, receive, send)
         finally:
-            self._postgres_session_context_manager.remove_session_context()
+            await self._postgres_session_context_manager.close_session_context()
@@ -0,0 +1,92 @@
+import logging
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.common.constants import ErrorCodesEnums
+from src.server.constants import query_budget_context
+from src.server.interfaces import IQueryBudgetMiddleware
+from src.server.query_budget import QueryBudget
+
+
+class QueryBudgetMiddleware(IQueryBudgetMiddleware):
+    """
+    Pure ASGI middleware giving every HTTP request a query budget, so endpoints
+    issuing too many statements or the same statement in a loop are noticed during
+    development instead of in production.
+
+    In strict mode the statement breaking the budget fails the request, otherwise the
+    violations are logged once the request is handled.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        logger: logging.Logger,
+        errors: ErrorCodesEnums,
+        max_queries: int,
+        max_repeats: int,
+        strict: bool,
+    ):
+        """
+        Initialize the middleware.
+
+        :param app: Wrapped ASGI application.
+        :param logger: Logger receiving the violations.
+        :param errors: Enum class containing standardized error codes and status codes.
+        :param max_queries: Maximum number of statements of a request.
+        :param max_repeats: Maximum number of executions of one statement within a
+                request.
+        :param strict: Whether a violation fails the request.
+        """
+
+        self._app = app
+        self._logger = logger
+        self._errors = errors
+        self._max_queries = max_queries
+        self._max_repeats = max_repeats
+        self._strict = strict
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, checking the statements of the HTTP request.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        budget = QueryBudget(
+            errors=self._errors,
+            max_queries=self._max_queries,
+            max_repeats=self._max_repeats,
+            strict=self._strict,
+        )
+        token = query_budget_context.set(budget)
+        try:
+            await self._app(scope, receive, send)
+        finally:
+            query_budget_context.reset(token)
+            if budget.violations and not self._strict:
+                self._log(scope, budget)
+
+    def _log(self, scope: Scope, budget: QueryBudget) -> None:
+        """
+        Log the violations of a request.
+
+        :param scope: ASGI connection scope.
+        :param budget: Query budget of the request.
+        """
+
+        route = scope.get("route")
+        path = getattr(route, "path", scope["path"])
+        self._logger.warning(
+            "Query budget exceeded by %s %s with %d queries: %s",
+            scope["method"],
+            path,
+            budget.count,
+            "; ".join(budget.violations),
+        )
@@ -0,0 +1,75 @@
+import logging
+import time
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.common.logger import RequestLogContext
+from src.server.constants import request_log_context
+from src.server.interfaces import IRequestLogMiddleware
+from src.server.middleware.psql_context_manager import REQUEST_ID_HEADER
+
+
+class RequestLogMiddleware(IRequestLogMiddleware):
+    """
+    Pure ASGI middleware making the route and the elapsed time of a request
+    available to every record logged while it runs, optionally logging one access
+    record per request with its status and latency.
+    """
+
+    def __init__(self, app: ASGIApp, logger: logging.Logger, access_log: bool):
+        """
+        Initialize the middleware.
+
+        :param app: Wrapped ASGI application.
+        :param logger: Logger receiving the access records.
+        :param access_log: Whether to log an access record per request.
+        """
+
+        self._app = app
+        self._logger = logger
+        self._access_log = access_log
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, setting the log context of the HTTP request.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        context = RequestLogContext(scope)
+        token = request_log_context.set(context)
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                context.request_id = Headers(raw=message["headers"]).get(
+                    REQUEST_ID_HEADER
+                )
+            await send(message)
+
+        try:
+            await self._app(scope, receive, send_wrapper)
+        finally:
+            if self._access_log:
+                self._logger.info(
+                    "%s %s %d",
+                    scope["method"],
+                    context.route or scope["path"],
+                    status,
+                    extra={
+                        "status": status,
+                        "latency_ms": round(
+                            (time.perf_counter() - context.started) * 1000, 3
+                        ),
+                    },
+                )
+            request_log_context.reset(token)
@@ -0,0 +1,167 @@
+import time
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.server.constants import request_timings_context
+from src.server.interfaces import IAppTimingMiddleware, IServerTimingMiddleware
+from src.server.metrics import RequestTimings, TimingName
+
+# Debug header values turning the Server-Timing header on
+TRUE_VALUES = ("1", "true", "yes", "on")
+# Reported phases with their descriptions, in order of the request flow
+SERVER_TIMING_PHASES = {
+    TimingName.AUTH: "API key check",
+    TimingName.DB: "Database",
+    TimingName.ORM: "ORM compilation and hydration",
+    TimingName.VALIDATION: "Schema validation",
+    TimingName.SERIALIZATION: "Serialization",
+}
+
+
+class ServerTimingMiddleware(IServerTimingMiddleware):
+    """
+    Pure ASGI middleware reporting where a request spent its time in the
+    ``Server-Timing`` response header, shown by browser developer tools.
+
+    Phases are read from the request timings filled by the application layers. The
+    middleware time is the total time without the time spent inside the innermost
+    middleware, measured by AppTimingMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp, enabled: bool, debug_header: str | None):
+        """
+        Initialize the middleware.
+
+        :param app: Wrapped ASGI application.
+        :param enabled: Whether to report timings on every response.
+        :param debug_header: Request header turning the report on for one request,
+                None to allow no opt-in.
+        """
+
+        self._app = app
+        self._enabled = enabled
+        self._debug_header = debug_header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, adding the Server-Timing header to the response if
+        it is requested.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+
+        if scope["type"] != "http" or not self._is_requested(scope):
+            await self._app(scope, receive, send)
+            return
+
+        timings = request_timings_context.get()
+        token = None
+        if timings is None:
+            timings = RequestTimings()
+            token = request_timings_context.set(timings)
+
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    self._render(timings, time.perf_counter() - started),
+                )
+            await send(message)
+
+        try:
+            await self._app(scope, receive, send_wrapper)
+        finally:
+            if token is not None:
+                request_timings_context.reset(token)
+
+    def _is_requested(self, scope: Scope) -> bool:
+        """
+        Check whether the request gets the Server-Timing header.
+
+        :param scope: ASGI connection scope.
+        :return: True if enabled for all requests or requested by the debug header.
+        """
+
+        if self._enabled:
+            return True
+        if self._debug_header is None:
+            return False
+
+        value = Headers(scope=scope).get(self._debug_header, "")
+        return value.lower() in TRUE_VALUES
+
+    @staticmethod
+    def _render(timings: RequestTimings, total: float) -> str:
+        """
+        Render the timings as a Server-Timing header value in milliseconds.
+
+        :param timings: Phase timings of the request.
+        :param total: Time since the request entered the middleware in seconds.
+        :return: Header value.
+        """
+
+        metrics = []
+        for name, description in SERVER_TIMING_PHASES.items():
+            duration = timings.durations.get(name)
+            if duration is None:
+                continue
+            if name == TimingName.DB:
+                metrics.append(
+                    f"{name};dur={duration * 1000:.2f};"
+                    f'desc="{description}, {timings.counts[name]} queries"'
+                )
+            else:
+                metrics.append(f'{name};dur={duration * 1000:.2f};desc="{description}"')
+
+        app_duration = timings.durations.get(TimingName.APP)
+        if app_duration is not None:
+            metrics.append(
+                f'middleware;dur={(total - app_duration) * 1000:.2f};desc="Middleware"'
+            )
+        metrics.append(f'total;dur={total * 1000:.2f};desc="Total"')
+
+        return ", ".join(metrics)
+
+
+class AppTimingMiddleware(IAppTimingMiddleware):
+    """
+    Pure ASGI middleware wrapping the router, recording the time from entering the
+    application to its response start as the application time of the request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware.
+
+        :param app: Wrapped ASGI application.
+        """
+
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, timing the application.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+
+        timings = request_timings_context.get()
+        if scope["type"] != "http" or timings is None:
+            await self._app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                timings.add(TimingName.APP, time.perf_counter() - started)
+            await send(message)
+
+        await self._app(scope, receive, send_wrapper)
@@ -0,0 +1,83 @@
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.server.constants import span_context
+from src.server.interfaces import ITracer, ITracingMiddleware
+from src.server.tracing import SpanKind
+
+# Responses from this status on mark the request span as failed
+ERROR_STATUS = 500
+
+
+class TracingMiddleware(ITracingMiddleware):
+    """
+    Pure ASGI middleware starting the root span of every sampled HTTP request.
+
+    Spans of the decorated usecase, service and repository methods nest under it
+    through the span context variable. The span is named after the matched route
+    template once the request is handled.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: ITracer):
+        """
+        Initialize the middleware.
+
+        :param app: Wrapped ASGI application.
+        :param tracer: Worker-wide tracer.
+        """
+
+        self._app = app
+        self._tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI connection, tracing the HTTP request if it is sampled.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        span = self._tracer.start_trace(
+            name=scope["method"],
+            kind=SpanKind.SERVER,
+            attributes={
+                "http.request.method": scope["method"],
+                "url.path": scope["path"],
+            },
+            traceparent=Headers(scope=scope).get("traceparent"),
+        )
+        if span is None:
+            await self._app(scope, receive, send)
+            return
+
+        status = ERROR_STATUS
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        token = span_context.set(span)
+        error = None
+        try:
+            await self._app(scope, receive, send_wrapper)
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            span_context.reset(token)
+
+            route = scope.get("route")
+            if route is not None:
+                span.name = f"{scope['method']} {route.path}"
+                span.attributes["http.route"] = route.path
+            span.attributes["http.response.status_code"] = status
+            if status >= ERROR_STATUS:
+                span.error = f"HTTP {status}"
+            span.end(error)
@@ -0,0 +1 @@
+from .budget import QueryBudget, get_orm_load, record_query
@@ -0,0 +1,140 @@
+from sqlalchemy.engine import ExecutionContext
+
+from src.common.constants import ErrorCodesEnums
+from src.common.errors import BackendException
+from src.server.constants import query_budget_context
+
+# Characters of a statement kept in violation messages
+STATEMENT_PREVIEW_LENGTH = 200
+# Execution option holding the top-level ORM load an eager load statement runs for
+ORM_LOAD_OPTION = "sa_top_level_orm_context"
+
+
+class QueryBudget:
+    """
+    Statements executed by one request checked against the request query budget.
+
+    A statement executed more times than allowed within one request, whatever its
+    parameters, is the signature of an N+1 pattern, such as a query issued per row
+    or per ancestor in a loop. A statement executed several times for one ORM load,
+    such as the chunks of 500 keys of a selectinload, is counted once. Every
+    violation is reported once per request.
+    """
+
+    __slots__ = (
+        "count",
+        "errors",
+        "loads",
+        "max_queries",
+        "max_repeats",
+        "repeats",
+        "strict",
+        "violations",
+    )
+
+    def __init__(
+        self,
+        errors: ErrorCodesEnums,
+        max_queries: int,
+        max_repeats: int,
+        strict: bool,
+    ):
+        """
+        Initialize the budget of a request.
+
+        :param errors: Enum class containing standardized error codes and status codes.
+        :param max_queries: Maximum number of statements of the request.
+        :param max_repeats: Maximum number of executions of one statement.
+        :param strict: Whether a violation fails the request instead of being kept
+                for a warning.
+        """
+
+        self.errors = errors
+        self.max_queries = max_queries
+        self.max_repeats = max_repeats
+        self.strict = strict
+        self.count = 0
+        self.repeats: dict[str, int] = {}
+        self.loads: set[tuple[str, object]] = set()
+        self.violations: list[str] = []
+
+    def add(self, statement: str, load: object | None = None) -> None:
+        """
+        Count an executed statement.
+
+        :param statement: SQL statement.
+        :param load: ORM load the statement is executed for, its executions after
+                the first are not counted.
+        :raises BackendException: In strict mode, if the statement breaks the budget.
+        """
+
+        if load is not None:
+            if (statement, load) in self.loads:
+                return
+            self.loads.add((statement, load))
+
+        self.count += 1
+        repeats = self.repeats.get(statement, 0) + 1
+        self.repeats[statement] = repeats
+
+        if self.count == self.max_queries + 1:
+            self._violate(f"more than {self.max_queries} queries")
+        if repeats == self.max_repeats + 1:
+            preview = " ".join(statement.split())[:STATEMENT_PREVIEW_LENGTH]
+            self._violate(
+                f"statement executed more than {self.max_repeats} times, "
+                f"likely N+1: {preview}"
+            )
+
+    def get_repeated(self) -> dict[str, int]:
+        """
+        Get the statements executed more times than allowed.
+
+        :return: Execution counts keyed by statement.
+        """
+
+        return {
+            statement: repeats
+            for statement, repeats in self.repeats.items()
+            if repeats > self.max_repeats
+        }
+
+    def _violate(self, violation: str) -> None:
+        """
+        Keep a violation, raising it in strict mode.
+
+        :param violation: Description of the violation.
+        :raises BackendException: In strict mode.
+        """
+
+        self.violations.append(violation)
+        if self.strict:
+            raise BackendException(
+                self.errors.Common.QUERY_BUDGET_EXCEEDED, cause=violation
+            )
+
+
+def get_orm_load(context: ExecutionContext) -> object | None:
+    """
+    Get the ORM load an executed statement is an eager load of.
+
+    :param context: Execution context of the statement.
+    :return: Context of the top-level ORM load, None for other statements.
+    """
+
+    return context.execution_options.get(ORM_LOAD_OPTION)
+
+
+def record_query(statement: str, load: object | None = None) -> None:
+    """
+    Count a statement against the budget of the current request, does nothing
+    outside of a request or with the budget turned off.
+
+    :param statement: SQL statement.
+    :param load: ORM load the statement is executed for.
+    :raises BackendException: In strict mode, if the statement breaks the budget.
+    """
+
+    budget = query_budget_context.get()
+    if budget is not None:
+        budget.add(statement, load=load)
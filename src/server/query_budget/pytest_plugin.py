@@ -0,0 +1,163 @@
+"""
+Pytest plugin asserting how many statements an endpoint executes.
+
+Enabled with ``pytest_plugins = ["src.server.query_budget.pytest_plugin"]`` in the
+root ``conftest.py`` or with ``pytest -p src.server.query_budget.pytest_plugin``::
+
+    def test_get_organization(client, query_counter):
+        with query_counter.expect(max_queries=2, max_repeats=1):
+            client.get(f"/api/v1/organizations/{sid}")
+"""
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine, event
+from sqlalchemy.engine import ExecutionContext
+
+from src.client.storages.postgres.core.deps import get_postgres_engine
+from src.server.query_budget.budget import get_orm_load
+
+
+class QueryCounter:
+    """
+    Counts the statements executed by the application engines while it is active.
+
+    Statements are counted on the engines rather than per request, so requests sent
+    by ``TestClient`` from its portal thread are counted as well. Only one request
+    should be in flight while counting. Like the request budget, the executions of
+    a statement for one ORM load are counted once.
+    """
+
+    def __init__(self, engines: tuple[Engine, ...]):
+        """
+        Initialize the counter.
+
+        :param engines: Synchronous engines to count the statements of.
+        """
+
+        self._engines = engines
+        self._loads: set[tuple[str, object]] = set()
+        self.statements: list[str] = []
+
+    def __enter__(self) -> "QueryCounter":
+        """
+        Start counting the statements of the engines.
+
+        :return: This counter.
+        """
+
+        for engine in self._engines:
+            event.listen(engine, "after_cursor_execute", self._on_executed)
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stop counting the statements of the engines."""
+
+        for engine in self._engines:
+            event.remove(engine, "after_cursor_execute", self._on_executed)
+
+    @property
+    def count(self) -> int:
+        """Number of statements counted since the last reset."""
+
+        return len(self.statements)
+
+    def get_repeated(self, threshold: int = 1) -> dict[str, int]:
+        """
+        Get the statements executed more than a given number of times.
+
+        :param threshold: Maximum number of executions of one statement.
+        :return: Execution counts keyed by statement.
+        """
+
+        return {
+            statement: repeats
+            for statement, repeats in Counter(self.statements).items()
+            if repeats > threshold
+        }
+
+    def reset(self) -> None:
+        """Forget the statements counted so far."""
+
+        self.statements.clear()
+        self._loads.clear()
+
+    @contextmanager
+    def expect(
+        self, max_queries: int, max_repeats: int | None = None
+    ) -> Iterator["QueryCounter"]:
+        """
+        Assert the statements executed within the block stay within a budget.
+
+        :param max_queries: Maximum number of statements.
+        :param max_repeats: Maximum number of executions of one statement, None to
+                allow any.
+        :return: Counter reset at the start of the block.
+        """
+
+        self.reset()
+        yield self
+
+        if self.count > max_queries:
+            pytest.fail(
+                f"Expected at most {max_queries} queries, executed {self.count}:\n"
+                + "\n".join(self.statements)
+            )
+        repeated = self.get_repeated(max_repeats) if max_repeats is not None else {}
+        if repeated:
+            pytest.fail(
+                f"Expected every statement at most {max_repeats} times, repeated:\n"
+                + "\n".join(
+                    f"{repeats}x {statement}" for statement, repeats in repeated.items()
+                )
+            )
+
+    def _on_executed(
+        self,
+        _connection: object,
+        _cursor: object,
+        statement: str,
+        _parameters: Any,  # noqa: ANN401
+        context: ExecutionContext,
+        _executemany: bool,
+    ) -> None:
+        """
+        Keep a statement executed by one of the engines, once per ORM load.
+
+        :param _connection: Connection that executed the statement.
+        :param _cursor: DBAPI cursor.
+        :param statement: Executed SQL statement.
+        :param _parameters: Bound parameters of the statement.
+        :param context: Execution context of the statement.
+        :param _executemany: Whether the statement ran once per parameter set.
+        """
+
+        load = get_orm_load(context)
+        if load is not None:
+            if (statement, load) in self._loads:
+                return
+            self._loads.add((statement, load))
+
+        self.statements.append(statement)
+
+
+@pytest.fixture
+def query_counter() -> Iterator[QueryCounter]:
+    """
+    Provides a counter of the statements executed by the application engines within
+    the test.
+
+    :return: Active QueryCounter instance.
+    """
+
+    engine = get_postgres_engine()
+    engines = [engine.get().sync_engine]
+    if engine.get_read().pool is not engine.get().pool:
+        engines.append(engine.get_read().sync_engine)
+
+    with QueryCounter(engines=tuple(engines)) as counter:
+        yield counter
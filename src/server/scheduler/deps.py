@@ -0,0 +1,21 @@
+from functools import lru_cache
+
+from src.common.logger.constants.deps import get_logger_config
+from src.common.logger.deps import get_base_logger, get_logger_manager
+from src.server.interfaces import IScheduler
+from src.server.scheduler import PeriodicScheduler
+
+
+@lru_cache
+def get_scheduler() -> IScheduler:
+    """
+    Provides the worker-wide instance of PeriodicScheduler.
+
+    :return: Instance of IScheduler.
+    """
+
+    return PeriodicScheduler(
+        logger=get_base_logger(
+            manager=get_logger_manager(config=get_logger_config()),
+        ),
+    )
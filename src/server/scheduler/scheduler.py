@@ -0,0 +1,79 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from src.server.interfaces import IScheduler
+
+
+class PeriodicScheduler(IScheduler):
+    """
+    Scheduler running each registered job in its own asyncio task.
+
+    A job waits for its interval after every run, so runs of the same job never
+    overlap. Errors are logged and do not stop the job.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        """
+        Initialize the scheduler.
+
+        :param logger: Logger instance for job failures and lifecycle events.
+        """
+
+        self._logger = logger
+        self._jobs: dict[str, tuple[float, Callable[[], Awaitable[None]]]] = {}
+        self._tasks: list[asyncio.Task] = []
+
+    def add_job(
+        self, name: str, interval: float, job: Callable[[], Awaitable[None]]
+    ) -> None:
+        """
+        Register a periodic job.
+
+        :param name: Unique name of the job, used in logs.
+        :param interval: Delay between job runs in seconds.
+        :param job: Coroutine function to run.
+        """
+
+        self._jobs[name] = (interval, job)
+
+    async def _run(
+        self, name: str, interval: float, job: Callable[[], Awaitable[None]]
+    ) -> None:
+        """
+        Run a job forever with the given interval between runs.
+
+        :param name: Name of the job.
+        :param interval: Delay between job runs in seconds.
+        :param job: Coroutine function to run.
+        """
+
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await job()
+            except Exception:
+                self._logger.exception("Scheduled job %s failed", name)
+
+    async def start(self) -> None:
+        """
+        Start running all registered jobs.
+        """
+
+        for name, (interval, job) in self._jobs.items():
+            self._tasks.append(
+                asyncio.create_task(self._run(name, interval, job), name=name)
+            )
+
+        self._logger.info("Scheduler started with %d job(s)", len(self._tasks))
+
+    async def stop(self) -> None:
+        """
+        Cancel all running jobs and wait for them to finish.
+        """
+
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
@@ -0,0 +1,3 @@
+from .exporters import OTLPFileSpanExporter, OTLPHTTPSpanExporter
+from .span import Span, SpanKind, record_statement
+from .tracer import Tracer
@@ -0,0 +1,52 @@
+from functools import lru_cache
+
+from src.common.logger.constants.deps import get_logger_config
+from src.common.logger.deps import get_base_logger, get_logger_manager
+from src.config.settings.deps import get_settings
+from src.server.interfaces import ISpanExporter, ITracer
+from src.server.tracing import OTLPFileSpanExporter, OTLPHTTPSpanExporter, Tracer
+
+
+def get_span_exporters() -> tuple[ISpanExporter, ...]:
+    """
+    Provides the configured destinations of finished spans.
+
+    :return: Tuple of ISpanExporter instances, empty if none is configured.
+    """
+
+    settings = get_settings().tracing
+    exporters = []
+
+    if settings.TRACING_EXPORT_PATH:
+        exporters.append(OTLPFileSpanExporter(path=settings.TRACING_EXPORT_PATH))
+    if settings.TRACING_EXPORT_ENDPOINT:
+        exporters.append(
+            OTLPHTTPSpanExporter(
+                endpoint=settings.TRACING_EXPORT_ENDPOINT,
+                timeout=settings.TRACING_EXPORT_TIMEOUT,
+            )
+        )
+
+    return tuple(exporters)
+
+
+@lru_cache
+def get_tracer() -> ITracer:
+    """
+    Provides the worker-wide tracer.
+
+    :return: Instance of ITracer.
+    """
+
+    settings = get_settings().tracing
+
+    return Tracer(
+        exporters=get_span_exporters(),
+        logger=get_base_logger(
+            manager=get_logger_manager(config=get_logger_config()),
+        ),
+        service_name=settings.TRACING_SERVICE_NAME,
+        sample_rate=settings.TRACING_SAMPLE_RATE,
+        max_statements=settings.TRACING_MAX_STATEMENTS_PER_SPAN,
+        max_queue=settings.TRACING_MAX_QUEUE,
+    )
@@ -0,0 +1,74 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from src.server.interfaces import ISpanExporter
+
+
+class OTLPFileSpanExporter(ISpanExporter):
+    """
+    Appends every batch of spans to a file as one OTLP JSON request per line, the
+    format read by the ``otlpjsonfile`` receiver of the OpenTelemetry Collector.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the exporter.
+
+        :param path: Path of the file, created if missing.
+        """
+
+        self._path = Path(path)
+
+    async def export(self, request: dict[str, Any]) -> None:
+        """
+        Append a batch of spans to the file.
+
+        :param request: OTLP ``ExportTraceServiceRequest`` in the JSON encoding.
+        """
+
+        line = json.dumps(request, separators=(",", ":")) + "\n"
+        await asyncio.to_thread(self._write, line)
+
+    def _write(self, line: str) -> None:
+        """
+        Append a line to the file, run in a thread to keep the event loop free.
+
+        :param line: Encoded batch.
+        """
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("a", encoding="utf-8") as file:
+            file.write(line)
+
+
+class OTLPHTTPSpanExporter(ISpanExporter):
+    """
+    Sends every batch of spans to an OTLP/HTTP collector in the JSON encoding.
+    """
+
+    def __init__(self, endpoint: str, timeout: float):
+        """
+        Initialize the exporter.
+
+        :param endpoint: Traces endpoint of the collector, such as
+                ``http://localhost:4318/v1/traces``.
+        :param timeout: Request timeout in seconds.
+        """
+
+        self._endpoint = endpoint
+        self._timeout = timeout
+
+    async def export(self, request: dict[str, Any]) -> None:
+        """
+        Send a batch of spans to the collector.
+
+        :param request: OTLP ``ExportTraceServiceRequest`` in the JSON encoding.
+        """
+
+        async with httpx.AsyncClient(timeout=self._timeout) as client:
+            response = await client.post(self._endpoint, json=request)
+            response.raise_for_status()
@@ -0,0 +1,119 @@
+import os
+from typing import Any
+
+from src.server.tracing.span import Span, SpanKind
+
+# Instrumentation scope reported with every span
+SCOPE_NAME = "src.server.tracing"
+# OTLP status codes
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+def encode_spans(service_name: str, spans: list[Span]) -> dict[str, Any]:
+    """
+    Encode finished spans as an OTLP ``ExportTraceServiceRequest`` in the JSON
+    encoding, with the statements of every span as its client spans.
+
+    :param service_name: Name of the service the spans are reported under.
+    :param spans: Finished spans.
+    :return: JSON-serializable request.
+    """
+
+    encoded = []
+    for span in spans:
+        encoded.append(_encode_span(span))
+        encoded.extend(_encode_statements(span))
+
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _encode_attributes({"service.name": service_name})
+                },
+                "scopeSpans": [{"scope": {"name": SCOPE_NAME}, "spans": encoded}],
+            }
+        ]
+    }
+
+
+def _encode_span(span: Span) -> dict[str, Any]:
+    """
+    Encode a span.
+
+    :param span: Finished span.
+    :return: OTLP JSON span.
+    """
+
+    attributes = dict(span.attributes)
+    if span.dropped_statements:
+        attributes["db.statements.dropped"] = span.dropped_statements
+
+    encoded = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": int(span.kind),
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": _encode_attributes(attributes),
+        "status": (
+            {"code": STATUS_ERROR, "message": span.error}
+            if span.error is not None
+            else {"code": STATUS_OK}
+        ),
+    }
+    if span.parent_id is not None:
+        encoded["parentSpanId"] = span.parent_id
+    return encoded
+
+
+def _encode_statements(span: Span) -> list[dict[str, Any]]:
+    """
+    Encode the statements of a span as its client spans.
+
+    :param span: Finished span.
+    :return: OTLP JSON spans.
+    """
+
+    encoded = []
+    for statement, start_ns, end_ns in span.statements:
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+        encoded.append(
+            {
+                "traceId": span.trace_id,
+                "spanId": os.urandom(8).hex(),
+                "parentSpanId": span.span_id,
+                "name": operation or "SQL",
+                "kind": int(SpanKind.CLIENT),
+                "startTimeUnixNano": str(start_ns),
+                "endTimeUnixNano": str(end_ns),
+                "attributes": _encode_attributes(
+                    {"db.system": "postgresql", "db.statement": statement}
+                ),
+                "status": {"code": STATUS_OK},
+            }
+        )
+    return encoded
+
+
+def _encode_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Encode attributes as OTLP key-value pairs.
+
+    :param attributes: Attribute values by key.
+    :return: OTLP JSON attributes.
+    """
+
+    encoded = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            encoded_value = {"boolValue": value}
+        elif isinstance(value, int):
+            encoded_value = {"intValue": str(value)}
+        elif isinstance(value, float):
+            encoded_value = {"doubleValue": value}
+        else:
+            encoded_value = {"stringValue": str(value)}
+        encoded.append({"key": key, "value": encoded_value})
+    return encoded
@@ -0,0 +1,139 @@
+import os
+import time
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
+
+from src.server.constants import span_context
+
+if TYPE_CHECKING:
+    from src.server.interfaces import ITracer
+
+
+class SpanKind(IntEnum):
+    """Span kinds, valued as in the OTLP protocol."""
+
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+
+class Span:
+    """
+    Timed operation of a sampled trace, such as a request or a decorated method.
+
+    Durations are measured on the monotonic clock and anchored to the wall clock once
+    at the start, so they are not skewed by clock adjustments. Statements executed
+    while the span is current are kept with it and exported as its client spans.
+    """
+
+    __slots__ = (
+        "attributes",
+        "dropped_statements",
+        "end_ns",
+        "error",
+        "kind",
+        "name",
+        "parent_id",
+        "span_id",
+        "start_ns",
+        "started",
+        "statements",
+        "trace_id",
+        "tracer",
+    )
+
+    def __init__(
+        self,
+        tracer: "ITracer",
+        name: str,
+        trace_id: str,
+        parent_id: str | None = None,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: dict[str, Any] | None = None,
+    ):
+        """
+        Start a span.
+
+        :param tracer: Tracer receiving the span once it ends.
+        :param name: Span name.
+        :param trace_id: Hex id of the trace.
+        :param parent_id: Hex id of the parent span, None for a root span.
+        :param kind: Span kind.
+        :param attributes: Initial span attributes.
+        """
+
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes = attributes or {}
+        self.statements: list[tuple[str, int, int]] = []
+        self.dropped_statements = 0
+        self.error: str | None = None
+        self.started = time.perf_counter_ns()
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+
+    def start_child(
+        self, name: str, attributes: dict[str, Any] | None = None
+    ) -> "Span":
+        """
+        Start a span nested in this one.
+
+        :param name: Span name.
+        :param attributes: Initial span attributes.
+        :return: Started child span.
+        """
+
+        return Span(
+            tracer=self.tracer,
+            name=name,
+            trace_id=self.trace_id,
+            parent_id=self.span_id,
+            attributes=attributes,
+        )
+
+    def add_statement(self, statement: str, started: float, duration: float) -> None:
+        """
+        Keep a statement executed while the span was current.
+
+        :param statement: SQL statement.
+        :param started: Start of the execution on the ``time.perf_counter`` clock.
+        :param duration: Duration of the execution in seconds.
+        """
+
+        if len(self.statements) >= self.tracer.max_statements:
+            self.dropped_statements += 1
+            return
+
+        start_ns = self.start_ns + int(started * 1e9) - self.started
+        self.statements.append((statement, start_ns, start_ns + int(duration * 1e9)))
+
+    def end(self, error: BaseException | None = None) -> None:
+        """
+        End the span and hand it over to the tracer for export.
+
+        :param error: Exception the operation failed with, None on success.
+        """
+
+        self.end_ns = self.start_ns + time.perf_counter_ns() - self.started
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        self.tracer.on_end(self)
+
+
+def record_statement(statement: str, started: float, duration: float) -> None:
+    """
+    Keep a statement with the current span, does nothing unless the current request
+    is traced.
+
+    :param statement: SQL statement.
+    :param started: Start of the execution on the ``time.perf_counter`` clock.
+    :param duration: Duration of the execution in seconds.
+    """
+
+    span = span_context.get()
+    if span is not None:
+        span.add_statement(statement, started, duration)
@@ -0,0 +1,154 @@
+import logging
+import os
+import random
+import re
+from collections import deque
+from typing import Any
+
+from src.server.interfaces import ISpanExporter, ITracer
+from src.server.tracing.otlp import encode_spans
+from src.server.tracing.span import Span, SpanKind
+
+# W3C trace context header: version, trace id, parent span id and flags
+TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+SAMPLED_FLAG = 0x01
+
+
+class Tracer(ITracer):
+    """
+    Tracer with head sampling, exporting finished spans in batches.
+
+    The sampling decision is taken once per trace when its root span starts, either
+    from the caller ``traceparent`` header or at random, so unsampled requests skip
+    span recording entirely. Finished spans are queued in memory and exported by a
+    periodic job, the queue is bounded and spans over its capacity are dropped and
+    counted.
+    """
+
+    def __init__(
+        self,
+        exporters: tuple[ISpanExporter, ...],
+        logger: logging.Logger,
+        service_name: str,
+        sample_rate: float,
+        max_statements: int,
+        max_queue: int,
+    ):
+        """
+        Initialize the tracer.
+
+        :param exporters: Destinations of the finished spans.
+        :param logger: Logger instance for export failures.
+        :param service_name: Name of the service the spans are reported under.
+        :param sample_rate: Share of traces recorded when the caller did not decide.
+        :param max_statements: Maximum number of statements kept per span.
+        :param max_queue: Maximum number of finished spans waiting for export.
+        """
+
+        self._exporters = exporters
+        self._logger = logger
+        self._service_name = service_name
+        self._sample_rate = sample_rate
+        self._max_statements = max_statements
+        self._max_queue = max_queue
+        self._queue: deque[Span] = deque()
+        self._exported = 0
+        self._dropped = 0
+
+    @property
+    def max_statements(self) -> int:
+        """
+        Maximum number of statements kept per span.
+
+        :return: Number of statements.
+        """
+
+        return self._max_statements
+
+    def start_trace(
+        self,
+        name: str,
+        kind: SpanKind,
+        attributes: dict[str, Any] | None = None,
+        traceparent: str | None = None,
+    ) -> Span | None:
+        """
+        Start the root span of a trace if it is sampled.
+
+        :param name: Span name.
+        :param kind: Span kind.
+        :param attributes: Initial span attributes.
+        :param traceparent: W3C ``traceparent`` header of the caller, whose trace is
+                continued and whose sampling decision is followed.
+        :return: Started span or None if the trace is not sampled.
+        """
+
+        match = TRACEPARENT_PATTERN.match(traceparent or "")
+        if match is not None:
+            trace_id, parent_id, flags = match.groups()
+            if not int(flags, 16) & SAMPLED_FLAG:
+                return None
+        elif random.random() < self._sample_rate:  # noqa: S311
+            trace_id, parent_id = os.urandom(16).hex(), None
+        else:
+            return None
+
+        return Span(
+            tracer=self,
+            name=name,
+            trace_id=trace_id,
+            parent_id=parent_id,
+            kind=kind,
+            attributes=attributes,
+        )
+
+    def on_end(self, span: Span) -> None:
+        """
+        Queue a finished span for export.
+
+        :param span: Finished span.
+        """
+
+        if len(self._queue) >= self._max_queue:
+            self._dropped += 1
+            return
+
+        self._queue.append(span)
+
+    async def flush(self) -> None:
+        """
+        Export all queued spans to every exporter.
+        """
+
+        if not self._queue:
+            return
+
+        spans = list(self._queue)
+        self._queue.clear()
+        request = encode_spans(service_name=self._service_name, spans=spans)
+
+        for exporter in self._exporters:
+            try:
+                await exporter.export(request)
+            except Exception:
+                self._dropped += len(spans)
+                self._logger.exception(
+                    "Failed to export %s spans with %s",
+                    len(spans),
+                    type(exporter).__name__,
+                )
+            else:
+                self._exported += len(spans)
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get the export counters.
+
+        :return: Dictionary with queued, exported and dropped span counts.
+        """
+
+        return {
+            "queued": len(self._queue),
+            "exported": self._exported,
+            "dropped": self._dropped,
+        }
@@ -0,0 +1,37 @@
+from functools import lru_cache
+
+from src.client.storages.postgres.core.deps import get_postgres_engine
+from src.common.logger.constants.deps import get_logger_config
+from src.common.logger.deps import get_base_logger, get_logger_manager
+from src.config.settings.deps import get_settings
+from src.server.interfaces import IPoolWarmup
+from src.server.warmup import PostgresPoolWarmup
+
+
+@lru_cache
+def get_pool_warmup() -> IPoolWarmup:
+    """
+    Provides the worker-wide instance of PostgresPoolWarmup.
+
+    The number of connections matches the local pool, behind PgBouncer without a
+    local pool a single connection still primes the compiled statement cache.
+
+    :return: Instance of IPoolWarmup.
+    """
+
+    settings = get_settings().postgres
+    pool_size = (
+        settings.POSTGRES_PGBOUNCER_POOL_SIZE
+        if settings.POSTGRES_PGBOUNCER
+        else settings.POOL_SIZE
+    )
+
+    return PostgresPoolWarmup(
+        psql_engine=get_postgres_engine(),
+        logger=get_base_logger(
+            manager=get_logger_manager(config=get_logger_config()),
+        ),
+        connections=max(pool_size, 1),
+        timeout=settings.POSTGRES_WARMUP_TIMEOUT,
+        enabled=settings.POSTGRES_WARMUP_ENABLED,
+    )
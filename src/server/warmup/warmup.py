@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from src.client.storages.postgres.interfaces import IPostgresEngine
+from src.server.interfaces import IPoolWarmup
+
+
+class PostgresPoolWarmup(IPoolWarmup):
+    """
+    Startup phase opening the pool connections at once and priming the registered
+    hot-path queries on each of them.
+
+    Every connection pays its setup and every statement is compiled by SQLAlchemy and
+    prepared by asyncpg in the connection statement cache before the first request,
+    so the first requests after a deploy run at steady-state latency. Queries are
+    expected to read a few rows at most, they are rolled back after the run. A failed
+    warmup is logged and does not keep the worker unready, the pool then fills on
+    demand.
+    """
+
+    def __init__(
+        self,
+        psql_engine: IPostgresEngine,
+        logger: logging.Logger,
+        connections: int,
+        timeout: float,
+        enabled: bool,
+    ):
+        """
+        Initialize the warmup.
+
+        :param psql_engine: Engine whose pools are warmed up.
+        :param logger: Logger instance for warmup progress and failures.
+        :param connections: Number of connections to open in every pool.
+        :param timeout: Maximum duration of the warmup in seconds.
+        :param enabled: Whether to warm up at all, the worker is ready at once if not.
+        """
+
+        self._psql_engine = psql_engine
+        self._logger = logger
+        self._connections = connections
+        self._timeout = timeout
+        self._queries: dict[str, Callable[[AsyncSession], Awaitable[None]]] = {}
+        self._ready = not enabled
+
+    def add_query(
+        self, name: str, query: Callable[[AsyncSession], Awaitable[None]]
+    ) -> None:
+        """
+        Register a hot-path query executed once per pooled connection.
+
+        :param name: Unique name of the query, used in logs.
+        :param query: Coroutine function running the query in the given session.
+        """
+
+        self._queries[name] = query
+
+    @property
+    def is_ready(self) -> bool:
+        """
+        Whether the warmup is over and the worker may receive traffic.
+
+        :return: True once the warmup has finished or failed.
+        """
+
+        return self._ready
+
+    async def run(self) -> None:
+        """
+        Open the pool connections and run every registered query on each of them.
+        """
+
+        if self._ready:
+            return
+
+        started = time.monotonic()
+        try:
+            async with asyncio.timeout(self._timeout):
+                for engine in self._get_engines():
+                    await self._warm_engine(engine)
+        except Exception:
+            self._logger.exception("Connection pool warmup failed")
+        else:
+            self._logger.info(
+                "Warmed up %d connection(s) with %d query(ies) in %.3f s",
+                self._connections,
+                len(self._queries),
+                time.monotonic() - started,
+            )
+        finally:
+            self._ready = True
+
+    def _get_engines(self) -> list[AsyncEngine]:
+        """
+        Get one engine per distinct pool, the read engine shares the primary pool
+        unless a replica is configured.
+
+        :return: List of engines to warm up.
+        """
+
+        engines = {}
+        for engine in (self._psql_engine.get(), self._psql_engine.get_read()):
+            engines.setdefault(id(engine.pool), engine)
+        return list(engines.values())
+
+    async def _warm_engine(self, engine: AsyncEngine) -> None:
+        """
+        Check out the configured number of connections simultaneously, so the pool
+        opens distinct ones, and prime the queries on all of them.
+
+        :param engine: Engine to warm up.
+        """
+
+        async with AsyncExitStack() as stack:
+            connections = await asyncio.gather(
+                *(
+                    stack.enter_async_context(engine.connect())
+                    for _ in range(self._connections)
+                )
+            )
+            await asyncio.gather(
+                *(self._prime(connection) for connection in connections)
+            )
+
+    async def _prime(self, connection: AsyncConnection) -> None:
+        """
+        Run every registered query once on a connection.
+
+        :param connection: Checked out connection.
+        """
+
+        async with AsyncSession(bind=connection, autoflush=False) as db:
+            for name, query in self._queries.items():
+                self._logger.debug("Priming query %s", name)
+                await query(db)
+            await db.rollback()
@@ -0,0 +1,30 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.client.storages.postgres.core.deps import get_postgres_engine
+
+pytest_plugins = ["src.server.query_budget.pytest_plugin"]
+
+
+@pytest.fixture
+async def postgres_engine() -> AsyncIterator[AsyncEngine]:
+    """
+    Provides the application engine, skipping the test if PostgreSQL is not
+    reachable with the configured settings.
+
+    :return: Connected application engine, disposed after the test.
+    """
+
+    engine = get_postgres_engine().get()
+    try:
+        async with engine.connect():
+            pass
+    except (OSError, SQLAlchemyError) as exc:
+        await engine.dispose()
+        pytest.skip(f"PostgreSQL is not reachable: {exc}")
+
+    yield engine
+    await engine.dispose()
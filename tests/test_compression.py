@@ -0,0 +1,43 @@
+from starlette.types import Message, Receive, Scope, Send
+
+from src.server.middleware.deps import get_compression_middleware
+
+SCOPE = {
+    "type": "http",
+    "method": "GET",
+    "path": "/events",
+    "headers": [(b"accept-encoding", b"gzip")],
+}
+
+
+async def receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def test_event_stream_is_sent_uncompressed_as_it_goes():
+    sent: list[Message] = []
+    events = [b"data: 1\n\n", b"data: 2\n\n", b""]
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    async def app(_scope: Scope, _receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"text/event-stream; charset=utf-8")],
+            }
+        )
+        for index, event in enumerate(events):
+            more_body = index < len(events) - 1
+            await send(
+                {"type": "http.response.body", "body": event, "more_body": more_body}
+            )
+            # Every event reaches the client before the next one is produced
+            assert sent[-1]["body"] == event
+
+    await get_compression_middleware(app)(SCOPE, receive, send)
+
+    assert (b"content-encoding", b"gzip") not in sent[0]["headers"]
+    assert [message["body"] for message in sent[1:]] == events
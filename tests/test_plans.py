@@ -0,0 +1,14 @@
+import pytest
+
+from benchmarks.plans import QueryPlanCheck
+
+
+@pytest.mark.usefixtures("postgres_engine")
+async def test_repository_query_plans():
+    try:
+        report = await QueryPlanCheck()._run(snapshot=None, update=False)  # noqa: SLF001
+    except RuntimeError as exc:
+        pytest.skip(str(exc))
+
+    failed = {name: report["cases"][name] for name in report["failed"]}
+    assert failed == {}
@@ -0,0 +1,155 @@
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine, ForeignKey, create_engine, event, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+    relationship,
+    selectinload,
+)
+
+from src.common.constants.deps import get_error_codes
+from src.common.errors import BackendException
+from src.server.query_budget import QueryBudget, get_orm_load
+from src.server.query_budget.pytest_plugin import QueryCounter
+
+# Three full chunks of the 500 keys selectinload loads per statement
+PARENTS = 1500
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Parent(Base):
+    __tablename__ = "parent"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    children: Mapped[list["Child"]] = relationship()
+
+
+class Child(Base):
+    __tablename__ = "child"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id: Mapped[int] = mapped_column(ForeignKey("parent.id"))
+
+
+@pytest.fixture
+def sqlite_engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            Parent(id=index, children=[Child()]) for index in range(PARENTS)
+        )
+        session.commit()
+
+    yield engine
+    engine.dispose()
+
+
+def create_budget(strict: bool = False) -> QueryBudget:
+    return QueryBudget(
+        errors=get_error_codes(), max_queries=3, max_repeats=2, strict=strict
+    )
+
+
+def load_parents(engine: Engine) -> None:
+    with Session(engine) as session:
+        session.scalars(select(Parent).options(selectinload(Parent.children))).all()
+
+
+def test_budget_within_limits_has_no_violations():
+    budget = create_budget()
+
+    for statement in ("SELECT 1", "SELECT 2", "SELECT 1"):
+        budget.add(statement)
+
+    assert budget.count == 3
+    assert budget.violations == []
+    assert budget.get_repeated() == {}
+
+
+def test_budget_reports_query_limit_once():
+    budget = create_budget()
+
+    for index in range(6):
+        budget.add(f"SELECT {index}")
+
+    assert budget.violations == ["more than 3 queries"]
+
+
+def test_budget_detects_repeated_statement():
+    budget = create_budget()
+
+    for _ in range(3):
+        budget.add("SELECT * FROM activity.activity WHERE sid = $1")
+    budget.add("SELECT 1")
+
+    assert budget.get_repeated() == {
+        "SELECT * FROM activity.activity WHERE sid = $1": 3
+    }
+    assert budget.violations == [
+        "statement executed more than 2 times, likely N+1: "
+        "SELECT * FROM activity.activity WHERE sid = $1",
+        "more than 3 queries",
+    ]
+
+
+def test_strict_budget_raises_on_violation():
+    budget = create_budget(strict=True)
+    budget.add("SELECT 1")
+    budget.add("SELECT 1")
+
+    with pytest.raises(BackendException) as exc_info:
+        budget.add("SELECT 1")
+
+    error = get_error_codes().Common.QUERY_BUDGET_EXCEEDED
+    assert exc_info.value.error_code == error.value[0]
+    assert "likely N+1" in exc_info.value.cause
+
+
+def test_strict_budget_allows_chunked_selectinload(sqlite_engine: Engine):
+    budget = QueryBudget(
+        errors=get_error_codes(), max_queries=3, max_repeats=1, strict=True
+    )
+
+    def on_executed(*args: Any) -> None:  # noqa: ANN401
+        _connection, _cursor, statement, _parameters, context, _executemany = args
+        budget.add(statement, load=get_orm_load(context))
+
+    event.listen(sqlite_engine, "after_cursor_execute", on_executed)
+    load_parents(sqlite_engine)
+
+    assert budget.count == 2
+    assert budget.violations == []
+
+    with pytest.raises(BackendException):
+        load_parents(sqlite_engine)
+
+    assert "likely N+1" in budget.violations[0]
+
+
+def test_query_counter_counts_chunked_selectinload_once(sqlite_engine: Engine):
+    with QueryCounter(engines=(sqlite_engine,)) as counter:
+        with counter.expect(max_queries=2, max_repeats=1):
+            load_parents(sqlite_engine)
+
+        assert counter.count == 2
+
+
+async def test_query_counter_counts_engine_statements(
+    postgres_engine: AsyncEngine, query_counter: QueryCounter
+):
+    with query_counter.expect(max_queries=3, max_repeats=2):
+        async with postgres_engine.connect() as connection:
+            for _ in range(2):
+                await connection.execute(text("SELECT 1"))
+
+    assert query_counter.get_repeated() == {"SELECT 1": 2}